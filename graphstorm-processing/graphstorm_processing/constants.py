@@ -107,3 +107,6 @@ SPARK_HADOOP_VERSIONS = {
 
 ########## Precomputed transformations ################
 TRANSFORMATIONS_FILENAME = "precomputed_transformations.json"
+
+########## Incremental processing ################
+PROCESSED_INPUT_FILES_FILENAME = "processed_input_files.json"
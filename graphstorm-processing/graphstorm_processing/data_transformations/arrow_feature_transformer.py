@@ -0,0 +1,619 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License").
+You may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Single-host implementations of the GSProcessing feature transformations,
+using PyArrow compute and numpy instead of Spark.
+
+The transformations produce the same values and JSON representations as
+their Spark counterparts under ``dist_transformations``, so representations
+can be shared between the two engines.
+"""
+
+import logging
+from collections import Counter
+from typing import Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# pylint: disable = no-name-in-module
+from scipy.special import erfinv
+
+from graphstorm_processing.config.feature_config_base import FeatureConfig
+from graphstorm_processing.constants import (
+    MAX_CATEGORIES_PER_FEATURE,
+    MISSING_CATEGORY,
+    RARE_CATEGORY,
+    TYPE_FLOAT32,
+    VALID_IMPUTERS,
+    VALID_NORMALIZERS,
+)
+
+ARROW_DTYPE_MAP = {"float32": pa.float32(), "float64": pa.float64()}
+# Feature types that the single-host engine can transform
+SUPPORTED_FEATURE_TYPES = frozenset(
+    {
+        "no-op",
+        "numerical",
+        "multi-numerical",
+        "bucket-numerical",
+        "categorical",
+        "multi-categorical",
+    }
+)
+
+
+def to_float_numpy(values: pa.ChunkedArray) -> np.ndarray:
+    """Converts a numerical or string column to a float64 array, with NaN for missing values."""
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        values = pc.if_else(pc.equal(values, ""), None, values)
+    return pc.cast(values, pa.float64()).to_numpy()
+
+
+def to_float_matrix(values: pa.ChunkedArray, separator: Optional[str]) -> np.ndarray:
+    """Converts a vector column, either delimited strings or lists, to a 2D float64 array.
+
+    Empty values in the vectors become NaN. All the vectors need to have the same length.
+    """
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        assert separator, "Separator needed when dealing with CSV multi-column data."
+        values = pc.split_pattern(values, separator)
+    values = values.combine_chunks()
+    lengths = pc.list_value_length(values).fill_null(0).to_numpy(zero_copy_only=False)
+    flat_values = pc.list_flatten(values)
+    if pa.types.is_string(flat_values.type):
+        flat_values = pc.if_else(pc.equal(flat_values, ""), "NaN", flat_values)
+    flat_values = pc.cast(flat_values, pa.float64()).to_numpy(zero_copy_only=False)
+    if len(lengths) == 0:
+        return np.zeros((0, 0))
+    if not np.all(lengths == lengths[0]):
+        raise ValueError(f"Expected vectors of the same length, got lengths {set(lengths)}")
+    return flat_values.reshape(len(lengths), lengths[0]).copy()
+
+
+def matrix_to_list_array(matrix: np.ndarray, mask: Optional[np.ndarray] = None) -> pa.Array:
+    """Converts a 2D array to a list array, optionally with null rows where mask is True."""
+    num_rows, dim = matrix.shape
+    offsets = pa.array(np.arange(num_rows + 1, dtype=np.int32) * dim)
+    if mask is not None and mask.any():
+        return pa.ListArray.from_arrays(offsets, pa.array(matrix.ravel()), mask=pa.array(mask))
+    return pa.ListArray.from_arrays(offsets, pa.array(matrix.ravel()))
+
+
+def _impute(values: np.ndarray, imputer: str) -> tuple[np.ndarray, Optional[float]]:
+    """Replaces NaN values with the mean, median or most frequent value of the column."""
+    missing = np.isnan(values)
+    if imputer == "none" or not values.size:
+        return values, None
+    present = values[~missing]
+    if imputer == "mean":
+        imputed_val = float(np.mean(present))
+    elif imputer == "median":
+        imputed_val = float(np.median(present))
+    else:
+        uniques, counts = np.unique(present, return_counts=True)
+        # Ties are resolved to the smallest value
+        imputed_val = float(uniques[np.argmax(counts)])
+    return np.where(missing, imputed_val, values), imputed_val
+
+
+def _check_imputer_and_norm(imputer: str, normalizer: str) -> str:
+    """Validates the imputer and normalizer names, returns the imputer name Spark uses."""
+    imputer = "mode" if imputer == "most_frequent" else imputer
+    assert imputer in VALID_IMPUTERS + ["mode"], f"Unsupported imputation: {imputer}"
+    assert normalizer in VALID_NORMALIZERS, f"Unsupported normalization: {normalizer}"
+    return imputer
+
+
+def _rank_gauss(values: np.ndarray, epsilon: float) -> np.ndarray:
+    """Maps values to a Gaussian distribution through their ranks."""
+    ranks = np.empty(len(values), dtype=np.float64)
+    ranks[np.argsort(values, kind="stable")] = np.arange(len(values))
+    clipped_rank = (ranks / (len(values) - 1) - 0.5) * 2
+    clipped_rank = np.maximum(np.minimum(clipped_rank, 1 - epsilon), epsilon - 1)
+    return erfinv(clipped_rank)
+
+
+class ArrowNumericalTransformation:
+    """Single-host counterpart of ``DistNumericalTransformation``.
+
+    Parameters
+    ----------
+    cols : Sequence[str]
+        The list of columns to apply the transformations on.
+    normalizer : str
+        The normalization to apply to the columns.
+        Valid values are "none", "min-max", "standard", "rank-gauss".
+    imputer : str
+        The type of missing value imputation to apply to the column.
+        Valid values are "mean", "median" and "most_frequent".
+    out_dtype: str
+        Output feature dtype.
+    epsilon: float
+        Epsilon for normalization used to avoid INF float during computation.
+    json_representation: Optional[dict]
+        JSON representation of the transformation. If provided, the transformation
+        will be applied using this representation.
+    """
+
+    def __init__(
+        self,
+        cols: Sequence[str],
+        normalizer: str = "none",
+        imputer: str = "none",
+        out_dtype: str = TYPE_FLOAT32,
+        epsilon: float = 1e-6,
+        json_representation: Optional[dict] = None,
+    ) -> None:
+        self.cols = cols
+        self.shared_norm = normalizer
+        self.shared_imputation = _check_imputer_and_norm(imputer, normalizer)
+        self.out_dtype = out_dtype
+        self.epsilon = epsilon
+        self.json_representation = json_representation or {}
+
+    @staticmethod
+    def get_transformation_name() -> str:
+        """Name of the transformation, shared with the Spark implementation."""
+        return "DistNumericalTransformation"
+
+    def apply(self, input_table: pa.Table) -> pa.Table:
+        """Imputes and normalizes each column, returns a table with the transformed columns."""
+        if self.json_representation:
+            impute_representation = self.json_representation["imputer_model"]
+            norm_representation = self.json_representation["normalizer_model"]
+            imputer = impute_representation["imputer_name"]
+            imputed_vals = impute_representation["imputed_val_dict"]
+            norm_name = norm_representation["norm_name"]
+            norm_reconstruction = norm_representation["norm_reconstruction"]
+            out_dtype = self.json_representation.get("out_dtype", TYPE_FLOAT32)
+            if norm_name == "rank-gauss":
+                raise ValueError("Rank-Gauss transformation does not support re-applying.")
+        else:
+            imputer, imputed_vals = self.shared_imputation, {}
+            norm_name, norm_reconstruction = self.shared_norm, {}
+            out_dtype = self.out_dtype
+            if norm_name == "rank-gauss":
+                assert len(self.cols) == 1, (
+                    "Rank-Gauss numerical transformation only supports single column, "
+                    f"got {self.cols}"
+                )
+
+        min_vals, max_vals, col_sums = [], [], {}
+        out_arrays = []
+        for col_idx, col_name in enumerate(self.cols):
+            column = input_table.column(col_name)
+            values = to_float_numpy(column)
+            if imputer != "none":
+                if col_name in imputed_vals:
+                    values = np.where(np.isnan(values), imputed_vals[col_name], values)
+                else:
+                    values, imputed_vals[col_name] = _impute(values, imputer)
+            missing = np.isnan(values)
+
+            if norm_name == "none":
+                if imputer == "none":
+                    out_arrays.append(column)
+                else:
+                    out_arrays.append(pa.array(values))
+                continue
+            if norm_name == "min-max":
+                if "originalMinValues" in norm_reconstruction:
+                    col_min = norm_reconstruction["originalMinValues"][col_idx]
+                    col_max = norm_reconstruction["originalMaxValues"][col_idx]
+                else:
+                    col_min, col_max = float(np.nanmin(values)), float(np.nanmax(values))
+                min_vals.append(col_min)
+                max_vals.append(col_max)
+                if col_max == col_min:
+                    # Same as Spark's MinMaxScaler for constant columns
+                    scaled = np.full_like(values, 0.5)
+                else:
+                    scaled = (values - col_min) / (col_max - col_min)
+            elif norm_name == "standard":
+                sum_key = f"sum({col_name})"
+                if "col_sums" in norm_reconstruction:
+                    col_sum = norm_reconstruction["col_sums"][sum_key]
+                else:
+                    col_sum = float(np.nansum(values)) if not missing.all() else np.nan
+                if np.isinf(col_sum) or np.isnan(col_sum):
+                    raise RuntimeError(
+                        "Missing values found in the data, cannot apply "
+                        "normalization. Use an imputer in the transformation."
+                    )
+                col_sums[sum_key] = col_sum
+                scaled = values / col_sum
+            else:
+                scaled = _rank_gauss(values, self.epsilon)
+            out_arrays.append(
+                pa.array(scaled, mask=missing, type=ARROW_DTYPE_MAP.get(out_dtype, pa.float32()))
+            )
+
+        norm_reconstruction = {}
+        if norm_name == "min-max":
+            norm_reconstruction = {"originalMinValues": min_vals, "originalMaxValues": max_vals}
+        elif norm_name == "standard":
+            norm_reconstruction = {"col_sums": col_sums}
+        if not self.json_representation:
+            self.json_representation = {
+                "cols": list(self.cols),
+                "imputer_model": {"imputed_val_dict": imputed_vals, "imputer_name": imputer},
+                "normalizer_model": {
+                    "norm_name": norm_name,
+                    "norm_reconstruction": norm_reconstruction,
+                },
+                "out_dtype": out_dtype,
+                "transformation_name": self.get_transformation_name(),
+            }
+        return pa.table(out_arrays, names=list(self.cols))
+
+
+class ArrowMultiNumericalTransformation:
+    """Single-host counterpart of ``DistMultiNumericalTransformation``."""
+
+    def __init__(
+        self,
+        cols: Sequence[str],
+        separator: Optional[str] = None,
+        normalizer: str = "none",
+        imputer: str = "none",
+        out_dtype: str = TYPE_FLOAT32,
+    ) -> None:
+        assert len(cols) == 1, "Multi-numerical transformation only supports a single column"
+        self.cols = cols
+        self.separator = separator
+        self.shared_norm = normalizer
+        self.shared_imputation = _check_imputer_and_norm(imputer, normalizer)
+        self.out_dtype = out_dtype
+        self.json_representation: dict = {}
+
+    @staticmethod
+    def get_transformation_name() -> str:
+        """Name of the transformation, shared with the Spark implementation."""
+        return "DistMultiNumericalTransformation"
+
+    def apply(self, input_table: pa.Table) -> pa.Table:
+        """Imputes and normalizes each dimension of the vector column."""
+        matrix = to_float_matrix(input_table.column(self.cols[0]), self.separator)
+        if self.shared_imputation != "none" and np.isnan(matrix).any():
+            for dim in range(matrix.shape[1]):
+                matrix[:, dim], _ = _impute(matrix[:, dim], self.shared_imputation)
+
+        if self.shared_norm == "min-max":
+            dim_min, dim_max = np.nanmin(matrix, axis=0), np.nanmax(matrix, axis=0)
+            dim_range = dim_max - dim_min
+            constant = dim_range == 0
+            matrix = (matrix - dim_min) / np.where(constant, 1, dim_range)
+            matrix[:, constant] = 0.5
+        elif self.shared_norm == "standard":
+            dim_sums = matrix.sum(axis=0)
+            invalid = np.isinf(dim_sums) | np.isnan(dim_sums) | (dim_sums == 0)
+            matrix = matrix * np.where(invalid, 0.0, 1.0 / np.where(invalid, 1.0, dim_sums))
+        elif self.shared_norm != "none":
+            raise RuntimeError(
+                f"Unknown normalizer requested for col {self.cols[0]}: {self.shared_norm}"
+            )
+
+        return pa.table(
+            [matrix_to_list_array(matrix.astype(np.dtype(self.out_dtype)))], names=list(self.cols)
+        )
+
+
+class ArrowBucketNumericalTransformation:
+    """Single-host counterpart of ``DistBucketNumericalTransformation``."""
+
+    # pylint: disable=redefined-builtin
+    def __init__(
+        self,
+        cols: Sequence[str],
+        range: Sequence[float],
+        bucket_cnt: int,
+        slide_window_size: float = 0.0,
+        imputer: str = "none",
+    ) -> None:
+        assert len(cols) == 1, "Bucket numerical transformation only supports single column"
+        self.cols = cols
+        self.range = range
+        self.bucket_count = bucket_cnt
+        self.slide_window_size = slide_window_size
+        self.shared_imputation = _check_imputer_and_norm(imputer, "none")
+        self.json_representation: dict = {}
+
+    @staticmethod
+    def get_transformation_name() -> str:
+        """Name of the transformation, shared with the Spark implementation."""
+        return "DistBucketNumericalTransformation"
+
+    def apply(self, input_table: pa.Table) -> pa.Table:
+        """Encodes each value as the buckets its sliding window overlaps."""
+        values = to_float_numpy(input_table.column(self.cols[0]))
+        values, _ = _impute(values, self.shared_imputation)
+        if np.isnan(values).any():
+            raise ValueError(
+                f"Missing values found in column {self.cols[0]}, "
+                "use an imputer in the bucket-numerical transformation."
+            )
+        min_val, max_val = self.range
+        bucket_size = (max_val - min_val) / self.bucket_count
+        epsilon = bucket_size / 10
+
+        def clip_to_range(vals: np.ndarray) -> np.ndarray:
+            vals = np.where(vals < min_val, min_val, vals)
+            return np.where(vals >= max_val, max_val - epsilon, vals)
+
+        low_idx = (clip_to_range(values - self.slide_window_size / 2) - min_val) // bucket_size
+        high_idx = (clip_to_range(values + self.slide_window_size / 2) - min_val) // bucket_size
+        bucket_ids = np.arange(self.bucket_count)
+        membership = (bucket_ids >= low_idx[:, None]) & (bucket_ids <= high_idx[:, None])
+        # Values outside the range belong only to the first or last bucket
+        membership[values <= min_val] = bucket_ids == 0
+        membership[values >= max_val] = bucket_ids == self.bucket_count - 1
+
+        return pa.table(
+            [matrix_to_list_array(membership.astype(np.float32))], names=list(self.cols)
+        )
+
+
+def _frequency_ordered(counts: Counter) -> list:
+    """Orders values by descending count, breaking ties alphabetically like StringIndexer."""
+    return sorted(counts, key=lambda value: (-counts[value], value))
+
+
+def _value_counts(values: pa.Array) -> Counter:
+    """Counts the occurrences of every value, including nulls."""
+    counts = pc.value_counts(values)
+    return Counter(
+        dict(zip(counts.field("values").to_pylist(), counts.field("counts").to_pylist()))
+    )
+
+
+class ArrowCategoryTransformation:
+    """Single-host counterpart of ``DistCategoryTransformation``, one-hot encodes categories."""
+
+    def __init__(self, cols: Sequence[str], json_representation: Optional[dict] = None) -> None:
+        self.cols = cols
+        self.json_representation = json_representation or {}
+
+    @staticmethod
+    def get_transformation_name() -> str:
+        """Name of the transformation, shared with the Spark implementation."""
+        return "DistCategoryTransformation"
+
+    def apply(self, input_table: pa.Table) -> pa.Table:
+        """One-hot encodes each column, missing and unknown categories are all-zero vectors."""
+        if self.json_representation:
+            precomputed_cols = self.json_representation["cols"]
+            assert set(precomputed_cols) == set(self.cols), (
+                f"Mismatched columns in precomputed transformation: "
+                f"pre-computed cols: {sorted(precomputed_cols)}, "
+                f"columns in current config: {sorted(self.cols)}"
+            )
+            labels_arrays = dict(
+                zip(precomputed_cols, self.json_representation["string_indexer_labels_arrays"])
+            )
+            # Spark re-applies the transformation with integer vectors
+            out_type = np.int32
+        else:
+            labels_arrays = {}
+            out_type = np.float32
+
+        out_arrays = []
+        for col_name in self.cols:
+            values = pc.cast(input_table.column(col_name), pa.string()).combine_chunks()
+            if col_name not in labels_arrays:
+                counts = _value_counts(values)
+                if len(counts) > MAX_CATEGORIES_PER_FEATURE:
+                    top_categories = pa.array(
+                        [value for value, _ in counts.most_common(MAX_CATEGORIES_PER_FEATURE - 1)],
+                        type=pa.string(),
+                    )
+                    values = pc.if_else(
+                        pc.is_in(values, value_set=top_categories), values, RARE_CATEGORY
+                    )
+                values = pc.if_else(pc.equal(values, ""), None, values)
+                counts = _value_counts(values)
+                counts.pop(None, None)
+                labels_arrays[col_name] = _frequency_ordered(counts)
+
+            labels = labels_arrays[col_name]
+            one_hot_idx = pc.index_in(values, value_set=pa.array(labels, type=pa.string()))
+            one_hot_idx = one_hot_idx.to_numpy(zero_copy_only=False)
+            one_hot = np.zeros((len(values), len(labels)), dtype=out_type)
+            known = ~np.isnan(one_hot_idx)
+            one_hot[np.flatnonzero(known), one_hot_idx[known].astype(np.int64)] = 1
+            out_arrays.append(matrix_to_list_array(one_hot))
+
+        if not self.json_representation:
+            self.json_representation = {
+                "string_indexer_labels_arrays": [labels_arrays[col] for col in self.cols],
+                "cols": list(self.cols),
+                "per_col_label_to_one_hot_idx": {
+                    col: {label: idx for idx, label in enumerate(labels_arrays[col])}
+                    for col in self.cols
+                },
+                "transformation_name": self.get_transformation_name(),
+            }
+        return pa.table(out_arrays, names=list(self.cols))
+
+
+class ArrowMultiCategoryTransformation:
+    """Single-host counterpart of ``DistMultiCategoryTransformation``, multi-hot encodes
+    delimited categories. Missing values are null, unknown categories are ignored."""
+
+    def __init__(self, cols: Sequence[str], separator: Optional[str] = None) -> None:
+        assert len(cols) == 1, "Multi-category transformation only supports one column at a time."
+        self.cols = cols
+        self.separator = separator
+        self.value_map: dict[str, int] = {}
+        self.json_representation: dict = {}
+
+    @staticmethod
+    def get_transformation_name() -> str:
+        """Name of the transformation, shared with the Spark implementation."""
+        return "DistMultiCategoryTransformation"
+
+    def apply(self, input_table: pa.Table) -> pa.Table:
+        """Multi-hot encodes the categories of each row."""
+        values = input_table.column(self.cols[0]).combine_chunks()
+        if not pa.types.is_list(values.type):
+            assert self.separator, "A separator is needed to split multi-category strings."
+            values = pc.split_pattern(pc.cast(values, pa.string()), self.separator)
+        tokens = pc.list_flatten(values)
+        parents = pc.list_parent_indices(values).to_numpy(zero_copy_only=False)
+
+        counts = _value_counts(tokens)
+        counts.pop(None, None)
+        over_limit = len(counts) > MAX_CATEGORIES_PER_FEATURE
+        if over_limit:
+            top_categories = dict(counts.most_common(MAX_CATEGORIES_PER_FEATURE - 1))
+            rare_count = sum(count for cat, count in counts.items() if cat not in top_categories)
+            counts = Counter(top_categories)
+            counts[RARE_CATEGORY] += rare_count
+        counts.pop("", None)
+        counts.pop(MISSING_CATEGORY, None)
+        categories = _frequency_ordered(counts)
+        self.value_map = {category: idx for idx, category in enumerate(categories)}
+
+        token_idx = pc.index_in(tokens, value_set=pa.array(categories, type=pa.string()))
+        token_idx = token_idx.to_numpy(zero_copy_only=False)
+        if over_limit:
+            # Rare categories share the placeholder's location
+            token_idx = np.where(np.isnan(token_idx), self.value_map[RARE_CATEGORY], token_idx)
+        known = ~np.isnan(token_idx)
+        multi_hot = np.zeros((len(values), len(categories)), dtype=np.float32)
+        multi_hot[parents[known], token_idx[known].astype(np.int64)] = 1
+
+        # Rows without values, or with a single missing value token are null
+        lengths = pc.list_value_length(values).fill_null(0).to_numpy(zero_copy_only=False)
+        first_tokens = pc.list_element(pc.if_else(pc.greater(lengths, 0), values, None), 0)
+        missing_first = pc.is_in(first_tokens, value_set=pa.array(["NaN", "None", "null", ""]))
+        null_rows = (lengths == 0) | (
+            (lengths == 1) & missing_first.fill_null(False).to_numpy(zero_copy_only=False)
+        )
+
+        return pa.table([matrix_to_list_array(multi_hot, mask=null_rows)], names=list(self.cols))
+
+
+class ArrowNoopTransformation:
+    """Single-host counterpart of ``NoopTransformation``, parses values as numbers."""
+
+    def __init__(
+        self,
+        cols: Sequence[str],
+        out_dtype: str = TYPE_FLOAT32,
+        separator: Optional[str] = None,
+        truncate_dim: Optional[int] = None,
+    ) -> None:
+        self.cols = cols
+        self.out_dtype = out_dtype
+        self.separator = separator
+        self.truncate_dim = truncate_dim
+        self.json_representation: dict = {}
+
+    @staticmethod
+    def get_transformation_name() -> str:
+        """Name of the transformation, shared with the Spark implementation."""
+        return "NoopTransformation"
+
+    def apply(self, input_table: pa.Table) -> pa.Table:
+        """Passes numerical values through, parsing delimited strings to vectors."""
+        out_type = ARROW_DTYPE_MAP.get(self.out_dtype, pa.float32())
+        out_arrays = []
+        for col_name in self.cols:
+            column = input_table.column(col_name)
+            if pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+                if not pa.types.is_integer(column.type.value_type) and not pa.types.is_floating(
+                    column.type.value_type
+                ):
+                    raise ValueError(
+                        f"Unsupported array type {column.type.value_type} for column {col_name}"
+                    )
+            elif pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+                if self.truncate_dim is not None:
+                    logging.warning("Trying use %s on a column of scalars!", self.truncate_dim)
+            elif self.separator:
+                column = pc.if_else(pc.equal(column, ""), None, column)
+                column = pc.cast(pc.split_pattern(column, self.separator), pa.list_(out_type))
+            else:
+                column = pc.cast(column, out_type)
+
+            if self.truncate_dim and pa.types.is_list(column.type):
+                column = pc.list_slice(column, 0, self.truncate_dim)
+            out_arrays.append(column)
+
+        return pa.table(out_arrays, names=list(self.cols))
+
+
+class ArrowFeatureTransformer:
+    """Selects the single-host transformation for a feature configuration.
+
+    Mirrors ``DistFeatureTransformer``, without needing a SparkSession.
+
+    Parameters
+    ----------
+    feature_config : FeatureConfig
+        The configuration of the feature to transform.
+    json_representation : dict
+        A pre-computed representation of the transformation, empty if
+        the transformation needs to be fit on the input data.
+
+    Raises
+    ------
+    NotImplementedError
+        If the transformation is only supported by the Spark engine.
+    """
+
+    def __init__(self, feature_config: FeatureConfig, json_representation: dict):
+        feat_type = feature_config.feat_type
+        args_dict = feature_config.transformation_kwargs
+        cols = feature_config.cols
+
+        if feat_type == "no-op":
+            self.transformation = ArrowNoopTransformation(cols, **args_dict)
+        elif feat_type == "numerical":
+            self.transformation = ArrowNumericalTransformation(
+                cols, **args_dict, json_representation=json_representation
+            )
+        elif feat_type == "multi-numerical":
+            self.transformation = ArrowMultiNumericalTransformation(cols, **args_dict)
+        elif feat_type == "bucket-numerical":
+            self.transformation = ArrowBucketNumericalTransformation(cols, **args_dict)
+        elif feat_type == "categorical":
+            self.transformation = ArrowCategoryTransformation(
+                cols, json_representation=json_representation
+            )
+        elif feat_type == "multi-categorical":
+            self.transformation = ArrowMultiCategoryTransformation(cols, **args_dict)
+        else:
+            raise NotImplementedError(
+                f"Feature {feature_config.feat_name} has type: {feat_type} that is not "
+                "supported by the Arrow engine, use the Spark engine instead."
+            )
+
+    def apply_transformation(self, input_table: pa.Table) -> tuple[pa.Table, dict]:
+        """Applies the transformation to the feature columns of the input table.
+
+        Returns
+        -------
+        tuple[pa.Table, dict]
+            The transformed columns, and the JSON representation of the transformation.
+        """
+        transformed_table = self.transformation.apply(input_table.select(self.transformation.cols))
+        return transformed_table, self.transformation.json_representation
+
+    def get_transformation_name(self) -> str:
+        """Get the name of the underlying transformation."""
+        return self.transformation.get_transformation_name()
@@ -16,17 +16,149 @@ limitations under the License.
 
 import logging
 import os
-from typing import Sequence
+from functools import lru_cache
+from typing import List, Sequence
+
 import numpy as np
+import pandas as pd
 import torch as th
 from pyspark.sql import DataFrame
 from pyspark.sql.types import ArrayType, IntegerType, FloatType, StructType, StructField
-from pyspark.sql.functions import udf
+from pyspark.sql.functions import pandas_udf
 from transformers import AutoTokenizer, AutoModel, AutoConfig
 
 from graphstorm_processing.constants import HUGGINGFACE_TOKENIZE, HUGGINGFACE_EMB
 from .base_dist_transformation import DistributedTransformation
 
+# Number of texts the LM encodes at a time. Each Arrow batch of texts is sorted by
+# token length and split into batches of this size, padded to their longest text.
+HF_EMB_BATCH_SIZE = 128
+
+
+@lru_cache(maxsize=None)
+def _get_device() -> str:
+    """Returns the device to run the LM on in the current executor process."""
+    if th.cuda.is_available():
+        gpu = int(os.environ["CUDA_VISIBLE_DEVICES"]) if "CUDA_VISIBLE_DEVICES" in os.environ else 0
+        return f"cuda:{gpu}"
+    logging.warning("Running HuggingFace transformation on CPU, runtime can be very long.")
+    return "cpu"
+
+
+@lru_cache(maxsize=None)
+def _load_tokenizer(hf_model: str):
+    """Loads a tokenizer once per Python process."""
+    return AutoTokenizer.from_pretrained(hf_model)
+
+
+@lru_cache(maxsize=None)
+def _load_lm_model(hf_model: str, device: str):
+    """Loads an LM once per Python process.
+
+    The Python workers of Spark executors are reused across tasks, so the
+    model is loaded once per executor process instead of once per task.
+    """
+    config = AutoConfig.from_pretrained(hf_model)
+    lm_model = AutoModel.from_pretrained(hf_model, config=config)
+    lm_model.eval()
+    return lm_model.to(device)
+
+
+def _check_texts(texts: pd.Series) -> None:
+    if not texts.map(lambda text: isinstance(text, str)).all():
+        raise ValueError("The input of the tokenizer has to be a string.")
+
+
+def tokenize_texts(texts: List[str], hf_model: str, max_seq_length: int) -> pd.DataFrame:
+    """Tokenizes a batch of texts, padded to max_seq_length.
+
+    Parameters
+    ----------
+    texts : List[str]
+        The texts to tokenize.
+    hf_model : str
+        The name of huggingface model.
+    max_seq_length: int
+        The maximal length of the tokenization results.
+
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame with the columns "input_ids", "attention_mask" and "token_type_ids",
+        every row of which is an int32 array of length max_seq_length.
+    """
+    if len(texts) == 0:
+        return pd.DataFrame({"input_ids": [], "attention_mask": [], "token_type_ids": []})
+    tokenizer = _load_tokenizer(hf_model)
+    t = tokenizer(
+        texts,
+        max_length=max_seq_length,
+        truncation=True,
+        padding="max_length",
+        return_tensors="np",
+    )
+    token_type_ids = t.get("token_type_ids", np.zeros_like(t["input_ids"]))
+    return pd.DataFrame(
+        {
+            "input_ids": list(t["input_ids"].astype(np.int32)),
+            "attention_mask": list(t["attention_mask"].astype(np.int32)),
+            "token_type_ids": list(token_type_ids.astype(np.int32)),
+        }
+    )
+
+
+def compute_lm_embeddings(
+    texts: List[str], hf_model: str, max_seq_length: int, batch_size: int = HF_EMB_BATCH_SIZE
+) -> np.ndarray:
+    """Computes the pooled LM embeddings of a batch of texts.
+
+    The texts are tokenized without padding and sorted by their token lengths.
+    The LM then encodes batches of texts of similar lengths, each padded
+    only to its longest text.
+
+    Parameters
+    ----------
+    texts : List[str]
+        The texts to encode.
+    hf_model : str
+        The name of huggingface model.
+    max_seq_length: int
+        The maximal length of the tokenization results.
+    batch_size: int
+        The number of texts the LM encodes at a time.
+
+    Returns
+    -------
+    np.ndarray
+        A float32 array of shape (len(texts), hidden_size).
+    """
+    device = _get_device()
+    tokenizer = _load_tokenizer(hf_model)
+    lm_model = _load_lm_model(hf_model, device)
+    tokens = tokenizer(texts, max_length=max_seq_length, truncation=True)
+    lengths = np.array([len(input_ids) for input_ids in tokens["input_ids"]])
+    order = np.argsort(-lengths, kind="stable")
+
+    embeddings = np.empty((len(texts), lm_model.config.hidden_size), dtype=np.float32)
+    with th.no_grad():
+        for start in range(0, len(order), batch_size):
+            idx = order[start : start + batch_size]
+            batch = tokenizer.pad(
+                {key: [tokens[key][i] for i in idx] for key in tokens.keys()},
+                padding="longest",
+                return_tensors="pt",
+            )
+            token_type_ids = batch.get("token_type_ids")
+            if token_type_ids is None:
+                token_type_ids = th.zeros_like(batch["input_ids"])
+            lm_outputs = lm_model(
+                input_ids=batch["input_ids"].to(device),
+                attention_mask=batch["attention_mask"].to(device).long(),
+                token_type_ids=token_type_ids.to(device).long(),
+            )
+            embeddings[idx] = lm_outputs.pooler_output.float().cpu().numpy()
+    return embeddings
+
 
 def apply_transform(
     cols: Sequence[str], action: str, hf_model: str, max_seq_length: int, input_df: DataFrame
@@ -34,6 +166,9 @@ def apply_transform(
     """Applies a single normalizer to the imputed dataframe, individually to each of the columns
     provided in the cols argument.
 
+    The texts are processed in Arrow batches with pandas UDFs, and the tokenizer and
+    LM are loaded once per executor process.
+
     Parameters
     ----------
     cols : Sequence[str]
@@ -47,15 +182,18 @@ def apply_transform(
     input_df : DataFrame
         The input DataFrame to apply normalization to.
     """
+    if action not in (HUGGINGFACE_TOKENIZE, HUGGINGFACE_EMB):
+        raise ValueError(f"The input action needs to be {HUGGINGFACE_TOKENIZE}")
+
+    tokenizer = _load_tokenizer(hf_model)
+    if max_seq_length > tokenizer.model_max_length:
+        # TODO: Could we possibly raise this at config time?
+        raise RuntimeError(
+            f"max_seq_length {max_seq_length} is larger "
+            f"than expected {tokenizer.model_max_length}"
+        )
 
     if action == HUGGINGFACE_TOKENIZE:
-        # Initialize the tokenizer
-        tokenizer = AutoTokenizer.from_pretrained(hf_model)
-        if max_seq_length > tokenizer.model_max_length:
-            raise RuntimeError(
-                f"max_seq_length {max_seq_length} is larger "
-                f"than expected {tokenizer.model_max_length}"
-            )
         # Define the schema of your return type
         tokenize_schema = StructType(
             [
@@ -66,28 +204,10 @@ def apply_transform(
         )
 
         # Define UDF
-        @udf(returnType=tokenize_schema)
-        def tokenize(text):
-            # Check if text is a string
-            if not isinstance(text, str):
-                raise ValueError("The input of the tokenizer has to be a string.")
-
-            # Tokenize the text
-            t = tokenizer(
-                text,
-                max_length=max_seq_length,
-                truncation=True,
-                padding="max_length",
-                return_tensors="np",
-            )
-            token_type_ids = t.get("token_type_ids", np.zeros_like(t["input_ids"], dtype=np.int8))
-            result = (
-                t["input_ids"][0].tolist(),  # Convert tensor to list
-                t["attention_mask"][0].astype(np.int8).tolist(),
-                token_type_ids[0].astype(np.int8).tolist(),
-            )
-
-            return result
+        @pandas_udf(tokenize_schema)
+        def tokenize(texts: pd.Series) -> pd.DataFrame:
+            _check_texts(texts)
+            return tokenize_texts(texts.tolist(), hf_model, max_seq_length)
 
         # Apply the UDF to the DataFrame
         transformed_df = input_df.withColumn(cols[0], tokenize(input_df[cols[0]]))
@@ -96,63 +216,21 @@ def apply_transform(
             transformed_df[cols[0]].getItem("attention_mask").alias("attention_mask"),
             transformed_df[cols[0]].getItem("token_type_ids").alias("token_type_ids"),
         )
-    elif action == HUGGINGFACE_EMB:
+    else:
         # Define the schema of your return type
         embedding_schema = ArrayType(FloatType())
 
-        if th.cuda.is_available():
-            gpu = (
-                int(os.environ["CUDA_VISIBLE_DEVICES"])
-                if "CUDA_VISIBLE_DEVICES" in os.environ
-                else 0
-            )
-            device = f"cuda:{gpu}"
-        else:
-            device = "cpu"
-            logging.warning("Running HuggingFace transformation on CPU, runtime can be very long.")
-        tokenizer = AutoTokenizer.from_pretrained(hf_model)
-        if max_seq_length > tokenizer.model_max_length:
-            # TODO: Could we possibly raise this at config time?
-            raise RuntimeError(
-                f"max_seq_length {max_seq_length} is larger "
-                f"than expected {tokenizer.model_max_length}"
-            )
-        config = AutoConfig.from_pretrained(hf_model)
-        lm_model = AutoModel.from_pretrained(hf_model, config)
-        lm_model.eval()
-        lm_model = lm_model.to(device)
-
         # Define UDF
-        @udf(returnType=embedding_schema)
-        def lm_emb(text):
-            # Check if text is a string
-            if not isinstance(text, str):
-                raise ValueError("The input of the tokenizer has to be a string.")
-
-            # Tokenize the text
-            outputs = tokenizer(
-                text,
-                max_length=max_seq_length,
-                truncation=True,
-                padding="max_length",
-                return_tensors="pt",
-            )
-            token_type_ids = outputs.get("token_type_ids")
-            if token_type_ids is None:
-                token_type_ids = th.zeros_like(outputs["input_ids"], dtype=th.int8)
-            with th.no_grad():
-                lm_outputs = lm_model(
-                    input_ids=outputs["input_ids"].to(device),
-                    attention_mask=outputs["attention_mask"].to(device).long(),
-                    token_type_ids=token_type_ids.to(device).long(),
-                )
-                embeddings = lm_outputs.pooler_output.cpu().squeeze().numpy()
-            return embeddings.tolist()
+        @pandas_udf(embedding_schema)
+        def lm_emb(texts: pd.Series) -> pd.Series:
+            _check_texts(texts)
+            if len(texts) == 0:
+                return pd.Series([], dtype=object)
+            embeddings = compute_lm_embeddings(texts.tolist(), hf_model, max_seq_length)
+            return pd.Series(list(embeddings))
 
         # Apply the UDF to the DataFrame
         transformed_df = input_df.select(lm_emb(input_df[cols[0]]).alias(cols[0]))
-    else:
-        raise ValueError(f"The input action needs to be {HUGGINGFACE_TOKENIZE}")
 
     return transformed_df
 
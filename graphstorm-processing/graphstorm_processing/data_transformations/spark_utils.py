@@ -259,3 +259,56 @@ def rename_multiple_cols(
         safe_new_cols.append(safe_new_name)
     mapping = dict(zip(old_cols, safe_new_cols))
     return df.select([F.col(c).alias(mapping.get(c, c)) for c in df.columns]), safe_new_cols
+
+
+def assign_contiguous_ids(input_df: DataFrame, id_col: str) -> Tuple[DataFrame, DataFrame]:
+    """Attach contiguous integer ids, starting at 0, to the rows of a DataFrame.
+
+    The ids follow the partition order of the DataFrame and the row order within
+    each partition, same as ``RDD.zipWithIndex``. Instead of round-tripping through
+    an RDD, we count the rows of every partition with a single aggregation and
+    add the prefix offset of each partition to the row position within it.
+
+    The partition and row positions are cached before counting, so that the
+    ids are consistent with the counts even when the input is non-deterministic,
+    e.g. the output of a shuffle. The cached DataFrame is returned along with
+    the result, and callers should ``unpersist()`` it once the ids have been
+    written out.
+
+    Parameters
+    ----------
+    input_df : DataFrame
+        The DataFrame to attach ids to.
+    id_col : str
+        The name of the new id column.
+
+    Returns
+    -------
+    Tuple[DataFrame, DataFrame]
+        The input DataFrame with an additional long column `id_col` with
+        values in ``[0, input_df.count())``, and the cached DataFrame it
+        is derived from.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    part_col = f"partition-id-{suffix}"
+    row_col = f"row-id-{suffix}"
+    # monotonically_increasing_id puts the partition id in the upper 31 bits and the
+    # position of the row within its partition in the lower 33 bits.
+    positions_df = input_df.select(
+        "*",
+        F.spark_partition_id().alias(part_col),
+        F.monotonically_increasing_id().bitwiseAND(F.lit((1 << 33) - 1)).alias(row_col),
+    ).cache()
+
+    part_counts = dict(positions_df.groupBy(part_col).count().collect())
+    num_partitions = max(part_counts.keys(), default=-1) + 1
+    offsets, offset = [], 0
+    for part_id in range(num_partitions):
+        offsets.append(offset)
+        offset += part_counts.get(part_id, 0)
+    offsets_col = F.array(*[F.lit(part_offset).cast("long") for part_offset in offsets or [0]])
+
+    ids_df = positions_df.withColumn(id_col, offsets_col[F.col(part_col)] + F.col(row_col)).drop(
+        part_col, row_col
+    )
+    return ids_df, positions_df
@@ -46,6 +46,15 @@ Script Parameters
 --do-repartition: str
     When set to true, we try to perform the row count alignment step on
     the Spark leader.
+--previous-output-prefix: str
+    S3 or local path prefix to the output of a previous GSProcessing run.
+    When provided, only the input files not processed by the previous runs
+    are processed, re-using the previous transformations and node id mappings.
+    The files of the previous output are copied to the output prefix, which
+    then contains the full graph.
+--engine: str
+    The processing engine, "spark" (default) or "arrow". The "arrow" engine
+    processes local data on a single host with PyArrow, without starting Spark.
 """
 
 import argparse
@@ -64,6 +73,9 @@ from typing import Any, Dict, Optional
 import boto3
 import botocore
 
+from graphstorm_processing.graph_loaders.arrow_heterogeneous_loader import (
+    ArrowHeterogeneousGraphLoader,
+)
 from graphstorm_processing.graph_loaders.dist_heterogeneous_loader import (
     DistHeterogeneousGraphLoader,
     HeterogeneousLoaderConfig,
@@ -71,7 +83,10 @@ from graphstorm_processing.graph_loaders.dist_heterogeneous_loader import (
 )
 from graphstorm_processing.config.config_parser import create_config_objects
 from graphstorm_processing.config.config_conversion import GConstructConfigConverter
-from graphstorm_processing.constants import TRANSFORMATIONS_FILENAME
+from graphstorm_processing.constants import (
+    PROCESSED_INPUT_FILES_FILENAME,
+    TRANSFORMATIONS_FILENAME,
+)
 from graphstorm_processing.data_transformations import spark_utils, s3_utils
 from graphstorm_processing.repartition_files import (
     repartition_files,
@@ -110,6 +125,14 @@ class ExecutorConfig:
         The name of the graph being processed. If not provided we use part of the input_prefix.
     do_repartition: bool
         Whether to apply repartitioning to the graph on the Spark leader.
+    previous_output_prefix: str, optional
+        Prefix for the output of a previous run. Can be S3 URI or local path.
+        When provided, only input files that the previous runs did not process
+        are processed, new node ids are appended to the previous mappings,
+        and the previous output files are copied to the output.
+    engine: str, optional
+        The processing engine, "spark" or "arrow". The "arrow" engine
+        runs on a single host without Spark and only supports local data.
     """
 
     local_config_path: str
@@ -123,6 +146,8 @@ class ExecutorConfig:
     add_reverse_edges: bool
     graph_name: Optional[str]
     do_repartition: bool
+    previous_output_prefix: Optional[str] = None
+    engine: str = "spark"
 
 
 @dataclasses.dataclass
@@ -137,6 +162,8 @@ class GSProcessingArguments:
     log_level: str
     graph_name: Optional[str]
     do_repartition: bool
+    previous_output_prefix: Optional[str]
+    engine: str
 
 
 class DistributedExecutor:
@@ -171,6 +198,10 @@ class DistributedExecutor:
             self.graph_name = derived_name
         check_graph_name(self.graph_name)
         self.repartition_on_leader = executor_config.do_repartition
+        self.previous_output_prefix = executor_config.previous_output_prefix
+        self.engine = executor_config.engine
+        if self.engine == "arrow" and self.filesystem_type != FilesystemType.LOCAL:
+            raise NotImplementedError("The arrow engine only supports local input and output.")
         # Input config dict using GSProcessing schema
         self.gsp_config_dict = {}
 
@@ -247,11 +278,22 @@ class DistributedExecutor:
             converter = GConstructConfigConverter()
             self.gsp_config_dict = converter.convert_to_gsprocessing(dataset_config_dict)["graph"]
 
-        # Create the Spark session for execution
-        self.spark = spark_utils.create_spark_session(self.execution_env, self.filesystem_type)
+        # Input files processed by this and previous runs, as full paths
+        self.processed_input_files = set()
+        previous_metadata = None
+        gsp_config_to_process = self.gsp_config_dict
+        if self.previous_output_prefix:
+            previous_metadata = self._prepare_incremental_run()
+            gsp_config_to_process = self._filter_processed_files(self.gsp_config_dict)
+
+        # Create the Spark session for execution, the arrow engine runs without Spark
+        if self.engine == "arrow":
+            self.spark = None
+        else:
+            self.spark = spark_utils.create_spark_session(self.execution_env, self.filesystem_type)
 
         # Initialize the graph loader
-        data_configs = create_config_objects(self.gsp_config_dict)
+        data_configs = create_config_objects(gsp_config_to_process)
         loader_config = HeterogeneousLoaderConfig(
             add_reverse_edges=self.add_reverse_edges,
             data_configs=data_configs,
@@ -263,12 +305,114 @@ class DistributedExecutor:
             num_output_files=self.num_output_files,
             output_prefix=self.output_prefix,
             precomputed_transformations=self.precomputed_transformations,
+            previous_output_prefix=self.previous_output_prefix,
+            previous_metadata=previous_metadata,
         )
 
-        self.loader = DistHeterogeneousGraphLoader(
-            self.spark,
-            loader_config,
-        )
+        if self.engine == "arrow":
+            self.loader = ArrowHeterogeneousGraphLoader(loader_config)
+        else:
+            self.loader = DistHeterogeneousGraphLoader(
+                self.spark,
+                loader_config,
+            )
+
+    def _read_previous_output_json(self, filename: str) -> Optional[dict]:
+        """Reads a JSON file from the previous output prefix, returns None if it does not exist."""
+        prefix = s3_utils.s3_path_remove_trailing(self.previous_output_prefix)
+        if self.filesystem_type == FilesystemType.LOCAL:
+            file_path = os.path.join(prefix, filename)
+            if not os.path.exists(file_path):
+                return None
+            with open(file_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        bucket, key_prefix = s3_utils.extract_bucket_and_key(prefix)
+        try:
+            response = boto3.client("s3").get_object(Bucket=bucket, Key=f"{key_prefix}/{filename}")
+        except botocore.exceptions.ClientError:  # type: ignore
+            return None
+        return json.loads(response["Body"].read())
+
+    def _prepare_incremental_run(self) -> dict:
+        """Loads the state of the previous run needed to process new input files.
+
+        Populates the set of processed input files, falls back to the previous
+        pre-computed transformations if the input does not provide any, and
+        returns the output metadata of the previous run.
+        """
+        prefix = s3_utils.s3_path_remove_trailing(self.previous_output_prefix)
+        if prefix == s3_utils.s3_path_remove_trailing(self.output_prefix):
+            raise ValueError(
+                "The output prefix of an incremental run needs to differ from "
+                f"the previous output prefix, got {prefix} for both"
+            )
+        # Prefer the metadata of the re-partitioned files, if the previous run created them
+        previous_metadata = self._read_previous_output_json(
+            "updated_row_counts_metadata.json"
+        ) or self._read_previous_output_json("metadata.json")
+        if previous_metadata is None:
+            raise RuntimeError(f"Could not find metadata.json under {prefix}")
+
+        previous_files = self._read_previous_output_json(PROCESSED_INPUT_FILES_FILENAME)
+        if previous_files is None:
+            # The previous data are part of the output, so they must not be processed again
+            raise RuntimeError(
+                f"Could not find {PROCESSED_INPUT_FILES_FILENAME} under {prefix}, "
+                "cannot determine the new input files"
+            )
+        self.processed_input_files.update(previous_files)
+
+        if not self.precomputed_transformations:
+            previous_transformations = self._read_previous_output_json(TRANSFORMATIONS_FILENAME)
+            if previous_transformations:
+                logging.info("Re-using the transformations of the previous run under %s", prefix)
+                self.precomputed_transformations = previous_transformations
+
+        return previous_metadata
+
+    def _filter_processed_files(self, gsp_config_dict: dict) -> dict:
+        """Returns a copy of the config that only contains input files not processed before.
+
+        Node and edge configurations without any new files are removed.
+        """
+        input_prefix = s3_utils.s3_path_remove_trailing(self.input_prefix)
+        config_copy = copy.deepcopy(gsp_config_dict)
+        for structure_key in ("nodes", "edges"):
+            new_structure_dicts = []
+            for structure_dict in config_copy.get(structure_key, []):
+                new_files = [
+                    input_file
+                    for input_file in structure_dict["data"]["files"]
+                    if f"{input_prefix}/{input_file}" not in self.processed_input_files
+                ]
+                if new_files:
+                    structure_dict["data"]["files"] = new_files
+                    new_structure_dicts.append(structure_dict)
+            if structure_key in config_copy:
+                config_copy[structure_key] = new_structure_dicts
+            logging.info(
+                "Incremental run: %d %s configurations have new files",
+                len(new_structure_dicts),
+                structure_key,
+            )
+        return config_copy
+
+    def _write_processed_input_files(self) -> None:
+        """Writes the full paths of all input files processed up to and including this run."""
+        input_prefix = s3_utils.s3_path_remove_trailing(self.input_prefix)
+        processed_files = set(self.processed_input_files)
+        for structure_key in ("nodes", "edges"):
+            for structure_dict in self.gsp_config_dict.get(structure_key, []):
+                processed_files.update(
+                    f"{input_prefix}/{input_file}" for input_file in structure_dict["data"]["files"]
+                )
+        with open(
+            os.path.join(self.local_metadata_output_path, PROCESSED_INPUT_FILES_FILENAME),
+            "w",
+            encoding="utf-8",
+        ) as f:
+            json.dump(sorted(processed_files), f, indent=4)
 
     def _upload_output_files(self, loader: DistHeterogeneousGraphLoader, force=False):
         """Upload output files to S3
@@ -311,7 +455,8 @@ class DistributedExecutor:
         t1 = time.time()
         logging.info("Time to transform data for distributed partitioning: %s sec", t1 - t0)
         # Stop the Spark context
-        self.spark.stop()
+        if self.spark:
+            self.spark.stop()
 
         all_match = verify_metadata_match(graph_meta_dict)
         repartitioner = ParquetRepartitioner(
@@ -395,6 +540,8 @@ class DistributedExecutor:
             )
             json.dump(input_dict_with_transforms, f, indent=4)
 
+        self._write_processed_input_files()
+
         # This is used to upload the output output JSON files to S3 on non-SageMaker runs,
         # since we can't rely on SageMaker to do it
         if self.filesystem_type == FilesystemType.S3:
@@ -578,6 +725,29 @@ def parse_args() -> argparse.Namespace:
         ),
     )
 
+    parser.add_argument(
+        "--previous-output-prefix",
+        type=str,
+        default=None,
+        help=(
+            "Output prefix of a previous run on an earlier version of the input data. "
+            "When provided, only new input files are processed, re-using the previous "
+            "transformations and appending new node ids to the previous node id mappings. "
+            "The previous output files are copied to the output prefix, which then contains "
+            "the full graph."
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default="spark",
+        choices=["spark", "arrow"],
+        help=(
+            "The processing engine. 'arrow' processes local data on a single host "
+            "with PyArrow, without starting Spark, for graphs that fit in memory."
+        ),
+    )
+
     return parser.parse_args()
 
 
@@ -715,6 +885,8 @@ def main():
         add_reverse_edges=gsprocessing_args.add_reverse_edges,
         graph_name=gsprocessing_args.graph_name,
         do_repartition=gsprocessing_args.do_repartition,
+        previous_output_prefix=gsprocessing_args.previous_output_prefix,
+        engine=gsprocessing_args.engine,
     )
 
     dist_executor = DistributedExecutor(executor_configuration)
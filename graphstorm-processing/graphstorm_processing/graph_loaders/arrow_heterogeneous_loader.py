@@ -0,0 +1,936 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License").
+You may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Single-host graph loader that runs the GSProcessing pipeline with PyArrow
+instead of Spark, for graphs that fit in the memory of one instance.
+
+The loader accepts the same configuration and produces the same output
+layout and metadata as ``DistHeterogeneousGraphLoader``, so its output
+can be used by gs-repartition and the partitioning step unchanged.
+"""
+
+import dataclasses
+import logging
+import math
+import os
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
+from pyarrow import dataset as ds
+from numpy.random import default_rng
+from pyspark.sql.types import DoubleType, StructType
+
+from graphstorm_processing.config.config_parser import (
+    EdgeConfig,
+    NodeConfig,
+    StructureConfig,
+)
+from graphstorm_processing.config.feature_config_base import FeatureConfig
+from graphstorm_processing.config.label_config_base import LabelConfig
+from graphstorm_processing.constants import (
+    COLUMN_NAME,
+    MAX_VALUE,
+    MIN_VALUE,
+    VALUE_COUNTS,
+    FilesystemType,
+)
+from graphstorm_processing.data_transformations.arrow_feature_transformer import (
+    SUPPORTED_FEATURE_TYPES,
+    ArrowFeatureTransformer,
+    ArrowMultiCategoryTransformation,
+)
+from graphstorm_processing.data_transformations.dist_label_loader import (
+    CustomSplit,
+    SplitRates,
+)
+
+from . import schema_utils
+from .dist_heterogeneous_loader import (
+    NODE_MAPPING_INT,
+    NODE_MAPPING_STR,
+    DistHeterogeneousGraphLoader,
+    HeterogeneousLoaderConfig,
+)
+
+PROBLEMATIC_CHARS = {" ", ",", ";", "{", "}", "(", ")", "=", "\n", "\t"}
+
+
+class ArrowHeterogeneousGraphLoader(DistHeterogeneousGraphLoader):
+    """
+    A graph loader that processes a heterogeneous graph on a single host, without Spark.
+
+    Each node and edge type is read into memory as a PyArrow Table and
+    its features are transformed concurrently by a pool of worker threads,
+    as PyArrow and numpy release the GIL for their compute kernels.
+    All outputs of a type are written in the order of the input rows,
+    split into the same number of files, so their row counts always match.
+
+    Parameters
+    ----------
+    loader_config : HeterogeneousLoaderConfig
+        Configuration object for the loader. If ``num_output_files`` is not set
+        we create one file per CPU for each output.
+    num_workers : Optional[int]
+        The number of threads that transform features concurrently,
+        defaults to the number of CPUs.
+
+    Raises
+    ------
+    NotImplementedError
+        If the input is on S3, the run is incremental,
+        or the configuration uses a transformation that is only supported by the Spark engine.
+    """
+
+    def __init__(
+        self,
+        loader_config: HeterogeneousLoaderConfig,
+        num_workers: Optional[int] = None,
+    ):
+        if not loader_config.num_output_files or loader_config.num_output_files <= 0:
+            loader_config = dataclasses.replace(loader_config, num_output_files=os.cpu_count() or 1)
+        super().__init__(None, loader_config)
+
+        if self.filesystem_type != FilesystemType.LOCAL:
+            raise NotImplementedError(
+                "The Arrow engine only supports local input and output, use the Spark engine "
+                "to process data on S3."
+            )
+        if self.previous_node_mapping_paths:
+            raise NotImplementedError(
+                "The Arrow engine does not support incremental runs, use the Spark engine instead."
+            )
+        for structure_configs in self._data_configs.values():
+            for structure_config in structure_configs:
+                for feat_conf in structure_config.feature_configs or []:
+                    if feat_conf.feat_type not in SUPPORTED_FEATURE_TYPES:
+                        raise NotImplementedError(
+                            f"Feature {feat_conf.feat_name} has type: {feat_conf.feat_type} "
+                            "that is not supported by the Arrow engine, use the Spark engine "
+                            "instead."
+                        )
+
+        self.num_workers = num_workers or os.cpu_count() or 1
+        # Mapping from node type to the node string ids, the position of each id is its int id
+        self.node_id_arrays: dict[str, pa.Array] = {}
+
+    def _num_files(self, num_rows: int) -> int:
+        """The number of files to write for an output with ``num_rows`` rows."""
+        return max(1, min(self.num_output_files, num_rows))
+
+    def _write_table(self, table: pa.Table, out_path: str) -> dict:
+        """Writes a table under ``out_path`` and returns its metadata entry.
+
+        Column names that are invalid in Parquet are replaced, and the
+        substitutions recorded in ``self.column_substitutions``.
+        """
+        new_names = []
+        for column in table.column_names:
+            new_column = column
+            if PROBLEMATIC_CHARS.intersection(column):
+                for pchar in PROBLEMATIC_CHARS:
+                    new_column = new_column.replace(pchar, "_")
+                self.column_substitutions[column] = new_column
+            new_names.append(new_column)
+        path_list = self._write_pyarrow_table(
+            table.rename_columns(new_names), out_path, num_files=self._num_files(len(table))
+        )
+        return self._create_metadata_entry(path_list)
+
+    def _read_input_table(
+        self,
+        structure_config: StructureConfig,
+        file_schema: Optional[StructType],
+        columns: Optional[Sequence[str]] = None,
+    ) -> pa.Table:
+        """Reads the files of a node or edge type into a single table.
+
+        CSV files are parsed following RFC 4180, with the column types
+        the Spark engine casts the CSV columns to.
+
+        Parameters
+        ----------
+        structure_config : StructureConfig
+            The node or edge configuration object.
+        file_schema : Optional[StructType]
+            The typed schema of the CSV files, created by ``schema_utils``.
+        columns : Optional[Sequence[str]]
+            The columns to read, by default the columns of the schema for
+            CSV files and all columns for Parquet files.
+
+        Returns
+        -------
+        pa.Table
+            The rows of all the input files, in file order.
+        """
+        file_paths = []
+        for input_file in structure_config.files:
+            file_path = os.path.join(self.input_prefix, input_file)
+            if os.path.isdir(file_path):
+                file_paths.extend(
+                    os.path.join(file_path, f)
+                    for f in sorted(os.listdir(file_path))
+                    if not f.startswith((".", "_"))
+                )
+            else:
+                file_paths.append(file_path)
+
+        if structure_config.format == "csv":
+            assert file_schema is not None, "A schema is needed to read CSV files"
+            column_types = {
+                field.name: pa.float64() if isinstance(field.dataType, DoubleType) else pa.string()
+                for field in file_schema.fields
+            }
+            file_format = ds.CsvFileFormat(
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=structure_config.separator or ",",
+                    quote_char='"',
+                    double_quote=True,
+                    newlines_in_values=True,
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=column_types,
+                    null_values=[""],
+                    strings_can_be_null=True,
+                ),
+            )
+            columns = columns or list(column_types)
+        else:
+            file_format = ds.ParquetFileFormat()
+
+        return ds.dataset(file_paths, format=file_format).to_table(columns=columns)
+
+    def _read_edge_table(
+        self, edge_config: EdgeConfig, columns: Optional[Sequence[str]] = None
+    ) -> pa.Table:
+        file_schema = (
+            schema_utils.parse_edge_file_schema(edge_config)
+            if edge_config.format == "csv"
+            else None
+        )
+        return self._read_input_table(edge_config, file_schema, columns)
+
+    @staticmethod
+    def _cast_ids(node_ids: pa.ChunkedArray, id_type: pa.DataType) -> pa.ChunkedArray:
+        """Casts node ids to the type of a node id mapping, if needed."""
+        if node_ids.type != id_type:
+            return pc.cast(node_ids, id_type)
+        return node_ids
+
+    def _write_node_ids_and_update_state(self, node_ids: pa.Array, node_type: str) -> None:
+        """Writes the mapping of a node type and keeps its node ids in memory.
+
+        The int id of each node is its position in ``node_ids``.
+        """
+        mapping_table = pa.table(
+            {
+                NODE_MAPPING_STR: node_ids,
+                NODE_MAPPING_INT: pa.array(np.arange(len(node_ids), dtype=np.int64)),
+            }
+        )
+        mapping_entry = self._write_table(
+            mapping_table, f"{self.output_prefix}/raw_id_mappings/{node_type}"
+        )
+        self.node_mapping_paths[node_type] = mapping_entry["data"]
+        self.node_id_arrays[node_type] = node_ids
+
+    def create_node_id_maps_from_edges(
+        self,
+        edge_configs: Sequence[EdgeConfig],
+        missing_node_types: Optional[set[str]] = None,
+    ) -> None:
+        """Creates node id mappings for the node types without node files from the edges.
+
+        Only the node id columns are read from the edge files. Node ids
+        get int ids in the order they first appear in the edges.
+        """
+        if missing_node_types is None:
+            missing_node_types = set()
+        node_type_to_ids = defaultdict(list)  # type: Dict[str, list[pa.ChunkedArray]]
+        for edge_config in edge_configs:
+            node_cols = {
+                ntype: ncol
+                for ntype, ncol in [
+                    (edge_config.src_ntype, edge_config.src_col),
+                    (edge_config.dst_ntype, edge_config.dst_col),
+                ]
+                if ntype in missing_node_types
+            }
+            if not node_cols:
+                continue
+            edges_table = self._read_edge_table(
+                edge_config, columns=[edge_config.src_col, edge_config.dst_col]
+            )
+            for ntype, ncol in [
+                (edge_config.src_ntype, edge_config.src_col),
+                (edge_config.dst_ntype, edge_config.dst_col),
+            ]:
+                if ntype in node_cols:
+                    node_ids = edges_table.column(ncol)
+                    if self.enable_assertions and node_ids.null_count > 0:
+                        raise ValueError(
+                            f"Found {node_ids.null_count} null values in node column {ncol}"
+                            " while extracting node ids from incoming edges structure "
+                            f"with cols: {edges_table.column_names}"
+                        )
+                    node_type_to_ids[ntype].append(node_ids)
+
+        for ntype, id_columns in node_type_to_ids.items():
+            logging.info(
+                "Creating mapping for node type '%s' from %d edge columns...",
+                ntype,
+                len(id_columns),
+            )
+            id_type = id_columns[0].type
+            all_ids = pa.chunked_array(
+                [
+                    chunk
+                    for id_column in id_columns
+                    for chunk in self._cast_ids(id_column, id_type).chunks
+                ],
+                type=id_type,
+            )
+            unique_ids = pc.unique(pc.drop_null(all_ids))
+            self._write_node_ids_and_update_state(unique_ids, ntype)
+
+    def process_node_data(self, node_configs: Sequence[NodeConfig]) -> Dict:
+        """Processes the features and labels of each node type and writes them to storage.
+
+        Returns
+        -------
+        Dict
+            A dict entry for the node_data key of the output metadata.json.
+        """
+        node_data_dict = {}  # type: Dict[str, Dict]
+        self.graph_info["nfeat_size"] = {}
+        self.graph_info["ntype_label"] = []
+        self.graph_info["ntype_label_property"] = []
+        self.graph_info["ntype_to_label_masks"] = defaultdict(list)
+        for node_config in node_configs:
+            node_type = node_config.ntype
+            node_col = node_config.node_col
+            logging.info(
+                "Processing data for node type %s with config: %s",
+                node_type,
+                node_config,
+            )
+
+            read_nodefile_start = perf_counter()
+            file_schema = (
+                schema_utils.parse_node_file_schema(node_config)
+                if node_config.format == "csv"
+                else None
+            )
+            nodes_table = self._read_input_table(node_config, file_schema)
+            self.timers["node_read_file"] += perf_counter() - read_nodefile_start
+
+            node_id_map_start_time = perf_counter()
+            if node_type in self.node_id_arrays:
+                logging.warning(
+                    "Encountered node type '%s' that already has "
+                    "a mapping, skipping map creation",
+                    node_type,
+                )
+                # Align the node rows with the existing mapping, same as the left join
+                # of the mapping with the nodes in the Spark engine
+                node_ids = self.node_id_arrays[node_type]
+                row_indices = pc.index_in(
+                    node_ids,
+                    value_set=self._cast_ids(
+                        nodes_table.column(node_col), node_ids.type
+                    ).combine_chunks(),
+                )
+                if self.enable_assertions:
+                    assert len(nodes_table) == len(node_ids), (
+                        f"Nodes table count ({len(nodes_table)}) does not match "
+                        f"mapping count ({len(node_ids)})"
+                    )
+                nodes_table = nodes_table.take(row_indices)
+            else:
+                logging.info("Creating node str-to-int mapping for node type: %s", node_type)
+                node_ids = nodes_table.column(node_col).combine_chunks()
+                self._write_node_ids_and_update_state(node_ids, node_type)
+            self.timers["node_map_creation"] += perf_counter() - node_id_map_start_time
+
+            node_type_metadata_dicts = {}
+            if node_config.feature_configs is not None:
+                process_node_features_start = perf_counter()
+                node_type_feature_metadata, ntype_feat_sizes = self._process_features(
+                    node_config.feature_configs, nodes_table, "node_features", node_type
+                )
+                self.graph_info["nfeat_size"].update({node_type: ntype_feat_sizes})
+                node_type_metadata_dicts.update(node_type_feature_metadata)
+                self.timers["_process_node_features"] += (
+                    perf_counter() - process_node_features_start
+                )
+            if node_config.label_configs is not None:
+                process_node_labels_start = perf_counter()
+                node_type_label_metadata = self._process_node_label_table(
+                    node_config.label_configs, nodes_table, node_type, node_ids
+                )
+                node_type_metadata_dicts.update(node_type_label_metadata)
+                self._add_node_label_graph_info(node_type, node_config.label_configs)
+                self.timers["_process_node_labels"] += perf_counter() - process_node_labels_start
+
+            if node_type_metadata_dicts:
+                if node_type in node_data_dict:
+                    node_data_dict[node_type].update(node_type_metadata_dicts)
+                else:
+                    node_data_dict[node_type] = node_type_metadata_dicts
+
+        logging.info("Finished processing node features")
+        return node_data_dict
+
+    def _transform_and_write_feature(
+        self, feat_conf: FeatureConfig, input_table: pa.Table, out_prefix: str, json_repr: dict
+    ) -> Tuple[dict, int, dict, str, float]:
+        """Transforms a single feature and writes it to storage, runs in a worker thread.
+
+        Returns
+        -------
+        Tuple[dict, int, dict, str, float]
+            The metadata entry of the feature, its size, the JSON representation
+            of its transformation, the transformation name and the time it took.
+        """
+        start = perf_counter()
+        transformer = ArrowFeatureTransformer(feat_conf, json_repr)
+        transformed_table, json_repr = transformer.apply_transformation(input_table)
+        feat_values = transformed_table.column(feat_conf.cols[0])
+        if pa.types.is_list(feat_values.type):
+            feat_size = pc.max(pc.list_value_length(feat_values)).as_py() or 0
+        else:
+            feat_size = 1
+        feat_meta = self._write_table(
+            pa.table({feat_conf.feat_name: feat_values}), f"{out_prefix}-{feat_conf.feat_name}"
+        )
+        return (
+            feat_meta,
+            feat_size,
+            json_repr,
+            transformer.get_transformation_name(),
+            perf_counter() - start,
+        )
+
+    def _process_features(
+        self,
+        feature_configs: Sequence[FeatureConfig],
+        input_table: pa.Table,
+        features_key: str,
+        type_name: str,
+    ) -> Tuple[Dict, Dict]:
+        """Transforms the features of a node or edge type concurrently and writes them to storage.
+
+        Parameters
+        ----------
+        feature_configs : Sequence[FeatureConfig]
+            The feature configuration objects of the type.
+        input_table : pa.Table
+            The table that contains the feature columns.
+        features_key : str
+            "node_features" or "edge_features", the key of the type's
+            transformations in the transformation representations.
+        type_name : str
+            The node or edge type name.
+
+        Returns
+        -------
+        Tuple[Dict, Dict]
+            The output metadata of each feature and the size of each feature,
+            with feature names as keys.
+        """
+        if features_key == "node_features":
+            out_prefix = os.path.join(self.output_prefix, f"node_data/{type_name}")
+        else:
+            out_prefix = os.path.join(
+                self.output_prefix, f"edge_data/{type_name.replace(':', '_')}"
+            )
+
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = []
+            for feat_conf in feature_configs:
+                # The representation is not empty iff there exists a pre-computed
+                # transformation for this feature name and type
+                json_representation = (
+                    self.pre_computed_transformations.get(features_key, {})
+                    .get(type_name, {})
+                    .get(feat_conf.feat_name, {})
+                )
+                if json_representation:
+                    logging.info(
+                        "Will apply pre-computed transformation for feature: %s",
+                        feat_conf.feat_name,
+                    )
+                futures.append(
+                    executor.submit(
+                        self._transform_and_write_feature,
+                        feat_conf,
+                        input_table,
+                        out_prefix,
+                        json_representation,
+                    )
+                )
+
+            feature_metadata = {}
+            feat_sizes = {}  # type: Dict[str, int]
+            for feat_conf, future in zip(feature_configs, futures):
+                feat_meta, feat_size, json_representation, transformation_name, duration = (
+                    future.result()
+                )
+                feat_name = feat_conf.feat_name
+                feature_metadata[feat_name] = feat_meta
+                feat_sizes[feat_name] = feat_size
+                if json_representation:
+                    self.transformation_representations[features_key][type_name][
+                        feat_name
+                    ] = json_representation
+                self.timers[f"{transformation_name}-{type_name}-{feat_name}"] = duration
+
+        return feature_metadata, feat_sizes
+
+    def _transform_label(self, label_conf: LabelConfig, input_table: pa.Table) -> pa.Array:
+        """Transforms a label column like ``DistLabelLoader``.
+
+        Single-label classification labels become int64 indices ordered by
+        descending frequency, multi-label ones multi-hot vectors and regression
+        labels are kept as-is. Sets ``graph_info["label_map"]`` for classification.
+        """
+        label_col = label_conf.label_column
+        labels = input_table.column(label_col)
+        if label_conf.task_type == "classification":
+            if label_conf.multilabel:
+                assert label_conf.separator
+                label_transformer = ArrowMultiCategoryTransformation(
+                    [label_col], label_conf.separator
+                )
+                transformed_label = label_transformer.apply(input_table).column(label_col)
+                self.graph_info["label_map"] = label_transformer.value_map
+                return transformed_label
+            str_labels = pc.cast(labels, pa.string())
+            label_counts = Counter(
+                dict(zip(*[field.to_pylist() for field in pc.value_counts(str_labels).flatten()]))
+            )
+            label_counts.pop(None, None)
+            # Same order as a StringIndexer with frequencyDesc order
+            label_list = sorted(label_counts, key=lambda label: (-label_counts[label], label))
+            self.graph_info["label_map"] = {label: idx for idx, label in enumerate(label_list)}
+            return pc.cast(
+                pc.index_in(str_labels, value_set=pa.array(label_list, type=pa.string())),
+                pa.int64(),
+            )
+        if label_conf.task_type == "regression":
+            if not (pa.types.is_integer(labels.type) or pa.types.is_floating(labels.type)):
+                raise RuntimeError(
+                    "Data type for regression should be a NumericType, "
+                    f"got {labels.type} for {label_col}"
+                )
+            return labels
+        raise RuntimeError(f"Unknown label task type {label_conf.task_type} for type: {label_col}")
+
+    def _process_node_label_table(
+        self,
+        label_configs: Sequence[LabelConfig],
+        nodes_table: pa.Table,
+        node_type: str,
+        node_ids: pa.Array,
+    ) -> Dict:
+        """Transforms the labels of a node type, creates their split masks and writes both."""
+        node_type_label_metadata = {}
+        for label_conf in label_configs:
+            self.graph_info["task_type"] = (
+                "node_class" if label_conf.task_type == "classification" else "node_regression"
+            )
+            self.graph_info["is_multilabel"] = label_conf.multilabel
+            logging.info(
+                "Processing label data for node type %s, label col: %s...",
+                node_type,
+                label_conf.label_column,
+            )
+            transformed_label = self._transform_label(label_conf, nodes_table)
+            if label_conf.task_type != "classification":
+                self.graph_info["label_map"] = {}
+            node_type_label_metadata[label_conf.label_column] = self._write_table(
+                pa.table({label_conf.label_column: transformed_label}),
+                f"{self.output_prefix}/node_data/{node_type}-label-{label_conf.label_column}",
+            )
+
+            self._update_label_properties(node_type, nodes_table, label_conf)
+
+            split_rates, custom_split_filenames = self._parse_split_configs(label_conf)
+            node_type_label_metadata.update(
+                self._create_split_files(
+                    nodes_table,
+                    label_conf.label_column,
+                    split_rates,
+                    f"{self.output_prefix}/node_data/{node_type}",
+                    custom_split_filenames,
+                    mask_field_names=label_conf.mask_field_names,
+                    id_columns=[node_ids],
+                )
+            )
+
+        return node_type_label_metadata
+
+    def _process_single_edge(
+        self, edge_config: EdgeConfig, edge_data_dict: dict, edge_structure_dict: dict
+    ):
+        """Processes a single edge type, including writing the edge structure and data.
+
+        Updates ``edge_data_dict`` and ``edge_structure_dict`` dicts in-place.
+        """
+        read_edges_start = perf_counter()
+        edges_table = self._read_edge_table(edge_config)
+        edge_type = (
+            f"{edge_config.src_ntype}:"
+            f"{edge_config.get_relation_name()}:"
+            f"{edge_config.dst_ntype}"
+        )
+        reverse_edge_type = (
+            f"{edge_config.dst_ntype}:"
+            f"{edge_config.get_relation_name()}-rev:"
+            f"{edge_config.src_ntype}"
+        )
+        logging.info("Processing edge type '%s'...", edge_type)
+
+        # Convert the node str ids to int ids through their positions in the mappings
+        src_node_ids = self.node_id_arrays[edge_config.src_ntype]
+        dst_node_ids = self.node_id_arrays[edge_config.dst_ntype]
+        src_int_ids = pc.index_in(
+            self._cast_ids(edges_table.column(edge_config.src_col), src_node_ids.type),
+            value_set=src_node_ids,
+        )
+        dst_int_ids = pc.index_in(
+            self._cast_ids(edges_table.column(edge_config.dst_col), dst_node_ids.type),
+            value_set=dst_node_ids,
+        )
+        # Drop edges with node ids missing from the mappings, like the inner joins in Spark
+        valid_edges = pc.and_(pc.is_valid(src_int_ids), pc.is_valid(dst_int_ids))
+        num_valid_edges = pc.sum(valid_edges).as_py() or 0
+        if num_valid_edges < len(edges_table):
+            logging.warning(
+                "Dropping %d edges of type '%s' with node ids missing from the node mappings",
+                len(edges_table) - num_valid_edges,
+                edge_type,
+            )
+            edges_table = edges_table.filter(valid_edges)
+            src_int_ids = src_int_ids.filter(valid_edges)
+            dst_int_ids = dst_int_ids.filter(valid_edges)
+        src_int_ids = pc.cast(src_int_ids, pa.int64())
+        dst_int_ids = pc.cast(dst_int_ids, pa.int64())
+
+        logging.info("Writing edge structure for edge type %s...", edge_type)
+        edge_structure_dict[edge_type] = self._write_table(
+            pa.table({"src_int_id": src_int_ids, "dst_int_id": dst_int_ids}),
+            os.path.join(self.output_prefix, f"edges/{edge_type.replace(':', '_')}"),
+        )
+        if self.add_reverse_edges:
+            logging.info("Writing edge structure for reverse edge type %s...", reverse_edge_type)
+            edge_structure_dict[reverse_edge_type] = self._write_table(
+                pa.table({"dst_int_id": dst_int_ids, "src_int_id": src_int_ids}),
+                os.path.join(self.output_prefix, f"edges/{reverse_edge_type.replace(':', '_')}"),
+            )
+        self.timers["read_edges_and_write_structure"] += perf_counter() - read_edges_start
+
+        if edge_config.feature_configs is None and edge_config.label_configs is None:
+            logging.info("No features or labels for edge type: %s", edge_type)
+            return
+
+        edge_type_metadata_dicts = {}
+        if edge_config.feature_configs is not None:
+            edge_feature_start = perf_counter()
+            edge_feature_metadata_dicts, etype_feat_sizes = self._process_features(
+                edge_config.feature_configs, edges_table, "edge_features", edge_type
+            )
+            self.graph_info["efeat_size"].update({edge_type: etype_feat_sizes})
+            edge_type_metadata_dicts.update(edge_feature_metadata_dicts)
+            self.timers["_process_edge_features"] += perf_counter() - edge_feature_start
+
+        if edge_config.label_configs is not None:
+            if edge_config.rel_col:
+                raise NotImplementedError(
+                    "Currently we do not support loading edge "
+                    "labels with multiple edge relation types"
+                )
+            edge_label_start = perf_counter()
+            label_metadata_dicts = self._process_edge_label_table(
+                edge_config.label_configs,
+                edges_table,
+                edge_type,
+                edge_config.rel_type,
+                id_columns=[
+                    edges_table.column(edge_config.src_col),
+                    edges_table.column(edge_config.dst_col),
+                ],
+            )
+            edge_type_metadata_dicts.update(label_metadata_dicts)
+            self._add_edge_label_graph_info(edge_type, reverse_edge_type, edge_config.label_configs)
+            if self.add_reverse_edges:
+                # For reverse edges only the label metadata
+                # (labels + split masks) are relevant.
+                edge_data_dict[reverse_edge_type] = label_metadata_dicts
+            self.timers["_process_edge_labels"] += perf_counter() - edge_label_start
+
+        if edge_type_metadata_dicts:
+            edge_data_dict[edge_type] = edge_type_metadata_dicts
+
+    def _process_edge_label_table(
+        self,
+        label_configs: Sequence[LabelConfig],
+        edges_table: pa.Table,
+        edge_type: str,
+        rel_type_prefix: str,
+        id_columns: Optional[Sequence[pa.ChunkedArray]] = None,
+    ) -> Dict:
+        """Transforms the labels of an edge type, creates their split masks and writes both.
+
+        ``id_columns`` are the source and destination string ids of the edges,
+        used to match the edges of custom split files.
+        """
+        label_metadata_dicts = {}
+        for label_conf in label_configs:
+            if label_conf.task_type != "link_prediction":
+                self.graph_info["task_type"] = (
+                    "edge_class" if label_conf.task_type == "classification" else "edge_regression"
+                )
+                if label_conf.task_type == "classification":
+                    self.graph_info["is_multilabel"] = label_conf.multilabel
+                logging.info(
+                    "Processing edge label(s) '%s' for edge type '%s'...",
+                    label_conf.label_column,
+                    edge_type,
+                )
+                transformed_label = self._transform_label(label_conf, edges_table)
+                label_metadata_dicts[label_conf.label_column] = self._write_table(
+                    pa.table({label_conf.label_column: transformed_label}),
+                    os.path.join(
+                        self.output_prefix,
+                        f"edge_data/{edge_type.replace(':', '_')}-label-{rel_type_prefix}",
+                    ),
+                )
+                self._update_label_properties(edge_type, edges_table, label_conf)
+            else:
+                self.graph_info["task_type"] = "link_prediction"
+                logging.info(
+                    "Skipping processing label for '%s' because task is link prediction",
+                    rel_type_prefix,
+                )
+
+            logging.info("Creating train/test/val split for edge type %s...", edge_type)
+            split_rates, custom_split_filenames = self._parse_split_configs(label_conf)
+            label_metadata_dicts.update(
+                self._create_split_files(
+                    edges_table,
+                    label_conf.label_column,
+                    split_rates,
+                    os.path.join(self.output_prefix, f"edge_data/{edge_type.replace(':', '_')}"),
+                    custom_split_filenames,
+                    mask_field_names=label_conf.mask_field_names,
+                    id_columns=id_columns,
+                )
+            )
+
+        return label_metadata_dicts
+
+    def _update_label_properties(
+        self,
+        node_or_edge_type: str,
+        original_labels: pa.Table,
+        label_config: LabelConfig,
+    ) -> None:
+        """Extracts and stores statistics about labels in ``self.label_properties``."""
+        label_col = label_config.label_column
+        if node_or_edge_type not in self.label_properties:
+            self.label_properties[node_or_edge_type] = Counter()
+        self.label_properties[node_or_edge_type][COLUMN_NAME] = label_col
+        labels = original_labels.column(label_col)
+
+        if label_config.task_type == "regression":
+            min_max = pc.min_max(labels)
+            current_min = self.label_properties[node_or_edge_type].get(MIN_VALUE, float("inf"))
+            current_max = self.label_properties[node_or_edge_type].get(MAX_VALUE, float("-inf"))
+            self.label_properties[node_or_edge_type][MIN_VALUE] = min(
+                current_min, min_max["min"].as_py()
+            )
+            self.label_properties[node_or_edge_type][MAX_VALUE] = max(
+                current_max, min_max["max"].as_py()
+            )
+        elif label_config.task_type == "classification":
+            if label_config.multilabel:
+                assert label_config.separator
+                labels = pc.list_flatten(
+                    pc.split_pattern(pc.cast(labels, pa.string()), label_config.separator)
+                )
+            value_counts = pc.value_counts(labels).flatten()
+            label_counts_dict: Counter = Counter(
+                dict(zip(value_counts[0].to_pylist(), value_counts[1].to_pylist()))
+            )
+            self.label_properties[node_or_edge_type][VALUE_COUNTS] = (
+                self.label_properties.get(VALUE_COUNTS, Counter()) + label_counts_dict
+            )
+        else:
+            raise RuntimeError(f"Invalid task type: {label_config.task_type}")
+
+    def _create_split_files(
+        self,
+        input_df: pa.Table,
+        label_column: str,
+        split_rates: Optional[SplitRates],
+        output_path: str,
+        custom_split_file: Optional[CustomSplit] = None,
+        seed: Optional[int] = None,
+        mask_field_names: Optional[tuple[str, str, str]] = None,
+        order_col=None,
+        id_columns: Optional[Sequence[pa.ChunkedArray]] = None,
+    ) -> Dict:
+        """Creates the train/val/test masks of a node or edge type and writes them to storage.
+
+        Parameters
+        ----------
+        input_df : pa.Table
+            The table of the nodes or edges, the masks follow its row order.
+        label_column : str
+            The name of the label column, rows with missing labels are excluded from all masks.
+            If an empty string, all rows are included in one of the masks.
+        split_rates : Optional[SplitRates]
+            The train/val/test split rates, by default 0.8:0.1:0.1.
+        output_path : str
+            The output path under which we write the masks.
+        custom_split_file : Optional[CustomSplit]
+            Custom split files that list the ids of the train/val/test nodes or edges.
+        seed : Optional[int]
+            An optional random seed for reproducibility.
+        mask_field_names : Optional[tuple[str, str, str]]
+            An optional tuple of field names to use for the split masks.
+        order_col
+            Unused, rows always keep the input order.
+        id_columns : Optional[Sequence[pa.ChunkedArray]]
+            The string ids of the rows, needed for custom splits: the node ids
+            for node types, the source and destination ids for edge types.
+
+        Returns
+        -------
+        Dict
+            The metadata dict elements for the train/val/test masks.
+        """
+        del order_col
+        mask_names = mask_field_names or ("train_mask", "val_mask", "test_mask")
+
+        if not custom_split_file:
+            masks = self._create_split_masks_split_rates(input_df, label_column, split_rates, seed)
+        else:
+            assert id_columns is not None, "Custom splits need the ids of the rows"
+            masks = self._create_split_masks_custom_split(custom_split_file, id_columns)
+
+        split_metadata = {}
+        for mask_name, mask_vals in zip(mask_names, masks):
+            split_metadata[mask_name] = self._write_table(
+                pa.table({mask_name: mask_vals}), f"{output_path}-{mask_name}"
+            )
+        return split_metadata
+
+    @staticmethod
+    def _create_split_masks_split_rates(
+        input_table: pa.Table,
+        label_column: str,
+        split_rates: Optional[SplitRates],
+        seed: Optional[int],
+    ) -> Sequence[np.ndarray]:
+        """Creates the train/val/test int8 masks by multinomial sampling with the split rates."""
+        if split_rates is None:
+            split_rates = SplitRates(train_rate=0.8, val_rate=0.1, test_rate=0.1)
+            logging.info(
+                "Split rate not provided for label column '%s', using split rates: %s",
+                label_column,
+                split_rates.tolist(),
+            )
+        elif math.fsum(split_rates.tolist()) != 1.0:
+            raise RuntimeError(f"Provided split rates  do not sum to 1: {split_rates}")
+
+        split_list = split_rates.tolist()
+        logging.info(
+            "Creating split files for label column '%s' with split rates: %s",
+            label_column,
+            split_list,
+        )
+        rng = default_rng(seed=seed)
+        # One-hot vectors indicating train/val/test membership
+        masks = rng.multinomial(1, split_list, size=len(input_table)).astype(np.int8)
+
+        if label_column:
+            labels = input_table.column(label_column)
+            missing = pc.is_null(labels, nan_is_null=True)
+            if not pa.types.is_floating(labels.type):
+                missing = pc.or_(
+                    missing,
+                    pc.is_in(pc.cast(labels, pa.string()), value_set=pa.array(["", "None", "NaN"])),
+                )
+            masks[missing.to_numpy(zero_copy_only=False)] = 0
+
+        return [masks[:, 0], masks[:, 1], masks[:, 2]]
+
+    def _create_split_masks_custom_split(
+        self, custom_split_file: CustomSplit, id_columns: Sequence[pa.ChunkedArray]
+    ) -> Sequence[np.ndarray]:
+        """Creates the train/val/test int8 masks of the rows whose ids are in the split files."""
+        if len(custom_split_file.mask_columns) != len(id_columns):
+            raise ValueError(
+                f"The number of column should be {len(id_columns)}, got columns: "
+                f"{custom_split_file.mask_columns}"
+            )
+        masks = []
+        for file_paths in [
+            custom_split_file.train,
+            custom_split_file.valid,
+            custom_split_file.test,
+        ]:
+            split_table = ds.dataset(
+                [os.path.join(self.input_prefix, file_path) for file_path in file_paths],
+                format="parquet",
+            ).to_table(columns=list(custom_split_file.mask_columns))
+            if len(id_columns) == 1:
+                # Custom split on node original ids
+                in_split = pc.is_in(
+                    id_columns[0],
+                    value_set=self._cast_ids(split_table.column(0), id_columns[0].type),
+                )
+            else:
+                # Custom split on edge (src, dst) original ids
+                rows_table = pa.table(
+                    {
+                        "src": id_columns[0],
+                        "dst": id_columns[1],
+                        "row": np.arange(len(id_columns[0]), dtype=np.int64),
+                    }
+                )
+                split_pairs = (
+                    pa.table(
+                        {
+                            "src": self._cast_ids(split_table.column(0), id_columns[0].type),
+                            "dst": self._cast_ids(split_table.column(1), id_columns[1].type),
+                        }
+                    )
+                    .group_by(["src", "dst"])
+                    .aggregate([])
+                )
+                split_rows = rows_table.join(split_pairs, keys=["src", "dst"], join_type="inner")
+                in_split = np.zeros(len(rows_table), dtype=bool)
+                in_split[split_rows.column("row").to_numpy()] = True
+                in_split = pa.array(in_split)
+            masks.append(in_split.to_numpy(zero_copy_only=False).astype(np.int8))
+        return masks
@@ -43,6 +43,7 @@ from pyspark.sql.types import (
 )
 from pyspark.sql.functions import col, when, monotonically_increasing_id
 from numpy.random import default_rng
+from joblib import Parallel, delayed
 
 from graphstorm_processing.constants import (
     DATA_SPLIT_SET_MASK_COL,
@@ -112,6 +113,15 @@ class HeterogeneousLoaderConfig:
     precomputed_transformations: dict
         A dictionary describing precomputed transformations for the features
         of the graph.
+    previous_output_prefix: Optional[str]
+        The prefix to the output of a previous run. Can be an S3 URI
+        or an **absolute** local path.
+    previous_metadata: Optional[dict]
+        The output metadata of the previous run under ``previous_output_prefix``.
+        When provided, the loader runs incrementally: new node ids are
+        appended after the ids of the previous mappings, and the files of the
+        previous output are copied to the output, so that the output
+        describes the full graph.
     """
 
     add_reverse_edges: bool
@@ -124,6 +134,8 @@ class HeterogeneousLoaderConfig:
     num_output_files: int
     output_prefix: str
     precomputed_transformations: dict
+    previous_output_prefix: Optional[str] = None
+    previous_metadata: Optional[dict] = None
 
 
 @dataclass
@@ -260,6 +272,18 @@ class DistHeterogeneousGraphLoader(object):
         self.graph_name = loader_config.graph_name
         self.skip_train_masks = False
         self.pre_computed_transformations = loader_config.precomputed_transformations
+        self.previous_metadata = loader_config.previous_metadata or {}
+        # Mapping from node type to the full paths of the node mapping files of a previous run
+        self.previous_node_mapping_paths: dict[str, Sequence[str]] = {}
+        if self.previous_metadata:
+            assert loader_config.previous_output_prefix
+            self.previous_output_prefix = s3_utils.s3_path_remove_trailing(
+                loader_config.previous_output_prefix
+            )
+            self.previous_node_mapping_paths = {
+                ntype: [f"{self.previous_output_prefix}/{path}" for path in mapping_dict["data"]]
+                for ntype, mapping_dict in self.previous_metadata["raw_id_mappings"].items()
+            }
 
     def process_and_write_graph_data(
         self, data_configs: Mapping[str, Sequence[StructureConfig]]
@@ -333,6 +357,11 @@ class DistHeterogeneousGraphLoader(object):
         metadata_dict["edge_data"] = edge_data_dict
         metadata_dict["edges"] = edge_structure_dict
 
+        if self.previous_metadata:
+            merge_start_time = perf_counter()
+            metadata_dict = self._merge_previous_metadata(metadata_dict)
+            self.timers["_merge_previous_metadata"] = perf_counter() - merge_start_time
+
         # Ensure output dict has the correct order of keys
         for edge_type in metadata_dict["edge_type"]:
             metadata_dict["edges"][edge_type] = metadata_dict["edges"].pop(edge_type)
@@ -757,6 +786,148 @@ class DistHeterogeneousGraphLoader(object):
 
         return metadata_dict
 
+    def _merge_previous_metadata(self, metadata_dict: Dict) -> Dict:
+        """Carries the graph data of a previous run forward to the output of an incremental run.
+
+        The files of the previous output are copied under the output prefix, and are listed
+        before the files of this run for every node and edge type. The node id mappings of
+        node types that this run did not touch are copied as well, so the output describes
+        the full graph, and later incremental runs continue the ids of every node type.
+        Modifies the provided metadata_dict in-place and returns it.
+        """
+        previous_metadata = self.previous_metadata
+        for node_type, mapping_dict in previous_metadata["raw_id_mappings"].items():
+            if node_type not in self.node_mapping_paths:
+                self.node_mapping_paths[node_type] = self._copy_previous_files(mapping_dict["data"])
+        metadata_dict["node_type"] = sorted(
+            set(metadata_dict["node_type"]).union(previous_metadata["node_type"])
+        )
+        metadata_dict["edge_type"] = list(previous_metadata["edge_type"]) + [
+            edge_type
+            for edge_type in metadata_dict["edge_type"]
+            if edge_type not in previous_metadata["edge_type"]
+        ]
+
+        for edge_type, edge_dict in previous_metadata["edges"].items():
+            metadata_dict["edges"][edge_type] = self._prepend_previous_files(
+                edge_dict, metadata_dict["edges"].get(edge_type)
+            )
+        for data_key in ("node_data", "edge_data"):
+            for type_name, type_data_dict in previous_metadata.get(data_key, {}).items():
+                merged_data_dict = metadata_dict[data_key].setdefault(type_name, {})
+                for feat_name, feat_dict in type_data_dict.items():
+                    merged_data_dict[feat_name] = self._prepend_previous_files(
+                        feat_dict, merged_data_dict.get(feat_name)
+                    )
+
+        self._merge_previous_graph_info(previous_metadata.get("graph_info", {}))
+
+        return metadata_dict
+
+    def _prepend_previous_files(self, previous_entry: Dict, entry: Optional[Dict]) -> Dict:
+        """Copies the files of a previous metadata entry and lists them before the files
+        of the corresponding entry of this run, if one exists."""
+        previous_files = self._copy_previous_files(previous_entry["data"])
+        if entry is None:
+            # Row counts are re-computed for the output
+            entry = {key: val for key, val in previous_entry.items() if key != "row_counts"}
+            entry["data"] = previous_files
+        else:
+            entry["data"] = previous_files + list(entry["data"])
+        return entry
+
+    def _copy_previous_files(self, relative_paths: Sequence[str]) -> list[str]:
+        """Copies files of the previous output to the same relative paths under the output prefix.
+
+        Parameters
+        ----------
+        relative_paths : Sequence[str]
+            File paths relative to the previous output prefix.
+
+        Returns
+        -------
+        list[str]
+            The paths of the copied files, relative to ``self.output_prefix``.
+        """
+        if self.filesystem_type == FilesystemType.LOCAL:
+            pyarrow_fs = fs.LocalFileSystem()
+            previous_prefix = self.previous_output_prefix
+            output_prefix = self.output_prefix
+        else:
+            bucket, _ = s3_utils.extract_bucket_and_key(self.output_prefix)
+            pyarrow_fs = fs.S3FileSystem(
+                region=s3_utils.get_bucket_region(bucket),
+                retry_strategy=fs.AwsStandardS3RetryStrategy(max_attempts=10),
+            )
+            # When using S3FileSystem pyarrow expects bucket/key paths
+            previous_prefix = self.previous_output_prefix[len("s3://") :]
+            output_prefix = self.output_prefix[len("s3://") :]
+
+        def copy_file(relative_path: str) -> None:
+            destination = f"{output_prefix}/{relative_path}"
+            pyarrow_fs.create_dir(os.path.dirname(destination), recursive=True)
+            pyarrow_fs.copy_file(f"{previous_prefix}/{relative_path}", destination)
+
+        cpu_count = os.cpu_count() or 4
+        Parallel(n_jobs=min(16, cpu_count), backend="threading")(
+            delayed(copy_file)(relative_path) for relative_path in relative_paths
+        )
+
+        return list(relative_paths)
+
+    def _merge_previous_graph_info(self, previous_graph_info: Dict) -> None:
+        """Adds the graph_info entries of a previous run for node and edge types
+        that this run did not process, and combines the label statistics."""
+        for key in ("nfeat_size", "efeat_size", "ntype_to_label_masks", "etype_to_label_masks"):
+            for type_name, type_info in previous_graph_info.get(key, {}).items():
+                self.graph_info.setdefault(key, {}).setdefault(type_name, type_info)
+
+        ntype_labels = self.graph_info.setdefault("ntype_label", [])
+        ntype_label_properties = self.graph_info.setdefault("ntype_label_property", [])
+        for node_type, label_property in zip(
+            previous_graph_info.get("ntype_label", []),
+            previous_graph_info.get("ntype_label_property", []),
+        ):
+            if node_type not in ntype_labels:
+                ntype_labels.append(node_type)
+                ntype_label_properties.append(label_property)
+        for key in ("etype_label", "etype_label_property"):
+            type_labels = self.graph_info.setdefault(key, [])
+            type_labels.extend(
+                label for label in previous_graph_info.get(key, []) if label not in type_labels
+            )
+
+        for type_name, previous_properties in previous_graph_info.get(
+            "label_properties", {}
+        ).items():
+            if type_name not in self.label_properties:
+                self.label_properties[type_name] = Counter(previous_properties)
+                continue
+            type_properties = self.label_properties[type_name]
+            if VALUE_COUNTS in previous_properties:
+                # Round-trip through JSON so label values are keyed like the previous counts
+                value_counts = json.loads(json.dumps(type_properties.get(VALUE_COUNTS, {})))
+                type_properties[VALUE_COUNTS] = Counter(
+                    previous_properties[VALUE_COUNTS]
+                ) + Counter(value_counts)
+            if MIN_VALUE in previous_properties:
+                type_properties[MIN_VALUE] = min(
+                    previous_properties[MIN_VALUE],
+                    type_properties.get(MIN_VALUE, float("inf")),
+                )
+            if MAX_VALUE in previous_properties:
+                type_properties[MAX_VALUE] = max(
+                    previous_properties[MAX_VALUE],
+                    type_properties.get(MAX_VALUE, float("-inf")),
+                )
+
+        if self.skip_train_masks and "task_type" in previous_graph_info:
+            # This run has no labels, the labels of the graph come from the previous runs
+            self.skip_train_masks = False
+            for key in ("task_type", "label_map", "is_multilabel"):
+                if key in previous_graph_info:
+                    self.graph_info[key] = previous_graph_info[key]
+
     def _add_row_counts_to_metadata(self, metadata_dict: Dict) -> Dict:
         """
         Add the number of rows per file for edge and node files generated to the metadata dict.
@@ -830,57 +1001,151 @@ class DistHeterogeneousGraphLoader(object):
             by default None. We create mappings from the edges for those missing node
             types.
         """
-        # TODO: If it is possible to have multiple edge files for a single node type,
-        # we should use self.node_mapping_paths here.
         if missing_node_types is None:
             missing_node_types = set()
-        node_type_to_mapping_df = {}  # type: Dict[str, DataFrame]
+        # Collect all the edge columns that reference each missing node type,
+        # so that every mapping is built and written once.
+        node_type_to_edge_cols = defaultdict(list)  # type: Dict[str, List[Tuple[EdgeConfig, str]]]
         for edge_config in edge_configs:
-            src_type = edge_config.src_ntype
-            src_col = edge_config.src_col
-            dst_type = edge_config.dst_ntype
-            dst_col = edge_config.dst_col
-            rel_type = edge_config.rel_type
-
-            # TODO: Read only column ids when we have that
-            edges_df = self._read_edge_df(edge_config)
-            edges_df.cache()
-
-            for ntype, ncol in [(src_type, src_col), (dst_type, dst_col)]:
+            for ntype, ncol in [
+                (edge_config.src_ntype, edge_config.src_col),
+                (edge_config.dst_ntype, edge_config.dst_col),
+            ]:
                 # We only create mapping for node types that don't have a corresponding node file
                 if ntype in missing_node_types:
-                    if ntype in node_type_to_mapping_df:
-                        mapping_df = node_type_to_mapping_df[ntype]
-                        logging.info(
-                            "Re-encountered node type '%s' in edge file for "
-                            "'%s:%s:%s', "
-                            "re-creating mapping for it using '%s' as join column...",
-                            ntype,
-                            src_type,
-                            rel_type,
-                            dst_type,
-                            ncol,
-                        )
-                        node_type_to_mapping_df[ntype] = self._extend_mapping_from_edges(
-                            mapping_df, edges_df, ncol
-                        )
-                    else:
-                        node_type_to_mapping_df[ntype] = self._create_initial_mapping_from_edges(
-                            edges_df, ncol
-                        )
+                    node_type_to_edge_cols[ntype].append((edge_config, ncol))
+
         # Write back each mapping and populate self.node_mapping_paths
-        for ntype, mapping_df in node_type_to_mapping_df.items():
-            assert ntype in missing_node_types
+        for ntype, edge_cols in node_type_to_edge_cols.items():
+            logging.info(
+                "Creating mapping for node type '%s' from %d edge columns...",
+                ntype,
+                len(edge_cols),
+            )
+            mapping_df, cached_ids_df = self._create_mapping_from_edge_cols(
+                edge_cols, self._read_previous_node_mapping(ntype)
+            )
             self._write_nodeid_mapping_and_update_state(mapping_df, ntype)
+            cached_ids_df.unpersist()
+
+    def _create_mapping_from_edge_cols(
+        self,
+        edge_cols: Sequence[Tuple[EdgeConfig, str]],
+        previous_mapping_df: Optional[DataFrame] = None,
+    ) -> DataFrame:
+        """Creates a node id mapping from all the edge columns that reference a node type.
+
+        The node ids of all the columns are unioned and deduplicated once, then
+        assigned contiguous integer ids from per-partition counts, without
+        joining partial mappings or going through RDDs.
+
+        Parameters
+        ----------
+        edge_cols : Sequence[Tuple[EdgeConfig, str]]
+            Pairs of edge configuration and the name of the node id column in its edge files.
+        previous_mapping_df : Optional[DataFrame]
+            The node id mapping of a previous run. If provided, only node ids that
+            do not exist in it get new ids, appended after its ids.
 
-    def _create_initial_mapping_from_edges(self, edges_df: DataFrame, node_col: str) -> DataFrame:
-        assert isinstance(node_col, str), f"{node_col=} not of str type, got {type(node_col)=}"
-        distinct_nodes_df = edges_df.select(node_col).distinct()
-        # TODO: Instead of using the below that triggers a computation,
-        # skip zipWithIndex and only trigger at write time?
-        node_mapping_df = self.create_node_id_map_from_nodes_df(distinct_nodes_df, node_col)
+        Returns
+        -------
+        Tuple[DataFrame, DataFrame]
+            A mapping DataFrame with the columns `node_str_id` and `node_int_id`,
+            and the cached DataFrame the new ids are derived from, to be
+            unpersisted once the mapping is written.
+        """
+        node_ids_dfs = []
+        for edge_config, node_col in edge_cols:
+            assert isinstance(node_col, str), f"{node_col=} not of str type, got {type(node_col)=}"
+            edges_df = self._read_edge_df(edge_config).select(node_col)
+            if self.enable_assertions:
+                self._check_no_null_node_ids(edges_df, node_col)
+            node_ids_dfs.append(edges_df.withColumnRenamed(node_col, NODE_MAPPING_STR))
+
+        all_node_ids = node_ids_dfs[0]
+        for node_ids_df in node_ids_dfs[1:]:
+            all_node_ids = all_node_ids.union(node_ids_df)
+        distinct_node_ids = all_node_ids.dropna().distinct()
+
+        if previous_mapping_df is not None:
+            _, mapping_df, cached_ids_df = self._append_to_previous_mapping(
+                distinct_node_ids, previous_mapping_df
+            )
+            return mapping_df, cached_ids_df
+        return spark_utils.assign_contiguous_ids(distinct_node_ids, NODE_MAPPING_INT)
+
+    def _read_previous_node_mapping(self, node_type: str) -> Optional[DataFrame]:
+        """Reads the node id mapping of a node type from a previous run, if one exists."""
+        if node_type not in self.previous_node_mapping_paths:
+            return None
+        return self.spark.read.parquet(*self.previous_node_mapping_paths[node_type]).select(
+            NODE_MAPPING_STR, NODE_MAPPING_INT
+        )
+
+    @staticmethod
+    def _append_to_previous_mapping(
+        node_df: DataFrame, previous_mapping_df: DataFrame
+    ) -> Tuple[DataFrame, DataFrame, DataFrame]:
+        """Assigns ids after the ids of a previous mapping to new nodes.
+
+        Rows of `node_df` whose node id already exists in the previous mapping
+        are skipped, as an incremental run only appends nodes.
+
+        Parameters
+        ----------
+        node_df : DataFrame
+            A DataFrame with the node string ids in the `node_str_id` column.
+        previous_mapping_df : DataFrame
+            The node id mapping of a previous run, with ids in ``[0, N)``.
+
+        Returns
+        -------
+        Tuple[DataFrame, DataFrame, DataFrame]
+            The new rows of `node_df` with their ids in the `node_int_id` column,
+            starting at N, the extended mapping that includes the previous mapping,
+            and the cached DataFrame the new ids are derived from, to be
+            unpersisted once the new rows and mapping are no longer needed.
+        """
+        num_previous_nodes = previous_mapping_df.count()
+        new_node_df = node_df.join(
+            previous_mapping_df.select(NODE_MAPPING_STR), on=NODE_MAPPING_STR, how="left_anti"
+        )
+        new_node_df, cached_ids_df = spark_utils.assign_contiguous_ids(
+            new_node_df, NODE_MAPPING_INT
+        )
+        new_node_df = new_node_df.withColumn(
+            NODE_MAPPING_INT, F.col(NODE_MAPPING_INT) + F.lit(num_previous_nodes)
+        )
+        mapping_df = previous_mapping_df.union(
+            new_node_df.select(NODE_MAPPING_STR, NODE_MAPPING_INT)
+        )
+        return new_node_df, mapping_df, cached_ids_df
 
-        return node_mapping_df
+    @staticmethod
+    def _check_no_null_node_ids(edges_df: DataFrame, node_col: str) -> None:
+        """Raises a ValueError if the node column of an edges DataFrame has null values."""
+        null_counts = (
+            edges_df.select(node_col)
+            .select(
+                F.count(
+                    F.when(
+                        F.col(node_col).contains("None")
+                        | F.col(node_col).contains("NULL")
+                        | (F.col(node_col) == "")
+                        | F.col(node_col).isNull()
+                        | F.isnan(node_col),
+                        node_col,
+                    )
+                ).alias(node_col)
+            )
+            .collect()[0][0]
+        )
+        if null_counts > 0:
+            raise ValueError(
+                f"Found {null_counts} null values in node column {node_col}"
+                " while extracting node ids from incoming edges structure "
+                f"with cols: {edges_df.columns}"
+            )
 
     def _extend_mapping_from_edges(
         self, mapping_df: DataFrame, edges_df: DataFrame, node_col: str
@@ -913,28 +1178,7 @@ class DistHeterogeneousGraphLoader(object):
             edges_df.select(node_col).distinct().dropna(), node_col, join_col
         )
         if self.enable_assertions:
-            null_counts = (
-                edges_df.select(node_col)
-                .select(
-                    F.count(
-                        F.when(
-                            F.col(node_col).contains("None")
-                            | F.col(node_col).contains("NULL")
-                            | (F.col(node_col) == "")
-                            | F.col(node_col).isNull()
-                            | F.isnan(node_col),
-                            node_col,
-                        )
-                    ).alias(node_col)
-                )
-                .collect()[0][0]
-            )
-            if null_counts > 0:
-                raise ValueError(
-                    f"Found {null_counts} null values in node column {node_col}"
-                    " while extracting node ids from incoming edges structure "
-                    f"with cols: {edges_df.columns}"
-                )
+            self._check_no_null_node_ids(edges_df, node_col)
 
         node_df_with_ids = incoming_node_ids.join(mapping_df, on=join_col, how="fullouter")
 
@@ -1070,6 +1314,7 @@ class DistHeterogeneousGraphLoader(object):
                 node_config,
             )
 
+            cached_ids_df = None
             read_nodefile_start = perf_counter()
             # TODO: Maybe we use same enforced type for Parquet and CSV
             # to ensure consistent behavior downstream?
@@ -1117,6 +1362,12 @@ class DistHeterogeneousGraphLoader(object):
                         for map_path in self.node_mapping_paths[node_type]
                     ]
                 )
+                previous_mapping_df = self._read_previous_node_mapping(node_type)
+                if previous_mapping_df is not None:
+                    # Only the nodes added after the previous run get new outputs
+                    mapping_df = mapping_df.filter(
+                        F.col(NODE_MAPPING_INT) >= previous_mapping_df.count()
+                    )
                 node_df_with_ids = mapping_df.join(
                     nodes_df, mapping_df[NODE_MAPPING_STR] == nodes_df[node_col], "left"
                 )
@@ -1135,6 +1386,17 @@ class DistHeterogeneousGraphLoader(object):
                 nodes_df = node_df_with_ids.withColumnRenamed(node_col, NODE_MAPPING_STR).orderBy(
                     NODE_MAPPING_INT
                 )
+            elif node_type in self.previous_node_mapping_paths:
+                logging.info(
+                    "Appending new nodes to the previous str-to-int mapping for node type: %s",
+                    node_type,
+                )
+                nodes_df, mapping_df, cached_ids_df = self._append_to_previous_mapping(
+                    nodes_df.withColumnRenamed(node_col, NODE_MAPPING_STR),
+                    self._read_previous_node_mapping(node_type),
+                )
+                nodes_df = nodes_df.orderBy(NODE_MAPPING_INT)
+                self._write_nodeid_mapping_and_update_state(mapping_df, node_type)
             else:
                 logging.info("Creating node str-to-int mapping for node type: %s", node_type)
                 nodes_df = self.create_node_id_map_from_nodes_df(nodes_df, node_col)
@@ -1161,17 +1423,7 @@ class DistHeterogeneousGraphLoader(object):
                 )
                 node_type_metadata_dicts.update(node_type_label_metadata)
 
-                for label_config in node_config.label_configs:
-                    if label_config.mask_field_names:
-                        mask_names = label_config.mask_field_names
-                    else:
-                        mask_names = ("train_mask", "val_mask", "test_mask")
-                    self.graph_info["ntype_to_label_masks"][node_type].extend(mask_names)
-
-                self.graph_info["ntype_label"].append(node_type)
-                self.graph_info["ntype_label_property"].append(
-                    node_config.label_configs[0].label_column
-                )
+                self._add_node_label_graph_info(node_type, node_config.label_configs)
                 self.timers["_process_node_labels"] += perf_counter() - process_node_labels_start
 
             if node_type_metadata_dicts:
@@ -1180,6 +1432,8 @@ class DistHeterogeneousGraphLoader(object):
                 else:
                     node_data_dict[node_type] = node_type_metadata_dicts
             nodes_df.unpersist()
+            if cached_ids_df is not None:
+                cached_ids_df.unpersist()
 
         logging.info("Finished processing node features")
         return node_data_dict
@@ -1430,23 +1684,7 @@ class DistHeterogeneousGraphLoader(object):
                 node_type,
                 label_conf.label_column,
             )
-            if label_conf.split_rate:
-                split_rates = SplitRates(
-                    train_rate=label_conf.split_rate["train"],
-                    val_rate=label_conf.split_rate["val"],
-                    test_rate=label_conf.split_rate["test"],
-                )
-            else:
-                split_rates = None
-            if label_conf.custom_split_filenames:
-                custom_split_filenames = CustomSplit(
-                    train=label_conf.custom_split_filenames["train"],
-                    valid=label_conf.custom_split_filenames["valid"],
-                    test=label_conf.custom_split_filenames["test"],
-                    mask_columns=label_conf.custom_split_filenames["column"],
-                )
-            else:
-                custom_split_filenames = None
+            split_rates, custom_split_filenames = self._parse_split_configs(label_conf)
 
             label_split_dicts = self._create_split_files(
                 nodes_df,
@@ -1769,22 +2007,9 @@ class DistHeterogeneousGraphLoader(object):
                         edge_config.rel_type,
                     )
                     edge_type_metadata_dicts.update(label_metadata_dicts)
-                    self.graph_info["etype_label"].append(edge_type)
-                    self.graph_info["etype_label"].append(reverse_edge_type)
-                    self.graph_info["etype_to_label_masks"][edge_type] = []
-
-                    # Collect all the mask names for the edge type
-                    for label_config in edge_config.label_configs:
-                        if label_config.mask_field_names:
-                            mask_names = label_config.mask_field_names
-                        else:
-                            mask_names = ("train_mask", "val_mask", "test_mask")
-                        self.graph_info["etype_to_label_masks"][edge_type].extend(mask_names)
-
-                    if edge_config.label_configs[0].task_type != "link_prediction":
-                        self.graph_info["etype_label_property"].append(
-                            edge_config.label_configs[0].label_column
-                        )
+                    self._add_edge_label_graph_info(
+                        edge_type, reverse_edge_type, edge_config.label_configs
+                    )
 
                     if self.add_reverse_edges:
                         # For reverse edges only the label metadata
@@ -1838,7 +2063,7 @@ class DistHeterogeneousGraphLoader(object):
                 edge_type,
             )
             json_representation = (
-                self.pre_computed_transformations.get("edges_features", {})
+                self.pre_computed_transformations.get("edge_features", {})
                 .get(edge_type, {})
                 .get(feat_conf.feat_name, {})
             )
@@ -2050,23 +2275,7 @@ class DistHeterogeneousGraphLoader(object):
                 self.output_prefix, f"edge_data/{edge_type.replace(':', '_')}"
             )
             logging.info("Creating train/test/val split for edge type %s...", edge_type)
-            if label_conf.split_rate:
-                split_rates = SplitRates(
-                    train_rate=label_conf.split_rate["train"],
-                    val_rate=label_conf.split_rate["val"],
-                    test_rate=label_conf.split_rate["test"],
-                )
-            else:
-                split_rates = None
-            if label_conf.custom_split_filenames:
-                custom_split_filenames = CustomSplit(
-                    train=label_conf.custom_split_filenames["train"],
-                    valid=label_conf.custom_split_filenames["valid"],
-                    test=label_conf.custom_split_filenames["test"],
-                    mask_columns=label_conf.custom_split_filenames["column"],
-                )
-            else:
-                custom_split_filenames = None
+            split_rates, custom_split_filenames = self._parse_split_configs(label_conf)
             label_split_dicts = self._create_split_files(
                 edges_df,
                 label_conf.label_column,
@@ -2079,6 +2288,66 @@ class DistHeterogeneousGraphLoader(object):
 
         return label_metadata_dicts
 
+    @staticmethod
+    def _parse_split_configs(
+        label_conf: LabelConfig,
+    ) -> Tuple[Optional[SplitRates], Optional[CustomSplit]]:
+        """Returns the split rates and custom split files of a label, None for the missing ones."""
+        if label_conf.split_rate:
+            split_rates = SplitRates(
+                train_rate=label_conf.split_rate["train"],
+                val_rate=label_conf.split_rate["val"],
+                test_rate=label_conf.split_rate["test"],
+            )
+        else:
+            split_rates = None
+        if label_conf.custom_split_filenames:
+            custom_split_filenames = CustomSplit(
+                train=label_conf.custom_split_filenames["train"],
+                valid=label_conf.custom_split_filenames["valid"],
+                test=label_conf.custom_split_filenames["test"],
+                mask_columns=label_conf.custom_split_filenames["column"],
+            )
+        else:
+            custom_split_filenames = None
+        return split_rates, custom_split_filenames
+
+    @staticmethod
+    def _get_mask_names(label_conf: LabelConfig) -> Sequence[str]:
+        """Returns the mask names of a label, the default names if none were configured."""
+        if label_conf.mask_field_names:
+            return label_conf.mask_field_names
+        return ("train_mask", "val_mask", "test_mask")
+
+    def _add_node_label_graph_info(
+        self, node_type: str, label_configs: Sequence[LabelConfig]
+    ) -> None:
+        """Records the labeled node type, its label property and mask names in graph_info."""
+        for label_config in label_configs:
+            self.graph_info["ntype_to_label_masks"][node_type].extend(
+                self._get_mask_names(label_config)
+            )
+
+        self.graph_info["ntype_label"].append(node_type)
+        self.graph_info["ntype_label_property"].append(label_configs[0].label_column)
+
+    def _add_edge_label_graph_info(
+        self, edge_type: str, reverse_edge_type: str, label_configs: Sequence[LabelConfig]
+    ) -> None:
+        """Records the labeled edge types, their label property and mask names in graph_info."""
+        self.graph_info["etype_label"].append(edge_type)
+        self.graph_info["etype_label"].append(reverse_edge_type)
+        self.graph_info["etype_to_label_masks"][edge_type] = []
+
+        # Collect all the mask names for the edge type
+        for label_config in label_configs:
+            self.graph_info["etype_to_label_masks"][edge_type].extend(
+                self._get_mask_names(label_config)
+            )
+
+        if label_configs[0].task_type != "link_prediction":
+            self.graph_info["etype_label_property"].append(label_configs[0].label_column)
+
     def _update_label_properties(
         self,
         node_or_edge_type: str,
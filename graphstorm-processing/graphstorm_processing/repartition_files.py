@@ -34,16 +34,20 @@ import re
 import shutil
 import sys
 import tempfile
+import threading
 import time
 import uuid
 from collections import Counter, defaultdict
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from itertools import accumulate
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import boto3
+import psutil
 import pyarrow
 from pyarrow import parquet as pq
 from pyarrow import fs
@@ -58,6 +62,38 @@ from graphstorm_processing.constants import FilesystemType
 NUM_WRITE_THREADS = 16
 
 
+class _MemoryBudget:
+    """Limits the bytes held in memory by concurrent repartitioning tasks.
+
+    A task that needs more bytes than the total budget is allowed to run
+    when no other task holds memory, so that every task can eventually make progress.
+
+    Parameters
+    ----------
+    budget_bytes : int
+        The total number of bytes concurrent tasks are allowed to hold.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, num_bytes: int) -> None:
+        """Block until `num_bytes` fit in the budget, then reserve them."""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.used_bytes == 0 or self.used_bytes + num_bytes <= self.budget_bytes
+            )
+            self.used_bytes += num_bytes
+
+    def release(self, num_bytes: int) -> None:
+        """Return `num_bytes` to the budget."""
+        with self._condition:
+            self.used_bytes -= num_bytes
+            self._condition.notify_all()
+
+
 class ParquetRepartitioner:
     """Performs re-partitioning of Parquet files.
 
@@ -75,6 +111,14 @@ class ParquetRepartitioner:
         When True will perform file streaming re-partitioning, holding at most 2 files
         worth of data in memory. When False (default), will load an entire feature/structure
         in memory and perform the re-partitioning using thread-parallelism.
+    parallel_repartitioning: bool, optional
+        When True will re-partition node/edge types and the files of each type
+        concurrently, only reading the row groups needed for each new file, and
+        re-using files whose row counts already match without reading them.
+        Takes precedence over `streaming_repartitioning`. By default False.
+    memory_budget_gb: Optional[float], optional
+        The memory in GB that concurrent tasks can use when `parallel_repartitioning`
+        is True. By default None, which uses half of the available memory.
     """
 
     def __init__(
@@ -84,6 +128,8 @@ class ParquetRepartitioner:
         region: Optional[str] = None,
         verify_outputs: bool = True,
         streaming_repartitioning=False,
+        parallel_repartitioning=False,
+        memory_budget_gb: Optional[float] = None,
     ):
         # Pyarrow expects paths of the form "bucket/path/to/file", so we strip the s3:// prefix
         self.input_prefix = input_prefix[5:] if input_prefix.startswith("s3://") else input_prefix
@@ -101,6 +147,13 @@ class ParquetRepartitioner:
             self.pyarrow_fs = fs.LocalFileSystem()
         self.verify_outputs = verify_outputs
         self.streaming_repartitioning = streaming_repartitioning
+        self.parallel_repartitioning = parallel_repartitioning
+        if memory_budget_gb:
+            budget_bytes = int(memory_budget_gb * 1024**3)
+        else:
+            budget_bytes = psutil.virtual_memory().available // 2
+        self.memory_budget = _MemoryBudget(budget_bytes)
+        self.num_threads = min(NUM_WRITE_THREADS, os.cpu_count() or 16)
         self.verbosity = 1 if logging.getLogger().getEffectiveLevel() <= logging.INFO else 0
 
     def read_dataset_from_relative_path(self, relative_path: str) -> ds.Dataset:
@@ -257,6 +310,8 @@ class ParquetRepartitioner:
             A data format dictionary with the row
             counts updated to match desired_counts.
         """
+        if self.parallel_repartitioning:
+            return self._repartition_parquet_files_parallel(data_entry_dict, desired_counts)
         if self.streaming_repartitioning:
             return self._repartition_parquet_files_streaming(data_entry_dict, desired_counts)
         else:
@@ -553,6 +608,180 @@ class ParquetRepartitioner:
 
         return data_entry_dict
 
+    def _repartition_parquet_files_parallel(
+        self, data_entry_dict: Dict, desired_counts: Sequence[int]
+    ) -> Dict:
+        """Repartition parquet files concurrently, reading only the rows each new file needs.
+
+        Each new file is assigned the range of rows it should contain. When the range
+        matches an existing file, we re-use the existing file without reading it.
+        Otherwise, we read the row groups of the existing files that overlap with the range,
+        and write the rows of the range to a new file. New files are created in parallel
+        threads, under the memory budget of the repartitioner.
+
+        The output is written to storage and the `data_entry_dict` dictionary file is
+        modified in-place and returned.
+
+        Raises
+        ------
+        RuntimeError
+            In cases where the sum of the desired counts does not match
+            the sum of actual file row counts, or the files are not in Parquet format.
+        """
+        row_counts = data_entry_dict["row_counts"]
+        if sum(desired_counts) != sum(row_counts):
+            raise RuntimeError(
+                f"Mismatch between total requested rows: {sum(desired_counts)}, "
+                f"and rows in the input files: {sum(row_counts)}"
+            )
+
+        data_format = data_entry_dict["format"]["name"]
+        if data_format != "parquet":
+            raise RuntimeError(
+                f"We only support Parquet file row count conversion, got format: {data_format}"
+            )
+
+        files_list = data_entry_dict["data"]
+        file_offsets = list(accumulate([0] + list(row_counts)))
+        file_index_per_range = {
+            (offset, row_count): file_idx
+            for file_idx, (offset, row_count) in enumerate(zip(file_offsets, row_counts))
+        }
+
+        uid_for_entry = uuid.uuid4().hex[:8]
+        new_data_entries = []
+        write_tasks = []
+        for repartitioned_file_index, (start, desired_count) in enumerate(
+            zip(accumulate([0] + list(desired_counts)), desired_counts)
+        ):
+            matching_file_index = file_index_per_range.get((start, desired_count))
+            if matching_file_index is not None:
+                logging.debug(
+                    "Existing file %s matches expected count, using existing file...",
+                    files_list[matching_file_index],
+                )
+                new_data_entries.append(files_list[matching_file_index])
+                continue
+
+            # Collect the rows of each existing file that belong to the new file,
+            # as (relative_path, first_row, end_row) ranges local to each file.
+            end = start + desired_count
+            row_ranges = [
+                (
+                    files_list[file_idx],
+                    max(start, file_offset) - file_offset,
+                    min(end, file_offset + row_count) - file_offset,
+                )
+                for file_idx, (file_offset, row_count) in enumerate(zip(file_offsets, row_counts))
+                if file_offset < end and file_offset + row_count > start
+            ]
+            new_relative_path = self.create_new_relative_path_from_existing(
+                files_list[0], repartitioned_file_index, uid_for_entry
+            )
+            new_data_entries.append(new_relative_path)
+            write_tasks.append((new_relative_path, row_ranges, desired_count))
+
+        logging.debug(
+            "Re-using %d files and creating %d new files for dataset under %s",
+            len(desired_counts) - len(write_tasks),
+            len(write_tasks),
+            Path(files_list[0]).parent,
+        )
+        with Parallel(
+            n_jobs=self.num_threads,
+            verbose=self.verbosity,
+            prefer="threads",
+        ) as parallel:
+            parallel(
+                delayed(self._write_row_ranges)(
+                    new_relative_path, row_ranges, desired_count, files_list[0]
+                )
+                for new_relative_path, row_ranges, desired_count in write_tasks
+            )
+
+        data_entry_dict["data"] = new_data_entries
+        data_entry_dict["row_counts"] = list(desired_counts)
+
+        return data_entry_dict
+
+    def _write_row_ranges(
+        self,
+        new_relative_path: str,
+        row_ranges: list[tuple[str, int, int]],
+        desired_count: int,
+        schema_relative_path: str,
+    ) -> None:
+        """Write the rows in `row_ranges` to a new file at `new_relative_path`.
+
+        Only the row groups that overlap with each range are read, and the
+        memory for them is reserved from the memory budget until the new file is written.
+
+        Parameters
+        ----------
+        new_relative_path : str
+            Relative path of the new file.
+        row_ranges : list[tuple[str, int, int]]
+            List of (relative_path, first_row, end_row) tuples, with the
+            rows of each existing file to include in the new file, in order.
+        desired_count : int
+            The number of rows of the new file.
+        schema_relative_path : str
+            Relative path of a file to read the schema from when `row_ranges` is empty.
+        """
+        # Find the row groups to read from each file, using only the file footers
+        row_group_reads = []
+        num_bytes = 0
+        for relative_path, first_row, end_row in row_ranges:
+            file_path = os.path.join(self.input_prefix, relative_path)
+            file_metadata = pq.read_metadata(file_path, filesystem=self.pyarrow_fs)
+            row_groups = []
+            row_groups_offset = 0
+            row_group_start = 0
+            for row_group_idx in range(file_metadata.num_row_groups):
+                row_group_meta = file_metadata.row_group(row_group_idx)
+                row_group_end = row_group_start + row_group_meta.num_rows
+                if row_group_start < end_row and row_group_end > first_row:
+                    if not row_groups:
+                        row_groups_offset = row_group_start
+                    row_groups.append(row_group_idx)
+                    num_bytes += row_group_meta.total_byte_size
+                row_group_start = row_group_end
+            row_group_reads.append(
+                (
+                    file_path,
+                    file_metadata,
+                    row_groups,
+                    first_row - row_groups_offset,
+                    end_row - first_row,
+                )
+            )
+
+        self.memory_budget.acquire(num_bytes)
+        try:
+            tables = []
+            for file_path, file_metadata, row_groups, offset, length in row_group_reads:
+                with self.pyarrow_fs.open_input_file(file_path) as source:
+                    table = pq.ParquetFile(source, metadata=file_metadata).read_row_groups(
+                        row_groups, use_threads=False
+                    )
+                tables.append(table.slice(offset=offset, length=length))
+
+            if tables:
+                new_table = pyarrow.concat_tables(tables)
+            else:
+                new_table = pq.read_schema(
+                    os.path.join(self.input_prefix, schema_relative_path),
+                    filesystem=self.pyarrow_fs,
+                ).empty_table()
+            if new_table.num_rows != desired_count:
+                raise RuntimeError(
+                    f"Expected {desired_count} rows for {new_relative_path}, "
+                    f"got {new_table.num_rows}"
+                )
+            self.write_parquet_to_relative_path(new_relative_path, new_table)
+        finally:
+            self.memory_budget.release(num_bytes)
+
     def modify_metadata_for_flat_arrays(self, file_list: List[str]) -> None:
         """Fix metadata to match DistPartitioning assumptions.
 
@@ -605,7 +834,7 @@ class ParquetRepartitioner:
 
 
 def collect_frequencies_for_data_counts(
-    data_meta: Dict[str, Dict[str, Dict]]
+    data_meta: Dict[str, Dict[str, Dict]],
 ) -> Dict[str, Counter]:
     """Gather the frequency of each row count list for each feature type in the provided data dict.
 
@@ -755,6 +984,21 @@ def parse_args(args):
         help="When True will use low-memory file-streaming repartitioning. "
         "Note that this option is much slower than the in-memory default.",
     )
+    parser.add_argument(
+        "--parallel-repartitioning",
+        type=lambda x: (str(x).lower() in ["true", "1"]),
+        default=False,
+        help="When True will repartition node/edge types and files concurrently, "
+        "re-using files whose row counts already match and only reading the row groups "
+        "needed for each new file. Takes precedence over --streaming-repartitioning.",
+    )
+    parser.add_argument(
+        "--memory-budget-gb",
+        type=float,
+        default=None,
+        help="Memory in GB that concurrent tasks can use with --parallel-repartitioning. "
+        "Default is half of the available memory.",
+    )
     parser.add_argument(
         "--input-metadata-file-name",
         default="metadata.json",
@@ -794,6 +1038,8 @@ class RepartitionConfig:
         input_metadata_file_name="metadata.json",
         updated_metadata_file_name="updated_row_counts_metadata.json",
         streaming_repartitioning=False,
+        parallel_repartitioning=False,
+        memory_budget_gb=None,
         log_level="INFO",
     )
 
@@ -803,6 +1049,8 @@ class RepartitionConfig:
         - input_metadata_file_name is the name of the original partitioning pipeline metadata file
         - updated_metadata_file_name is the name of the output partitioning pipeline metadata file
         - streaming_repartitioning is a boolean flag to enable/disable file-streaming repartitioning
+        - parallel_repartitioning is a boolean flag to enable/disable parallel repartitioning
+        - memory_budget_gb is the memory concurrent tasks can use with parallel repartitioning
         - log_level is the logging level to use (e.g. "DEBUG", "INFO", "WARNING", "ERROR")
         - input_prefix is the only required field
     """
@@ -811,6 +1059,8 @@ class RepartitionConfig:
     input_metadata_file_name: str = "metadata.json"
     updated_metadata_file_name: str = "updated_row_counts_metadata.json"
     streaming_repartitioning: bool = False
+    parallel_repartitioning: bool = False
+    memory_budget_gb: Optional[float] = None
     log_level: str = "INFO"
 
 
@@ -845,7 +1095,7 @@ def modify_flat_array_metadata(
         if edge_types_with_labels:
             # And at least one edge label
             if len(graph_info["etype_label_property"]) > 0:
-                etype_label_property = graph_info["etype_label_property"][0]  #  type: str
+                etype_label_property = graph_info["etype_label_property"][0]  # type: str
                 if task_type not in {"link_predict", "link_prediction"}:
                     assert etype_label_property, (
                         "When task is not link prediction, providing an 'etype_label_property' "
@@ -958,7 +1208,6 @@ def modify_flat_array_metadata(
 
 
 def _repartition_edge_files(metadata_dict: dict[str, Any], repartitioner: ParquetRepartitioner):
-    edge_structure_meta = metadata_dict["edges"]  # type: Dict[str, Dict[str, Dict]]
     # We first collect the most frequent row counts, to minimize the number of
     # repartitions we have to perform.
     edge_data_meta = metadata_dict["edge_data"]
@@ -968,8 +1217,9 @@ def _repartition_edge_files(metadata_dict: dict[str, Any], repartitioner: Parque
     edge_row_counts_frequencies = collect_frequencies_for_data_counts(edge_data_meta)
 
     # Re-partition the edge files based on the most frequent row counts for each edge type
-    for type_idx, (type_name, type_data_dict) in enumerate(edge_data_meta.items()):
-        src, relation, dst = type_name.split(":")
+    type_tasks = []  # type: List[Callable[[], None]]
+    for type_idx, type_name in enumerate(edge_data_meta.keys()):
+        _, relation, _ = type_name.split(":")
 
         if relation.endswith("-rev"):
             # Reverse edge types do not have their own data,
@@ -984,91 +1234,112 @@ def _repartition_edge_files(metadata_dict: dict[str, Any], repartitioner: Parque
             )
             continue
 
-        reverse_edge_type_name = f"{dst}:{relation}-rev:{src}"
-        most_frequent_counts = list(edge_row_counts_frequencies[type_name].most_common(1)[0][0])
+        type_tasks.append(
+            partial(
+                _repartition_edge_type,
+                metadata_dict,
+                type_name,
+                type_idx,
+                list(edge_row_counts_frequencies[type_name].most_common(1)[0][0]),
+                repartitioner,
+            )
+        )
+
+    _run_type_tasks(type_tasks, repartitioner)
+
+
+def _repartition_edge_type(
+    metadata_dict: dict[str, Any],
+    type_name: str,
+    type_idx: int,
+    most_frequent_counts: list[int],
+    repartitioner: ParquetRepartitioner,
+):
+    src, relation, dst = type_name.split(":")
+    reverse_edge_type_name = f"{dst}:{relation}-rev:{src}"
+    edge_structure_meta = metadata_dict["edges"]  # type: Dict[str, Dict[str, Dict]]
+    edge_data_meta = metadata_dict["edge_data"]
+    type_data_dict = edge_data_meta[type_name]
+
+    structure_counts = edge_structure_meta[type_name]["row_counts"]
+
+    # Repartition edge structure files if the row counts don't match the most frequent
+    if structure_counts != most_frequent_counts:
+        logging.info(
+            "Repartitioning %d structure files for edge type %d/%d: '%s'",
+            len(edge_structure_meta[type_name]["data"]),
+            type_idx + 1,
+            len(edge_data_meta),
+            type_name,
+        )
 
-        structure_counts = edge_structure_meta[type_name]["row_counts"]
+        edge_structure_meta[type_name] = repartitioner.repartition_parquet_files(
+            edge_structure_meta[type_name], most_frequent_counts
+        )
+    else:
+        logging.info(
+            "Structure files for edge type %d/%d: '%s' match, skipping repartitioning",
+            type_idx + 1,
+            len(edge_data_meta),
+            type_name,
+        )
 
-        # Repartition edge structure files if the row counts don't match the most frequent
-        if structure_counts != most_frequent_counts:
+    # If the reverse structure counts don't match we'll need to re-partition
+    # them because the feature files are shared between regular and reverse
+    if reverse_edge_type_name in edge_structure_meta:
+        if edge_structure_meta[reverse_edge_type_name]["row_counts"] != most_frequent_counts:
             logging.info(
-                "Repartitioning %d structure files for edge type %d/%d: '%s'",
-                len(edge_structure_meta[type_name]["data"]),
-                type_idx + 1,
-                len(edge_data_meta),
-                type_name,
+                "Repartitioning %d structure files for reverse edge type '%s'",
+                len(edge_structure_meta[reverse_edge_type_name]["data"]),
+                reverse_edge_type_name,
             )
-
-            edge_structure_meta[type_name] = repartitioner.repartition_parquet_files(
-                edge_structure_meta[type_name], most_frequent_counts
+            edge_structure_meta[reverse_edge_type_name] = repartitioner.repartition_parquet_files(
+                edge_structure_meta[reverse_edge_type_name],
+                most_frequent_counts,
             )
-        else:
+
+    # Repartition edge feature files if the row counts don't match the most frequent
+    for feature_idx, (feature_name, feature_dict) in enumerate(type_data_dict.items()):
+        if feature_dict["row_counts"] != most_frequent_counts:
             logging.info(
-                "Structure files for edge type %d/%d: '%s' match, skipping repartitioning",
-                type_idx + 1,
-                len(edge_data_meta),
+                "Repartitioning %d feature files for edge type '%s', feature %d/%d '%s'",
+                len(feature_dict["data"]),
                 type_name,
+                feature_idx + 1,
+                len(type_data_dict),
+                feature_name,
             )
-
-        # If the reverse structure counts don't match we'll need to re-partition
-        # them because the feature files are shared between regular and reverse
-        if reverse_edge_type_name in edge_structure_meta:
-            if edge_structure_meta[reverse_edge_type_name]["row_counts"] != most_frequent_counts:
-                logging.info(
-                    "Repartitioning %d structure files for reverse edge type '%s'",
-                    len(edge_structure_meta[reverse_edge_type_name]["data"]),
-                    reverse_edge_type_name,
-                )
-                edge_structure_meta[reverse_edge_type_name] = (
-                    repartitioner.repartition_parquet_files(
-                        edge_structure_meta[reverse_edge_type_name],
-                        most_frequent_counts,
-                    )
-                )
-
-        # Repartition edge feature files if the row counts don't match the most frequent
-        for feature_idx, (feature_name, feature_dict) in enumerate(type_data_dict.items()):
-            if feature_dict["row_counts"] != most_frequent_counts:
+            feature_dict = repartitioner.repartition_parquet_files(
+                feature_dict, most_frequent_counts
+            )
+            if (
+                reverse_edge_type_name in edge_data_meta
+                and feature_name in edge_data_meta[reverse_edge_type_name]
+            ):
                 logging.info(
-                    "Repartitioning %d feature files for edge type '%s', feature %d/%d '%s'",
-                    len(feature_dict["data"]),
-                    type_name,
-                    feature_idx + 1,
-                    len(type_data_dict),
+                    "Assigning re-partitioned feature files for '%s' to reverse edge type '%s'",
                     feature_name,
+                    reverse_edge_type_name,
                 )
-                feature_dict = repartitioner.repartition_parquet_files(
-                    feature_dict, most_frequent_counts
-                )
-                if (
-                    reverse_edge_type_name in edge_data_meta
-                    and feature_name in edge_data_meta[reverse_edge_type_name]
-                ):
-                    logging.info(
-                        "Assigning re-partitioned feature files for '%s' to reverse "
-                        "edge type '%s'",
-                        feature_name,
-                        reverse_edge_type_name,
-                    )
-                    edge_data_meta[reverse_edge_type_name][feature_name] = feature_dict
-                else:
-                    logging.debug(
-                        "Did not find reverse of edge type '%s', %s in %s",
-                        type_name,
-                        reverse_edge_type_name,
-                        edge_data_meta.keys(),
-                    )
+                edge_data_meta[reverse_edge_type_name][feature_name] = feature_dict
             else:
-                logging.info(
-                    (
-                        "Feature '%s' (%d/%d) of edge type '%s', already has correct row counts, "
-                        "skipping repartitioning."
-                    ),
-                    feature_name,
-                    feature_idx + 1,
-                    len(type_data_dict),
+                logging.debug(
+                    "Did not find reverse of edge type '%s', %s in %s",
                     type_name,
+                    reverse_edge_type_name,
+                    edge_data_meta.keys(),
                 )
+        else:
+            logging.info(
+                (
+                    "Feature '%s' (%d/%d) of edge type '%s', already has correct row counts, "
+                    "skipping repartitioning."
+                ),
+                feature_name,
+                feature_idx + 1,
+                len(type_data_dict),
+                type_name,
+            )
 
 
 def _repartition_node_files(metadata_dict: dict[str, Any], repartitioner: ParquetRepartitioner):
@@ -1077,37 +1348,74 @@ def _repartition_node_files(metadata_dict: dict[str, Any], repartitioner: Parque
     node_row_counts_frequencies = collect_frequencies_for_data_counts(node_data_meta)
 
     logging.info("Repartitioning node feature files")
-    for type_idx, (type_name, type_data_dict) in enumerate(node_data_meta.items()):
-        logging.info(
-            "Repartitioning feature files for node type '%s', (%d/%d)",
-            type_name,
-            type_idx + 1,
-            len(node_data_meta),
+    type_tasks = []  # type: List[Callable[[], None]]
+    for type_idx, type_name in enumerate(node_data_meta.keys()):
+        type_tasks.append(
+            partial(
+                _repartition_node_type,
+                node_data_meta,
+                type_name,
+                type_idx,
+                list(node_row_counts_frequencies[type_name].most_common(1)[0][0]),
+                repartitioner,
+            )
         )
-        most_frequent_counts = list(node_row_counts_frequencies[type_name].most_common(1)[0][0])
 
-        for feature_idx, (feature_name, feature_dict) in enumerate(type_data_dict.items()):
-            if feature_dict["row_counts"] != most_frequent_counts:
-                logging.info(
-                    "Repartitioning %d feature files for node type '%s', feature '%s' (%d/%d)",
-                    len(feature_dict["data"]),
-                    type_name,
-                    feature_name,
-                    feature_idx + 1,
-                    len(type_data_dict),
-                )
-                repartitioner.repartition_parquet_files(feature_dict, most_frequent_counts)
-            else:
-                logging.info(
-                    (
-                        "Feature '%s' (%d/%d) of node type '%s', already has correct row counts, "
-                        "skipping repartitioning."
-                    ),
-                    feature_name,
-                    feature_idx + 1,
-                    len(type_data_dict),
-                    type_name,
-                )
+    _run_type_tasks(type_tasks, repartitioner)
+
+
+def _repartition_node_type(
+    node_data_meta: dict[str, Any],
+    type_name: str,
+    type_idx: int,
+    most_frequent_counts: list[int],
+    repartitioner: ParquetRepartitioner,
+):
+    type_data_dict = node_data_meta[type_name]
+    logging.info(
+        "Repartitioning feature files for node type '%s', (%d/%d)",
+        type_name,
+        type_idx + 1,
+        len(node_data_meta),
+    )
+
+    for feature_idx, (feature_name, feature_dict) in enumerate(type_data_dict.items()):
+        if feature_dict["row_counts"] != most_frequent_counts:
+            logging.info(
+                "Repartitioning %d feature files for node type '%s', feature '%s' (%d/%d)",
+                len(feature_dict["data"]),
+                type_name,
+                feature_name,
+                feature_idx + 1,
+                len(type_data_dict),
+            )
+            repartitioner.repartition_parquet_files(feature_dict, most_frequent_counts)
+        else:
+            logging.info(
+                (
+                    "Feature '%s' (%d/%d) of node type '%s', already has correct row counts, "
+                    "skipping repartitioning."
+                ),
+                feature_name,
+                feature_idx + 1,
+                len(type_data_dict),
+                type_name,
+            )
+
+
+def _run_type_tasks(type_tasks: List[Callable[[], None]], repartitioner: ParquetRepartitioner):
+    """Runs the repartitioning task of each node/edge type, concurrently
+    if `repartitioner.parallel_repartitioning` is True."""
+    if not repartitioner.parallel_repartitioning:
+        for type_task in type_tasks:
+            type_task()
+        return
+
+    with ThreadPoolExecutor(max_workers=repartitioner.num_threads) as executor:
+        futures = [executor.submit(type_task) for type_task in type_tasks]
+        # Raise any exception that happened during repartitioning
+        for future in futures:
+            future.result()
 
 
 def repartition_files(metadata_dict: Dict[str, Any], repartitioner: ParquetRepartitioner):
@@ -1180,6 +1488,11 @@ def main():
     streaming_repartitioning: bool
         When True will use low-memory file-streaming repartitioning.
         Note that this option is much slower than the in-memory default.
+    parallel_repartitioning: bool
+        When True will repartition node/edge types and files concurrently,
+        only reading the rows needed for each new file.
+    memory_budget_gb: Optional[float]
+        Memory in GB that concurrent tasks can use with parallel repartitioning.
     input_metadata_file_name : str
         Name of the original partitioning pipeline metadata file.
     updated_metadata_file_name : str
@@ -1242,6 +1555,8 @@ def main():
         region,
         verify_outputs=True,
         streaming_repartitioning=repartition_config.streaming_repartitioning,
+        parallel_repartitioning=repartition_config.parallel_repartitioning,
+        memory_budget_gb=repartition_config.memory_budget_gb,
     )
 
     metadata_dict = repartition_files(metadata_dict, repartitioner)
@@ -0,0 +1,139 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License").
+You may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Benchmark creating node id mappings from the edge files of a graph with many relations.
+
+Compares the single-pass mapping builder of DistHeterogeneousGraphLoader, that
+unions all the edge columns of a node type once, with the previous approach that
+extends the mapping with a join and re-indexes it through zipWithIndex for every
+edge type that references the node type.
+
+Usage:
+    python benchmark_node_id_mapping.py --num-relations 32 --num-edges 200000
+"""
+
+import argparse
+import os
+import tempfile
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from pyspark.sql import SparkSession
+
+from graphstorm_processing.config.config_parser import EdgeConfig
+from graphstorm_processing.graph_loaders.dist_heterogeneous_loader import (
+    DistHeterogeneousGraphLoader,
+    HeterogeneousLoaderConfig,
+)
+
+
+def generate_edge_configs(input_dir: str, num_relations: int, num_edges: int, num_nodes: int):
+    """Writes the edge files of user-[rel_i]-item relations and returns their configs."""
+    rng = np.random.default_rng(42)
+    edge_configs = []
+    for rel_idx in range(num_relations):
+        edge_file = f"edges/rel{rel_idx}.parquet"
+        os.makedirs(os.path.join(input_dir, "edges"), exist_ok=True)
+        pd.DataFrame(
+            {
+                "src": [f"user-{i}" for i in rng.integers(num_nodes, size=num_edges)],
+                "dst": [f"item-{i}" for i in rng.integers(num_nodes, size=num_edges)],
+            }
+        ).to_parquet(os.path.join(input_dir, edge_file))
+        data_dict = {"format": "parquet", "files": [edge_file]}
+        edge_dict = {
+            "data": data_dict,
+            "source": {"column": "src", "type": "user"},
+            "relation": {"type": f"rel{rel_idx}"},
+            "dest": {"column": "dst", "type": "item"},
+        }
+        edge_configs.append(EdgeConfig(edge_dict, data_dict))
+    return edge_configs
+
+
+def create_loader(spark: SparkSession, input_dir: str, output_dir: str, edge_configs):
+    """Creates a loader that writes under output_dir."""
+    loader_config = HeterogeneousLoaderConfig(
+        add_reverse_edges=False,
+        data_configs={"edges": edge_configs},
+        enable_assertions=False,
+        graph_name="benchmark",
+        input_prefix=input_dir,
+        local_input_path=input_dir,
+        local_metadata_output_path=output_dir,
+        num_output_files=None,
+        output_prefix=output_dir,
+        precomputed_transformations={},
+    )
+    return DistHeterogeneousGraphLoader(spark, loader_config)
+
+
+def create_mappings_with_joins(loader: DistHeterogeneousGraphLoader, edge_configs) -> None:
+    """The previous approach: extend each mapping once per referencing edge type."""
+    mappings = {}
+    for edge_config in edge_configs:
+        edges_df = loader._read_edge_df(edge_config)  # pylint: disable=protected-access
+        edges_df.cache()
+        for ntype, ncol in [
+            (edge_config.src_ntype, edge_config.src_col),
+            (edge_config.dst_ntype, edge_config.dst_col),
+        ]:
+            if ntype in mappings:
+                # pylint: disable=protected-access
+                mappings[ntype] = loader._extend_mapping_from_edges(mappings[ntype], edges_df, ncol)
+            else:
+                mappings[ntype] = loader.create_node_id_map_from_nodes_df(
+                    edges_df.select(ncol).distinct(), ncol
+                )
+    for ntype, mapping_df in mappings.items():
+        # pylint: disable=protected-access
+        loader._write_nodeid_mapping_and_update_state(mapping_df, ntype)
+
+
+def main():
+    """Runs both approaches and prints their runtimes."""
+    parser = argparse.ArgumentParser("Benchmark node id mapping creation from edges")
+    parser.add_argument("--num-relations", type=int, default=32)
+    parser.add_argument("--num-edges", type=int, default=200000, help="Edges per relation.")
+    parser.add_argument("--num-nodes", type=int, default=1000000, help="Nodes per node type.")
+    args = parser.parse_args()
+
+    spark = SparkSession.builder.master("local[*]").appName("NodeIdMappingBenchmark").getOrCreate()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_dir = os.path.join(tmpdir, "input")
+        edge_configs = generate_edge_configs(
+            input_dir, args.num_relations, args.num_edges, args.num_nodes
+        )
+
+        start = perf_counter()
+        loader = create_loader(spark, input_dir, os.path.join(tmpdir, "joins"), edge_configs)
+        create_mappings_with_joins(loader, edge_configs)
+        join_time = perf_counter() - start
+
+        start = perf_counter()
+        loader = create_loader(spark, input_dir, os.path.join(tmpdir, "single"), edge_configs)
+        loader.create_node_id_maps_from_edges(edge_configs, {"user", "item"})
+        single_pass_time = perf_counter() - start
+
+    print(f"Relations: {args.num_relations}, edges per relation: {args.num_edges}")
+    print(f"Join and zipWithIndex per edge type: {join_time:.2f}s")
+    print(f"Single-pass union and prefix offsets: {single_pass_time:.2f}s")
+    print(f"Speedup: {join_time / single_pass_time:.2f}x")
+    spark.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -82,6 +82,20 @@ def parse_args() -> argparse.Namespace:
         "Note that this option is much slower than the in-memory default.",
         choices=["True", "False", "1", "0"],
     )
+    parser.add_argument(
+        "--parallel-repartitioning",
+        type=lambda x: (str(x).lower() in ["true", "1"]),
+        default=False,
+        help="When True will repartition node/edge types and files concurrently, "
+        "only reading the rows needed for each new file.",
+        choices=["True", "False", "1", "0"],
+    )
+    parser.add_argument(
+        "--memory-budget-gb",
+        type=float,
+        default=None,
+        help="Memory in GB that concurrent tasks can use with --parallel-repartitioning.",
+    )
     parser.add_argument(
         "--updated-metadata-file-name",
         type=str,
@@ -108,6 +122,8 @@ def main():
         s3_input_prefix,
         "--streaming-repartitioning",
         "True" if args.streaming_repartitioning else "False",
+        "--parallel-repartitioning",
+        "True" if args.parallel_repartitioning else "False",
         "--input-metadata-file-name",
         args.config_filename,
         "--log-level",
@@ -116,6 +132,9 @@ def main():
         args.updated_metadata_file_name,
     ]
 
+    if args.memory_budget_gb is not None:
+        container_args.extend(["--memory-budget-gb", str(args.memory_budget_gb)])
+
     if args.job_name is None:
         args.job_name = "gsprocessing-repartitioning"
 
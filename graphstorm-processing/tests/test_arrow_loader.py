@@ -0,0 +1,275 @@
+"""
+Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License").
+You may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from graphstorm_processing.config.config_parser import create_config_objects
+from graphstorm_processing.constants import TRANSFORMATIONS_FILENAME
+from graphstorm_processing.data_transformations.arrow_feature_transformer import (
+    ArrowCategoryTransformation,
+    ArrowNumericalTransformation,
+)
+from graphstorm_processing.graph_loaders.arrow_heterogeneous_loader import (
+    ArrowHeterogeneousGraphLoader,
+)
+from graphstorm_processing.graph_loaders.dist_heterogeneous_loader import (
+    HeterogeneousLoaderConfig,
+)
+from graphstorm_processing.graph_loaders.row_count_utils import verify_metadata_match
+
+_ROOT = os.path.abspath(os.path.dirname(__file__))
+INPUT_PATH = os.path.join(_ROOT, "resources/small_heterogeneous_graph")
+
+
+@pytest.fixture(autouse=True, name="tempdir")
+def tempdir_fixture():
+    """Create temp dir for output files"""
+    tempdirectory = tempfile.mkdtemp(
+        prefix=os.path.join(_ROOT, "resources/test_output/"),
+    )
+    yield tempdirectory
+    shutil.rmtree(tempdirectory)
+
+
+def read_gsprocessing_config(remove_hf_features: bool = True) -> dict:
+    """Read the small graph config, optionally without the HuggingFace features."""
+    config_path = os.path.join(INPUT_PATH, "gsprocessing-config.json")
+    with open(config_path, "r", encoding="utf-8") as conf_file:
+        graph_config = json.load(conf_file)["graph"]
+    if remove_hf_features:
+        for node_config in graph_config["nodes"]:
+            node_config["features"] = [
+                feat
+                for feat in node_config.get("features", [])
+                if feat["transformation"]["name"] != "huggingface"
+            ]
+    return graph_config
+
+
+def create_arrow_loader(
+    graph_config: dict, tempdir: str, input_path: str = INPUT_PATH, num_output_files: int = 2
+) -> ArrowHeterogeneousGraphLoader:
+    """Create an Arrow loader that writes its output under tempdir"""
+    loader_config = HeterogeneousLoaderConfig(
+        add_reverse_edges=True,
+        data_configs=create_config_objects(graph_config),
+        enable_assertions=True,
+        graph_name="small_heterogeneous_graph",
+        input_prefix=input_path,
+        local_input_path=input_path,
+        local_metadata_output_path=tempdir,
+        num_output_files=num_output_files,
+        output_prefix=tempdir,
+        precomputed_transformations={},
+    )
+    return ArrowHeterogeneousGraphLoader(loader_config)
+
+
+def read_output(tempdir: str, metadata_entry: dict) -> pd.DataFrame:
+    """Read all the files of a metadata entry, in order"""
+    return pd.concat(
+        [pq.read_table(os.path.join(tempdir, path)).to_pandas() for path in metadata_entry["data"]],
+        ignore_index=True,
+    )
+
+
+def test_arrow_loader_small_graph(tempdir: str):
+    """Test processing the small heterogeneous graph with the Arrow engine"""
+    arrow_loader = create_arrow_loader(read_gsprocessing_config(), tempdir)
+    metadata = arrow_loader.load().processed_graph_metadata_dict
+
+    with open(os.path.join(tempdir, "metadata.json"), "r", encoding="utf-8") as mfile:
+        assert json.load(mfile) == json.loads(json.dumps(metadata))
+    assert os.path.exists(os.path.join(tempdir, TRANSFORMATIONS_FILENAME))
+
+    assert metadata["node_type"] == ["director", "genre", "movie", "user"]
+    assert metadata["num_nodes_per_type"] == [3, 2, 4, 5]
+    assert metadata["edge_type"] == [
+        "movie:included_in:genre",
+        "genre:included_in-rev:movie",
+        "user:rated:movie",
+        "movie:rated-rev:user",
+        "director:directed:movie",
+        "movie:directed-rev:director",
+    ]
+    assert metadata["num_edges_per_type"] == [4, 4, 6, 6, 4, 4]
+    # All the outputs of a type are split into the same row counts
+    assert verify_metadata_match(metadata)
+
+    graph_info = metadata["graph_info"]
+    assert graph_info["nfeat_size"] == {
+        "user": {"age": 1, "multi": 2, "no-op-truncated": 1, "state": 3}
+    }
+    assert graph_info["task_type"] == "node_class"
+    assert graph_info["label_map"] == {"male": 0, "female": 1}
+    assert graph_info["label_properties"]["user"]["VALUE_COUNTS"] == {
+        "male": 3,
+        "female": 1,
+        None: 1,
+    }
+    assert graph_info["ntype_to_label_masks"] == {"user": ["train_mask", "val_mask", "test_mask"]}
+
+    # Node rows keep the order of the input file
+    user_mapping = read_output(tempdir, metadata["raw_id_mappings"]["user"])
+    assert user_mapping["orig"].tolist() == ["mark", "john", "tara", "kate", "george"]
+    assert_array_equal(user_mapping["new"].to_numpy(), np.arange(5))
+    user_data = metadata["node_data"]["user"]
+    labels = read_output(tempdir, user_data["gender"])["gender"]
+    assert labels.iloc[3] is None or np.isnan(labels.iloc[3])
+    assert labels.drop(index=3).tolist() == [0, 0, 1, 0]
+    # The user without a label is not part of any split
+    masks = np.stack(
+        [
+            read_output(tempdir, user_data[mask_name])[mask_name].to_numpy()
+            for mask_name in ["train_mask", "val_mask", "test_mask"]
+        ],
+        axis=1,
+    )
+    assert_array_equal(masks.sum(axis=1), [1, 1, 1, 0, 1])
+
+    # Edge structure uses the node int ids
+    movie_ids = read_output(tempdir, metadata["raw_id_mappings"]["movie"])
+    movie_to_int = dict(zip(movie_ids["orig"], movie_ids["new"]))
+    rated_edges = read_output(tempdir, metadata["edges"]["user:rated:movie"])
+    edges_df = pd.read_csv(os.path.join(INPUT_PATH, "edges/user-rated-movie.csv"))
+    assert_array_equal(rated_edges["dst_int_id"], edges_df["~to"].map(movie_to_int))
+    reverse_edges = read_output(tempdir, metadata["edges"]["movie:rated-rev:user"])
+    assert_array_equal(reverse_edges["src_int_id"], rated_edges["src_int_id"])
+
+
+def test_arrow_loader_transformations_match_representations(tempdir: str):
+    """Test that re-applying the written representations reproduces the features"""
+    arrow_loader = create_arrow_loader(read_gsprocessing_config(), tempdir, num_output_files=1)
+    processed_graph = arrow_loader.load()
+    metadata = processed_graph.processed_graph_metadata_dict
+    user_representations = processed_graph.transformation_representations["node_features"]["user"]
+    assert user_representations["state"]["transformation_name"] == "DistCategoryTransformation"
+    assert user_representations["age"]["transformation_name"] == "DistNumericalTransformation"
+
+    input_table = pa.Table.from_pandas(
+        pd.read_csv(os.path.join(INPUT_PATH, "nodes/user.csv"), usecols=["age", "state"])
+    )
+
+    state_feature = read_output(tempdir, metadata["node_data"]["user"]["state"])["state"]
+    precomputed_state = ArrowCategoryTransformation(
+        ["state"], json_representation=user_representations["state"]
+    ).apply(input_table)
+    assert_array_equal(
+        np.stack(state_feature.to_numpy()),
+        np.array(precomputed_state.column("state").to_pylist()),
+    )
+
+    age_feature = read_output(tempdir, metadata["node_data"]["user"]["age"])["age"]
+    precomputed_age = ArrowNumericalTransformation(
+        ["age"], json_representation=user_representations["age"]
+    ).apply(input_table)
+    assert_allclose(age_feature.to_numpy(), precomputed_age.column("age").to_numpy())
+
+
+def test_arrow_loader_custom_splits(tempdir: str):
+    """Test custom node and edge splits from Parquet input with the Arrow engine"""
+    input_path = os.path.join(tempdir, "input")
+    output_path = os.path.join(tempdir, "output")
+    os.makedirs(input_path)
+    os.makedirs(output_path)
+    pd.DataFrame({"id": ["a", "b", "c", "d"], "label": ["x", "y", None, "x"]}).to_parquet(
+        os.path.join(input_path, "nodes.parquet")
+    )
+    pd.DataFrame({"src": ["a", "b", "c", "d"], "dst": ["b", "c", "d", "a"]}).to_parquet(
+        os.path.join(input_path, "edges.parquet")
+    )
+    split_ids = {"train": ["a", "c"], "val": ["b"], "test": ["d"]}
+    for split, node_ids in split_ids.items():
+        pd.DataFrame({"nid": node_ids}).to_parquet(os.path.join(input_path, f"{split}.parquet"))
+    edge_split_ids = {"train": (["a", "c"], ["b", "d"]), "val": (["b"], ["c"]), "test": ([], [])}
+    for split, (src_ids, dst_ids) in edge_split_ids.items():
+        pd.DataFrame({"src": src_ids, "dst": dst_ids}, dtype="string").to_parquet(
+            os.path.join(input_path, f"edge_{split}.parquet")
+        )
+    graph_config = {
+        "nodes": [
+            {
+                "data": {"format": "parquet", "files": ["nodes.parquet"]},
+                "type": "n",
+                "column": "id",
+                "labels": [
+                    {
+                        "column": "label",
+                        "type": "classification",
+                        "custom_split_filenames": {
+                            "train": ["train.parquet"],
+                            "valid": ["val.parquet"],
+                            "test": ["test.parquet"],
+                            "column": ["nid"],
+                        },
+                    }
+                ],
+            }
+        ],
+        "edges": [
+            {
+                "data": {"format": "parquet", "files": ["edges.parquet"]},
+                "source": {"column": "src", "type": "n"},
+                "dest": {"column": "dst", "type": "n"},
+                "relation": {"type": "r"},
+                "labels": [
+                    {
+                        "column": "",
+                        "type": "link_prediction",
+                        "custom_split_filenames": {
+                            "train": ["edge_train.parquet"],
+                            "valid": ["edge_val.parquet"],
+                            "test": ["edge_test.parquet"],
+                            "column": ["src", "dst"],
+                        },
+                    }
+                ],
+            }
+        ],
+    }
+    arrow_loader = create_arrow_loader(graph_config, output_path, input_path=input_path)
+    metadata = arrow_loader.load().processed_graph_metadata_dict
+    assert verify_metadata_match(metadata)
+
+    node_data = metadata["node_data"]["n"]
+    assert_array_equal(
+        read_output(output_path, node_data["train_mask"])["train_mask"], [1, 0, 1, 0]
+    )
+    assert_array_equal(read_output(output_path, node_data["val_mask"])["val_mask"], [0, 1, 0, 0])
+    assert_array_equal(read_output(output_path, node_data["test_mask"])["test_mask"], [0, 0, 0, 1])
+
+    edge_data = metadata["edge_data"]["n:r:n"]
+    assert_array_equal(
+        read_output(output_path, edge_data["train_mask"])["train_mask"], [1, 0, 1, 0]
+    )
+    assert_array_equal(read_output(output_path, edge_data["val_mask"])["val_mask"], [0, 1, 0, 0])
+    assert_array_equal(read_output(output_path, edge_data["test_mask"])["test_mask"], [0, 0, 0, 0])
+
+
+def test_arrow_loader_unsupported_transformation(tempdir: str):
+    """Test that transformations only the Spark engine supports are rejected upfront"""
+    with pytest.raises(NotImplementedError, match="not supported by the Arrow engine"):
+        create_arrow_loader(read_gsprocessing_config(remove_hf_features=False), tempdir)
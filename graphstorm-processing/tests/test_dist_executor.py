@@ -20,10 +20,20 @@ import shutil
 import tempfile
 from unittest import mock
 
+import pyarrow.parquet as pq
 import pytest
 
 from graphstorm_processing.distributed_executor import DistributedExecutor, ExecutorConfig
-from graphstorm_processing.constants import TRANSFORMATIONS_FILENAME, FilesystemType, ExecutionEnv
+from graphstorm_processing.graph_loaders.dist_heterogeneous_loader import (
+    NODE_MAPPING_INT,
+    NODE_MAPPING_STR,
+)
+from graphstorm_processing.constants import (
+    PROCESSED_INPUT_FILES_FILENAME,
+    TRANSFORMATIONS_FILENAME,
+    FilesystemType,
+    ExecutionEnv,
+)
 from test_dist_heterogenous_loader import verify_integ_test_output, NODE_CLASS_GRAPHINFO_UPDATES
 
 pytestmark = pytest.mark.usefixtures("spark")
@@ -175,3 +185,211 @@ def test_dist_executor_graph_name(executor_configuration: ExecutorConfig):
     executor_configuration.input_prefix = executor_configuration.input_prefix + "/"
     dist_executor = DistributedExecutor(executor_configuration)
     assert dist_executor.graph_name == "small_heterogeneous_graph"
+
+
+def _incremental_gsp_config(input_files: list[str]) -> dict:
+    """Creates a GSProcessing config for the input files of an incremental test"""
+
+    def files_with_prefix(prefix: str) -> list[str]:
+        return [input_file for input_file in input_files if input_file.startswith(prefix)]
+
+    def csv_data(prefix: str) -> dict:
+        return {"format": "csv", "files": files_with_prefix(prefix), "separator": ","}
+
+    return {
+        "version": "gsprocessing-v1.0",
+        "graph": {
+            "nodes": [
+                {
+                    "data": csv_data("nodes/user"),
+                    "type": "user",
+                    "column": "~id",
+                    "features": [{"column": "age", "transformation": {"name": "no-op"}}],
+                }
+            ],
+            "edges": [
+                {
+                    "data": csv_data("edges/rated"),
+                    "source": {"column": "~from", "type": "user"},
+                    "dest": {"column": "~to", "type": "movie"},
+                    "relation": {"type": "rated"},
+                    "features": [{"column": "rating", "transformation": {"name": "no-op"}}],
+                },
+                {
+                    "data": csv_data("edges/directed"),
+                    "source": {"column": "~from", "type": "director"},
+                    "dest": {"column": "~to", "type": "movie"},
+                    "relation": {"type": "directed"},
+                },
+            ],
+        },
+    }
+
+
+def _read_output_column(output_prefix: str, data_dict: dict, column: str) -> list:
+    """Reads a column from all the files of a metadata entry, in order"""
+    values = []
+    for path in data_dict["data"]:
+        values.extend(pq.read_table(os.path.join(output_prefix, path)).column(column).to_pylist())
+    return values
+
+
+def test_dist_executor_incremental_runs(tempdir: str):
+    """Test that chained incremental runs keep node ids unique and contiguous,
+    and that each incremental output describes the full graph."""
+    input_path = os.path.join(tempdir, "input")
+    os.makedirs(os.path.join(input_path, "nodes"))
+    os.makedirs(os.path.join(input_path, "edges"))
+    headers = {
+        "nodes/user": "~id,age",
+        "edges/rated": "~from,~to,rating",
+        "edges/directed": "~from,~to",
+    }
+    # Each run adds one batch of files to the input
+    batches = [
+        {
+            "nodes/user-0.csv": [("mark", 30), ("john", 22)],
+            "edges/rated-0.csv": [("mark", "movie1", 4), ("john", "movie2", 3)],
+            "edges/directed-0.csv": [("director1", "movie1"), ("director2", "movie2")],
+        },
+        # The director node type and the directed edge type are not touched by this run
+        {
+            "nodes/user-1.csv": [("tara", 33), ("kate", 29)],
+            "edges/rated-1.csv": [("tara", "movie1", 2), ("kate", "movie3", 5)],
+        },
+        # A run that only adds new directors and movies
+        {
+            "edges/directed-1.csv": [("director3", "movie4"), ("director1", "movie3")],
+        },
+    ]
+
+    input_rows = {prefix: [] for prefix in headers}
+    previous_output = None
+    previous_mappings = {}
+    for run_idx, batch in enumerate(batches):
+        for input_file, rows in batch.items():
+            prefix = input_file.split("-", maxsplit=1)[0]
+            input_rows[prefix].extend(rows)
+            with open(os.path.join(input_path, input_file), "w", encoding="utf-8") as f:
+                f.write("\n".join([headers[prefix]] + [",".join(map(str, row)) for row in rows]))
+        input_files = sorted(
+            input_file for input_batch in batches[: run_idx + 1] for input_file in input_batch
+        )
+        with open(os.path.join(input_path, "gsprocessing-config.json"), "w", encoding="utf-8") as f:
+            json.dump(_incremental_gsp_config(input_files), f)
+
+        output_path = os.path.join(tempdir, f"output-{run_idx}")
+        os.makedirs(output_path)
+        dist_executor = DistributedExecutor(
+            ExecutorConfig(
+                local_config_path=input_path,
+                local_metadata_output_path=output_path,
+                input_prefix=input_path,
+                output_prefix=output_path,
+                num_output_files=2,
+                config_filename="gsprocessing-config.json",
+                execution_env=ExecutionEnv.LOCAL,
+                filesystem_type=FilesystemType.LOCAL,
+                add_reverse_edges=True,
+                graph_name="incremental_graph",
+                do_repartition=True,
+                previous_output_prefix=previous_output,
+            )
+        )
+        # Only the new input files are processed
+        # pylint: disable=protected-access
+        processed_files = {
+            input_file
+            for structure_configs in dist_executor.loader._data_configs.values()
+            for structure_config in structure_configs
+            for input_file in structure_config.files
+        }
+        assert processed_files == set(batch.keys())
+        dist_executor.spark.stop = mock.MagicMock(name="stop")
+        dist_executor.run()
+
+        with open(os.path.join(output_path, "metadata.json"), "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+        with open(
+            os.path.join(output_path, PROCESSED_INPUT_FILES_FILENAME), "r", encoding="utf-8"
+        ) as f:
+            assert json.load(f) == [f"{input_path}/{input_file}" for input_file in input_files]
+
+        # Every node type has a mapping with unique and contiguous ids,
+        # that keeps the ids of the previous run
+        assert metadata["node_type"] == ["director", "movie", "user"]
+        mappings = {}
+        for node_type in metadata["node_type"]:
+            str_ids = _read_output_column(
+                output_path, metadata["raw_id_mappings"][node_type], NODE_MAPPING_STR
+            )
+            int_ids = _read_output_column(
+                output_path, metadata["raw_id_mappings"][node_type], NODE_MAPPING_INT
+            )
+            assert len(set(str_ids)) == len(str_ids)
+            assert sorted(int_ids) == list(range(len(int_ids)))
+            mappings[node_type] = dict(zip(str_ids, int_ids))
+            for str_id, int_id in previous_mappings.get(node_type, {}).items():
+                assert mappings[node_type][str_id] == int_id
+        previous_mappings = mappings
+
+        expected_directors = {src for src, _ in input_rows["edges/directed"]}
+        expected_movies = {dst for _, dst, _ in input_rows["edges/rated"]}.union(
+            dst for _, dst in input_rows["edges/directed"]
+        )
+        assert set(mappings["director"]) == expected_directors
+        assert set(mappings["movie"]) == expected_movies
+        assert set(mappings["user"]) == {user for user, _ in input_rows["nodes/user"]}
+        num_nodes = dict(zip(metadata["node_type"], metadata["num_nodes_per_type"]))
+        assert num_nodes == {ntype: len(mapping) for ntype, mapping in mappings.items()}
+
+        # The node features are in the order of the node ids
+        ages = _read_output_column(output_path, metadata["node_data"]["user"]["age"], "age")
+        assert len(ages) == num_nodes["user"]
+        for user, age in input_rows["nodes/user"]:
+            assert float(ages[mappings["user"][user]]) == age
+
+        # The edges of all runs are in the output, with their features in the same order
+        assert metadata["edge_type"] == [
+            "user:rated:movie",
+            "movie:rated-rev:user",
+            "director:directed:movie",
+            "movie:directed-rev:director",
+        ]
+        for edge_type, src_type, dst_type, expected_rows in [
+            ("user:rated:movie", "user", "movie", input_rows["edges/rated"]),
+            ("director:directed:movie", "director", "movie", input_rows["edges/directed"]),
+        ]:
+            src_ids = _read_output_column(output_path, metadata["edges"][edge_type], "src_int_id")
+            dst_ids = _read_output_column(output_path, metadata["edges"][edge_type], "dst_int_id")
+            expected_edges = [
+                (mappings[src_type][row[0]], mappings[dst_type][row[1]]) for row in expected_rows
+            ]
+            assert sorted(zip(src_ids, dst_ids)) == sorted(expected_edges)
+        ratings = _read_output_column(
+            output_path, metadata["edge_data"]["user:rated:movie"]["rating"], "rating"
+        )
+        src_ids = _read_output_column(
+            output_path, metadata["edges"]["user:rated:movie"], "src_int_id"
+        )
+        dst_ids = _read_output_column(
+            output_path, metadata["edges"]["user:rated:movie"], "dst_int_id"
+        )
+        expected_ratings = {
+            (mappings["user"][user], mappings["movie"][movie]): rating
+            for user, movie, rating in input_rows["edges/rated"]
+        }
+        assert {
+            edge: float(rating) for edge, rating in zip(zip(src_ids, dst_ids), ratings)
+        } == expected_ratings
+
+        previous_output = output_path
+
+
+def test_dist_executor_incremental_same_output(
+    tempdir: str, executor_configuration: ExecutorConfig
+):
+    """Test that an incremental run cannot write to the previous output"""
+    executor_configuration.previous_output_prefix = tempdir
+    with pytest.raises(ValueError, match="needs to differ"):
+        DistributedExecutor(executor_configuration)
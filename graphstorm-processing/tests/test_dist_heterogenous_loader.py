@@ -417,8 +417,40 @@ def test_create_all_mapppings_from_edges(
         files_with_prefix = [
             os.path.join(dghl_loader.local_meta_output_path, x) for x in mapping_files
         ]
-        mapping_count = spark.read.parquet(*files_with_prefix).count()
-        assert mapping_count == expected_node_counts[node_type]
+        mapping_df = spark.read.parquet(*files_with_prefix)
+        assert mapping_df.count() == expected_node_counts[node_type]
+        # Every node gets a unique contiguous id
+        id_list = [
+            row[NODE_MAPPING_INT]
+            for row in mapping_df.select(NODE_MAPPING_INT).orderBy(NODE_MAPPING_INT).collect()
+        ]
+        assert id_list == list(range(expected_node_counts[node_type]))
+        assert mapping_df.select(NODE_MAPPING_STR).distinct().count() == len(id_list)
+
+
+def test_append_to_previous_mapping(spark: SparkSession):
+    """Test that new nodes get ids after the ids of a previous mapping"""
+    previous_mapping_df = spark.createDataFrame(
+        [("a", 0), ("b", 1), ("c", 2)], schema=[NODE_MAPPING_STR, NODE_MAPPING_INT]
+    )
+    nodes_df = spark.createDataFrame(
+        [("b", 1.0), ("d", 2.0), ("e", 3.0)], schema=[NODE_MAPPING_STR, "feat"]
+    )
+
+    # pylint: disable=protected-access
+    new_nodes_df, mapping_df, cached_ids_df = (
+        DistHeterogeneousGraphLoader._append_to_previous_mapping(nodes_df, previous_mapping_df)
+    )
+
+    # Existing nodes are skipped, new nodes continue the previous id range
+    new_rows = new_nodes_df.orderBy(NODE_MAPPING_INT).collect()
+    assert [row[NODE_MAPPING_STR] for row in new_rows] in (["d", "e"], ["e", "d"])
+    assert [row[NODE_MAPPING_INT] for row in new_rows] == [3, 4]
+    mapping = {row[NODE_MAPPING_STR]: row[NODE_MAPPING_INT] for row in mapping_df.collect()}
+    assert len(mapping) == 5
+    assert {key: mapping[key] for key in ("a", "b", "c")} == {"a": 0, "b": 1, "c": 2}
+    assert sorted(mapping.values()) == list(range(5))
+    cached_ids_df.unpersist()
 
 
 def test_create_some_mapppings_from_edges(
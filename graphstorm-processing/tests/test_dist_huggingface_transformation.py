@@ -24,6 +24,9 @@ from transformers import AutoTokenizer, AutoConfig, AutoModel
 from graphstorm_processing.data_transformations.dist_transformations import (
     DistHFTransformation,
 )
+from graphstorm_processing.data_transformations.dist_transformations.dist_hf_transformation import (
+    compute_lm_embeddings,
+)
 
 
 def test_hf_tokenizer_example(spark: SparkSession, check_df_schema):
@@ -131,3 +134,25 @@ def test_hf_emb_example(spark: SparkSession, check_df_schema):
         np.testing.assert_almost_equal(
             row[0], expected_output[idx], decimal=3, err_msg=f"Row {idx} is not equal"
         )
+
+
+def test_hf_emb_length_sorted_batches():
+    texts = [
+        "nurse",
+        "a much longer description of an occupation",
+        "doctor",
+        "software development engineer",
+        "scientist",
+    ]
+    hf_model = "bert-base-uncased"
+
+    # Batches of texts with different lengths are padded to their longest text
+    # and the embeddings are returned in the input order.
+    batched_embs = compute_lm_embeddings(texts, hf_model, max_seq_length=16, batch_size=2)
+    assert batched_embs.shape == (len(texts), 768)
+    assert batched_embs.dtype == np.float32
+    for idx, text in enumerate(texts):
+        single_emb = compute_lm_embeddings([text], hf_model, max_seq_length=16)
+        np.testing.assert_almost_equal(
+            batched_embs[idx], single_emb[0], decimal=3, err_msg=f"Row {idx} is not equal"
+        )
@@ -191,10 +191,11 @@ def create_parquet_files_fixture():
     [
         "_repartition_parquet_files_in_memory",
         "_repartition_parquet_files_streaming",
+        "_repartition_parquet_files_parallel",
     ],
 )
 def test_repartition_functions(desired_counts: List[int], partition_function_name: str):
-    """Test the repartition functions, streaming and in-memory"""
+    """Test the repartition functions, streaming, in-memory and parallel"""
     assert sum(desired_counts) == 50
 
     my_partitioner = ParquetRepartitioner(TEMP_DATA_PREFIX, filesystem_type=FilesystemType.LOCAL)
@@ -238,6 +239,78 @@ def test_repartition_functions(desired_counts: List[int], partition_function_nam
     assert_array_equal(original_table, repartitioned_table)
 
 
+def test_repartition_parallel_reuses_matching_files():
+    """Test that parallel repartitioning re-uses files with matching counts without rewriting"""
+    # Use a tiny memory budget to ensure tasks that exceed the budget still make progress
+    my_partitioner = ParquetRepartitioner(
+        TEMP_DATA_PREFIX,
+        filesystem_type=FilesystemType.LOCAL,
+        parallel_repartitioning=True,
+        memory_budget_gb=1e-9,
+    )
+
+    with open(
+        os.path.join(TEMP_DATA_PREFIX, "partitioned_metadata.json"), "r", encoding="utf-8"
+    ) as metafile:
+        metadata_dict = json.load(metafile)
+
+    edge_type_meta = metadata_dict["edges"]["src:dummy_type:dst"]
+    original_files = list(edge_type_meta["data"])
+    # Original counts are [8, 8, 8, 8, 18], so files 0, 1 and 4 cover the same rows
+    desired_counts = [8, 8, 10, 6, 18]
+    updated_meta = my_partitioner.repartition_parquet_files(edge_type_meta, desired_counts)
+
+    assert updated_meta["row_counts"] == desired_counts
+    for file_idx in [0, 1, 4]:
+        assert updated_meta["data"][file_idx] == original_files[file_idx]
+    for file_idx in [2, 3]:
+        assert updated_meta["data"][file_idx] not in original_files
+
+    repartitioned_table = pa.concat_tables(
+        [pq.read_table(os.path.join(TEMP_DATA_PREFIX, path)) for path in updated_meta["data"]]
+    )
+    assert_array_equal(repartitioned_table.column("src_int_id").to_numpy(), range(0, 50))
+    assert_array_equal(repartitioned_table.column("dst_int_id").to_numpy(), range(50, 100))
+
+
+def test_repartition_parallel_row_groups():
+    """Test parallel repartitioning of files with multiple row groups"""
+    row_groups_path = os.path.join(TEMP_DATA_PREFIX, "row_groups", "parquet")
+    os.makedirs(row_groups_path)
+    row_counts = [7, 13, 0, 10]
+    data_files = []
+    total_rows = 0
+    for i, row_count in enumerate(row_counts):
+        filename = f"part-{str(i).zfill(5)}.parquet"
+        # Set the type explicitly, so that the empty file has the same schema as the rest
+        feature = pa.array(range(total_rows, total_rows + row_count), type=pa.int64())
+        pq.write_table(
+            pa.table([feature], names=["feature"]),
+            os.path.join(row_groups_path, filename),
+            row_group_size=3,
+        )
+        data_files.append(f"row_groups/parquet/{filename}")
+        total_rows += row_count
+
+    my_partitioner = ParquetRepartitioner(
+        TEMP_DATA_PREFIX, filesystem_type=FilesystemType.LOCAL, parallel_repartitioning=True
+    )
+    desired_counts = [10, 0, 5, 15]
+    updated_meta = my_partitioner.repartition_parquet_files(
+        {"format": {"name": "parquet"}, "data": data_files, "row_counts": row_counts},
+        desired_counts,
+    )
+
+    assert updated_meta["row_counts"] == desired_counts
+    start = 0
+    for expected_count, result_filepath in zip(desired_counts, updated_meta["data"]):
+        file_values = pq.read_table(os.path.join(TEMP_DATA_PREFIX, result_filepath)).column(
+            "feature"
+        )
+        assert_array_equal(file_values.to_numpy(), range(start, start + expected_count))
+        start += expected_count
+
+
 # TODO: Add simple tests for the load functions
 
 
@@ -363,7 +436,8 @@ def test_collect_frequencies_for_data_counts():
         "node_class",
     ],
 )
-def test_repartition_files_integration(monkeypatch, task_type):
+@pytest.mark.parametrize("parallel_repartitioning", ["False", "True"])
+def test_repartition_files_integration(monkeypatch, task_type, parallel_repartitioning):
     """Integration test for repartition script"""
     with monkeypatch.context() as m:
         m.setattr(
@@ -377,6 +451,8 @@ def test_repartition_files_integration(monkeypatch, task_type):
                 "partitioned_metadata.json",
                 "--updated-metadata-file-name",
                 "updated_row_counts_metadata.json",
+                "--parallel-repartitioning",
+                parallel_repartitioning,
             ],
         )
         # We monkeypatch json.load to inject the task_type into the metadata
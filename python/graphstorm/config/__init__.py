@@ -30,6 +30,10 @@ from .config import (BUILTIN_TASK_NODE_CLASSIFICATION,
                      BUILTIN_TASK_RECONSTRUCT_EDGE_FEAT,
                      BUILTIN_TASK_MULTI_TASK)
 from .config import SUPPORTED_TASKS
+from .config import (BUILTIN_PRECISION_FP32,
+                     BUILTIN_PRECISION_FP16,
+                     BUILTIN_PRECISION_BF16,
+                     BUILTIN_PRECISIONS)
 
 from .config import (BUILTIN_LP_DOT_DECODER,
                      BUILTIN_LP_DISTMULT_DECODER,
@@ -54,6 +54,7 @@ from .config import GRAPHSTORM_SAGEMAKER_TASK_TRACKER
 from .config import SUPPORTED_TASK_TRACKER
 
 from .config import SUPPORTED_TASKS
+from .config import BUILTIN_PRECISION_FP32, BUILTIN_PRECISIONS
 
 from .config import BUILTIN_LP_DISTMULT_DECODER
 from .config import SUPPORTED_LP_DECODER
@@ -74,6 +75,7 @@ from ..eval import SUPPORTED_HIT_AT_METRICS
 
 from ..dataloading import BUILTIN_LP_UNIFORM_NEG_SAMPLER
 from ..dataloading import BUILTIN_LP_JOINT_NEG_SAMPLER
+from ..dataloading import BUILTIN_FEAT_CACHE_POLICIES
 
 __all__ = [
     "get_argument_parser",
@@ -760,10 +762,13 @@ class GSConfig:
         _ = self.verbose
         _ = self.use_wholegraph_embed
         _ = self.use_graphbolt
+        _ = self.precision
 
         # Data
         _ = self.node_feat_name
         _ = self.edge_feat_name
+        _ = self.node_feat_num_categories
+        _ = self.edge_feat_num_categories
         _ = self.edge_feat_mp_op
         _ = self.decoder_edge_feat
 
@@ -771,6 +776,7 @@ class GSConfig:
         _ = self.fixed_test_size
         _ = self.eval_fanout
         _ = self.use_mini_batch_infer
+        _ = self.infer_pipeline_depth
         _ = self.eval_batch_size
         _ = self.eval_frequency
         _ = self.no_validation
@@ -788,6 +794,9 @@ class GSConfig:
             _ = self.lr
             _ = self.max_grad_norm
             _ = self.grad_norm_type
+            _ = self.prefetch_depth
+            _ = self.node_feat_cache_size
+            _ = self.node_feat_cache_policy
             _ = self.gnn_norm
             _ = self.decoder_norm
             _ = self.sparse_optimizer_lr
@@ -839,6 +848,7 @@ class GSConfig:
             _ = self.use_self_loop
             _ = self.use_node_embeddings
             _ = self.num_bases
+            _ = self.fuse_relations
             _ = self.num_heads
             _ = self.num_ffn_layers_in_gnn
 
@@ -1063,6 +1073,21 @@ class GSConfig:
         else:
             return False
 
+    @property
+    def precision(self):
+        """ The numerical precision of model training and inference, which is one of
+            ``fp32``, ``fp16`` and ``bf16``. With ``fp16`` or ``bf16``, the forward
+            computation and the loss are run under ``torch.autocast``, while model
+            parameters, sparse embeddings and optimizer states stay in fp32.
+            Default is ``fp32``.
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_precision"):
+            assert self._precision in BUILTIN_PRECISIONS, \
+                f"precision must be one of {BUILTIN_PRECISIONS}, but get {self._precision}."
+            return self._precision
+        return BUILTIN_PRECISION_FP32
+
     ###################### language model support #########################
     # Bert related
     @property
@@ -1256,6 +1281,45 @@ class GSConfig:
             return self._grad_norm_type
         return 2
 
+    @property
+    def prefetch_depth(self):
+        """ The number of mini-batches prefetched on a background thread during
+            training. The next ``prefetch_depth`` mini-batches are sampled, their features
+            and labels are fetched and copied to the device while the current mini-batch
+            is computed. Default is 0, which prepares mini-batches synchronously.
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_prefetch_depth"):
+            assert isinstance(self._prefetch_depth, int) and self._prefetch_depth >= 0, \
+                "prefetch_depth must be a non-negative integer."
+            return self._prefetch_depth
+        return 0
+
+    @property
+    def node_feat_cache_size(self):
+        """ The memory budget in MB of the per-trainer cache of the node features
+            stored in remote partitions. Default is 0, which disables the cache.
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_node_feat_cache_size"):
+            cache_size = float(self._node_feat_cache_size)
+            assert cache_size >= 0, "node_feat_cache_size must be non-negative."
+            return cache_size
+        return 0
+
+    @property
+    def node_feat_cache_policy(self):
+        """ The policy of the node feature cache, which is one of ``lru``, ``lfu``
+            and ``degree``. Default is ``lru``.
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_node_feat_cache_policy"):
+            assert self._node_feat_cache_policy in BUILTIN_FEAT_CACHE_POLICIES, \
+                f"node_feat_cache_policy must be one of {BUILTIN_FEAT_CACHE_POLICIES}, " \
+                f"but get {self._node_feat_cache_policy}."
+            return self._node_feat_cache_policy
+        return BUILTIN_FEAT_CACHE_POLICIES[0]
+
     @property
     def input_activate(self):
         """ Input layer activation funtion type. Either None or ``relu``. Default is None.
@@ -1327,6 +1391,42 @@ class GSConfig:
         return None
 
     @property
+    def edge_feat_num_categories(self):
+        """ The number of categories of the edge features that store category indices,
+        e.g., the ``index`` output of the ``to_categorical`` feature transformation.
+        Default is None.
+
+        It is in the format of ``"src_ntype,etype,dst_ntype:num_categories",...``.
+        The input layer looks up an embedding for each category of these edge types
+        instead of projecting their features, so each of these edge types must have
+        exactly one edge feature.
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_edge_feat_num_categories"):
+            feat_names = self.edge_feat_name
+            num_categories = {}
+            for cat_info in self._edge_feat_num_categories:
+                cat_info = cat_info.split(":")
+                assert len(cat_info) == 2, \
+                        f"Unknown format of the number of categories: {cat_info}, " + \
+                        "must be: etype:num_categories."
+                can_etype = tuple(item.strip() for item in cat_info[0].split(","))
+                assert len(can_etype) == 3, \
+                        f"Unknown format of the edge type {cat_info[0]}, must be: " + \
+                         "src_node_type,relation_type,dst_node_type."
+                assert can_etype not in num_categories, \
+                        f"You already specify the number of categories of {can_etype}."
+                assert cat_info[1].isdigit() and int(cat_info[1]) > 0, \
+                        f"The number of categories of {can_etype} must be a positive integer."
+                assert isinstance(feat_names, str) or \
+                    (isinstance(feat_names, dict) and len(feat_names.get(can_etype, [])) == 1), \
+                        f"Edge {can_etype} must have exactly one edge feature " \
+                        "to store the category indices."
+                num_categories[can_etype] = int(cat_info[1])
+            return num_categories
+
+        return None
+    @property
     def edge_feat_mp_op(self):
         """ The operation for using edge features during message passing computation.
             Defaut is "concat".
@@ -1396,6 +1496,40 @@ class GSConfig:
         # By default, return None which means there is no node feature
         return None
 
+    @property
+    def node_feat_num_categories(self):
+        """ The number of categories of the node features that store category indices,
+        e.g., the ``index`` output of the ``to_categorical`` feature transformation.
+        Default is None.
+
+        It is in the format of ``"ntype0:num_categories","ntype1:num_categories",...``.
+        The input layer looks up an embedding for each category of these node types
+        instead of projecting their features, so each of these node types must have
+        exactly one node feature.
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_node_feat_num_categories"):
+            feat_names = self.node_feat_name
+            num_categories = {}
+            for cat_info in self._node_feat_num_categories:
+                cat_info = cat_info.split(":")
+                assert len(cat_info) == 2, \
+                        f"Unknown format of the number of categories: {cat_info}, " + \
+                        "must be NODE_TYPE:NUM_CATEGORIES."
+                ntype = cat_info[0]
+                assert ntype not in num_categories, \
+                        f"You already specify the number of categories of {ntype}."
+                assert cat_info[1].isdigit() and int(cat_info[1]) > 0, \
+                        f"The number of categories of {ntype} must be a positive integer."
+                assert isinstance(feat_names, str) or \
+                    (isinstance(feat_names, dict) and len(feat_names.get(ntype, [])) == 1), \
+                        f"Node {ntype} must have exactly one node feature " \
+                        "to store the category indices."
+                num_categories[ntype] = int(cat_info[1])
+            return num_categories
+
+        return None
+
     def _check_fanout(self, fanout, fot_name):
         try:
             if fanout[0].isnumeric() or fanout[0] == "-1":
@@ -1593,6 +1727,20 @@ class GSConfig:
             # So we set it to True by default
             return True
 
+    @property
+    def infer_pipeline_depth(self):
+        """ The number of mini-batches sampled and fetched ahead of the computation
+            on a background thread in each layer of full-graph inference.
+            Default is 0, which runs full-graph inference in the calling thread.
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_infer_pipeline_depth"):
+            assert isinstance(self._infer_pipeline_depth, int) \
+                and self._infer_pipeline_depth >= 0, \
+                "infer_pipeline_depth must be a non-negative integer."
+            return self._infer_pipeline_depth
+        return 0
+
     @property
     def gnn_norm(self):
         """ Normalization method for GNN layers. Options include ``batch`` or ``layer``.
@@ -2095,6 +2243,18 @@ class GSConfig:
         # By default do not use num_bases
         return -1
 
+    @property
+    def fuse_relations(self):
+        """ Whether to compute the RGCN message passing of all relations in a fused
+            kernel instead of one graph convolution per relation. Default is False.
+        """
+        # pylint: disable=no-member
+        if hasattr(self, "_fuse_relations"):
+            assert self._fuse_relations in [True, False], \
+                "fuse_relations should be either True or False"
+            return self._fuse_relations
+        return False
+
     ## RGAT and HGT only ##
     @property
     def num_heads(self):
@@ -2503,9 +2663,12 @@ class GSConfig:
 
     @property
     def eval_negative_sampler(self):
-        """ The negative sampler used for link prediction training.
-            Built-in samplers include ``uniform``, ``joint``, ``localuniform``,
-            ``all_etype_uniform`` and ``all_etype_joint``. Default is ``joint``.
+        """ The negative sampler used for link prediction evaluation.
+            Built-in samplers include ``uniform``, ``joint``, ``full`` and
+            ``full_filtered``. ``full`` ranks each positive edge against all the nodes
+            of the destination node type, and ``full_filtered`` also removes the other
+            true edges of the source node from the candidates. ``num_negative_edges_eval``
+            is ignored by ``full`` and ``full_filtered``. Default is ``joint``.
         """
         # pylint: disable=no-member
         if hasattr(self, "_eval_negative_sampler"):
@@ -3200,6 +3363,15 @@ def _add_initialization_args(parser):
             "See https://docs.dgl.ai/stochastic_training/ for details"
         )
     )
+    group.add_argument(
+        "--precision",
+        type=str,
+        default=argparse.SUPPRESS,
+        choices=BUILTIN_PRECISIONS,
+        help="The numerical precision of model training and inference. 'fp16' and "
+             "'bf16' run the forward computation under autocast. 'fp16' also uses "
+             "dynamic loss scaling on GPUs."
+    )
     return parser
 
 def _add_gsgnn_basic_args(parser):
@@ -3240,6 +3412,16 @@ def _add_gnn_args(parser):
             "the corresponding feature name is <feat_name>"
             "2)'--edge-feat-name etype0:feat0 etype1:feat0,feat1,...': "
             "different edge types have different edge features.")
+    group.add_argument("--node-feat-num-categories", nargs='+', type=str,
+            default=argparse.SUPPRESS,
+            help="The number of categories of the node features that store category "
+            "indices, in the format of 'ntype0:num_categories ntype1:num_categories ...'. "
+            "The input layer looks up an embedding for each category of these node types.")
+    group.add_argument("--edge-feat-num-categories", nargs='+', type=str,
+            default=argparse.SUPPRESS,
+            help="The number of categories of the edge features that store category "
+            "indices, in the format of 'etype0:num_categories etype1:num_categories ...'. "
+            "The input layer looks up an embedding for each category of these edge types.")
     group.add_argument("--edge-feat-mp-op", type=str, default=argparse.SUPPRESS,
             help="The operation for using edge feature in message passing computation."
                       "Supported operations include {BUILTIN_EDGE_FEAT_MP_OPS}")
@@ -3270,6 +3452,10 @@ def _add_gnn_args(parser):
             type=lambda x: (str(x).lower() in ['true', '1']),
             default=argparse.SUPPRESS
     )
+    parser.add_argument("--infer-pipeline-depth", type=int, default=argparse.SUPPRESS,
+            help="The number of mini-batches sampled and fetched ahead of the computation "
+                 "on a background thread in each layer of full-graph inference. "
+                 "0 means no pipelining.")
 
     return parser
 
@@ -3336,6 +3522,18 @@ def _add_hyperparam_args(parser):
             help="maximum L2 norm of gradients")
     group.add_argument("--grad-norm-type", type=float, default=argparse.SUPPRESS,
             help="norm type for gradient clips")
+    group.add_argument("--prefetch-depth", type=int, default=argparse.SUPPRESS,
+            help="The number of mini-batches sampled, fetched and copied to the device "
+                 "on a background thread during training. 0 means no prefetching.")
+    group.add_argument("--node-feat-cache-size", type=float, default=argparse.SUPPRESS,
+            help="The memory budget in MB of the per-trainer cache of the node features "
+                 "stored in remote partitions. 0 disables the cache.")
+    group.add_argument("--node-feat-cache-policy", type=str, default=argparse.SUPPRESS,
+            choices=BUILTIN_FEAT_CACHE_POLICIES,
+            help="The policy of the node feature cache. 'lru' admits all missed rows "
+                 "and evicts the least recently used rows. 'lfu' only admits rows that "
+                 "are accessed more frequently than the rows they evict. 'degree' "
+                 "caches the remote nodes with the most edges in the local partition.")
     group.add_argument(
             "--use-node-embeddings",
             type=lambda x: (str(x).lower() in ['true', '1']),
@@ -3419,6 +3617,10 @@ def _add_rgcn_args(parser):
     group = parser.add_argument_group(title="rgcn")
     group.add_argument("--num-bases", type=int, default=argparse.SUPPRESS,
             help="number of filter weight matrices, default: -1 [use all]")
+    group.add_argument("--fuse-relations",
+            type=lambda x: (str(x).lower() in ['true', '1']), default=argparse.SUPPRESS,
+            help="Whether to compute the message passing of all relations in a fused "
+                 "kernel. Default: False.")
     return parser
 
 def _add_node_classification_args(parser):
@@ -3513,7 +3715,10 @@ def _add_link_prediction_args(parser):
     group.add_argument("--train-negative-sampler", type=str, default=argparse.SUPPRESS,
             help="The algorithm of sampling negative edges for link prediction.training ")
     group.add_argument("--eval-negative-sampler", type=str, default=argparse.SUPPRESS,
-            help="The algorithm of sampling negative edges for link prediction evaluation")
+            help="The algorithm of sampling negative edges for link prediction evaluation. "
+                 "Built-in samplers include uniform, joint, full and full_filtered. "
+                 "full and full_filtered rank each positive edge against all "
+                 "the nodes of the destination node type.")
     group.add_argument('--eval-etype', nargs='+', type=str, default=argparse.SUPPRESS)
     group.add_argument('--train-etype', nargs='+', type=str, default=argparse.SUPPRESS,
             help="The list of canonical etype that will be added as"
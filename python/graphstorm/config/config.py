@@ -79,6 +79,12 @@ SUPPORTED_TASKS  = [BUILTIN_TASK_NODE_CLASSIFICATION, \
     BUILTIN_TASK_RECONSTRUCT_NODE_FEAT,
     BUILTIN_TASK_RECONSTRUCT_EDGE_FEAT]
 
+# Numerical precision of model training and inference
+BUILTIN_PRECISION_FP32 = "fp32"
+BUILTIN_PRECISION_FP16 = "fp16"
+BUILTIN_PRECISION_BF16 = "bf16"
+BUILTIN_PRECISIONS = [BUILTIN_PRECISION_FP32, BUILTIN_PRECISION_FP16, BUILTIN_PRECISION_BF16]
+
 EARLY_STOP_CONSECUTIVE_INCREASE_STRATEGY = "consecutive_increase"
 EARLY_STOP_AVERAGE_INCREASE_STRATEGY = "average_increase"
 
@@ -26,7 +26,9 @@ from .dataloading import GSgnnEdgeDataLoader
 from .dataloading import GSgnnNodeDataLoader, GSgnnNodeSemiSupDataLoader
 from .dataloading import (GSgnnLinkPredictionTestDataLoader,
                           GSgnnLinkPredictionJointTestDataLoader,
-                          GSgnnLinkPredictionPredefinedTestDataLoader)
+                          GSgnnLinkPredictionPredefinedTestDataLoader,
+                          GSgnnLinkPredictionFullTestDataLoader,
+                          GSgnnLinkPredictionFilteredFullTestDataLoader)
 from .dataloading import (FastGSgnnLinkPredictionDataLoader,
                           FastGSgnnLPLocalJointNegDataLoader,
                           FastGSgnnLPJointNegDataLoader,
@@ -35,15 +37,21 @@ from .dataloading import (GSgnnEdgeDataLoaderBase,
                           GSgnnLinkPredictionDataLoaderBase,
                           GSgnnNodeDataLoaderBase)
 from .dataloading import GSgnnMultiTaskDataLoader
+from .dataloading import GSgnnPrefetchLoader, move_to_device
 
 from .dataset import GSgnnData
+from .feat_cache import (GSgnnNodeFeatCache,
+                         FeatRowCache,
+                         BUILTIN_FEAT_CACHE_POLICIES)
 
 from .dataloading import (BUILTIN_LP_UNIFORM_NEG_SAMPLER,
                           BUILTIN_LP_JOINT_NEG_SAMPLER,
                           BUILTIN_LP_INBATCH_JOINT_NEG_SAMPLER,
                           BUILTIN_LP_LOCALUNIFORM_NEG_SAMPLER,
                           BUILTIN_LP_LOCALJOINT_NEG_SAMPLER,
-                          BUILTIN_LP_FIXED_NEG_SAMPLER)
+                          BUILTIN_LP_FIXED_NEG_SAMPLER,
+                          BUILTIN_LP_FULL_NEG_SAMPLER,
+                          BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER)
 from .dataloading import BUILTIN_LP_ALL_ETYPE_UNIFORM_NEG_SAMPLER
 from .dataloading import BUILTIN_LP_ALL_ETYPE_JOINT_NEG_SAMPLER
 from .dataloading import (BUILTIN_FAST_LP_UNIFORM_NEG_SAMPLER,
@@ -19,6 +19,9 @@ import math
 import inspect
 import logging
 import importlib.metadata
+import queue
+import threading
+from contextlib import contextmanager
 from packaging import version
 import dgl
 import torch as th
@@ -508,6 +511,8 @@ BUILTIN_FAST_LP_JOINT_NEG_SAMPLER = 'fast_joint'
 BUILTIN_FAST_LP_LOCALUNIFORM_NEG_SAMPLER = 'fast_localuniform'
 BUILTIN_FAST_LP_LOCALJOINT_NEG_SAMPLER = 'fast_localjoint'
 BUILTIN_LP_FIXED_NEG_SAMPLER = 'fixed'
+BUILTIN_LP_FULL_NEG_SAMPLER = 'full'
+BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER = 'full_filtered'
 
 class GSgnnLinkPredictionDataLoaderBase():
     """ The base dataloader class for link prediction tasks.
@@ -1439,6 +1444,101 @@ class GSgnnLinkPredictionPredefinedTestDataLoader(GSgnnLinkPredictionTestDataLoa
         self._current_pos[etype] += self._batch_size
         return pos_neg_tuple, end_of_etype
 
+class GSgnnLinkPredictionFullTestDataLoader(GSgnnLinkPredictionTestDataLoader):
+    """ Mini-batch dataloader for link prediction validation and test
+    that ranks each positive edge against all candidate destination nodes.
+
+    The dataloader only generates positive edges. The negative sample type
+    it returns is ``full``, which tells ``run_lp_mini_batch_predict`` to score
+    every positive edge against all the nodes of the destination node type
+    instead of a sampled negative set.
+
+    Parameters
+    -----------
+    dataset: GSgnnData
+        The GraphStorm data.
+    target_idx : dict of Tensors
+        The target edge indexes for link prediction.
+    batch_size: int
+        Mini-batch size.
+    num_negative_edges: int
+        Not used. Kept to share the constructor signature with the other test
+        dataloaders.
+    fanout: list of int, or dict of list
+        Neighbor sampling fanout. If it's a dict of list, it indicates the fanout for each
+        edge type.
+    fixed_test_size: int
+        Fixed number of test data used in evaluation.
+        If it is none, use the whole testset.
+        Default: None.
+    node_feats: str, or dict of list of str
+        Node feature fileds. Default: None.
+    edge_feats: str, or dict of list of str
+        Edge feature fileds. Default: None.
+    pos_graph_edge_feats: str or dict of list of str
+        The edge feature fields used by positive graph in link prediction.
+        Default: None.
+    filter_true_edges: bool
+        Whether to exclude the destination nodes that are connected to the source
+        node by another edge of the same edge type in the graph from the candidates
+        (the filtered ranking setting). Default: False.
+    """
+    def __init__(self, dataset, target_idx, batch_size, num_negative_edges=0,
+                 fanout=None, fixed_test_size=None,
+                 node_feats=None, edge_feats=None,
+                 pos_graph_edge_feats=None, filter_true_edges=False):
+        self._filter_true_edges = filter_true_edges
+        super().__init__(dataset, target_idx, batch_size,
+                         num_negative_edges=num_negative_edges,
+                         fanout=fanout,
+                         fixed_test_size=fixed_test_size,
+                         node_feats=node_feats,
+                         edge_feats=edge_feats,
+                         pos_graph_edge_feats=pos_graph_edge_feats)
+
+    def _prepare_negative_sampler(self, _):
+        # Every node of the destination node type is a candidate,
+        # so there is nothing to sample and the negative sampler is None.
+        self._neg_sample_type = BUILTIN_LP_FULL_NEG_SAMPLER
+
+    def _next_data(self, etype):
+        """ Get postive edges for the next iteration for a specific edge type
+        """
+        g = self.data.g
+        current_pos = self._current_pos[etype]
+        end_of_etype = current_pos + self._batch_size >= self._fixed_test_size[etype]
+
+        pos_eids = self._target_idx[etype][current_pos:self._fixed_test_size[etype]] \
+            if end_of_etype \
+            else self._target_idx[etype][current_pos:current_pos+self._batch_size]
+        pos_src, pos_dst = g.find_edges(pos_eids, etype=etype)
+        self._current_pos[etype] += self._batch_size
+        return {etype: (pos_src, None, pos_dst, None)}, end_of_etype
+
+    @property
+    def filter_true_edges(self):
+        """ Whether known true edges are removed from the candidate lists.
+        """
+        return self._filter_true_edges
+
+class GSgnnLinkPredictionFilteredFullTestDataLoader(GSgnnLinkPredictionFullTestDataLoader):
+    """ Mini-batch dataloader for link prediction validation and test
+    that ranks each positive edge against all candidate destination nodes
+    except the ones already connected to the source node (filtered ranking).
+    """
+    def __init__(self, dataset, target_idx, batch_size, num_negative_edges=0,
+                 fanout=None, fixed_test_size=None,
+                 node_feats=None, edge_feats=None,
+                 pos_graph_edge_feats=None):
+        super().__init__(dataset, target_idx, batch_size,
+                         num_negative_edges=num_negative_edges,
+                         fanout=fanout,
+                         fixed_test_size=fixed_test_size,
+                         node_feats=node_feats,
+                         edge_feats=edge_feats,
+                         pos_graph_edge_feats=pos_graph_edge_feats,
+                         filter_true_edges=True)
+
 ################ Minibatch DataLoader (Node classification) #######################
 
 class GSgnnNodeDataLoaderBase():
@@ -1923,6 +2023,158 @@ class GSgnnMultiTaskDataLoader:
         return fanouts
 
 
+################ Prefetching DataLoader #######################
+
+def move_to_device(data, device):
+    """ Move the tensors and DGL graphs in a (nested) tuple, list or dict to a device.
+
+    Other objects, e.g., None, are returned as they are.
+
+    Parameters
+    ----------
+    data: tensor, DGLGraph, tuple, list or dict
+        The data to move.
+    device: torch.device
+        The target device.
+
+    Returns
+    -------
+    The data on the target device with the same structure as the input.
+    """
+    if isinstance(data, (th.Tensor, dgl.DGLGraph)):
+        return data.to(device)
+    if isinstance(data, dict):
+        return {key: move_to_device(val, device) for key, val in data.items()}
+    if isinstance(data, (list, tuple)):
+        return type(data)(move_to_device(val, device) for val in data)
+    return data
+
+class GSgnnPrefetchLoader:
+    r""" Prefetch the mini-batches of a GraphStorm dataloader on a background thread.
+
+    The background thread iterates over the dataloader to sample mini-batches,
+    applies ``fetch_fn`` to each mini-batch, e.g., to fetch node features and labels,
+    and then applies ``to_device_fn``, e.g., to copy the blocks, features and labels
+    to the training device. Up to ``prefetch_depth`` prepared mini-batches are kept
+    ahead of the computation of the current mini-batch. The mini-batches are returned
+    in the same order as the dataloader returns them.
+
+    Sampling from a distributed graph and fetching features from distributed tensors
+    make RPC calls, and the RPC client is not thread-safe. While the loader is
+    iterated, the background thread is the only thread that issues RPC calls: the
+    calling thread must not make RPC calls, e.g., pull sparse embeddings, except
+    inside :py:meth:`pause`, which waits for the background thread to finish
+    preparing the current mini-batch and blocks it until the context exits.
+
+    When ``prefetch_depth`` is 0, the mini-batches are sampled and prepared
+    synchronously in the calling thread.
+
+    Parameters
+    ----------
+    dataloader: GraphStorm dataloader
+        The dataloader to prefetch mini-batches from.
+    fetch_fn: callable
+        The function applied to each mini-batch, which may make RPC calls.
+        Default: None, the mini-batches are used as they are.
+    to_device_fn: callable
+        The function applied to the output of ``fetch_fn``, which must not make RPC calls.
+        Default: None, the fetched mini-batches are returned as they are.
+    prefetch_depth: int
+        The maximal number of mini-batches prepared ahead of the computation.
+        Default: 1.
+    """
+    def __init__(self, dataloader, fetch_fn=None, to_device_fn=None, prefetch_depth=1):
+        assert prefetch_depth >= 0, "prefetch_depth must be non-negative."
+        self._dataloader = dataloader
+        self._fetch_fn = fetch_fn if fetch_fn is not None else lambda batch: batch
+        self._to_device_fn = to_device_fn if to_device_fn is not None else lambda batch: batch
+        self._prefetch_depth = prefetch_depth
+        self._rpc_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._dataloader)
+
+    @property
+    def dataloader(self):
+        """ The dataloader wrapped by the prefetch loader.
+        """
+        return self._dataloader
+
+    @property
+    def prefetch_depth(self):
+        """ The maximal number of prefetched mini-batches.
+        """
+        return self._prefetch_depth
+
+    @contextmanager
+    def pause(self):
+        """ Stop the background thread from sampling and fetching mini-batches.
+
+        The calling thread can make RPC calls, e.g., to evaluate the model,
+        inside the context.
+        """
+        with self._rpc_lock:
+            yield
+
+    def _next_batch(self, batch_iter):
+        """ Sample and fetch the next mini-batch. Return None at the end.
+        """
+        with self._rpc_lock:
+            try:
+                batch = next(batch_iter)
+            except StopIteration:
+                return None
+            batch = self._fetch_fn(batch)
+        return (self._to_device_fn(batch),)
+
+    def __iter__(self):
+        if self._prefetch_depth == 0:
+            for batch in self._dataloader:
+                yield self._to_device_fn(self._fetch_fn(batch))
+            return
+
+        batch_queue = queue.Queue(maxsize=self._prefetch_depth)
+        stop_event = threading.Event()
+        errors = []
+
+        def _prefetch():
+            try:
+                with self._rpc_lock:
+                    batch_iter = iter(self._dataloader)
+                while not stop_event.is_set():
+                    item = self._next_batch(batch_iter)
+                    while not stop_event.is_set():
+                        try:
+                            batch_queue.put(item, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+                    if item is None:
+                        return
+            except Exception as e: # pylint: disable=broad-exception-caught
+                errors.append(e)
+                stop_event.set()
+
+        thread = threading.Thread(target=_prefetch, daemon=True)
+        thread.start()
+        try:
+            while True:
+                try:
+                    item = batch_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if len(errors) > 0:
+                        raise errors[0]
+                    continue
+                if item is None:
+                    break
+                yield item[0]
+        finally:
+            # Stop the background thread, e.g., when training stops early,
+            # so that it does not make RPC calls after the loop.
+            stop_event.set()
+            thread.join()
+
+
 ####################### Distillation #############################
 
 class DistillDataManager:
@@ -28,6 +28,7 @@ from torch.utils.data import Dataset
 from ..utils import get_rank, get_world_size, is_distributed, barrier, is_wholegraph
 from ..utils import sys_tracker
 from .utils import dist_sum, flip_node_mask
+from .feat_cache import GSgnnNodeFeatCache
 from ..utils import get_graph_name
 
 from ..wholegraph import is_wholegraph_embedding
@@ -44,7 +45,7 @@ def split_full_edge_list(g, etype, rank):
     return th.arange(start, end)
 
 def prepare_batch_input(g, input_nodes,
-                        dev='cpu', feat_field='feat'):
+                        dev='cpu', feat_field='feat', feat_cache=None):
     """ Prepare minibatch input features
 
     Note: The output is stored in dev.
@@ -59,6 +60,8 @@ def prepare_batch_input(g, input_nodes,
         Device to put output in.
     feat_field: str or dict of list of str
         Fields to extract features
+    feat_cache: GSgnnNodeFeatCache
+        The cache of remote node features. Default: None.
 
     Return:
     -------
@@ -80,6 +83,8 @@ def prepare_batch_input(g, input_nodes,
                 data = g.nodes[ntype].data[fname]
                 if is_wholegraph_embedding(data):
                     data = data.gather(nid.to(dev))
+                elif feat_cache is not None and feat_cache.is_cached(ntype, fname):
+                    data = feat_cache.get(ntype, fname, nid).to(dev)
                 else:
                     data = data[nid].to(dev)
                 feats.append(data)
@@ -197,6 +202,7 @@ class GSgnnData():
         self._edge_feat_field = edge_feat_field
         self._lm_feat_ntypes = lm_feat_ntypes if lm_feat_ntypes is not None else []
         self._lm_feat_etypes = lm_feat_etypes if lm_feat_etypes is not None else []
+        self._node_feat_cache = None
 
         if get_rank() == 0:
             g = self._g
@@ -261,6 +267,32 @@ class GSgnnData():
         """
         return self._g
 
+    def init_node_feat_cache(self, cache_size, policy="lru"):
+        """ Cache the node features of the nodes in remote partitions.
+
+        After the cache is initialized, ``get_node_feats`` serves the cached rows
+        of the node features in ``node_feat_field`` locally and only fetches
+        the missed rows from remote machines.
+
+        Parameters
+        ----------
+        cache_size : float
+            The memory budget of the cache in MB.
+        policy : str
+            The cache policy, which is one of ``lru``, ``lfu`` and ``degree``.
+            Default: ``lru``.
+        """
+        if self._node_feat_field is None or cache_size <= 0:
+            return
+        self._node_feat_cache = GSgnnNodeFeatCache(self._g, self._node_feat_field,
+                                                   cache_size, policy)
+
+    @property
+    def node_feat_cache(self):
+        """ The cache of remote node features. None if the cache is not initialized.
+        """
+        return self._node_feat_cache
+
     @property
     def graph_name(self):
         """ The distributed graph's name extracted from the given part_config JSON file.
@@ -391,7 +423,8 @@ class GSgnnData():
             input_nodes = {g.ntypes[0]: input_nodes}
 
         return prepare_batch_input(g, input_nodes, dev=device,
-                                   feat_field=nfeat_fields)
+                                   feat_field=nfeat_fields,
+                                   feat_cache=self._node_feat_cache)
 
     def get_edge_feats(self, input_edges, efeat_fields, device='cpu'):
         """ Get the edge features of the given input edges. The feature fields are defined
@@ -0,0 +1,353 @@
+"""
+    Copyright 2024 Contributors
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Cache of remote node features for GraphStorm trainers.
+"""
+import logging
+import threading
+
+import dgl
+import torch as th
+
+from ..utils import rt_profiler
+from ..wholegraph import is_wholegraph_embedding
+
+FEAT_CACHE_POLICY_LRU = "lru"
+FEAT_CACHE_POLICY_LFU = "lfu"
+FEAT_CACHE_POLICY_DEGREE = "degree"
+BUILTIN_FEAT_CACHE_POLICIES = [FEAT_CACHE_POLICY_LRU,
+                               FEAT_CACHE_POLICY_LFU,
+                               FEAT_CACHE_POLICY_DEGREE]
+
+# Two random odd multipliers for hashing node IDs into the count-min sketch.
+_SKETCH_HASH_MULTIPLIERS = [0x9E3779B1, 0x85EBCA77]
+
+class FeatRowCache:
+    """ A fixed-capacity cache of the feature rows of one feature.
+
+    The cache keeps the node IDs in a sorted index, so that a batch of node IDs
+    is looked up with a single ``searchsorted``. The cache supports three policies:
+
+    * ``lru``: every missed row is admitted and the least recently used rows are evicted.
+    * ``lfu``: the access frequencies of the missed rows are estimated with a count-min
+      sketch. A missed row is admitted only if it is accessed more frequently than
+      the row it evicts.
+    * ``degree``: the cache is filled once with ``fill`` and never changes.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximal number of rows in the cache.
+    row_shape : tuple of int
+        The shape of a feature row.
+    dtype : torch.dtype
+        The data type of the feature.
+    policy : str
+        The cache policy.
+    """
+    def __init__(self, capacity, row_shape, dtype, policy=FEAT_CACHE_POLICY_LRU):
+        assert capacity > 0, "The capacity of the cache must be larger than 0."
+        assert policy in BUILTIN_FEAT_CACHE_POLICIES, \
+            f"Unknown feature cache policy {policy}. " \
+            f"It should be one of {BUILTIN_FEAT_CACHE_POLICIES}."
+        self._capacity = capacity
+        self._policy = policy
+        self._keys = th.full((capacity,), -1, dtype=th.int64)
+        self._rows = th.zeros((capacity,) + tuple(row_shape), dtype=dtype)
+        # The last access step for LRU or the access frequency for LFU.
+        self._scores = th.zeros((capacity,), dtype=th.int64)
+        self._num_used = 0
+        self._step = 0
+        self._sorted_keys = th.zeros((0,), dtype=th.int64)
+        self._sorted_slots = th.zeros((0,), dtype=th.int64)
+        if policy == FEAT_CACHE_POLICY_LFU:
+            self._sketch_width = max(4 * capacity, 1024)
+            self._sketch = th.zeros((len(_SKETCH_HASH_MULTIPLIERS), self._sketch_width),
+                                    dtype=th.int64)
+
+    @property
+    def capacity(self):
+        """ The maximal number of rows in the cache.
+        """
+        return self._capacity
+
+    @property
+    def num_cached(self):
+        """ The number of rows in the cache.
+        """
+        return self._num_used
+
+    def _update_index(self, slots):
+        """ Update the sorted index after the keys in the slots are replaced.
+
+        Instead of sorting all cached keys again, the entries of the replaced slots
+        are dropped from the index and the new keys are merged into it, so the cost
+        is linear in the cache size plus sorting the new keys only.
+        """
+        sorted_keys, sorted_slots = self._sorted_keys, self._sorted_slots
+        if len(sorted_slots) > 0:
+            replaced = th.zeros((self._capacity,), dtype=th.bool)
+            replaced[slots] = True
+            keep = ~replaced[sorted_slots]
+            sorted_keys, sorted_slots = sorted_keys[keep], sorted_slots[keep]
+        new_keys, order = th.sort(self._keys[slots])
+        new_slots = slots[order]
+        # The positions of the new keys in the merged index.
+        new_pos = th.searchsorted(sorted_keys, new_keys) + th.arange(len(new_keys))
+        is_new = th.zeros((len(sorted_keys) + len(new_keys),), dtype=th.bool)
+        is_new[new_pos] = True
+        self._sorted_keys = th.empty((len(is_new),), dtype=th.int64)
+        self._sorted_keys[new_pos] = new_keys
+        self._sorted_keys[~is_new] = sorted_keys
+        self._sorted_slots = th.empty((len(is_new),), dtype=th.int64)
+        self._sorted_slots[new_pos] = new_slots
+        self._sorted_slots[~is_new] = sorted_slots
+
+    def _locate(self, nids):
+        """ Return the slots of the node IDs in the cache, or -1 if not cached.
+        """
+        if len(self._sorted_keys) == 0 or len(nids) == 0:
+            return th.full((len(nids),), -1, dtype=th.int64)
+        pos = th.searchsorted(self._sorted_keys, nids).clamp(max=len(self._sorted_keys) - 1)
+        hit = self._sorted_keys[pos] == nids
+        return th.where(hit, self._sorted_slots[pos], th.full_like(pos, -1))
+
+    def _estimate_freq(self, nids, update=True):
+        """ Estimate the access frequencies of the node IDs with the count-min sketch.
+        """
+        freqs = []
+        for i, mult in enumerate(_SKETCH_HASH_MULTIPLIERS):
+            idx = (nids * mult) % self._sketch_width
+            if update:
+                self._sketch[i].index_add_(0, idx, th.ones_like(idx))
+            freqs.append(self._sketch[i][idx])
+        return th.stack(freqs).min(dim=0).values
+
+    def lookup(self, nids):
+        """ Look up the feature rows of the node IDs.
+
+        Parameters
+        ----------
+        nids : Tensor
+            The node IDs.
+
+        Returns
+        -------
+        tuple of (Tensor, Tensor) : The boolean mask of the cached node IDs and
+        the feature rows of the cached node IDs.
+        """
+        self._step += 1
+        slots = self._locate(nids)
+        hit = slots >= 0
+        hit_slots = slots[hit]
+        if self._policy == FEAT_CACHE_POLICY_LRU:
+            self._scores[hit_slots] = self._step
+        elif self._policy == FEAT_CACHE_POLICY_LFU:
+            self._scores[hit_slots] += 1
+        return hit, self._rows[hit_slots]
+
+    def fill(self, nids, rows):
+        """ Put the feature rows of the node IDs into the free slots of the cache.
+
+        Parameters
+        ----------
+        nids : Tensor
+            The node IDs. They must not be in the cache.
+        rows : Tensor
+            The feature rows of the node IDs.
+        """
+        num = min(len(nids), self._capacity - self._num_used)
+        if num <= 0:
+            return
+        slots = th.arange(self._num_used, self._num_used + num)
+        self._keys[slots] = nids[:num]
+        self._rows[slots] = rows[:num].to(self._rows.dtype)
+        self._scores[slots] = self._step
+        self._num_used += num
+        self._update_index(slots)
+
+    def admit(self, nids, rows):
+        """ Admit the feature rows of the missed node IDs into the cache.
+
+        Parameters
+        ----------
+        nids : Tensor
+            The node IDs that are not in the cache.
+        rows : Tensor
+            The feature rows of the node IDs.
+        """
+        if self._policy == FEAT_CACHE_POLICY_DEGREE or len(nids) == 0:
+            return
+
+        if self._policy == FEAT_CACHE_POLICY_LFU:
+            freqs = self._estimate_freq(nids)
+            # Admit the most frequently accessed rows first.
+            order = th.argsort(freqs, descending=True)
+            nids, rows, freqs = nids[order], rows[order], freqs[order]
+        num_free = self._capacity - self._num_used
+        if num_free > 0:
+            start = self._num_used
+            self.fill(nids, rows)
+            if self._policy == FEAT_CACHE_POLICY_LFU:
+                self._scores[start:self._num_used] = freqs[:num_free]
+                freqs = freqs[num_free:]
+            nids, rows = nids[num_free:], rows[num_free:]
+        if len(nids) == 0:
+            return
+
+        num = min(len(nids), self._capacity)
+        # Evict the rows with the smallest scores.
+        victim_scores, victims = th.topk(self._scores, num, largest=False)
+        if self._policy == FEAT_CACHE_POLICY_LRU:
+            # Do not evict the rows used by the current batch.
+            keep = victim_scores < self._step
+        else:
+            keep = freqs[:num] > victim_scores
+        victims = victims[keep]
+        if len(victims) == 0:
+            return
+        self._keys[victims] = nids[:num][keep]
+        self._rows[victims] = rows[:num][keep].to(self._rows.dtype)
+        if self._policy == FEAT_CACHE_POLICY_LRU:
+            self._scores[victims] = self._step
+        else:
+            self._scores[victims] = freqs[:num][keep]
+        self._update_index(victims)
+
+class GSgnnNodeFeatCache:
+    """ A per-trainer cache of the node features stored in remote partitions.
+
+    Node features in the local partition are read from shared memory directly.
+    The features of the nodes in remote partitions are fetched over the network,
+    so repeatedly accessed remote rows, e.g., the features of high-degree nodes,
+    are cached in the trainer process. Only the missed rows are fetched from the
+    remote machines. The hit rate is reported through ``rt_profiler``.
+
+    The memory budget is shared by all cached features in proportion to their sizes.
+
+    Parameters
+    ----------
+    g : DistGraph
+        The distributed graph.
+    node_feat_field : str or dict of list of str
+        The node features to cache.
+    cache_size : float
+        The memory budget of the cache in MB.
+    policy : str
+        The cache policy. ``lru`` admits every missed row and evicts the least
+        recently used rows. ``lfu`` only admits the rows that are accessed more
+        frequently than the rows they evict. ``degree`` caches the remote nodes
+        with the most edges in the local partition once and never changes.
+        Default: ``lru``.
+    """
+    def __init__(self, g, node_feat_field, cache_size, policy=FEAT_CACHE_POLICY_LRU):
+        assert policy in BUILTIN_FEAT_CACHE_POLICIES, \
+            f"Unknown feature cache policy {policy}. " \
+            f"It should be one of {BUILTIN_FEAT_CACHE_POLICIES}."
+        self._g = g
+        self._gpb = g.get_partition_book()
+        self._policy = policy
+        self._lock = threading.Lock()
+        self._caches = {}
+
+        if isinstance(node_feat_field, str):
+            node_feat_field = {ntype: [node_feat_field] for ntype in g.ntypes}
+        fields = []
+        for ntype, fnames in (node_feat_field or {}).items():
+            for fname in fnames:
+                data = g.nodes[ntype].data[fname]
+                if is_wholegraph_embedding(data):
+                    # WholeGraph features are not fetched over RPC.
+                    continue
+                fields.append((ntype, fname, data))
+        tot_bytes = sum(data.shape[0] * _row_bytes(data) for _, _, data in fields)
+        if tot_bytes == 0:
+            return
+        frac = min(cache_size * 1024 * 1024 / tot_bytes, 1.)
+        for ntype, fname, data in fields:
+            capacity = int(data.shape[0] * frac)
+            if capacity > 0:
+                self._caches[(ntype, fname)] = FeatRowCache(capacity, data.shape[1:],
+                                                            data.dtype, policy)
+                logging.debug("Cache %d rows of node feature %s of %s.",
+                              capacity, fname, ntype)
+        if policy == FEAT_CACHE_POLICY_DEGREE:
+            self._fill_by_degree()
+
+    def _fill_by_degree(self):
+        """ Fill the caches with the remote nodes that have the most edges in
+        the local partition, i.e., the remote nodes sampled most often by this trainer.
+        """
+        local_g = self._g.local_partition
+        if local_g is None:
+            logging.warning("The local partition is not available. "
+                            "The node feature cache is empty.")
+            return
+        halo = local_g.ndata['inner_node'] == 0
+        degs = (local_g.in_degrees() + local_g.out_degrees())[halo]
+        ntype_ids, type_nids = self._gpb.map_to_per_ntype(local_g.ndata[dgl.NID][halo])
+        for (ntype, fname), cache in self._caches.items():
+            mask = ntype_ids == self._g.get_ntype_id(ntype)
+            nids, ntype_degs = type_nids[mask], degs[mask]
+            top = th.topk(ntype_degs, min(cache.capacity, len(ntype_degs))).indices
+            nids = nids[top]
+            cache.fill(nids, self._g.nodes[ntype].data[fname][nids])
+
+    def is_cached(self, ntype, fname):
+        """ Whether the feature is cached.
+        """
+        return (ntype, fname) in self._caches
+
+    def get(self, ntype, fname, nids):
+        """ Get the node features of the node IDs.
+
+        Parameters
+        ----------
+        ntype : str
+            The node type.
+        fname : str
+            The feature name.
+        nids : Tensor
+            The node IDs.
+
+        Returns
+        -------
+        Tensor : The node features.
+        """
+        data = self._g.nodes[ntype].data[fname]
+        if (ntype, fname) not in self._caches:
+            return data[nids]
+        cache = self._caches[(ntype, fname)]
+        is_remote = self._gpb.nid2partid(nids, ntype) != self._gpb.partid
+        remote_idx = th.nonzero(is_remote, as_tuple=True)[0]
+        out = th.empty((len(nids),) + tuple(data.shape[1:]), dtype=data.dtype)
+        with self._lock:
+            hit, rows = cache.lookup(nids[remote_idx])
+        out[remote_idx[hit]] = rows
+        # Fetch the local rows and the missed remote rows in one request.
+        fetch_idx = th.cat([th.nonzero(~is_remote, as_tuple=True)[0], remote_idx[~hit]])
+        fetched = data[nids[fetch_idx]]
+        out[fetch_idx] = fetched
+        num_local = len(nids) - len(remote_idx)
+        with self._lock:
+            cache.admit(nids[remote_idx[~hit]], fetched[num_local:])
+        rt_profiler.count("node_feat_cache_hit", int(hit.sum()), len(remote_idx))
+        return out
+
+def _row_bytes(data):
+    num_elems = 1
+    for dim in data.shape[1:]:
+        num_elems *= dim
+    return num_elems * th.tensor([], dtype=data.dtype).element_size()
@@ -156,29 +156,32 @@ class GSHardEdgeDstNegativeSampler(_BaseNegativeSampler):
                 neg[:,:num_hard_neg] = hard_negatives[:,:num_hard_neg]
                 return src, neg.reshape((-1,))
         else:
-            # slow track, we need to handle cases when there are -1s
-            hard_negatives, _ = th.sort(hard_negatives, dim=1, descending=True)
-
+            # Variable-length track, we need to handle cases when there are -1s.
+            # Each row keeps a random subset of its valid hard negatives. Instead of
+            # shuffling row by row, draw a random key for every slot, push the keys
+            # of the -1 slots below all valid keys and take the top-k keys of each
+            # row, which gives a uniform random order of the valid hard negatives
+            # followed by the -1s.
             src, neg = self._negative_sampler._generate(g, eids, canonical_etype)
-            for i in range(len(eids)):
-                hard_negative = hard_negatives[i]
-                # ignore -1s
-                hard_negative = hard_negative[hard_negative > -1]
-                max_num_hard_neg = hard_negative.shape[0]
-                hard_negative = hard_negative[th.randperm(max_num_hard_neg)]
-
-                if required_num_hard_neg < max_num_hard_neg:
-                    # Only need required_num_hard_neg hard negatives.
-                    hard_negative = hard_negative[:required_num_hard_neg]
-                    num_hard_neg = required_num_hard_neg
-                else:
-                    num_hard_neg = max_num_hard_neg
-
-                # replace random negatives with fixed negatives
-                neg[i*self._k:i*self._k + (num_hard_neg \
-                              if num_hard_neg < self._k else self._k)] = \
-                    hard_negative[:num_hard_neg if num_hard_neg < self._k else self._k]
-            return src, neg
+            valid = hard_negatives > -1
+            num_cols = min(self._k, hard_negatives.shape[1])
+            keys = th.rand(hard_negatives.shape, device=hard_negatives.device)
+            keys[~valid] = -1
+            _, order = th.topk(keys, num_cols, dim=1)
+            hard_negatives = th.gather(hard_negatives, 1, order)
+
+            # Number of hard negatives to use for each row.
+            num_hard_neg = th.clamp(th.sum(valid, dim=1),
+                                    max=min(required_num_hard_neg, self._k))
+            fill = th.arange(num_cols, device=hard_negatives.device).unsqueeze(0) \
+                < num_hard_neg.unsqueeze(1)
+
+            # replace random negatives with fixed negatives
+            neg = neg.reshape(-1, self._k)
+            neg[:,:num_cols] = th.where(fill.to(neg.device),
+                                        hard_negatives.to(neg.device, neg.dtype),
+                                        neg[:,:num_cols])
+            return src, neg.reshape((-1,))
 
 class GSFixedEdgeDstNegativeSampler(object):
     """ GraphStorm negative sampler that uses fixed negative destination nodes
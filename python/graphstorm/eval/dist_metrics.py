@@ -0,0 +1,371 @@
+"""
+    Copyright 2024 Contributors
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Distributed evaluation metrics computed from sufficient statistics.
+
+    Instead of exchanging all predictions and labels between trainers, each
+    trainer computes small statistics of its local predictions, e.g., the number
+    of correct predictions, per-class confusion counts, score histograms or
+    sums of errors. The statistics are summed on rank 0, which computes
+    the final scores and broadcasts them to all trainers.
+"""
+import logging
+
+import numpy as np
+import torch as th
+
+from ..utils import get_backend, get_rank, get_world_size
+
+# The number of histogram bins used to approximate ROC-AUC and PR-AUC.
+NUM_SCORE_HIST_BINS = 10000
+# Below this number of evaluation samples, metrics are computed exactly
+# on the gathered predictions.
+EXACT_EVAL_MAX_SIZE = 1000000
+
+def _comm_device():
+    """ The device of the tensors used in collective communication.
+    """
+    if get_backend() == "nccl":
+        return th.device("cuda", th.cuda.current_device())
+    return th.device("cpu")
+
+def _to_class_pred(pred):
+    """ Convert logits into predicted classes.
+    """
+    if pred.dim() > 1:
+        if pred.shape[1] == 1:
+            pred = pred.squeeze(1)
+        else:
+            pred = pred.argmax(dim=1)
+    return pred.long()
+
+def _binary_scores(pred, labels, multilabel):
+    """ Convert predictions and labels into per-class binary scores and labels.
+
+    Returns
+    -------
+    tuple of (Tensor, Tensor) : scores and binary labels of shape (N, C), where C
+    is 1 for binary classification.
+    """
+    pred = pred.to(th.float64)
+    if not multilabel and len(labels.shape) == 2 and labels.shape[1] == 1:
+        labels = labels.squeeze(1)
+    if len(labels.shape) == 2:
+        # Multi-label classification.
+        return pred, labels
+    if pred.dim() == 1 or pred.shape[1] <= 2:
+        # Binary classification. Use the score of the positive class.
+        scores = pred if pred.dim() == 1 else pred[:, -1]
+        return scores.reshape(-1, 1), labels.reshape(-1, 1)
+    # Multi-class classification is evaluated as one-vs-rest.
+    one_hot = th.nn.functional.one_hot(labels.long(), num_classes=pred.shape[1])
+    return pred, one_hot
+
+class DistMetric:
+    """ A metric computed from the sum of the statistics of all trainers.
+
+    Parameters
+    ----------
+    multilabel: bool
+        Whether this is a multi-label classification task.
+    """
+    def __init__(self, multilabel=False):
+        self._multilabel = multilabel
+
+    def local_range(self, pred, labels): # pylint: disable=unused-argument
+        """ The local values that need a global maximum before computing statistics.
+
+        Returns
+        -------
+        list of float : The values. The global maximum of each value is passed
+        to ``local_stats``.
+        """
+        return []
+
+    def local_stats(self, pred, labels, global_range):
+        """ Compute the statistics of the local predictions.
+
+        Returns
+        -------
+        Tensor : A float64 tensor of statistics.
+        """
+        raise NotImplementedError
+
+    def finalize(self, stats, global_range):
+        """ Compute the score from the statistics summed over all trainers.
+        """
+        raise NotImplementedError
+
+class DistAccuracy(DistMetric):
+    """ Accuracy for single-label classification.
+    """
+    def local_stats(self, pred, labels, global_range):
+        pred = _to_class_pred(pred)
+        labels = labels.reshape(-1).long()
+        return th.tensor([th.sum(pred == labels).item(), len(labels)], dtype=th.float64)
+
+    def finalize(self, stats, global_range):
+        return (stats[0] / stats[1]).item() if stats[1] > 0 else 0
+
+class DistF1Score(DistMetric):
+    """ Macro-averaged F1 score over the classes that appear in the labels or predictions.
+    """
+    def local_range(self, pred, labels):
+        pred = _to_class_pred(pred)
+        max_pred = pred.max().item() if len(pred) > 0 else 0
+        max_label = labels.max().item() if len(labels) > 0 else 0
+        return [max(max_pred, max_label) + 1]
+
+    def local_stats(self, pred, labels, global_range):
+        num_classes = int(global_range[0])
+        pred = _to_class_pred(pred)
+        labels = labels.reshape(-1).long()
+        true_pos = th.bincount(labels[pred == labels], minlength=num_classes)
+        pred_cnt = th.bincount(pred, minlength=num_classes)
+        label_cnt = th.bincount(labels, minlength=num_classes)
+        return th.stack([true_pos, pred_cnt, label_cnt]).to(th.float64)
+
+    def finalize(self, stats, global_range):
+        true_pos, pred_cnt, label_cnt = stats.reshape(3, -1)
+        present = (pred_cnt + label_cnt) > 0
+        precision = th.where(pred_cnt > 0, true_pos / pred_cnt.clamp(min=1), 0.)
+        recall = th.where(label_cnt > 0, true_pos / label_cnt.clamp(min=1), 0.)
+        denom = precision + recall
+        f1_score = th.where(denom > 0, 2 * precision * recall / denom.clamp(min=1e-30), 0.)
+        return f1_score[present].mean().item()
+
+class DistHistogramAUC(DistMetric):
+    """ ROC-AUC or PR-AUC computed from the score histograms of positive
+    and negative samples of each class.
+
+    The scores are binned into ``num_bins`` bins between the global minimal and
+    maximal scores. Samples in the same bin are treated as ties.
+
+    Parameters
+    ----------
+    multilabel: bool
+        Whether this is a multi-label classification task.
+    curve: str
+        ``roc`` or ``pr``.
+    num_bins: int
+        The number of histogram bins.
+    """
+    def __init__(self, multilabel=False, curve="roc", num_bins=NUM_SCORE_HIST_BINS):
+        super(DistHistogramAUC, self).__init__(multilabel)
+        assert curve in ["roc", "pr"]
+        self._curve = curve
+        self._num_bins = num_bins
+
+    def local_range(self, pred, labels):
+        scores, _ = _binary_scores(pred, labels, self._multilabel)
+        if len(scores) == 0:
+            return [-np.inf, -np.inf]
+        return [-scores.min().item(), scores.max().item()]
+
+    def local_stats(self, pred, labels, global_range):
+        scores, bin_labels = _binary_scores(pred, labels, self._multilabel)
+        low, high = -global_range[0], global_range[1]
+        width = (high - low) / self._num_bins if high > low else 1.
+        bins = ((scores - low) / width).long().clamp(0, self._num_bins - 1)
+        num_classes = scores.shape[1]
+        hist = th.zeros((num_classes, 2, self._num_bins), dtype=th.float64)
+        for i in range(num_classes):
+            is_pos = bin_labels[:, i] == 1
+            hist[i, 0] = th.bincount(bins[~is_pos, i], minlength=self._num_bins).cpu()
+            hist[i, 1] = th.bincount(bins[is_pos, i], minlength=self._num_bins).cpu()
+        return hist
+
+    def _roc_auc(self, neg, pos):
+        neg_below = th.cumsum(neg, dim=0) - neg
+        return (th.sum(pos * (neg_below + 0.5 * neg)) / (pos.sum() * neg.sum())).item()
+
+    def _pr_auc(self, neg, pos):
+        # Thresholds from the highest bin to the lowest bin.
+        true_pos = th.cumsum(pos.flip(0), dim=0)
+        false_pos = th.cumsum(neg.flip(0), dim=0)
+        valid = (true_pos + false_pos) > 0
+        precision = (true_pos / (true_pos + false_pos).clamp(min=1))[valid].numpy()
+        recall = (true_pos / pos.sum())[valid].numpy()
+        precision = np.concatenate([[1.], precision])
+        recall = np.concatenate([[0.], recall])
+        # Trapezoidal rule, as in sklearn.metrics.auc.
+        return float(np.sum(np.diff(recall) * (precision[1:] + precision[:-1]) / 2))
+
+    def finalize(self, stats, global_range):
+        num_classes = stats.numel() // (2 * self._num_bins)
+        hist = stats.reshape(num_classes, 2, self._num_bins)
+        aucs = []
+        for i in range(num_classes):
+            neg, pos = hist[i, 0], hist[i, 1]
+            # AUC is only defined when there are both positive and negative samples.
+            if pos.sum() > 0 and neg.sum() > 0:
+                aucs.append(self._roc_auc(neg, pos) if self._curve == "roc" \
+                    else self._pr_auc(neg, pos))
+        if len(aucs) == 0:
+            logging.error("No positively labeled data available. Cannot compute AUC.")
+            return 0
+        return sum(aucs) / len(aucs)
+
+class DistRegressionError(DistMetric):
+    """ RMSE, MSE or MAE for regression.
+
+    Parameters
+    ----------
+    metric: str
+        ``rmse``, ``mse`` or ``mae``.
+    """
+    def __init__(self, metric):
+        super(DistRegressionError, self).__init__()
+        self._metric = metric
+
+    def local_stats(self, pred, labels, global_range):
+        pred = th.squeeze(pred).to(th.float64).reshape(-1)
+        labels = th.squeeze(labels).to(th.float64).reshape(-1)
+        assert pred.shape == labels.shape, \
+            f"prediction and labels have different shapes. {pred.shape} vs. {labels.shape}"
+        diff = pred - labels
+        return th.tensor([th.sum(diff * diff).item(), th.sum(th.abs(diff)).item(),
+                          len(diff)], dtype=th.float64)
+
+    def finalize(self, stats, global_range):
+        if stats[2] == 0:
+            return 0
+        if self._metric == "mae":
+            return (stats[1] / stats[2]).item()
+        mse = stats[0] / stats[2]
+        return th.sqrt(mse).item() if self._metric == "rmse" else mse.item()
+
+def get_dist_metric(metric, pred, multilabel=False):
+    """ Get the distributed implementation of a metric.
+
+    Parameters
+    ----------
+    metric: str
+        The metric name.
+    pred: Tensor
+        The local predictions, used to decide the type of the task.
+    multilabel: bool
+        Whether this is a multi-label classification task.
+
+    Returns
+    -------
+    DistMetric : The distributed metric or None if the metric has to be computed
+    on the gathered predictions.
+    """
+    if metric == "accuracy":
+        # Accuracy of multi-label classification is the average ROC-AUC.
+        return DistHistogramAUC(multilabel, curve="roc") if multilabel else DistAccuracy()
+    if metric == "f1_score" and not multilabel:
+        return DistF1Score()
+    if metric == "roc_auc":
+        return DistHistogramAUC(multilabel, curve="roc")
+    if metric == "precision_recall" and not multilabel \
+            and (pred.dim() == 1 or pred.shape[1] <= 2):
+        return DistHistogramAUC(multilabel, curve="pr")
+    if metric in ["rmse", "mse", "mae"]:
+        return DistRegressionError(metric)
+    return None
+
+def compute_dist_scores(metrics, pred, labels):
+    """ Compute the scores of the metrics from the statistics of all trainers.
+
+    The statistics are summed on rank 0, which computes the scores and
+    broadcasts them to all trainers.
+
+    Parameters
+    ----------
+    metrics: dict of str to DistMetric
+        The metrics to compute.
+    pred: Tensor
+        The local predictions.
+    labels: Tensor
+        The local labels.
+
+    Returns
+    -------
+    dict : The scores of the metrics in the format of {metric: score}.
+    """
+    device = _comm_device()
+    names = list(metrics.keys())
+    pred, labels = pred.cpu(), labels.cpu()
+
+    ranges = [metrics[name].local_range(pred, labels) for name in names]
+    range_sizes = [len(rng) for rng in ranges]
+    if sum(range_sizes) > 0:
+        global_range = th.tensor(sum(ranges, []), dtype=th.float64, device=device)
+        th.distributed.all_reduce(global_range, op=th.distributed.ReduceOp.MAX)
+        global_range = th.split(global_range.cpu(), range_sizes)
+    else:
+        global_range = [th.zeros((0,), dtype=th.float64) for _ in names]
+    global_range = [rng.tolist() for rng in global_range]
+
+    stats = [metrics[name].local_stats(pred, labels, rng) \
+             for name, rng in zip(names, global_range)]
+    stat_shapes = [stat.shape for stat in stats]
+    stats = th.cat([stat.reshape(-1) for stat in stats]).to(device)
+    th.distributed.reduce(stats, dst=0, op=th.distributed.ReduceOp.SUM)
+
+    scores = [None]
+    if get_rank() == 0:
+        stats = th.split(stats.cpu(), [int(np.prod(shape)) for shape in stat_shapes])
+        scores[0] = {name: metrics[name].finalize(stat.reshape(shape), rng) \
+            for name, stat, shape, rng in zip(names, stats, stat_shapes, global_range)}
+    th.distributed.broadcast_object_list(scores, src=0)
+    return scores[0]
+
+def compute_sharded_scores(metric_list, pred, labels, multilabel=False,
+                           exact_eval_max_size=EXACT_EVAL_MAX_SIZE):
+    """ Compute the scores of the metrics without gathering all predictions.
+
+    Parameters
+    ----------
+    metric_list: list of str
+        The metrics to compute.
+    pred: Tensor
+        The local predictions.
+    labels: Tensor
+        The local labels.
+    multilabel: bool
+        Whether this is a multi-label classification task.
+    exact_eval_max_size: int
+        If the total number of samples across trainers is not larger than
+        this number, the scores are not computed from sufficient statistics.
+
+    Returns
+    -------
+    dict : The scores of the metrics in the format of {metric: score}, or None
+    if the scores have to be computed exactly on the gathered predictions,
+    i.e., there is only one trainer, there are few samples, some metrics
+    do not have a distributed implementation or some trainers do not have
+    predictions. All trainers return None if any of them cannot use the
+    distributed implementation.
+    """
+    if get_world_size() <= 1:
+        return None
+    metrics = None
+    if pred is not None and labels is not None:
+        metrics = {metric: get_dist_metric(metric, pred, multilabel) for metric in metric_list}
+        if any(metric is None for metric in metrics.values()):
+            metrics = None
+    # All trainers have to take the same path. Otherwise, some of them wait
+    # in the collectives of compute_dist_scores while the others wait in
+    # the collectives of the exact path, so trainers agree on the decision.
+    stats = th.tensor([len(labels) if metrics is not None else 0, int(metrics is None)],
+                      dtype=th.int64, device=_comm_device())
+    th.distributed.all_reduce(stats, op=th.distributed.ReduceOp.SUM)
+    num_samples, num_unsupported = stats.tolist()
+    if num_unsupported > 0 or num_samples <= exact_eval_max_size:
+        return None
+    return compute_dist_scores(metrics, pred, labels)
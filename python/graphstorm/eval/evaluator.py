@@ -27,6 +27,7 @@ import torch as th
 from .eval_func import SUPPORTED_HIT_AT_METRICS
 from .eval_func import ClassificationMetrics, RegressionMetrics, LinkPredictionMetrics
 from .utils import broadcast_data
+from .dist_metrics import compute_sharded_scores, EXACT_EVAL_MAX_SIZE
 from ..config.config import (EARLY_STOP_AVERAGE_INCREASE_STRATEGY,
                              EARLY_STOP_CONSECUTIVE_INCREASE_STRATEGY,
                              LINK_PREDICTION_MAJOR_EVAL_ETYPE_ALL)
@@ -529,6 +530,11 @@ class GSgnnClassificationEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterf
         The early stop strategy. GraphStorm supports two strategies:
         1) ``consecutive_increase``, and 2) ``average_increase``.
         Default: ``average_increase``.
+    exact_eval_max_size: int
+        When there are more validation or test samples than this number across all
+        trainers, metrics are computed from statistics summed over trainers instead
+        of exchanging all predictions. ROC-AUC and PR-AUC are then approximated with
+        score histograms. Default: 1000000.
     """
     def __init__(self, eval_frequency,
                  eval_metric_list=None,
@@ -536,7 +542,8 @@ class GSgnnClassificationEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterf
                  use_early_stop=False,
                  early_stop_burnin_rounds=0,
                  early_stop_rounds=3,
-                 early_stop_strategy=EARLY_STOP_AVERAGE_INCREASE_STRATEGY):
+                 early_stop_strategy=EARLY_STOP_AVERAGE_INCREASE_STRATEGY,
+                 exact_eval_max_size=EXACT_EVAL_MAX_SIZE):
         # set default metric list
         if eval_metric_list is None:
             eval_metric_list = ["accuracy"]
@@ -547,6 +554,7 @@ class GSgnnClassificationEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterf
                                                            early_stop_rounds,
                                                            early_stop_strategy)
         self._multilabel = multilabel
+        self._exact_eval_max_size = exact_eval_max_size
         self._best_val_score = {}
         self._best_test_score = {}
         self._best_iter = {}
@@ -583,19 +591,9 @@ class GSgnnClassificationEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterf
         test_score: dict
             Test scores of different classification metrics in the format of {metric: test_score}.
         """
-        # exchange preds and labels between runners
-        local_rank = get_rank()
-        world_size = get_world_size()
-        val_pred = broadcast_data(local_rank, world_size, val_pred)
-        val_labels = broadcast_data(local_rank, world_size, val_labels)
-        test_pred = broadcast_data(local_rank, world_size, test_pred) \
-            if test_pred is not None else None
-        test_labels = broadcast_data(local_rank, world_size, test_labels) \
-            if test_labels is not None else None
-
         with th.no_grad():
-            val_score = self.compute_score(val_pred, val_labels, train=False)
-            test_score = self.compute_score(test_pred, test_labels, train=False)
+            val_score = self._compute_eval_score(val_pred, val_labels)
+            test_score = self._compute_eval_score(test_pred, test_labels)
 
         for metric in self.metric_list:
             # be careful whether > or < it might change per metric.
@@ -608,6 +606,28 @@ class GSgnnClassificationEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterf
 
         return val_score, test_score
 
+    def _compute_eval_score(self, pred, labels):
+        """ Compute the validation or test scores across all trainers.
+
+        For large evaluation sets, the scores are computed from statistics summed
+        over trainers. Otherwise, predictions and labels are exchanged between
+        trainers and the scores are computed exactly.
+        """
+        scores = compute_sharded_scores(self.metric_list, pred, labels,
+                                        multilabel=self._multilabel,
+                                        exact_eval_max_size=self._exact_eval_max_size)
+        if scores is not None:
+            return scores
+
+        # exchange preds and labels between runners
+        local_rank = get_rank()
+        world_size = get_world_size()
+        pred = broadcast_data(local_rank, world_size, pred) \
+            if pred is not None else None
+        labels = broadcast_data(local_rank, world_size, labels) \
+            if labels is not None else None
+        return self.compute_score(pred, labels, train=False)
+
     def compute_score(self, pred, labels, train=True):
         """ Compute classification evaluation score.
 
@@ -673,13 +693,18 @@ class GSgnnRegressionEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterface)
         The early stop strategy. GraphStorm supports two strategies:
         1) ``consecutive_increase``, and 2) ``average_increase``.
         Default: ``average_increase``.
+    exact_eval_max_size: int
+        When there are more validation or test samples than this number across all
+        trainers, metrics are computed from statistics summed over trainers instead
+        of exchanging all predictions. Default: 1000000.
     """
     def __init__(self, eval_frequency,
                  eval_metric_list=None,
                  use_early_stop=False,
                  early_stop_burnin_rounds=0,
                  early_stop_rounds=3,
-                 early_stop_strategy=EARLY_STOP_AVERAGE_INCREASE_STRATEGY):
+                 early_stop_strategy=EARLY_STOP_AVERAGE_INCREASE_STRATEGY,
+                 exact_eval_max_size=EXACT_EVAL_MAX_SIZE):
         # set default metric list
         if eval_metric_list is None:
             eval_metric_list = ["rmse"]
@@ -689,6 +714,7 @@ class GSgnnRegressionEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterface)
         self._best_val_score = {}
         self._best_test_score = {}
         self._best_iter = {}
+        self._exact_eval_max_size = exact_eval_max_size
         self.metrics_obj = RegressionMetrics()
 
         for metric in self.metric_list:
@@ -721,19 +747,9 @@ class GSgnnRegressionEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterface)
         test_score: dict
             Test scores of different regression metrics in the format of {metric: test_score}.
         """
-        # exchange preds and labels between runners
-        local_rank = get_rank()
-        world_size = get_world_size()
-        val_pred = broadcast_data(local_rank, world_size, val_pred)
-        val_labels = broadcast_data(local_rank, world_size, val_labels)
-        test_pred = broadcast_data(local_rank, world_size, test_pred) \
-            if test_pred is not None else None
-        test_labels = broadcast_data(local_rank, world_size, test_labels) \
-            if test_labels is not None else None
-
         with th.no_grad():
-            val_score = self.compute_score(val_pred, val_labels)
-            test_score = self.compute_score(test_pred, test_labels)
+            val_score = self._compute_eval_score(val_pred, val_labels)
+            test_score = self._compute_eval_score(test_pred, test_labels)
 
         for metric in self.metric_list:
             # be careful whether > or < it might change per metric.
@@ -746,6 +762,27 @@ class GSgnnRegressionEvaluator(GSgnnBaseEvaluator, GSgnnPredictionEvalInterface)
 
         return val_score, test_score
 
+    def _compute_eval_score(self, pred, labels):
+        """ Compute the validation or test scores across all trainers.
+
+        For large evaluation sets, the scores are computed from statistics summed
+        over trainers. Otherwise, predictions and labels are exchanged between
+        trainers and the scores are computed exactly.
+        """
+        scores = compute_sharded_scores(self.metric_list, pred, labels,
+                                        exact_eval_max_size=self._exact_eval_max_size)
+        if scores is not None:
+            return scores
+
+        # exchange preds and labels between runners
+        local_rank = get_rank()
+        world_size = get_world_size()
+        pred = broadcast_data(local_rank, world_size, pred) \
+            if pred is not None else None
+        labels = broadcast_data(local_rank, world_size, labels) \
+            if labels is not None else None
+        return self.compute_score(pred, labels)
+
     def compute_score(self, pred, labels, train=True):
         """ Compute regression evaluation score.
 
@@ -541,9 +541,33 @@ def calc_transe_neg_tail_score(h_emb, t_emb, r_emb, num_chunks,
         raise ValueError("Unknown norm on the angular distance. Only support L1 and L2.")
     return transe_score
 
+def count_higher_scores(pos_score, neg_score):
+    """ Count, for each positive score, the negative scores strictly greater than it.
+
+        This is the comparison-count kernel behind the link prediction rankings.
+        It never sorts the score rows, so it can be accumulated over chunks of
+        candidates.
+
+        Parameters
+        ----------
+        pos_score: torch.Tensor
+            Positive scores in the shape of (N,).
+        neg_score: torch.Tensor
+            Negative scores in the shape of (N, K).
+
+        Returns
+        -------
+        th.Tensor: The number of negative scores greater than the positive score
+        for each of the N rows.
+    """
+    return th.sum(neg_score > pos_score.view(-1, 1), dim=1)
+
 def calc_ranking(pos_score, neg_score):
     """ Calculate ranking of positive scores among negative scores
 
+        The ranking of a positive score is one plus the number of negative scores
+        greater than it. Ties are resolved in favor of the positive score.
+
         Parameters
         ----------
         pos_score: torch.Tensor
@@ -555,13 +579,7 @@ def calc_ranking(pos_score, neg_score):
         -------
         ranking of positive scores: th.Tensor
     """
-    pos_score = pos_score.view(-1, 1)
-    # perturb object
-    scores = th.cat([pos_score, neg_score], dim=1)
-    scores = th.sigmoid(scores)
-    _, indices = th.sort(scores, dim=1, descending=True)
-    indices = th.nonzero(indices == 0)
-    rankings = indices[:, 1].view(-1) + 1
+    rankings = count_higher_scores(pos_score, neg_score) + 1
     rankings = rankings.detach()
     if is_distributed() and get_backend() == "gloo":
         rankings = rankings.cpu() # Save GPU memory
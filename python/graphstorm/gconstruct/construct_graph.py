@@ -22,8 +22,11 @@ from functools import partial
 import os
 import json
 import argparse
+import contextlib
 import gc
 import logging
+import shutil
+import tempfile
 
 import numpy as np
 import torch as th
@@ -41,8 +44,9 @@ from .transform import (print_node_label_stats,
                         print_edge_label_stats,
                         save_node_label_stats,
                         save_edge_label_stats)
-from .id_map import NoopMap, IdMap, map_node_ids
-from .utils import (multiprocessing_data_read,
+from .id_map import (NoopMap, ArrayIdMap, map_node_ids, share_id_maps,
+                     save_reverse_id_map)
+from .utils import (multiprocessing_data_read, DataReadWorkerPool,
                     update_two_phase_feat_ops, ExtMemArrayMerger,
                     partition_graph,
                     ExtMemArrayWrapper,
@@ -213,7 +217,7 @@ def parse_edge_data(in_file, feat_ops, label_ops, node_id_map, read_file,
 def _process_data(user_pre_parser, user_parser,
                   two_phase_feat_ops,
                   in_files, num_proc, task_info,
-                  ext_mem_workspace):
+                  ext_mem_workspace, worker_pool=None, result_fn=None):
     """ Process node and edge data.
 
     Parameter
@@ -232,11 +236,17 @@ def _process_data(user_pre_parser, user_parser,
         Task meta info for debugging.
     ext_mem_workspace : str
         The path of the external-memory work space.
+    worker_pool : DataReadWorkerPool
+        The worker pool to process the data files. If it is None, new processes
+        are created to process the data files.
+    result_fn : callable
+        The function called with the processed data of each file as soon as
+        the file is processed. Its return value is kept as the processed data.
     """
     if len(two_phase_feat_ops) > 0:
         pre_parse_start = time.time()
         phase_one_ret = multiprocessing_data_read(in_files, num_proc, user_pre_parser,
-                                                  ext_mem_workspace)
+                                                  ext_mem_workspace, worker_pool)
         update_two_phase_feat_ops(phase_one_ret, two_phase_feat_ops)
 
         dur = time.time() - pre_parse_start
@@ -245,7 +255,7 @@ def _process_data(user_pre_parser, user_parser,
 
     start = time.time()
     return_dict = multiprocessing_data_read(in_files, num_proc, user_parser,
-                                            ext_mem_workspace)
+                                            ext_mem_workspace, worker_pool, result_fn)
     dur = time.time() - start
     logging.debug("Processing data files for %s takes %.3f seconds.",
                     task_info, dur)
@@ -253,7 +263,7 @@ def _process_data(user_pre_parser, user_parser,
 
 
 def process_node_data(process_confs, arr_merger, remap_id,
-                      ext_mem_workspace=None, num_processes=1):
+                      ext_mem_workspace=None, num_processes=1, worker_pool=None):
     """ Process node data
 
     We need to process all node data before we can process edge data.
@@ -293,6 +303,8 @@ def process_node_data(process_confs, arr_merger, remap_id,
         The number of processes to process the input files.
     ext_mem_workspace: str or None
         The path of external-memory work space for multi-column features
+    worker_pool: DataReadWorkerPool
+        The worker pool to process the input files.
 
     Returns
     -------
@@ -349,7 +361,8 @@ def process_node_data(process_confs, arr_merger, remap_id,
                                     in_files,
                                     num_proc,
                                     f"node {node_type}",
-                                    ext_mem_workspace_type)
+                                    ext_mem_workspace_type,
+                                    worker_pool)
         type_node_id_map = [None] * len(return_dict)
         type_node_data = {}
         for i, (node_ids, data) in return_dict.items():
@@ -386,7 +399,7 @@ def process_node_data(process_confs, arr_merger, remap_id,
                 and not remap_id:
             type_node_id_map = NoopMap(len(type_node_id_map))
         elif type_node_id_map is not None:
-            type_node_id_map = IdMap(type_node_id_map)
+            type_node_id_map = ArrayIdMap(type_node_id_map)
             sys_tracker.check(f'Create node ID map of {node_type}')
 
         if node_type not in label_stats:
@@ -478,9 +491,97 @@ def _collect_parsed_edge_data(data_dict):
 
     return type_src_ids, type_dst_ids, type_edge_data
 
+class _EdgeDataStager:
+    """ Stage the edges parsed from multiple files while the files are processed.
+
+    It is called with the data parsed from each file as soon as the file is processed.
+    It stages the source and destination node IDs and the edge data of the file
+    with ExtMemArrayMerger. If the external-memory workspace is given, they are
+    written to the workspace and freed, so that the edges of all input files are
+    not held in memory at the same time. The label statistics stay in the parsed data.
+
+    Parameters
+    ----------
+    arr_merger : ExtMemArrayMerger
+        The merger that stages and merges the arrays.
+    etype_str : str
+        The name of the edge type, which is the prefix of the names of the edge data.
+    block_idx : int
+        The index of the edge block in the configurations. It tells apart the node IDs
+        of the edge blocks of the same edge type.
+    """
+    def __init__(self, arr_merger, etype_str, block_idx):
+        self._arr_merger = arr_merger
+        self._etype_str = etype_str
+        self._id_names = (f"edge_ids/{block_idx}/src_ids", f"edge_ids/{block_idx}/dst_ids")
+        self.feat_names = []
+        self.has_ids = False
+
+    def __call__(self, file_idx, data):
+        """ Stage the node IDs and the edge data parsed from a file.
+
+        Parameters
+        ----------
+        file_idx : int
+            The index of the file.
+        data : tuple
+            The source IDs, destination IDs and the edge data parsed from the file.
+
+        Returns
+        -------
+        tuple : the label statistics in the parsed data.
+        """
+        if data is None:
+            return data
+        src_ids, dst_ids, feat_data = data
+        stats = {name: val for name, val in feat_data.items() \
+                 if name.startswith(LABEL_STATS_FIELD)}
+        if src_ids is not None:
+            self.has_ids = True
+            if len(src_ids) == 0:
+                return (None, None, stats)
+            for ids, name in zip((src_ids, dst_ids), self._id_names):
+                self._arr_merger.stage(ids, name, file_idx)
+        for feat_name, feat in feat_data.items():
+            if feat_name in stats:
+                continue
+            self._arr_merger.stage(feat, self._etype_str + "_" + feat_name, file_idx)
+            if feat_name not in self.feat_names:
+                self.feat_names.append(feat_name)
+        return (None, None, stats)
+
+    def merge_feat(self, feat_name):
+        """ Get the merged edge data.
+
+        Parameters
+        ----------
+        feat_name : str
+            The name of the edge data.
+
+        Returns
+        -------
+        Numpy array : the merged edge data.
+        """
+        return self._arr_merger.merge_staged(self._etype_str + "_" + feat_name)
+
+    def merge_ids(self):
+        """ Get the merged source and destination node IDs.
+
+        Returns
+        -------
+        tuple of Numpy arrays : the source and destination node IDs.
+        """
+        ids = [self._arr_merger.merge_staged(name, force_ext_mem=True) \
+               for name in self._id_names]
+        if ids[0] is None:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        # The merged IDs in the workspace are read-only memory-mapped arrays.
+        return tuple(arr.to_numpy() if isinstance(arr, ExtMemArrayWrapper) else arr \
+                     for arr in ids)
+
 def process_edge_data(process_confs, node_id_map, arr_merger,
                       ext_mem_workspace=None, num_processes=1,
-                      skip_nonexist_edges=False):
+                      skip_nonexist_edges=False, worker_pool=None):
     """ Process edge data
 
     The edge data of an edge type is defined as follows:
@@ -519,7 +620,10 @@ def process_edge_data(process_confs, node_id_map, arr_merger,
     skip_nonexist_edges : bool
         Whether or not to skip edges that don't exist.
     ext_mem_workspace: str or None
-        The path of external-memory work space for multi-column features
+        The path of external-memory work space for multi-column features.
+        If it is given, the edges are also staged in the work space.
+    worker_pool: DataReadWorkerPool
+        The worker pool to process the input files.
 
     Returns
     -------
@@ -538,7 +642,11 @@ def process_edge_data(process_confs, node_id_map, arr_merger,
     edge_data = {}
     label_stats = {}
     label_masks = {}
-    for process_conf in process_confs:
+    if worker_pool is not None:
+        # Send every node ID map to a worker once instead of with the parser
+        # of every edge type.
+        worker_pool.share(node_id_map)
+    for block_idx, process_conf in enumerate(process_confs):
         # each iteration is to process an edge type.
         assert 'relation' in process_conf, \
                 "'relation' is not defined for an edge type."
@@ -584,13 +692,17 @@ def process_edge_data(process_confs, node_id_map, arr_merger,
 
         ext_mem_workspace_type = os.path.join(ext_mem_workspace, "_".join(edge_type)) \
                 if ext_mem_workspace is not None else None
+        # The node IDs and edge data are staged as soon as each file is processed.
+        edge_stager = _EdgeDataStager(arr_merger, "-".join(edge_type), block_idx)
         return_dict = _process_data(user_pre_parser,
                                     user_parser,
                                     two_phase_feat_ops,
                                     in_files,
                                     num_proc,
                                     f"edge {edge_type}",
-                                    ext_mem_workspace_type)
+                                    ext_mem_workspace_type,
+                                    worker_pool,
+                                    edge_stager)
 
         type_src_ids, type_dst_ids, type_edge_data = \
             _collect_parsed_edge_data(return_dict)
@@ -609,32 +721,27 @@ def process_edge_data(process_confs, node_id_map, arr_merger,
 
         # handle edge type
         for feat_name in list(type_edge_data):
-            # features start with LABEL_STATS_FIELD store label statistics
-            if feat_name.startswith(LABEL_STATS_FIELD):
-                label_name, stats_type, stats = \
-                    collect_label_stats(feat_name, type_edge_data[feat_name])
-                label_stats[edge_type][label_name] = (stats_type, stats)
-                del type_edge_data[feat_name]
-            else:
-                etype_str = "-".join(edge_type)
-                merged_feat = arr_merger(type_edge_data[feat_name],
-                                         etype_str + "_" + feat_name)
-                if feat_name in after_merge_feat_ops:
-                    # do data transformation with the entire feat array.
-                    merged_feat = \
-                        after_merge_feat_ops[feat_name].after_merge_transform(merged_feat)
-                type_edge_data[feat_name] = merged_feat
-                sys_tracker.check(f'Merge edge data {feat_name} of {edge_type}')
+            # The edge data left in the parsed data are label statistics,
+            # whose names start with LABEL_STATS_FIELD.
+            label_name, stats_type, stats = \
+                collect_label_stats(feat_name, type_edge_data[feat_name])
+            label_stats[edge_type][label_name] = (stats_type, stats)
+            del type_edge_data[feat_name]
+        for feat_name in edge_stager.feat_names:
+            merged_feat = edge_stager.merge_feat(feat_name)
+            if feat_name in after_merge_feat_ops:
+                # do data transformation with the entire feat array.
+                merged_feat = \
+                    after_merge_feat_ops[feat_name].after_merge_transform(merged_feat)
+            type_edge_data[feat_name] = merged_feat
+            sys_tracker.check(f'Merge edge data {feat_name} of {edge_type}')
             gc.collect()
 
         assert len(type_src_ids) > 0, \
             f"{edge_type} does not contain any edges." \
             "GraphStorm does not support such case."
-        if type_src_ids[0] is not None: # handle src_ids and dst_ids
-            assert all(src_ids is not None for src_ids in type_src_ids)
-            assert all(dst_ids is not None for dst_ids in type_dst_ids)
-            type_src_ids = np.concatenate(type_src_ids)
-            type_dst_ids = np.concatenate(type_dst_ids)
+        if edge_stager.has_ids: # handle src_ids and dst_ids
+            type_src_ids, type_dst_ids = edge_stager.merge_ids()
             assert len(type_src_ids) == len(type_dst_ids)
 
             edges[edge_type] = (type_src_ids, type_dst_ids)
@@ -781,6 +888,14 @@ def print_graph_info(g, node_data, edge_data, node_label_stats, edge_label_stats
 def process_graph(args):
     """ Process the graph.
     """
+    # Release the resources that outlive a failed run, e.g., the worker
+    # processes and the shared ID maps, whether or not processing succeeds.
+    with contextlib.ExitStack() as cleanup:
+        _process_graph(args, cleanup)
+
+def _process_graph(args, cleanup):
+    """ Process the graph and register the cleanup of its resources in `cleanup`.
+    """
     check_graph_name(args.graph_name)
     logging.basicConfig(level=get_log_level(args.logging_level))
     if args.no_feature_validate:
@@ -809,16 +924,45 @@ def process_graph(args):
         if len(output_format) == 1 and output_format[0] == "DistDGL" else None
     convert2ext_mem = ExtMemArrayMerger(ext_mem_workspace, args.ext_mem_feat_size)
 
+    # Start the worker processes once and reuse them to process all node types
+    # and edge types.
+    max_num_processes = max(num_processes_for_nodes, num_processes_for_edges)
+    worker_pool = DataReadWorkerPool(max_num_processes) \
+        if args.use_worker_pool and max_num_processes > 1 else None
+    if worker_pool is not None:
+        # Kill the worker processes if processing fails before the worker pool is closed.
+        # Otherwise, they wait for new tasks forever.
+        cleanup.callback(worker_pool.terminate)
     raw_node_id_maps, node_data, node_label_stats, node_label_masks = \
         process_node_data(process_confs['nodes'], convert2ext_mem,
                           args.remap_node_id, ext_mem_workspace,
-                          num_processes=num_processes_for_nodes)
+                          num_processes=num_processes_for_nodes,
+                          worker_pool=worker_pool)
     sys_tracker.check('Process the node data')
+    if args.share_id_maps:
+        # Publish the node ID maps once into memory-mapped files so that
+        # the worker processes of edge parsing attach to them read-only
+        # instead of getting their own copies of the ID maps.
+        # Use POSIX shared memory if no external-memory workspace is given.
+        if ext_mem_workspace is not None:
+            os.makedirs(ext_mem_workspace, exist_ok=True)
+            shm_root = ext_mem_workspace
+        else:
+            shm_root = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        shared_id_map_dir = tempfile.mkdtemp(prefix="id_maps_", dir=shm_root)
+        # The ID maps may be stored in RAM-backed shared memory (/dev/shm),
+        # which is not freed until reboot if the directory is not removed.
+        cleanup.callback(shutil.rmtree, shared_id_map_dir, ignore_errors=True)
+        share_id_maps(raw_node_id_maps, shared_id_map_dir)
+        sys_tracker.check('Share node ID maps')
     edges, edge_data, edge_label_stats, edge_label_masks, hard_edge_neg_ops = \
         process_edge_data(process_confs['edges'], raw_node_id_maps,
                           convert2ext_mem, ext_mem_workspace,
                           num_processes=num_processes_for_edges,
-                          skip_nonexist_edges=args.skip_nonexist_edges)
+                          skip_nonexist_edges=args.skip_nonexist_edges,
+                          worker_pool=worker_pool)
+    if worker_pool is not None:
+        worker_pool.close()
     sys_tracker.check('Process the edge data')
     num_nodes = {ntype: len(raw_node_id_maps[ntype]) for ntype in raw_node_id_maps}
 
@@ -940,6 +1084,9 @@ def process_graph(args):
         raw_id_map.save(map_prefix)
         logging.info("Graph construction generated new node IDs for '%s'. " + \
                     "The ID map is saved under %s.", ntype, map_prefix)
+        if args.save_reverse_id_map and not isinstance(raw_id_map, NoopMap):
+            save_reverse_id_map(map_prefix)
+            logging.debug("Save the reverse ID map of '%s' under %s.", ntype, map_prefix)
 
 if __name__ == '__main__':
     argparser = argparse.ArgumentParser("Preprocess graphs")
@@ -985,6 +1132,18 @@ if __name__ == '__main__':
     argparser.add_argument("--ext-mem-feat-size", type=int, default=64,
                            help="The minimal number of feature dimensions that features " + \
                                    "can be stored in external memory.")
+    argparser.add_argument("--use-worker-pool", action='store_true',
+                           help="Start the worker processes once and reuse them to process "
+                                "the data of all node types and edge types.")
+    argparser.add_argument("--share-id-maps", action='store_true',
+                           help="Store node ID maps in shared memory (or memory-mapped files "
+                                "in the external-memory workspace) so that the processes "
+                                "that parse edge data share them instead of each holding "
+                                "a copy.")
+    argparser.add_argument("--save-reverse-id-map", action='store_true',
+                           help="Also save a pre-sorted, memory-mappable reverse ID map "
+                                "for every node type, so that remapping inference results "
+                                "opens the ID maps without loading and sorting them.")
     argparser.add_argument("--logging-level", type=str, default="info",
                            help="The logging level. The possible values: debug, info, warning, \
                                    error. The default value is info.")
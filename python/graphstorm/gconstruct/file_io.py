@@ -313,18 +313,30 @@ def read_data_parquet(data_file, data_fields=None):
     """
     table = pq.read_table(data_file)
     data = {}
-    df_table = table.to_pandas()
 
-    if df_table.shape[0] == 0:
+    if table.num_rows == 0:
         logging.warning("%s has an empty data. "
                         "The data frame shape is %s",
-                        data_file, df_table.shape)
+                        data_file, (table.num_rows, table.num_columns))
         return None
 
+    # Multi-dimension arrays stored as FixedSizeList columns are reshaped
+    # from their flattened values instead of going through pandas objects.
+    fixed_size_cols = {field.name: field.type.list_size for field in table.schema \
+                       if pa.types.is_fixed_size_list(field.type) \
+                       and table.column(field.name).null_count == 0}
+    df_table = table.select([name for name in table.column_names \
+                             if name not in fixed_size_cols]).to_pandas()
+
     if data_fields is None:
-        data_fields = list(df_table.keys())
+        data_fields = table.column_names
     for key in data_fields:
-        assert key in df_table, f"The data field {key} does not exist in {data_file}."
+        assert key in table.column_names, \
+            f"The data field {key} does not exist in {data_file}."
+        if key in fixed_size_cols:
+            values = table.column(key).combine_chunks().flatten()
+            data[key] = values.to_numpy(zero_copy_only=False).reshape(-1, fixed_size_cols[key])
+            continue
         d = df_table[key].to_numpy()
 
         # For multi-dimension arrays, we split them by rows and
@@ -345,19 +357,20 @@ def read_data_parquet(data_file, data_fields=None):
         data[key] = d
     return data
 
-def write_data_parquet(data, data_file):
-    """ Write data in parquet files.
+def data_to_arrow_table(data):
+    """ Convert data into an Arrow table.
 
-    Normally, Parquet cannot support multi-dimension arrays.
-    This function splits a multi-dimensiion array into N arrays
-    (each row is an array) and store the arrays as objects in the parquet file.
+    A multi-dimension array is stored as a FixedSizeList column built directly
+    on the flattened array buffer, instead of one Python object per row.
 
     Parameters
     ----------
     data : dict
-        The data to be saved to the Parquet file.
-    data_file : str
-        The file name of the Parquet file.
+        The data to be converted, in the format of {column name: array}.
+
+    Returns
+    -------
+    pyarrow.Table : The Arrow table.
     """
     arr_dict = {}
     for key in data:
@@ -369,9 +382,25 @@ def write_data_parquet(data, data_file):
         if len(arr.shape) == 1:
             arr_dict[key] = arr
         else:
-            arr_dict[key] = [arr[i] for i in range(len(arr))]
-    table = pa.Table.from_arrays(list(arr_dict.values()), names=list(arr_dict.keys()))
-    pq.write_table(table, data_file)
+            values = pa.array(np.ascontiguousarray(arr).reshape(-1))
+            arr_dict[key] = pa.FixedSizeListArray.from_arrays(values, arr.shape[1])
+    return pa.Table.from_arrays(list(arr_dict.values()), names=list(arr_dict.keys()))
+
+def write_data_parquet(data, data_file):
+    """ Write data in parquet files.
+
+    Normally, Parquet cannot support multi-dimension arrays.
+    This function stores a multi-dimension array as a list column in
+    the parquet file, where each row is an array.
+
+    Parameters
+    ----------
+    data : dict
+        The data to be saved to the Parquet file.
+    data_file : str
+        The file name of the Parquet file.
+    """
+    pq.write_table(data_to_arrow_table(data), data_file)
 
 def read_data_hdf5(data_file, data_fields=None, in_mem=True):
     """ Read the data from a HDF5 file.
@@ -32,6 +32,9 @@ from .file_io import read_data_parquet
 from .utils import ExtMemArrayWrapper
 
 GIB_BYTES = 1024**3
+# The pre-sorted reverse ID map stored next to the ID mapping parquet files.
+# The underscore prefix keeps it out of the parquet dataset of the directory.
+REVERSE_ID_MAP_FILE = "_reverse_ids.npy"
 
 class NoopMap:
     """ It doesn't map IDs.
@@ -79,6 +82,12 @@ class IdReverseMap:
 
         This loads an ID map for output IDs.
 
+        If the ID map directory contains a reverse ID map saved by
+        `save_reverse_id_map`, the raw IDs are memory-mapped from it
+        lazily on first use instead of reading and sorting all the
+        parquet files. Processes on the same host then share the
+        page cache of the file.
+
         Parameters
         ----------
         id_map_prefix : str
@@ -87,6 +96,13 @@ class IdReverseMap:
     def __init__(self, id_map_prefix):
         assert os.path.exists(id_map_prefix), \
             f"{id_map_prefix} does not exist."
+        reverse_map_file = os.path.join(id_map_prefix, REVERSE_ID_MAP_FILE)
+        if os.path.isfile(reverse_map_file):
+            self._reverse_map_file = reverse_map_file
+            self._ids = None
+            return
+
+        self._reverse_map_file = None
         try:
             data = read_data_parquet(id_map_prefix, [MAPPING_INPUT_ID, MAPPING_OUTPUT_ID])
         except AssertionError:
@@ -100,8 +116,39 @@ class IdReverseMap:
         sort_idx = np.argsort(data[MAPPING_OUTPUT_ID])
         self._ids = data[MAPPING_INPUT_ID][sort_idx]
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # A memory-mapped ID map is reopened by the process that unpickles it.
+        if self._reverse_map_file is not None:
+            state["_ids"] = None
+        return state
+
+    @property
+    def is_mmap(self):
+        """ Whether the raw IDs are memory-mapped from a reverse ID map file.
+        """
+        return self._reverse_map_file is not None
+
+    @property
+    def ids(self):
+        """ The raw IDs ordered by GraphStorm IDs.
+
+        The raw IDs of string type are stored as fixed-width UTF-8 byte strings
+        if they are memory-mapped from a reverse ID map file.
+        """
+        if self._ids is None:
+            self._ids = np.load(self._reverse_map_file, mmap_mode="r")
+        return self._ids
+
+    def _decode(self, ids):
+        """ Decode the fixed-width UTF-8 byte strings into strings.
+        """
+        if ids.dtype.kind == "S":
+            return np.char.decode(ids, "utf-8")
+        return ids
+
     def __len__(self):
-        return len(self._ids)
+        return len(self.ids)
 
     def map_range(self, start, end):
         """ Map a range of GraphStorm IDs to the raw IDs.
@@ -117,7 +164,7 @@ class IdReverseMap:
         -------
         tensor: A numpy array of raw IDs.
         """
-        return self._ids[start:end]
+        return self._decode(self.ids[start:end])
 
     def map_id(self, ids):
         """ Map the GraphStorm IDs to the raw IDs.
@@ -134,7 +181,46 @@ class IdReverseMap:
         if len(ids) == 0:
             return np.array([], dtype=np.str)
 
-        return self._ids[ids]
+        return self._decode(self.ids[ids])
+
+    def save(self, id_map_prefix):
+        """ Save the raw IDs as a fixed-width memory-mappable reverse ID map.
+
+        The file is stored as ``_reverse_ids.npy`` under `id_map_prefix`.
+        The i-th element is the raw ID of the node whose GraphStorm ID is i.
+        Integer raw IDs keep their integer type and all other raw IDs are
+        stored as fixed-width UTF-8 byte strings.
+
+        Parameters
+        ----------
+        id_map_prefix : str
+            The ID mapping directory where the reverse ID map is saved to.
+        """
+        ids = np.asarray(self.ids)
+        if not np.issubdtype(ids.dtype, np.integer) and ids.dtype.kind != "S":
+            ids = np.char.encode(ids.astype(str), "utf-8")
+        os.makedirs(id_map_prefix, exist_ok=True)
+        reverse_map_file = os.path.join(id_map_prefix, REVERSE_ID_MAP_FILE)
+        # Write to a temporary file first so that readers never see
+        # a partially written reverse ID map.
+        tmp_file = f"{reverse_map_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            np.save(f, ids)
+        os.replace(tmp_file, reverse_map_file)
+
+def save_reverse_id_map(id_map_prefix):
+    """ Persist a memory-mappable reverse ID map for an ID mapping directory.
+
+    It sorts the ID mapping parquet files under `id_map_prefix` by GraphStorm IDs
+    once and saves the raw IDs into a fixed-width file, so that `IdReverseMap`
+    can open the ID map in constant time afterwards.
+
+    Parameters
+    ----------
+    id_map_prefix : str
+        The ID mapping directory, e.g., ``<output_dir>/raw_id_mappings/<ntype>``.
+    """
+    IdReverseMap(id_map_prefix).save(id_map_prefix)
 
 class IdMap:
     """ Map an ID to a new ID.
@@ -230,24 +316,223 @@ class IdMap:
             The file prefix under which the ID map will be saved to.
 
         """
-        os.makedirs(file_prefix, exist_ok=True)
         table = pa.Table.from_arrays([pa.array(self._ids.keys()), self._ids.values()],
                                      names=[MAPPING_INPUT_ID, MAPPING_OUTPUT_ID])
-        bytes_per_row = table.nbytes // table.num_rows
-        # Split table in parts, such that the max expected file size is ~1GB
-        max_rows_per_file = GIB_BYTES // bytes_per_row
-        total_rows_written = 0
-        file_idx = 0
-        while total_rows_written < table.num_rows:
-            start = total_rows_written
-            filename = f"part-{str(file_idx).zfill(5)}.parquet"
-
-            pq.write_table(
-                table.slice(offset=start, length=max_rows_per_file),
-                os.path.join(file_prefix, filename)
-            )
-            total_rows_written = min(start + max_rows_per_file, table.num_rows)
-            file_idx += 1
+        _save_mapping_table(table, file_prefix)
+
+class ArrayIdMap:
+    """ Map an ID to a new ID with sorted arrays.
+
+    This is an array-backed version of IdMap. Instead of building a Python dict
+    over all raw IDs, it keeps the raw IDs in a sorted Numpy array together with
+    the new IDs in the same order and maps IDs with `np.searchsorted`.
+    Integer IDs are stored with their original integer type. All other IDs are
+    cast into strings and stored as fixed-width UTF-8 byte strings. This
+    significantly reduces the memory footprint of the ID map and mapping IDs
+    runs as vectorized Numpy operations instead of a Python loop.
+
+    It can be used as a drop-in replacement of IdMap.
+
+    Parameters
+    ----------
+    ids : Array
+        The input IDs
+    """
+    def __init__(self, ids):
+        # If the IDs are stored in ExtMemArray, we should convert it to Numpy array.
+        if isinstance(ids, ExtMemArrayWrapper):
+            ids = ids.to_numpy()
+        ids = np.asarray(ids)
+
+        self._is_int = np.issubdtype(ids.dtype, np.integer)
+        keys = ids if self._is_int else self._to_bytes(ids)
+        sort_idx = np.argsort(keys, kind="stable")
+        sorted_keys = keys[sort_idx]
+        # Handle duplicated IDs in the same way as IdMap, i.e., the last occurrence
+        # of an ID determines its new ID. As the sort is stable, the last
+        # occurrence is the last one among the same keys in the sorted array.
+        if len(sorted_keys) > 1:
+            last = np.ones(len(sorted_keys), dtype=bool)
+            last[:-1] = sorted_keys[1:] != sorted_keys[:-1]
+            if not np.all(last):
+                logging.warning("There are %d duplicated IDs in the ID map.",
+                                len(last) - np.sum(last))
+                sorted_keys = sorted_keys[last]
+                sort_idx = sort_idx[last]
+        self._keys = sorted_keys
+        self._vals = sort_idx.astype(np.int64)
+        self._shared_path = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # If the ID map is stored in memory-mapped files, we only need to pass
+        # the path of the files to other processes.
+        if self._shared_path is not None:
+            del state["_keys"]
+            del state["_vals"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._shared_path is not None:
+            self._attach(self._shared_path)
+
+    def _attach(self, path):
+        """ Open the memory-mapped ID map files in read-only mode.
+        """
+        self._keys = np.load(os.path.join(path, "keys.npy"), mmap_mode="r")
+        self._vals = np.load(os.path.join(path, "vals.npy"), mmap_mode="r")
+
+    def share_memory(self, path):
+        """ Move the ID map into memory-mapped files.
+
+        After this call, the ID map is backed by read-only memory-mapped files
+        under `path`. When the ID map is passed to other processes, only the
+        path is pickled and the other processes attach to the same files.
+        If `path` is on tmpfs (e.g., /dev/shm), the ID map is stored in
+        POSIX shared memory; otherwise, all processes share the page cache.
+
+        Parameters
+        ----------
+        path : str
+            The directory where the ID map files are stored.
+        """
+        if self._shared_path is not None:
+            return
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "keys.npy"), self._keys)
+        np.save(os.path.join(path, "vals.npy"), self._vals)
+        self._attach(path)
+        self._shared_path = path
+
+    @property
+    def is_shared(self):
+        """ Whether the ID map is stored in memory-mapped files.
+        """
+        return self._shared_path is not None
+
+    @staticmethod
+    def _to_bytes(ids):
+        """ Cast IDs into fixed-width UTF-8 byte strings.
+        """
+        if ids.dtype.kind == "S":
+            return ids
+        return np.char.encode(ids.astype(str), "utf-8")
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def map_key_dtype(self):
+        """ Return the data type of map keys.
+        """
+        return self._keys.dtype if self._is_int else str
+
+    def map_id(self, ids):
+        """ Map the input IDs to the new IDs.
+
+        Parameters
+        ----------
+        ids : tensor
+            The input IDs
+
+        Returns
+        -------
+        tuple of tensors : the tensor of new IDs, the location of the IDs in the input ID tensor.
+        """
+        if len(ids) == 0 or len(self._keys) == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        ids = np.asarray(ids)
+        if self._is_int:
+            # If the data type of the key is integer, the input Ids should
+            # also be integers.
+            assert np.issubdtype(ids.dtype, np.integer), \
+                    "The key of ID map is integer, input IDs should also be integers. " \
+                    + f"But get {type(ids[0])}."
+        else:
+            # If the data type of the key is string, the input Ids should not be integer.
+            assert not np.issubdtype(ids.dtype, np.integer), \
+                "The key of ID map is string, input IDs are integers."
+            ids = self._to_bytes(ids)
+
+        # If the input ID exists in the ID map, map it to a new ID
+        # and keep its location in the input ID array.
+        # Otherwise, skip the ID.
+        locs = np.searchsorted(self._keys, ids)
+        # IDs larger than all keys get len(self._keys) from searchsorted.
+        locs = np.clip(locs, 0, len(self._keys) - 1)
+        idx = np.nonzero(self._keys[locs] == ids)[0]
+        return self._vals[locs[idx]], idx
+
+    def save(self, file_prefix):
+        """ Save the ID map to a set of parquet files.
+
+        Files are split such that they are not significantly larger
+        than 1GB per file. The rows are stored in the order of raw IDs.
+
+        Parameters
+        ----------
+        file_prefix : str
+            The file prefix under which the ID map will be saved to.
+        """
+        keys = pa.array(self._keys)
+        if not self._is_int:
+            keys = keys.cast(pa.string())
+        table = pa.Table.from_arrays([keys, pa.array(self._vals)],
+                                     names=[MAPPING_INPUT_ID, MAPPING_OUTPUT_ID])
+        _save_mapping_table(table, file_prefix)
+
+def _save_mapping_table(table, file_prefix):
+    """ Save an ID mapping table to a set of parquet files.
+
+    Files are split such that they are not significantly larger
+    than 1GB per file.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        The ID mapping table.
+    file_prefix : str
+        The file prefix under which the ID map will be saved to.
+    """
+    os.makedirs(file_prefix, exist_ok=True)
+    # A reverse ID map saved by an earlier run is preferred by IdReverseMap,
+    # so it has to go once the mapping it was built from is rewritten.
+    reverse_id_file = os.path.join(file_prefix, REVERSE_ID_MAP_FILE)
+    if os.path.exists(reverse_id_file):
+        os.remove(reverse_id_file)
+    bytes_per_row = table.nbytes // table.num_rows
+    # Split table in parts, such that the max expected file size is ~1GB
+    max_rows_per_file = GIB_BYTES // bytes_per_row
+    total_rows_written = 0
+    file_idx = 0
+    while total_rows_written < table.num_rows:
+        start = total_rows_written
+        filename = f"part-{str(file_idx).zfill(5)}.parquet"
+
+        pq.write_table(
+            table.slice(offset=start, length=max_rows_per_file),
+            os.path.join(file_prefix, filename)
+        )
+        total_rows_written = min(start + max_rows_per_file, table.num_rows)
+        file_idx += 1
+
+def share_id_maps(node_id_map, path):
+    """ Store the ID maps of all node types in memory-mapped files.
+
+    Only ArrayIdMap can be shared. Other ID maps are kept as they are.
+
+    Parameters
+    ----------
+    node_id_map : dict
+        The key is the node type and value is IdMap, ArrayIdMap or NoopMap.
+    path : str
+        The directory where the ID map files are stored.
+    """
+    for ntype, id_map in node_id_map.items():
+        if isinstance(id_map, ArrayIdMap):
+            id_map.share_memory(os.path.join(path, ntype))
+            logging.debug("Share the ID map of %s under %s.", ntype, path)
 
 def map_node_ids(src_ids, dst_ids, edge_type, node_id_map, skip_nonexist_edges):
     """ Map node IDs of source and destination nodes of edges.
@@ -267,7 +552,7 @@ def map_node_ids(src_ids, dst_ids, edge_type, node_id_map, skip_nonexist_edges):
     edge_type : tuple
         It contains source node type, relation type, destination node type.
     node_id_map : dict
-        The key is the node type and value is IdMap or NoopMap.
+        The key is the node type and value is IdMap, ArrayIdMap or NoopMap.
     skip_nonexist_edges : bool
         Whether or not to skip edges whose endpoint nodes don't exist.
 
@@ -27,10 +27,14 @@ import sys
 import math
 from functools import partial
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import torch as th
 from ..model.utils import pad_file_index
-from .file_io import write_data_parquet
+from .file_io import data_to_arrow_table
 from .id_map import IdReverseMap
 from ..utils import get_log_level
 from .utils import multiprocessing_exec_no_return as multiprocessing_remap
@@ -67,29 +71,92 @@ GS_REMAP_BUILTIN_COLS = [GS_REMAP_NID_COL,
 # id_maps to each worker process.
 id_maps = {}
 
+# Max number of rows remapped and written at a time. Input shards are memory
+# mapped and each output file is written block by block, so the memory
+# footprint of a worker does not grow with the shard size.
+GS_REMAP_WRITE_BLOCK_SIZE = 262144
+
+def _iter_blocks(data):
+    """ Return the data to write as an iterable of blocks.
+
+        ``data`` is either a dict of numpy Arrays or an iterable of them.
+    """
+    return [data] if isinstance(data, dict) else data
+
+def _rename_columns(data, col_name_map):
+    """ Rename the columns of data according to col_name_map.
+    """
+    if col_name_map is None:
+        return data
+    return {col_name_map.get(key, key): val for key, val in data.items()}
+
+def format_csv_vectors(vals):
+    """ Format each row of a 2D array as a string of values separated by semicolons.
+
+        The values are cast into strings and joined row by row with Arrow compute
+        kernels, instead of formatting each value in Python. Values are formatted
+        in their own precision, e.g., a float32 value 0.1 is written as ``0.1``
+        instead of the Python float representation ``0.10000000149011612``.
+
+        Parameters
+        ----------
+        vals: numpy.ndarray
+            A 2D array.
+
+        Return
+        ------
+        numpy.ndarray: The formatted rows.
+    """
+    num_rows, dim = vals.shape
+    if dim == 0:
+        return np.full(num_rows, "", dtype=object)
+    # List offsets are int32, so each slice has less than 2^31 values.
+    step = max(1, (2 ** 31 - 1) // dim)
+    rows = []
+    for start in range(0, num_rows, step):
+        block = np.ascontiguousarray(vals[start:start + step])
+        strs = pc.cast(pa.array(block.reshape(-1)), pa.string())
+        offsets = pa.array(np.arange(0, block.size + 1, dim, dtype=np.int32))
+        rows.append(pc.binary_join(pa.ListArray.from_arrays(offsets, strs), ";") \
+                    .to_numpy(zero_copy_only=False))
+    return np.concatenate(rows) if len(rows) > 0 else np.array([], dtype=object)
+
+def _load_tensor(path):
+    """ Load a tensor saved by torch.save, memory mapped when possible.
+    """
+    try:
+        return th.load(path, mmap=True)
+    except (TypeError, RuntimeError):
+        # Older PyTorch versions or the legacy serialization format
+        # do not support memory mapping.
+        return th.load(path)
+
 def write_data_parquet_file(data, file_prefix, col_name_map=None):
     """ Write data into disk using parquet format.
 
+        Multi-dimension data are stored as FixedSizeList columns.
+
         Parameters
         ----------
-        data: dict of numpy Arrays
-            Data to be written into disk.
+        data: dict of numpy Arrays, or iterable of dict of numpy Arrays
+            Data to be written into disk. An iterable of dicts is written
+            block by block into the same file.
         file_prefix: str
             File prefix. The output will be <file_prefix>.parquet.
         col_name_map: dict
             A mapping from builtin column name to user defined column name.
     """
-    if col_name_map is not None:
-        updated_data = {}
-        for key, val in data.items():
-            if key in col_name_map:
-                updated_data[col_name_map[key]] = val
-            else:
-                updated_data[key] = val
-        data = updated_data
-
     output_fname = f"{file_prefix}.parquet"
-    write_data_parquet(data, output_fname)
+    writer = None
+    try:
+        for block in _iter_blocks(data):
+            table = data_to_arrow_table(_rename_columns(block, col_name_map))
+            if writer is None:
+                writer = pq.ParquetWriter(output_fname, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
 
 def write_data_csv_file(data, file_prefix, delimiter=",", col_name_map=None):
     """ Write data into disk using csv format.
@@ -105,8 +172,9 @@ def write_data_csv_file(data, file_prefix, delimiter=",", col_name_map=None):
 
         Parameters
         ----------
-        data: dict of numpy Arrays
-            Data to be written into disk.
+        data: dict of numpy Arrays, or iterable of dict of numpy Arrays
+            Data to be written into disk. An iterable of dicts is written
+            block by block into the same file.
         file_prefix: str
             File prefix. The output will be <file_prefix>.parquet.
         delimiter: str
@@ -114,39 +182,31 @@ def write_data_csv_file(data, file_prefix, delimiter=",", col_name_map=None):
         col_name_map: dict
             A mapping from builtin column name to user defined column name.
     """
-    if col_name_map is not None:
-        updated_data = {}
-        for key, val in data.items():
-            if key in col_name_map:
-                updated_data[col_name_map[key]] = val
-            else:
-                updated_data[key] = val
-        data = updated_data
-
     output_fname = f"{file_prefix}.csv"
-    csv_data = {}
-    for key, vals in data.items():
-        # Each <key, val> pair represents the column name and
-        # the column data of a column.
-        if len(vals.shape) == 1:
-            # vals is a 1D matrix.
-            # The data will be saved as
-            #   key,
-            #   0.1,
-            #   0.2,
-            #   ...
-            csv_data[key] = vals.tolist()
-        elif len(vals.shape) == 2:
-            # vals is a 2D matrix.
-            # The data will be saved as
-            #   key,
-            #   0.001;1.2000;0.736;...,
-            #   0.002;1.1010;0.834;...,
-            #   ...
-            csv_data[key] = [";".join([str(v) for v in val]) \
-                             for val in vals.tolist()]
-    data_frame = pd.DataFrame(csv_data)
-    data_frame.to_csv(output_fname, index=False, sep=delimiter)
+    with open(output_fname, "w", encoding="utf-8", newline="") as f:
+        for i, block in enumerate(_iter_blocks(data)):
+            csv_data = {}
+            for key, vals in _rename_columns(block, col_name_map).items():
+                # Each <key, val> pair represents the column name and
+                # the column data of a column.
+                if len(vals.shape) == 1:
+                    # vals is a 1D matrix.
+                    # The data will be saved as
+                    #   key,
+                    #   0.1,
+                    #   0.2,
+                    #   ...
+                    csv_data[key] = vals
+                elif len(vals.shape) == 2:
+                    # vals is a 2D matrix.
+                    # The data will be saved as
+                    #   key,
+                    #   0.001;1.2000;0.736;...,
+                    #   0.002;1.1010;0.834;...,
+                    #   ...
+                    csv_data[key] = format_csv_vectors(vals)
+            data_frame = pd.DataFrame(csv_data)
+            data_frame.to_csv(f, index=False, sep=delimiter, header=i == 0)
 
 def worker_remap_node_data(data_file_path, nid_path, ntype, data_col_key,
     output_fname_prefix, chunk_size, output_func):
@@ -169,19 +229,23 @@ def worker_remap_node_data(data_file_path, nid_path, ntype, data_col_key,
         output_func: func
             Function used to write data to disk.
     """
-    node_data = th.load(data_file_path).numpy()
-    nids = th.load(nid_path).numpy()
+    node_data = _load_tensor(data_file_path)
+    nids = _load_tensor(nid_path)
     nid_map = id_maps[ntype]
     num_chunks = math.ceil(len(node_data) / chunk_size)
 
+    def gen_blocks(start, end):
+        for block_start in range(start, end, GS_REMAP_WRITE_BLOCK_SIZE):
+            block_end = min(block_start + GS_REMAP_WRITE_BLOCK_SIZE, end)
+            data = node_data[block_start:block_end].numpy()
+            nid = nid_map.map_id(nids[block_start:block_end].numpy())
+            yield {data_col_key: data,
+                   GS_REMAP_NID_COL: nid}
+
     for i in range(num_chunks):
         start = i * chunk_size
         end = (i + 1) * chunk_size if i + 1 < num_chunks else len(node_data)
-        data = node_data[start:end]
-        nid = nid_map.map_id(nids[start:end])
-        data = {data_col_key: data,
-                GS_REMAP_NID_COL: nid}
-        output_func(data, f"{output_fname_prefix}_{pad_file_index(i)}")
+        output_func(gen_blocks(start, end), f"{output_fname_prefix}_{pad_file_index(i)}")
 
 def worker_remap_edge_pred(pred_file_path, src_nid_path,
     dst_nid_path, src_type, dst_type,
@@ -208,23 +272,27 @@ def worker_remap_edge_pred(pred_file_path, src_nid_path,
         output_func: func
             Function used to write data to disk.
     """
-    pred_result = th.load(pred_file_path).numpy()
-    src_nids = th.load(src_nid_path).numpy()
-    dst_nids = th.load(dst_nid_path).numpy()
+    pred_result = _load_tensor(pred_file_path)
+    src_nids = _load_tensor(src_nid_path)
+    dst_nids = _load_tensor(dst_nid_path)
     src_id_map = id_maps[src_type]
     dst_id_map = id_maps[dst_type]
     num_chunks = math.ceil(len(pred_result) / chunk_size)
+
+    def gen_blocks(start, end):
+        for block_start in range(start, end, GS_REMAP_WRITE_BLOCK_SIZE):
+            block_end = min(block_start + GS_REMAP_WRITE_BLOCK_SIZE, end)
+            pred = pred_result[block_start:block_end].numpy()
+            src_nid = src_id_map.map_id(src_nids[block_start:block_end].numpy())
+            dst_nid = dst_id_map.map_id(dst_nids[block_start:block_end].numpy())
+            yield {GS_REMAP_PREDICTION_COL: pred,
+                   GS_REMAP_SRC_NID_COL: src_nid,
+                   GS_REMAP_DST_NID_COL: dst_nid}
+
     for i in range(num_chunks):
         start = i * chunk_size
         end = (i + 1) * chunk_size if i + 1 < num_chunks else len(pred_result)
-        pred = pred_result[start:end]
-        src_nid = src_id_map.map_id(src_nids[start:end])
-        dst_nid = dst_id_map.map_id(dst_nids[start:end])
-        data = {GS_REMAP_PREDICTION_COL: pred,
-                GS_REMAP_SRC_NID_COL: src_nid,
-                GS_REMAP_DST_NID_COL: dst_nid}
-
-        output_func(data, f"{output_fname_prefix}_{pad_file_index(i)}")
+        output_func(gen_blocks(start, end), f"{output_fname_prefix}_{pad_file_index(i)}")
 
 def _get_file_range(num_files, rank, world_size):
     """ Get the range of files to process by the current instance.
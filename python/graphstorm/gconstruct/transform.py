@@ -21,11 +21,14 @@ import logging
 import os
 import sys
 import abc
+import glob
+import hashlib
 import json
 import warnings
 from typing import Any, Dict, List, Optional
 
 import numpy as np
+import pandas as pd
 import torch as th
 
 from scipy.special import erfinv # pylint: disable=no-name-in-module
@@ -44,6 +47,9 @@ LABEL_STATS_FREQUENCY_COUNT = "frequency_cnt"
 
 CLASSIFICATION_LABEL_STATS_TYPES = [LABEL_STATS_FREQUENCY_COUNT]
 
+CATEGORICAL_ONE_HOT_OUTPUT = "one_hot"
+CATEGORICAL_INDEX_OUTPUT = "index"
+
 def _check_label_stats_type(task_type, label_stats_type):
     if task_type == "classification":
         if label_stats_type is not None:
@@ -454,7 +460,14 @@ class BucketTransform(FeatTransform):
 class CategoricalTransform(TwoPhaseFeatTransform):
     """ Convert the data into categorical values.
 
-    The categorical values are stored as integers.
+    The categorical values are stored as integers. By default, the categorical
+    values are encoded as one-hot (or multi-hot) vectors. When the output format
+    is ``index``, the categorical values are stored as indices of the categories
+    instead, which is more memory efficient for columns with many categories.
+    A single categorical value is stored as an array of shape (N, 1). Multiple
+    categorical values are stored as an array of shape (N, max_dim), where
+    max_dim is the maximal number of categorical values in a row, and the
+    empty slots are filled with -1. Unknown categorical values are stored as -1.
 
     Parameters
     ----------
@@ -466,24 +479,86 @@ class CategoricalTransform(TwoPhaseFeatTransform):
         The separator to split data into multiple categorical values.
     transform_conf : dict
         The configuration for the feature transformation.
+    output_format : str
+        The output format of the categorical values. It can be ``one_hot``
+        or ``index``. Default: ``one_hot``.
     """
-    def __init__(self, col_name, feat_name, separator=None, transform_conf=None):
+    def __init__(self, col_name, feat_name, separator=None, transform_conf=None,
+                 output_format=CATEGORICAL_ONE_HOT_OUTPUT):
+        assert output_format in [CATEGORICAL_ONE_HOT_OUTPUT, CATEGORICAL_INDEX_OUTPUT], \
+            f"Unknown output format {output_format} of categorical feature {feat_name}."
         self._val_dict = {}
+        self._max_dim = None
         if transform_conf is not None and 'mapping' in transform_conf:
             # We assume the keys of a categorical mapping are strings.
             # But previously keys can be integers. So we convert them
             # into strings.
             self._val_dict = \
                 {str(key): val for key, val in transform_conf['mapping'].items()}
+            self._max_dim = transform_conf.get('max_dim', None)
             self._conf = transform_conf
         else:
             self._conf = transform_conf
         self._separator = separator
+        self._output_format = output_format
+        self._build_vocab()
         super(CategoricalTransform, self).__init__(col_name, feat_name)
 
+    def _build_vocab(self):
+        """ Build the sorted vocabulary for vectorized look-ups.
+        """
+        keys = np.array(list(self._val_dict.keys()), dtype=str)
+        vals = np.array(list(self._val_dict.values()), dtype=np.int64)
+        sort_idx = np.argsort(keys)
+        self._vocab_keys = keys[sort_idx]
+        self._vocab_vals = vals[sort_idx]
+
+    def _lookup(self, vals):
+        """ Look up the category indices of string values.
+
+        Parameters
+        ----------
+        vals : Numpy array of strings
+            The categorical values.
+
+        Returns
+        -------
+        tuple of Numpy arrays : the category indices and a boolean mask that
+        indicates whether the values exist in the vocabulary.
+        """
+        if len(self._vocab_keys) == 0:
+            return np.zeros(len(vals), dtype=np.int64), np.zeros(len(vals), dtype=bool)
+        locs = np.searchsorted(self._vocab_keys, vals)
+        locs[locs == len(self._vocab_keys)] = 0
+        exist = self._vocab_keys[locs] == vals
+        return self._vocab_vals[locs], exist
+
+    def _split(self, feats):
+        """ Split multiple categorical values in each row.
+
+        Parameters
+        ----------
+        feats : Numpy array
+            Data with multiple categorical values separated by the separator.
+
+        Returns
+        -------
+        tuple of Numpy arrays : the row index and the position in the row of each
+        categorical value, and the categorical values.
+        """
+        vals = pd.Series(feats, dtype=object).str.split(self._separator, regex=False).explode()
+        valid = vals.notna().to_numpy()
+        rows = vals.index.to_numpy()[valid]
+        # The position of each value in its row.
+        cols = vals.groupby(level=0).cumcount().to_numpy()[valid]
+        return rows, cols, vals.to_numpy()[valid].astype(str)
+
     def pre_process(self, feats):
+        need_max_dim = self._separator is not None \
+            and self._output_format == CATEGORICAL_INDEX_OUTPUT \
+            and self._max_dim is None
         # If the mapping already exists, we don't need to do anything.
-        if len(self._val_dict) > 0:
+        if len(self._val_dict) > 0 and not need_max_dim:
             return {}
 
         assert isinstance(feats, (np.ndarray, ExtMemArrayWrapper)), \
@@ -501,18 +576,27 @@ class CategoricalTransform(TwoPhaseFeatTransform):
             assert feats.dtype.type is np.str_, \
                 "We can only convert strings to multiple categorical values with separaters." \
                 f"for feature {self.feat_name}"
-            vals = []
-            for feat in feats:
-                vals.extend(feat.split(self._separator))
-            return {self.feat_name: np.unique(vals)}
+            _, cols, vals = self._split(feats)
+            vals = np.unique(vals) if len(self._val_dict) == 0 else np.array([], dtype=str)
+            if not need_max_dim:
+                return {self.feat_name: vals}
+            max_dim = int(cols.max()) + 1 if len(cols) > 0 else 0
+            return {self.feat_name: {"vals": vals, "max_dim": max_dim}}
 
     def update_info(self, info):
+        if len(info) > 0 and isinstance(info[0], dict):
+            self._max_dim = max(max(finfo["max_dim"] for finfo in info), 1)
+            info = [finfo["vals"] for finfo in info]
+            if self._conf is not None:
+                self._conf['max_dim'] = self._max_dim
+
         # We already have the mapping.
         if len(self._val_dict) > 0:
-            assert len(info) == 0
+            assert all(len(finfo) == 0 for finfo in info)
             return
 
         self._val_dict = {str(key): i for i, key in enumerate(np.unique(np.concatenate(info)))}
+        self._build_vocab()
         # We need to save the mapping in the config object.
         if self._conf is not None:
             self._conf['mapping'] = self._val_dict
@@ -529,21 +613,31 @@ class CategoricalTransform(TwoPhaseFeatTransform):
         -------
         np.array
         """
-        encoding = np.zeros((len(feats), len(self._val_dict)), dtype=np.int8)
+        feats = np.asarray(feats)
+        index_output = self._output_format == CATEGORICAL_INDEX_OUTPUT
         if self._separator is None:
-            for i, feat in enumerate(feats):
-                if feat is None:
-                    continue
-                if str(feat) in self._val_dict:
-                    encoding[i, self._val_dict[str(feat)]] = 1
-                # if key does not exist, keep the feature as all zeros.
+            rows = np.nonzero(feats != None)[0] # pylint: disable=singleton-comparison
+            cols = np.zeros(len(rows), dtype=np.int64)
+            idx, exist = self._lookup(feats[rows].astype(str))
+            width = 1
         else:
-            for i, feat in enumerate(feats):
-                if feat is None:
-                    continue
-                idx = [self._val_dict[val] for val in feat.split(self._separator) \
-                       if val in self._val_dict]
-                encoding[i, idx] = 1
+            rows, cols, vals = self._split(feats)
+            idx, exist = self._lookup(vals)
+            if index_output:
+                assert self._max_dim is not None, \
+                    f"The max number of categorical values of {self.feat_name} is unknown."
+                # Drop the values that do not fit in the output.
+                exist &= cols < self._max_dim
+            width = self._max_dim
+
+        if index_output:
+            # if key does not exist, keep the index as -1.
+            encoding = np.full((len(feats), width), -1, dtype=np.int64)
+            encoding[rows[exist], cols[exist]] = idx[exist]
+        else:
+            # if key does not exist, keep the feature as all zeros.
+            encoding = np.zeros((len(feats), len(self._val_dict)), dtype=np.int8)
+            encoding[rows[exist], idx[exist]] = 1
         return {self.feat_name: encoding}
 
 class NumericalMinMaxTransform(TwoPhaseFeatTransform):
@@ -889,6 +983,138 @@ class RankGaussTransform(GlobalProcessFeatTransform):
 
         return self.as_out_dtype(feats)
 
+class ApproxRankGaussTransform(TwoPhaseFeatTransform):
+    """ Use approximate Gauss rank transformation to transform input data
+
+        Different from RankGaussTransform, which ranks the entire feature after
+        features of all files are merged, this transformation builds a quantile
+        sketch of each input file in the first phase, i.e., the values at
+        `num_quantiles` evenly spaced ranks of the file. The sketches are merged
+        into an approximate cumulative distribution function (CDF) of the entire
+        feature. In the second phase, each file is transformed independently by
+        mapping its values through the approximate CDF. Therefore, it never
+        materializes the entire feature in memory and it runs in parallel with
+        the other per-file transformations.
+
+    Parameters
+    ----------
+    col_name : str
+        The name of the column that contains the feature.
+    feat_name : str
+        The feature name used in the constructed graph.
+    out_dtype:
+        The dtype of the transformed feature.
+        Default: None, we will not do data type casting.
+    epsilon: float
+        Epsilon for normalization.
+    num_quantiles: int
+        The number of quantiles kept in the sketch of each input file.
+        A larger value gives a more accurate approximation.
+        Default: 1024.
+    """
+    def __init__(self, col_name, feat_name, out_dtype=None, epsilon=None,
+                 num_quantiles=1024):
+        assert num_quantiles > 1, "num_quantiles must be larger than 1."
+        self._epsilon = epsilon if epsilon is not None else 1e-6
+        self._num_quantiles = num_quantiles
+        # The knots of the approximate CDF of each column.
+        self._cdf_vals = None
+        self._cdf_probs = None
+        out_dtype = np.float32 if out_dtype is None else out_dtype
+        super(ApproxRankGaussTransform, self).__init__(col_name, feat_name, out_dtype)
+
+    def _to_2d_numerical(self, feats):
+        """ Convert the input feature into a 2D numerical array.
+        """
+        assert isinstance(feats, (np.ndarray, ExtMemArrayWrapper)), \
+                f"The feature {self.feat_name} has to be NumPy array."
+        if isinstance(feats, ExtMemArrayWrapper):
+            feats = feats.to_numpy()
+        feats = self.feat2numerical(feats)
+        if validate_features():
+            assert validate_numerical_feats(feats), \
+                f"There are NaN, Inf or missing value in the {self.feat_name} feature."
+        return feats.reshape(len(feats), -1)
+
+    def pre_process(self, feats):
+        """ Build the quantile sketch of the feature in a file.
+
+        The sketch contains the values at evenly spaced ranks of each column,
+        the ranks of the values, and the number of rows.
+        """
+        feats = self._to_2d_numerical(feats)
+        num_rows = len(feats)
+        if num_rows == 0:
+            return {}
+        ranks = np.unique(np.linspace(0, num_rows - 1,
+                                      min(self._num_quantiles, num_rows)).round().astype(np.int64))
+        # np.partition only sorts the elements around the selected ranks.
+        vals = np.partition(feats, ranks, axis=0)[ranks]
+        return {self.feat_name: (vals, ranks, num_rows)}
+
+    @staticmethod
+    def _count_less(knots, vals, ranks, num_rows):
+        """ Estimate the number of values smaller than each knot in a file from its sketch.
+
+        The estimation is exact for the knots in the sketch and for all knots
+        when the sketch keeps all the values of the file.
+        """
+        pos = np.searchsorted(vals, knots, side='left')
+        lo_pos = np.maximum(pos - 1, 0)
+        hi_pos = np.minimum(pos, len(vals) - 1)
+        # There are at least ranks[pos - 1] + 1 and at most ranks[pos] values
+        # smaller than a knot in (vals[pos - 1], vals[pos]).
+        lo_rank = ranks[lo_pos] + 1
+        hi_rank = ranks[hi_pos]
+        gap = (vals[hi_pos] - vals[lo_pos]).astype(np.float64)
+        frac = np.divide(knots - vals[lo_pos], gap,
+                         out=np.zeros(len(knots), dtype=np.float64), where=gap > 0)
+        counts = lo_rank + frac * (hi_rank - lo_rank)
+        exact = vals[hi_pos] == knots
+        counts[exact] = ranks[hi_pos[exact]]
+        counts[pos == 0] = 0
+        counts[pos == len(vals)] = num_rows
+        return counts
+
+    def update_info(self, info):
+        """ Merge the quantile sketches of all files into the approximate CDF.
+        """
+        assert len(info) > 0, f"There is no data for the feature {self.feat_name}."
+        tot_rows = sum(num_rows for _, _, num_rows in info)
+        num_cols = info[0][0].shape[1]
+        self._cdf_vals = []
+        self._cdf_probs = []
+        for col in range(num_cols):
+            # Evaluate the merged CDF on (a subset of) the values in all sketches.
+            knots = np.unique(np.concatenate([vals[:, col] for vals, _, _ in info]))
+            max_knots = self._num_quantiles * 4
+            if len(knots) > max_knots:
+                knots = knots[np.linspace(0, len(knots) - 1, max_knots).round().astype(np.int64)]
+            # The rank of a value in the entire feature is the sum of its ranks in
+            # all files. The rank in a file is estimated from the sketch.
+            ranks = np.zeros(len(knots), dtype=np.float64)
+            for vals, file_ranks, num_rows in info:
+                ranks += self._count_less(knots, vals[:, col], file_ranks, num_rows)
+            probs = ranks / max(tot_rows - 1, 1)
+            self._cdf_vals.append(knots)
+            self._cdf_probs.append(np.clip(probs, 0, 1))
+
+    def call(self, feats):
+        """ Map the feature through the approximate CDF and the inverse Gauss error function.
+        """
+        assert self._cdf_vals is not None, \
+            f"The quantile sketch of the feature {self.feat_name} is not built."
+        orig_shape = feats.shape
+        feats = self._to_2d_numerical(feats)
+        probs = np.empty(feats.shape, dtype=np.float64)
+        for col in range(feats.shape[1]):
+            probs[:, col] = np.interp(feats[:, col], self._cdf_vals[col], self._cdf_probs[col])
+        # norm to [-1, 1]
+        feats = (probs - 0.5) * 2
+        feats = np.clip(feats, -1 + self._epsilon, 1 - self._epsilon)
+        feats = erfinv(feats).reshape(orig_shape)
+        return {self.feat_name: feats}
+
 class Tokenizer(FeatTransform):
     """ A wrapper to a tokenizer.
 
@@ -944,10 +1170,133 @@ class Tokenizer(FeatTransform):
                 atten_mask_name: th.cat(att_masks, dim=0).numpy(),
                 token_type_id_name: th.cat(type_ids, dim=0).numpy()}
 
+class EmbeddingCache:
+    """ A content-addressed on-disk cache of text embeddings.
+
+    The embeddings are keyed by the hash of the model name, the maximal
+    sequence length and the text. The cache is stored as shards under
+    `<cache_dir>/<hash of the model name and the maximal sequence length>`.
+    Each shard contains the sorted keys and the embeddings of a batch of texts
+    and is named after the hash of its keys, so that the worker processes
+    can add shards to the same cache concurrently. The embeddings of
+    the shards are loaded with memory mapping.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The directory that stores the cache.
+    model_name : str
+        The LM model name.
+    max_seq_length : int
+        The maximal sequence length used in the tokenization.
+    """
+    def __init__(self, cache_dir, model_name, max_seq_length):
+        self._prefix = f"{model_name}\0{max_seq_length}\0"
+        model_key = hashlib.sha256(self._prefix.encode("utf-8")).hexdigest()
+        self._cache_dir = os.path.join(cache_dir, model_key)
+        os.makedirs(self._cache_dir, exist_ok=True)
+        self._keys = None
+        self._embs = None
+
+    def hash_texts(self, texts):
+        """ Compute the cache keys of the texts.
+
+        Parameters
+        ----------
+        texts : list of str
+            The texts.
+
+        Returns
+        -------
+        Numpy array : the keys of the texts.
+        """
+        keys = [hashlib.sha256((self._prefix + text).encode("utf-8")).digest() \
+                for text in texts]
+        return np.array(keys, dtype="S32")
+
+    def _load(self):
+        """ Load the keys of all shards in the cache.
+        """
+        self._keys = []
+        self._embs = []
+        for key_file in sorted(glob.glob(os.path.join(self._cache_dir, "*.keys.npy"))):
+            emb_file = key_file[:-len(".keys.npy")] + ".emb.npy"
+            if not os.path.exists(emb_file):
+                continue
+            self._keys.append(np.load(key_file))
+            self._embs.append(np.load(emb_file, mmap_mode="r"))
+
+    def get(self, keys):
+        """ Look up the embeddings of the keys.
+
+        Parameters
+        ----------
+        keys : Numpy array
+            The keys returned by `hash_texts`.
+
+        Returns
+        -------
+        tuple of (Numpy array, Numpy array) : the boolean mask of the keys found
+        in the cache and the embeddings of the found keys.
+        """
+        if self._keys is None:
+            self._load()
+        found = np.zeros(len(keys), dtype=bool)
+        embs = None
+        for shard_keys, shard_embs in zip(self._keys, self._embs):
+            if found.all():
+                break
+            missing = np.nonzero(~found)[0]
+            locs = np.searchsorted(shard_keys, keys[missing])
+            locs[locs >= len(shard_keys)] = 0
+            hit = shard_keys[locs] == keys[missing]
+            if not hit.any():
+                continue
+            if embs is None:
+                embs = np.zeros((len(keys),) + shard_embs.shape[1:], dtype=shard_embs.dtype)
+            embs[missing[hit]] = shard_embs[locs[hit]]
+            found[missing[hit]] = True
+        if embs is None:
+            return found, None
+        return found, embs[found]
+
+    def put(self, keys, embs):
+        """ Add the embeddings of the keys to the cache.
+
+        Parameters
+        ----------
+        keys : Numpy array
+            The keys returned by `hash_texts`.
+        embs : Numpy array
+            The embeddings of the keys.
+        """
+        if len(keys) == 0:
+            return
+        order = np.argsort(keys)
+        keys, embs = keys[order], embs[order]
+        shard_name = hashlib.sha256(keys.tobytes()).hexdigest()
+        path = os.path.join(self._cache_dir, shard_name)
+        # Write the embeddings before the keys and rename them to make sure
+        # other processes never read a partially written shard.
+        for suffix, arr in ((".emb.npy", embs), (".keys.npy", keys)):
+            tmp_path = f"{path}.{generate_hash()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp_path, path + suffix)
+        if self._keys is None:
+            self._load()
+        else:
+            self._keys.append(keys)
+            self._embs.append(embs)
+
 class Text2BERT(FeatTransform):
     """ Compute LM embeddings.
 
-    It computes LM embeddings.
+    It computes LM embeddings. Identical strings in the input are embedded once.
+    The strings are sorted by their token lengths and the padding of each
+    inference batch is trimmed to the longest string in the batch. If `cache_dir`
+    is provided, the embeddings are cached on disk and reused by later runs with
+    the same LM model.
 
     Parameters
     ----------
@@ -964,9 +1313,12 @@ class Text2BERT(FeatTransform):
     out_dtype:
         The dtype of the transformed feature.
         Default: None, we will not do data type casting.
+    cache_dir : str
+        The directory of the on-disk embedding cache.
+        Default: None, the embeddings are not cached.
     """
     def __init__(self, col_name, feat_name, tokenizer, model_name,
-                 infer_batch_size=None, out_dtype=None):
+                 infer_batch_size=None, out_dtype=None, cache_dir=None):
         out_dtype = np.float32 if out_dtype is None else out_dtype
         super(Text2BERT, self).__init__(col_name, feat_name, out_dtype)
         self.model_name = model_name
@@ -974,6 +1326,8 @@ class Text2BERT(FeatTransform):
         self.tokenizer = tokenizer
         self.device = None
         self.infer_batch_size = infer_batch_size
+        self.cache_dir = cache_dir
+        self._cache = None
 
     def _init(self):
         """ Initialize the LM model.
@@ -999,6 +1353,48 @@ class Text2BERT(FeatTransform):
                 lm_model = lm_model.to(self.device)
             self.lm_model = lm_model
 
+    def _get_cache(self):
+        """ Get the embedding cache. The cache is opened in the worker process.
+        """
+        if self.cache_dir is not None and self._cache is None:
+            self._cache = EmbeddingCache(self.cache_dir, self.model_name,
+                                         self.tokenizer.max_seq_length)
+        return self._cache
+
+    def _compute_embs(self, strs):
+        """ Compute LM embeddings of unique strings in length-bucketed batches.
+        """
+        self._init()
+        outputs = self.tokenizer(strs)
+        tokens = th.tensor(outputs['input_ids'])
+        att_masks = th.tensor(outputs['attention_mask'])
+        token_types = th.tensor(outputs['token_type_ids'])
+        # Sort the strings by their lengths so that each batch contains
+        # strings of similar lengths and we can trim the padding.
+        lens = att_masks.long().sum(dim=1)
+        order = th.argsort(lens)
+        batch_size = self.infer_batch_size if self.infer_batch_size is not None else len(strs)
+        with th.no_grad():
+            out_embs = []
+            for batch in th.split(order, batch_size):
+                max_len = max(int(lens[batch].max()), 1)
+                batch_tokens = tokens[batch, :max_len]
+                batch_masks = att_masks[batch, :max_len].long()
+                batch_types = token_types[batch, :max_len].long()
+                if self.device is not None:
+                    outputs = self.lm_model(batch_tokens.to(self.device),
+                                            attention_mask=batch_masks.to(self.device),
+                                            token_type_ids=batch_types.to(self.device))
+                else:
+                    outputs = self.lm_model(batch_tokens,
+                                            attention_mask=batch_masks,
+                                            token_type_ids=batch_types)
+                out_embs.append(outputs.pooler_output.cpu().numpy())
+        sorted_embs = np.concatenate(out_embs) if len(out_embs) > 1 else out_embs[0]
+        embs = np.empty_like(sorted_embs)
+        embs[order.numpy()] = sorted_embs
+        return embs
+
     def call(self, feats):
         """ Compute LM embeddings of the strings..
 
@@ -1011,38 +1407,43 @@ class Text2BERT(FeatTransform):
         -------
         dict: LM embeddings.
         """
-        self._init()
-        strs = feats
-        outputs = self.tokenizer(strs)
-        if self.infer_batch_size is not None:
-            tokens_list = th.split(th.tensor(outputs['input_ids']), self.infer_batch_size)
-            att_masks_list = th.split(th.tensor(outputs['attention_mask']),
-                                      self.infer_batch_size)
-            token_types_list = th.split(th.tensor(outputs['token_type_ids']),
-                                        self.infer_batch_size)
+        # Only embed the unique strings. None and NaN get the code -1.
+        codes, uniq_strs = pd.factorize(pd.Series(np.asarray(feats).reshape(-1)))
+        uniq_strs = list(uniq_strs)
+        if len(uniq_strs) == 0:
+            # The input is empty or only has missing values.
+            self._init()
+            return {self.feat_name: np.zeros((len(codes), self.lm_model.config.hidden_size),
+                                             dtype=np.float32)}
+        cache = self._get_cache()
+        if cache is not None:
+            keys = cache.hash_texts(uniq_strs)
+            found, cached_embs = cache.get(keys)
+            missing = np.nonzero(~found)[0]
         else:
-            tokens_list = [th.tensor(outputs['input_ids'])]
-            att_masks_list = [th.tensor(outputs['attention_mask'])]
-            token_types_list = [th.tensor(outputs['token_type_ids'])]
-        with th.no_grad():
-            out_embs = []
-            for tokens, att_masks, token_types in zip(tokens_list, att_masks_list,
-                                                      token_types_list):
-                if self.device is not None:
-                    outputs = self.lm_model(tokens.to(self.device),
-                                            attention_mask=att_masks.to(self.device).long(),
-                                            token_type_ids=token_types.to(self.device).long())
-                else:
-                    outputs = self.lm_model(tokens,
-                                            attention_mask=att_masks.long(),
-                                            token_type_ids=token_types.long())
-                out_embs.append(outputs.pooler_output.cpu().numpy())
-        if len(out_embs) > 1:
-            feats = np.concatenate(out_embs)
+            found, cached_embs = np.zeros(len(uniq_strs), dtype=bool), None
+            missing = np.arange(len(uniq_strs))
+
+        new_embs = self._compute_embs([uniq_strs[i] for i in missing]) \
+            if len(missing) > 0 else None
+        if cache is not None and new_embs is not None:
+            cache.put(keys[missing], new_embs)
+        if cached_embs is None:
+            uniq_embs = new_embs
         else:
-            feats = out_embs[0]
-
-        return {self.feat_name: feats}
+            uniq_embs = np.empty((len(uniq_strs),) + cached_embs.shape[1:],
+                                 dtype=cached_embs.dtype)
+            uniq_embs[found] = cached_embs
+            if new_embs is not None:
+                uniq_embs[missing] = new_embs
+        if len(missing) < len(uniq_strs):
+            logging.debug("%d out of %d unique strings of %s are found in the embedding cache.",
+                          len(uniq_strs) - len(missing), len(uniq_strs), self.feat_name)
+
+        embs = uniq_embs[codes]
+        # The embeddings of missing values are zeros.
+        embs[codes == -1] = 0
+        return {self.feat_name: embs}
 
 class Noop(FeatTransform):
     """ This doesn't transform the feature.
@@ -1333,7 +1734,8 @@ def parse_feat_ops(confs, input_data_format=None):
                                                 int(conf['max_seq_length'])),
                                       conf['bert_model'],
                                       infer_batch_size=infer_batch_size,
-                                      out_dtype=out_dtype)
+                                      out_dtype=out_dtype,
+                                      cache_dir=conf.get('cache_dir', None))
             elif conf['name'] == 'max_min_norm':
                 # TODO: Not support max_min_norm feature transformation on multiple columns
                 # without explicitly defining max_val and min_val.
@@ -1364,11 +1766,21 @@ def parse_feat_ops(confs, input_data_format=None):
             elif conf['name'] == 'rank_gauss':
                 epsilon = conf['epsilon'] if 'epsilon' in conf else None
                 uniquify = conf['uniquify'] if 'uniquify' in conf else False
-                transform = RankGaussTransform(feat['feature_col'],
-                                               feat_name,
-                                               out_dtype=out_dtype,
-                                               epsilon=epsilon,
-                                               uniquify=uniquify)
+                if conf.get('approx', False):
+                    assert not uniquify, \
+                        "uniquify is not supported by the approximate rank gauss transformation."
+                    num_quantiles = conf['num_quantiles'] if 'num_quantiles' in conf else 1024
+                    transform = ApproxRankGaussTransform(feat['feature_col'],
+                                                         feat_name,
+                                                         out_dtype=out_dtype,
+                                                         epsilon=epsilon,
+                                                         num_quantiles=num_quantiles)
+                else:
+                    transform = RankGaussTransform(feat['feature_col'],
+                                                   feat_name,
+                                                   out_dtype=out_dtype,
+                                                   epsilon=epsilon,
+                                                   uniquify=uniquify)
             elif conf['name'] == 'to_categorical':
                 separator = conf['separator'] if 'separator' in conf else None
                 # TODO: Not support categorical feature transformation on multiple columns.
@@ -1376,8 +1788,11 @@ def parse_feat_ops(confs, input_data_format=None):
                 if isinstance(feat['feature_col'], list) and len(feat['feature_col']) > 1:
                     raise RuntimeError("Do not support categorical "
                                        "feature transformation on multiple columns")
+                output_format = conf['output_format'] if 'output_format' in conf \
+                    else CATEGORICAL_ONE_HOT_OUTPUT
                 transform = CategoricalTransform(feat['feature_col'], feat_name,
-                                                 separator=separator, transform_conf=conf)
+                                                 separator=separator, transform_conf=conf,
+                                                 output_format=output_format)
             elif conf['name'] == 'bucket_numerical':
                 assert 'bucket_cnt' in conf, \
                     "It is required to count of bucket information for bucket feature transform"
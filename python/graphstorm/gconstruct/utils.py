@@ -25,9 +25,14 @@ import copy
 import traceback
 import shutil
 import uuid
+import io
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.reduction import ForkingPickler
 
 
 import numpy as np
+import psutil
 import dgl
 from dgl import distributed as dgl_distributed
 from packaging import version
@@ -42,6 +47,9 @@ SHARED_MEMORY_CROSS_PROCESS_STORAGE = "shared_memory"
 PICKLE_CROSS_PROCESS_STORAGE = "pickle"
 EXT_MEMORY_STORAGE = "ext_memory"
 VALIDATE_FEATRE= True
+# The number of rows read from a feature array at a time when shuffling
+# features into partitions.
+FEAT_SHUFFLE_CHUNK_ROWS = 1024 * 1024
 
 def validate_features():
     """ Check whether gconstruct needs to validate the input features
@@ -218,6 +226,88 @@ def generate_hash():
     random_uuid = uuid.uuid4()
     return str(random_uuid)
 
+def _set_worker_device(worker_id):
+    """ Set a GPU device for a worker process.
+
+    We need to set a GPU device for each worker process in case that
+    some transformations (e.g., computing BERT embeddings) require GPU computation.
+    """
+    if th.cuda.is_available():
+        num_gpus = th.cuda.device_count()
+        gpu = worker_id % num_gpus
+        os.environ['CUDA_VISIBLE_DEVICES'] = str(gpu)
+        if worker_id >= num_gpus:
+            logging.warning("There are more than 1 processes are attachd to GPU %d.", gpu)
+
+def _pack_worker_data(file_idx, data, ext_mem_workspace):
+    """ Prepare the data processed by a worker process to be sent to the main process.
+
+    Parameters
+    ----------
+    file_idx : int
+        The index of the processed file.
+    data : dict/tuple/list of tensors
+        Data returned by user_parser
+    ext_mem_workspace : str
+        The path of the external-memory work space.
+
+    Returns
+    -------
+    tuple : the storage type and the data.
+    """
+    if ext_mem_workspace is not None:
+        return (EXT_MEMORY_STORAGE, _to_ext_memory(f"file-{file_idx}", data, ext_mem_workspace))
+    # Max pickle obj size is 2 GByte
+    if _estimate_sizeof(data) > SHARED_MEM_OBJECT_THRESHOLD:
+        # Use torch shared memory as a workaround
+        # This will consume shared memory and cause an additional
+        # data copy, i.e., general memory to torch shared memory.
+        return (SHARED_MEMORY_CROSS_PROCESS_STORAGE, _to_shared_memory(data))
+    return (PICKLE_CROSS_PROCESS_STORAGE, data)
+
+def _unpack_worker_data(vals):
+    """ Get the data sent by a worker process.
+
+    Parameters
+    ----------
+    vals : tuple
+        The storage type and the data.
+    """
+    # If the size of `vals`` is larger than utils.SHARED_MEM_OBJECT_THRESHOLD
+    # we will automatically convert tensors in `vals` into torch tensor
+    # and copy the tensor into shared memory.
+    # This helps avoid the pickle max obj size issue.
+    storage_type, vals = vals
+    if storage_type == SHARED_MEMORY_CROSS_PROCESS_STORAGE:
+        vals = _to_numpy_array(vals)
+    return vals
+
+def _set_start_method():
+    """ Set the start method of worker processes.
+    """
+    dgl_version = importlib.metadata.version("dgl")
+    # Only enable spawn for DGL>2.3.0 for compatibility
+    if (version.parse(dgl_version).base_version > version.parse("2.3.0").base_version
+        and th.cuda.is_available()):
+        multiprocessing.set_start_method("spawn", force=True)
+
+def _check_worker_alive(processes):
+    """ Check whether all worker processes are alive.
+    """
+    for proc in processes:
+        if not proc.is_alive() and proc.exitcode < 0:
+            raise RuntimeError("One of the work process crashed with"
+                               f"{proc.exitcode}. In most of cases, it is "
+                               "due to out-of-memory. Please check your "
+                               "instance memory size and the shared memory "
+                               "size.") from None
+    logging.warning("One of the processes has been processing the "
+                    "input data for more than one hour. This will "
+                    "not cause any error but please check whether "
+                    "the input data files are too large. "
+                    "We suggest you to spit the file(s) into "
+                    "smaller chunks.")
+
 def worker_fn(worker_id, task_queue, res_queue, user_parser, ext_mem_workspace):
     """ The worker function in the worker pool
 
@@ -235,14 +325,7 @@ def worker_fn(worker_id, task_queue, res_queue, user_parser, ext_mem_workspace):
     ext_mem_workspace : str
         The path of the external-memory work space.
     """
-    # We need to set a GPU device for each worker process in case that
-    # some transformations (e.g., computing BERT embeddings) require GPU computation.
-    if th.cuda.is_available():
-        num_gpus = th.cuda.device_count()
-        gpu = worker_id % num_gpus
-        os.environ['CUDA_VISIBLE_DEVICES'] = str(gpu)
-        if worker_id >= num_gpus:
-            logging.warning("There are more than 1 processes are attachd to GPU %d.", gpu)
+    _set_worker_device(worker_id)
     try:
         i = 0
         while True:
@@ -250,17 +333,7 @@ def worker_fn(worker_id, task_queue, res_queue, user_parser, ext_mem_workspace):
             i, in_file = task_queue.get_nowait()
             logging.debug("%d Processing %s", worker_id, in_file)
             data = user_parser(in_file)
-            size = _estimate_sizeof(data)
-            if ext_mem_workspace is not None:
-                data = (EXT_MEMORY_STORAGE, _to_ext_memory(f"file-{i}", data, ext_mem_workspace))
-            # Max pickle obj size is 2 GByte
-            elif size > SHARED_MEM_OBJECT_THRESHOLD:
-                # Use torch shared memory as a workaround
-                # This will consume shared memory and cause an additional
-                # data copy, i.e., general memory to torch shared memory.
-                data = (SHARED_MEMORY_CROSS_PROCESS_STORAGE, _to_shared_memory(data))
-            else:
-                data = (PICKLE_CROSS_PROCESS_STORAGE, data)
+            data = _pack_worker_data(i, data, ext_mem_workspace)
             res_queue.put((i, data))
             gc.collect()
     except queue.Empty:
@@ -294,7 +367,245 @@ def update_two_phase_feat_ops(phase_one_info, ops):
         if op.feat_name in feat_info:
             op.update_info(feat_info[op.feat_name])
 
-def multiprocessing_data_read(in_files, num_processes, user_parser, ext_mem_workspace=None):
+class _SharedObjPickler(ForkingPickler):
+    """ Pickle the objects shared with a worker pool by their keys.
+    """
+    def __init__(self, file, shared_keys):
+        super().__init__(file)
+        self._shared_keys = shared_keys
+        self.used_keys = set()
+
+    def persistent_id(self, obj):
+        key = self._shared_keys.get(id(obj))
+        if key is not None:
+            self.used_keys.add(key)
+        return key
+
+class _SharedObjUnpickler(pickle.Unpickler):
+    """ Unpickle the objects shared with a worker pool from the copies in the worker.
+    """
+    def __init__(self, file, shared_objs):
+        super().__init__(file)
+        self._shared_objs = shared_objs
+
+    def persistent_load(self, pid):
+        return self._shared_objs[pid]
+
+def pool_worker_fn(worker_id, task_queue, res_queue):
+    """ The worker function of a persistent worker pool.
+
+    A worker gets three kinds of messages from its own task queue:
+    a share message ("share", key, obj) that keeps a copy of a shared object,
+    a job message ("job", pickled_parser) that sets the parser used by the following
+    tasks, and a task message ("task", file_idx, in_file, ext_mem_workspace) that
+    processes one input file. The shared objects referenced by the parser are
+    taken from the copies kept by the worker. The worker exits when it gets None.
+
+    Parameters
+    ----------
+    worker_id : int
+        The worker ID, starting from 0.
+    task_queue : Queue
+        The queue that contains the tasks of this worker.
+    res_queue : Queue
+        The queue that contains the processed data. This is shared by all workers.
+    """
+    _set_worker_device(worker_id)
+    user_parser = None
+    shared_objs = {}
+    while True:
+        msg = task_queue.get()
+        if msg is None:
+            break
+        if msg[0] == "share":
+            shared_objs[msg[1]] = msg[2]
+            continue
+        if msg[0] == "job":
+            user_parser = _SharedObjUnpickler(io.BytesIO(msg[1]), shared_objs).load()
+            continue
+        _, file_idx, in_file, ext_mem_workspace = msg
+        try:
+            logging.debug("%d Processing %s", worker_id, in_file)
+            data = user_parser(in_file)
+            data = _pack_worker_data(file_idx, data, ext_mem_workspace)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            data = ''.join(traceback.TracebackException.from_exception(e).format())
+        res_queue.put((worker_id, file_idx, data))
+        data = None
+        gc.collect()
+
+class DataReadWorkerPool:
+    """ A pool of worker processes that is reused by multiple calls of
+    multiprocessing_data_read.
+
+    multiprocessing_data_read creates new worker processes every time it is called.
+    When processing a graph with many node types and edge types, the cost of
+    starting the processes adds up. The worker pool starts the processes once
+    and reuses them for all calls. The user parser is sent to each worker once
+    per call. Large objects that are used by the parsers of many calls, e.g.,
+    the node ID maps used to parse every edge type, can be registered with
+    ``share``. They are sent to a worker only once, when a parser first
+    references them, instead of being pickled with the parser of every call.
+    The processed data are sent back to the main process through
+    pipes directly instead of going through a Manager process, and large data
+    are sent in torch shared memory.
+
+    Parameters
+    ----------
+    num_processes : int
+        The number of worker processes.
+    """
+    def __init__(self, num_processes):
+        assert num_processes > 1, "A worker pool needs at least two worker processes."
+        self._num_processes = num_processes
+        self._task_queues = []
+        self._processes = []
+        # The shared objects, the keys of the shared objects by their Python IDs
+        # and the keys of the shared objects sent to each worker.
+        self._shared_objs = {}
+        self._shared_keys = {}
+        self._sent_keys = [set() for _ in range(num_processes)]
+        _set_start_method()
+        self._res_queue = multiprocessing.Queue()
+        for i in range(num_processes):
+            task_queue = multiprocessing.Queue()
+            # The workers are daemon processes so that they never keep the main
+            # process alive, e.g., when the main process exits with an error.
+            proc = Process(target=pool_worker_fn, args=(i, task_queue, self._res_queue),
+                           daemon=True)
+            proc.start()
+            self._task_queues.append(task_queue)
+            self._processes.append(proc)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        # If there is an error, the workers may still be processing tasks
+        # or waiting for their results to be consumed, so we kill them.
+        if exc_type is not None:
+            self.terminate()
+        else:
+            self.close()
+
+    @property
+    def num_processes(self):
+        """ The number of worker processes.
+        """
+        return self._num_processes
+
+    def share(self, objs):
+        """ Register the objects that are sent to each worker at most once.
+
+        When the user parser of a later call references one of the objects,
+        the parser is pickled with the key of the object and the worker uses
+        its own copy of the object, which is sent with the first job that needs it.
+        The objects must not be modified after they are registered.
+
+        Parameters
+        ----------
+        objs : dict
+            The key is a unique name of the object and the value is the object.
+        """
+        for key, obj in objs.items():
+            self._shared_objs[key] = obj
+            self._shared_keys[id(obj)] = key
+
+    def read(self, in_files, num_processes, user_parser, ext_mem_workspace=None,
+             result_fn=None):
+        """ Read data from multiple files with the worker processes.
+
+        At most `num_processes` files are processed at the same time.
+
+        Parameters
+        ----------
+        in_files : list of str
+            The input data files.
+        num_processes : int
+            The maximal number of files processed in parallel.
+        user_parser : callable
+            The user-defined function to read and process the data files.
+        ext_mem_workspace : str
+            The path of the external-memory work space.
+        result_fn : callable
+            If it is provided, it is called with the file index and the processed data
+            of each file as soon as the file is processed, and its return value is
+            kept as the processed data of the file.
+
+        Returns
+        -------
+        a dict : key is the file index, the value is processed data.
+        """
+        assert len(self._processes) > 0, "The worker pool has been closed."
+        num_workers = min(num_processes, self._num_processes, len(in_files))
+        buf = io.BytesIO()
+        pickler = _SharedObjPickler(buf, self._shared_keys)
+        pickler.dump(user_parser)
+        job = buf.getvalue()
+        for worker_id, task_queue in enumerate(self._task_queues[:num_workers]):
+            for key in pickler.used_keys - self._sent_keys[worker_id]:
+                task_queue.put(("share", key, self._shared_objs[key]))
+                self._sent_keys[worker_id].add(key)
+            task_queue.put(("job", job))
+        tasks = list(enumerate(in_files))
+        tasks.reverse()
+        for task_queue in self._task_queues[:num_workers]:
+            file_idx, in_file = tasks.pop()
+            task_queue.put(("task", file_idx, in_file, ext_mem_workspace))
+
+        return_dict = {}
+        while len(return_dict) < len(in_files):
+            try:
+                worker_id, file_idx, vals = self._res_queue.get(timeout=3600)
+            except queue.Empty:
+                _check_worker_alive(self._processes)
+                continue
+
+            if not isinstance(vals, tuple):
+                logging.error("Processing file %d fails.", file_idx)
+                logging.error(vals)
+                self.terminate()
+                raise RuntimeError("One of the worker processes fails. Stop processing.")
+            # Assign the next file to the idle worker.
+            if len(tasks) > 0:
+                next_idx, in_file = tasks.pop()
+                self._task_queues[worker_id].put(("task", next_idx, in_file,
+                                                  ext_mem_workspace))
+            return_dict[file_idx] = _apply_result_fn(result_fn, file_idx,
+                                                     _unpack_worker_data(vals))
+            sys_tracker.check(f'process data file: {file_idx}')
+        return return_dict
+
+    def close(self):
+        """ Stop all worker processes.
+        """
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for proc in self._processes:
+            proc.join()
+        self._task_queues = []
+        self._processes = []
+        self._shared_objs = {}
+        self._shared_keys = {}
+
+    def terminate(self):
+        """ Kill all worker processes without waiting for their tasks.
+        """
+        for proc in self._processes:
+            proc.terminate()
+            proc.join()
+        self._task_queues = []
+        self._processes = []
+        self._shared_objs = {}
+        self._shared_keys = {}
+
+def _apply_result_fn(result_fn, file_idx, data):
+    """ Apply `result_fn` to the processed data of a file if it is provided.
+    """
+    return result_fn(file_idx, data) if result_fn is not None else data
+
+def multiprocessing_data_read(in_files, num_processes, user_parser, ext_mem_workspace=None,
+                              worker_pool=None, result_fn=None):
     """ Read data from multiple files with multiprocessing.
 
     It creates a set of worker processes, each of which runs a worker function.
@@ -316,17 +627,23 @@ def multiprocessing_data_read(in_files, num_processes, user_parser, ext_mem_work
         The user-defined function to read and process the data files.
     ext_mem_workspace : str
         The path of the external-memory work space.
+    worker_pool : DataReadWorkerPool
+        If it is provided, the data files are processed by the processes
+        in the worker pool instead of newly created processes.
+    result_fn : callable
+        If it is provided, it is called with the file index and the processed data
+        of each file as soon as the file is processed, and its return value is
+        kept as the processed data of the file.
 
     Returns
     -------
     a dict : key is the file index, the value is processed data.
     """
-    if num_processes > 1 and len(in_files) > 1:
-        dgl_version = importlib.metadata.version("dgl")
-        # Only enable spawn for DGL>2.3.0 for compatibility
-        if (version.parse(dgl_version).base_version > version.parse("2.3.0").base_version
-            and th.cuda.is_available()):
-            multiprocessing.set_start_method("spawn", force=True)
+    if num_processes > 1 and len(in_files) > 1 and worker_pool is not None:
+        return worker_pool.read(in_files, num_processes, user_parser, ext_mem_workspace,
+                                result_fn)
+    elif num_processes > 1 and len(in_files) > 1:
+        _set_start_method()
         processes = []
         manager = multiprocessing.Manager()
         task_queue = manager.Queue()
@@ -346,33 +663,15 @@ def multiprocessing_data_read(in_files, num_processes, user_parser, ext_mem_work
                 file_idx, vals= res_queue.get(timeout=3600)
             except queue.Empty:
                 # check whether every processes are alive
-                for proc in processes:
-                    if not proc.is_alive() and proc.exitcode < 0:
-                        raise RuntimeError("One of the work process crashed with"
-                                           f"{proc.exitcode}. In most of cases, it is "
-                                           "due to out-of-memory. Please check your "
-                                           "instance memory size and the shared memory "
-                                           "size.") from None
-                logging.warning("One of the processes has been processing the "
-                                "input data for more than one hour. This will "
-                                "not cause any error but please check whether "
-                                "the input data files are too large. "
-                                "We suggest you to spit the file(s) into "
-                                "smaller chunks.")
+                _check_worker_alive(processes)
                 continue
 
             if not isinstance(vals, tuple):
                 logging.error("Processing file %d fails.", file_idx)
                 logging.error(vals)
                 raise RuntimeError("One of the worker processes fails. Stop processing.")
-            # If the size of `vals`` is larger than utils.SHARED_MEM_OBJECT_THRESHOLD
-            # we will automatically convert tensors in `vals` into torch tensor
-            # and copy the tensor into shared memory.
-            # This helps avoid the pickle max obj size issue.
-            storage_type, vals = vals
-            if storage_type == SHARED_MEMORY_CROSS_PROCESS_STORAGE:
-                vals = _to_numpy_array(vals)
-            return_dict[file_idx] = vals
+            return_dict[file_idx] = _apply_result_fn(result_fn, file_idx,
+                                                     _unpack_worker_data(vals))
             sys_tracker.check(f'process data file: {file_idx}')
             gc.collect()
 
@@ -386,6 +685,7 @@ def multiprocessing_data_read(in_files, num_processes, user_parser, ext_mem_work
             return_dict[i] = user_parser(in_file)
             if ext_mem_workspace is not None:
                 return_dict[i] = _to_ext_memory(f"file-{i}", return_dict[i], ext_mem_workspace)
+            return_dict[i] = _apply_result_fn(result_fn, i, return_dict[i])
         return return_dict
 
 def worker_fn_no_return(worker_id, task_queue, func):
@@ -852,6 +1152,8 @@ class ExtMemArrayMerger:
         self._ext_mem_workspace = ext_mem_workspace
         self._ext_mem_feat_size = ext_mem_feat_size
         self._tensor_files = []
+        # The staged chunks of the arrays that are not merged yet.
+        self._staged = {}
 
     def __del__(self):
         for tensor_file in self._tensor_files:
@@ -892,6 +1194,65 @@ class ExtMemArrayMerger:
         else:
             return convert_to_ext_mem_numpy(tensor_path, arrs[0])
 
+    def _staged_dir(self, name):
+        return os.path.join(self._ext_mem_workspace, "staged", name)
+
+    def stage(self, arr, name, chunk_idx):
+        """ Stage a chunk of an array before all chunks of the array are available.
+
+        If the external memory workspace is given, a chunk in memory is written
+        to a file in the workspace, so that the chunk can be freed as soon as
+        it is staged. The chunks are merged in the order of their indices by
+        ``merge_staged``.
+
+        Parameters
+        ----------
+        arr : array
+            The chunk of the array.
+        name : str
+            The name of the external memory array.
+        chunk_idx : int
+            The index of the chunk.
+        """
+        if self._ext_mem_workspace is not None and isinstance(arr, np.ndarray) \
+                and len(arr) > 0 and _is_numeric(arr):
+            chunk_path = os.path.join(self._staged_dir(name), f"chunk-{chunk_idx}.npy")
+            arr = convert_to_ext_mem_numpy(chunk_path, arr)
+        self._staged.setdefault(name, {})[chunk_idx] = arr
+
+    def merge_staged(self, name, force_ext_mem=False):
+        """ Merge the staged chunks of an array and remove the staged chunk files.
+
+        Parameters
+        ----------
+        name : str
+            The name of the external memory array.
+        force_ext_mem : bool
+            Whether to store the merged array in the external memory workspace
+            regardless of its feature size, e.g., for the node IDs of edges.
+
+        Returns
+        -------
+        Numpy array : an array stored in external memory, or None if no chunk is staged.
+        """
+        chunks = self._staged.pop(name, {})
+        arrs = [chunks[chunk_idx] for chunk_idx in sorted(chunks)]
+        if len(arrs) == 0:
+            return None
+        if force_ext_mem and self._ext_mem_workspace is not None:
+            tensor_path = os.path.join(self._ext_mem_workspace, name + ".npy")
+            os.makedirs(os.path.dirname(tensor_path), exist_ok=True)
+            self._tensor_files.append(tensor_path)
+            merged = _merge_arrs(arrs, tensor_path)
+        else:
+            merged = self(arrs, name)
+            if isinstance(merged, np.memmap):
+                # The merged array should not reference the staged chunk files.
+                merged = np.array(merged)
+        if self._ext_mem_workspace is not None:
+            shutil.rmtree(self._staged_dir(name), ignore_errors=True)
+        return merged
+
 def convert_to_ext_mem_numpy(tensor_path, arr):
     """ Convert a numpy array to memory mapped array.
 
@@ -949,8 +1310,114 @@ def load_maps(output_dir, fname):
 
     return th.load(map_file)
 
+def _row_nbytes(arr):
+    """ The number of bytes of a row in an array.
+    """
+    return int(np.prod(arr.shape[1:], dtype=np.int64)) * np.dtype(arr.dtype).itemsize
+
+def _gather_rows(data, orig_ids):
+    """ Gather the rows of `orig_ids` from an array.
+
+    The rows are read in the ascending order of `orig_ids` and in chunks,
+    which turns random accesses into sequential reads when the array is stored
+    in external memory (e.g., memmap or HDF5). The rows are then
+    written into the output array in the order of `orig_ids`.
+
+    Parameters
+    ----------
+    data : Numpy array or ExtMemArrayWrapper
+        The array to read rows from.
+    orig_ids : Numpy array
+        The row indices.
+
+    Returns
+    -------
+    Pytorch tensor : the rows in the order of `orig_ids`.
+    """
+    order = np.argsort(orig_ids, kind="stable")
+    sorted_ids = orig_ids[order]
+    if len(sorted_ids) == 0:
+        return th.tensor(np.asarray(data[sorted_ids]))
+    out = None
+    for start in range(0, len(sorted_ids), FEAT_SHUFFLE_CHUNK_ROWS):
+        end = min(start + FEAT_SHUFFLE_CHUNK_ROWS, len(sorted_ids))
+        rows = np.asarray(data[sorted_ids[start:end]])
+        if out is None:
+            out = np.empty((len(sorted_ids),) + rows.shape[1:], dtype=rows.dtype)
+        out[order[start:end]] = rows
+    return th.from_numpy(out)
+
+def _shuffle_partition_feats(output_dir, num_partitions, feat_fname, feats, orig_id_keys,
+                             num_workers, mem_budget):
+    """ Shuffle node or edge features into the partitions.
+
+    The features of all partitions are gathered by a pool of threads.
+    A partition is saved as soon as all of its features are gathered, and the
+    partitions whose features are gathered at the same time must fit in the
+    memory budget. At least one partition is processed at a time. The feature file
+    of a partition is still written with a single `dgl.data.utils.save_tensors` call,
+    so the features of a whole partition are held in memory when it is saved.
+
+    Parameters
+    ----------
+    output_dir : str
+        The directory of the partitioned results.
+    num_partitions : int
+        The number of partitions.
+    feat_fname : str
+        The feature file of a partition, i.e., node_feat.dgl or edge_feat.dgl.
+    feats : dict of dict of arrays
+        The features of each node type or edge type. The key is the node type or
+        the edge type string used in the feature file.
+    orig_id_keys : dict of str
+        The key of the original IDs of each node type or edge type in the feature file.
+    num_workers : int
+        The number of threads to gather features.
+    mem_budget : int
+        The memory budget in bytes for the features being gathered.
+    """
+    pending = []
+
+    def save_oldest():
+        part_id, data, futures, part_bytes = pending.pop(0)
+        for key, future in futures.items():
+            data[key] = future.result()
+        # Delete the original IDs from the features.
+        for orig_id_key in orig_id_keys.values():
+            del data[orig_id_key]
+        part_dir = os.path.join(output_dir, "part" + str(part_id))
+        dgl.data.utils.save_tensors(os.path.join(part_dir, feat_fname), data)
+        sys_tracker.check(f'Save {feat_fname} of partition {part_id}')
+        return part_bytes
+
+    in_flight_bytes = 0
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        for i in range(num_partitions):
+            part_dir = os.path.join(output_dir, "part" + str(i))
+            data = dgl.data.utils.load_tensors(os.path.join(part_dir, feat_fname))
+            tasks = []
+            for type_key, type_feats in feats.items():
+                # We store the original IDs as a feature when we partition the graph.
+                # We can get the original IDs from the features and now
+                # we use them to retrieve the right features.
+                orig_ids = data[orig_id_keys[type_key]].numpy()
+                for name, feat in type_feats.items():
+                    tasks.append((type_key + "/" + name, feat, orig_ids))
+            part_bytes = sum(_row_nbytes(feat) * len(orig_ids) \
+                             for _, feat, orig_ids in tasks)
+            # Save the earlier partitions until the new partition fits in the budget.
+            while len(pending) > 0 and in_flight_bytes + part_bytes > mem_budget:
+                in_flight_bytes -= save_oldest()
+            futures = {key: pool.submit(_gather_rows, feat, orig_ids) \
+                       for key, feat, orig_ids in tasks}
+            pending.append((i, data, futures, part_bytes))
+            in_flight_bytes += part_bytes
+        while len(pending) > 0:
+            save_oldest()
+
 def partition_graph(g, node_data, edge_data, graph_name, num_partitions, output_dir,
-                    part_method=None, save_mapping=True, use_graphbolt=False):
+                    part_method=None, save_mapping=True, use_graphbolt=False,
+                    num_workers=None, mem_budget=None):
     """ Partition a graph
 
     This takes advantage of the graph partition function in DGL.
@@ -984,6 +1451,12 @@ def partition_graph(g, node_data, edge_data, graph_name, num_partitions, output_
         after partitioning.
 
         .. versionadded:: 0.4.0
+    num_workers: int
+        The number of threads to shuffle node/edge features into partitions.
+        By default, it uses one thread per partition up to the number of CPUs.
+    mem_budget: int
+        The memory budget in bytes for the features being shuffled at the same time.
+        By default, it is half of the available memory.
     """
     from dgl.distributed.graph_partition_book import _etype_tuple_to_str
     orig_id_name = "__gs_orig_id"
@@ -1087,36 +1560,22 @@ def partition_graph(g, node_data, edge_data, graph_name, num_partitions, output_
             sys_tracker.check(f'Get edge data of edge {etype} in partition 0')
         dgl.data.utils.save_tensors(os.path.join(part_dir, "edge_feat.dgl"), efeat_data)
     else:
-        for i in range(num_partitions):
-            part_dir = os.path.join(output_dir, "part" + str(i))
-            data = dgl.data.utils.load_tensors(os.path.join(part_dir, "node_feat.dgl"))
-            # Get the node features for the partition and save the node features in node_feat.dgl.
-            for ntype in node_data:
-                # We store the original node IDs as a node feature when we partition the graph.
-                # We can get the original node IDs from the node features and now
-                # we use them to retrieve the right node features.
-                orig_ids = data[ntype + "/" + orig_id_name]
-                for name, ndata in node_data[ntype].items():
-                    data[ntype + "/" + name] = th.tensor(ndata[orig_ids])
-                sys_tracker.check(f'Get node data of node {ntype} in partition {i}')
-            # Delete the original node IDs from the node data.
-            for ntype in g.ntypes:
-                del data[ntype + "/" + orig_id_name]
-            dgl.data.utils.save_tensors(os.path.join(part_dir, "node_feat.dgl"), data)
-
-            data = dgl.data.utils.load_tensors(os.path.join(part_dir, "edge_feat.dgl"))
-            # Get the edge features for the partition and save the edge features in edge_feat.dgl.
-            for etype in edge_data:
-                # We store the original edge IDs as a edge feature when we partition the graph.
-                # We can get the original edge IDs from the edge features and now
-                # we use them to retrieve the right edge features.
-                orig_ids = data[_etype_tuple_to_str(etype) + '/' + orig_id_name]
-                for name, edata in edge_data[etype].items():
-                    data[_etype_tuple_to_str(etype) + "/" + name] = th.tensor(edata[orig_ids])
-                sys_tracker.check(f'Get edge data of edge {etype} in partition {i}')
-            for etype in g.canonical_etypes:
-                del data[_etype_tuple_to_str(etype) + '/' + orig_id_name]
-            dgl.data.utils.save_tensors(os.path.join(part_dir, "edge_feat.dgl"), data)
+        if num_workers is None:
+            num_workers = min(num_partitions, os.cpu_count() or 1)
+        if mem_budget is None:
+            mem_budget = psutil.virtual_memory().available // 2
+        _shuffle_partition_feats(output_dir, num_partitions, "node_feat.dgl", node_data,
+                                 {ntype: ntype + "/" + orig_id_name for ntype in g.ntypes},
+                                 num_workers, mem_budget)
+        sys_tracker.check('Shuffle node data')
+        _shuffle_partition_feats(output_dir, num_partitions, "edge_feat.dgl",
+                                 {_etype_tuple_to_str(etype): edata \
+                                  for etype, edata in edge_data.items()},
+                                 {_etype_tuple_to_str(etype): \
+                                  _etype_tuple_to_str(etype) + "/" + orig_id_name \
+                                  for etype in g.canonical_etypes},
+                                 num_workers, mem_budget)
+        sys_tracker.check('Shuffle edge data')
 
     if save_mapping:
         new_node_mapping, new_edge_mapping = mapping
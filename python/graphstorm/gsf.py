@@ -97,6 +97,8 @@ from .model.edge_decoder import (LinkPredictDotDecoder,
                                  LinkPredictWeightedTransEDecoder)
 from .dataloading import (BUILTIN_LP_UNIFORM_NEG_SAMPLER,
                           BUILTIN_LP_JOINT_NEG_SAMPLER,
+                          BUILTIN_LP_FULL_NEG_SAMPLER,
+                          BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER,
                           BUILTIN_LP_INBATCH_JOINT_NEG_SAMPLER,
                           BUILTIN_LP_LOCALUNIFORM_NEG_SAMPLER,
                           BUILTIN_LP_LOCALJOINT_NEG_SAMPLER,
@@ -119,7 +121,9 @@ from .dataloading import (FastGSgnnLinkPredictionDataLoader,
                           GSgnnAllEtypeLinkPredictionDataLoader)
 from .dataloading import (GSgnnLinkPredictionTestDataLoader,
                           GSgnnLinkPredictionJointTestDataLoader,
-                          GSgnnLinkPredictionPredefinedTestDataLoader)
+                          GSgnnLinkPredictionPredefinedTestDataLoader,
+                          GSgnnLinkPredictionFullTestDataLoader,
+                          GSgnnLinkPredictionFilteredFullTestDataLoader)
 
 from .eval import (GSgnnClassificationEvaluator,
                    GSgnnRegressionEvaluator,
@@ -991,6 +995,8 @@ def set_encoder(model, g, config, train_task):
     reconstruct_feats = len(config.construct_feat_ntype) > 0
     model_encoder_type = config.model_encoder_type
     if config.node_lm_configs is not None:
+        assert config.node_feat_num_categories is None, \
+            "Categorical node features are not supported with language models."
         emb_path = os.path.join(os.path.dirname(config.part_config),
                 "cached_embs") if config.cache_lm_embed else None
         if model_encoder_type == "lm":
@@ -1018,14 +1024,16 @@ def set_encoder(model, g, config, train_task):
                                             use_node_embeddings=config.use_node_embeddings,
                                             force_no_embeddings=config.construct_feat_ntype,
                                             num_ffn_layers_in_input=config.num_ffn_layers_in_input,
-                                            use_wholegraph_sparse_emb=config.use_wholegraph_embed)
+                                            use_wholegraph_sparse_emb=config.use_wholegraph_embed,
+                                            num_categories=config.node_feat_num_categories)
         # set edge encoder input layer no matter if having edge feature names or not
         # TODO: add support of languange models and GLEM
         edge_feat_size = get_edge_feat_size(g, config.edge_feat_name)
         edge_encoder = GSEdgeEncoderInputLayer(g, edge_feat_size, config.hidden_size,
                                         dropout=config.dropout,
                                         activation=config.input_activate,
-                                        num_ffn_layers_in_input=config.num_ffn_layers_in_input)
+                                        num_ffn_layers_in_input=config.num_ffn_layers_in_input,
+                                        num_categories=config.edge_feat_num_categories)
         model.set_edge_input_encoder(edge_encoder)
 
     # The number of feature dimensions can change. For example, the feature dimensions
@@ -1054,7 +1062,8 @@ def set_encoder(model, g, config, train_task):
                                            dropout=dropout,
                                            use_self_loop=config.use_self_loop,
                                            num_ffn_layers_in_gnn=config.num_ffn_layers_in_gnn,
-                                           norm=config.gnn_norm)
+                                           norm=config.gnn_norm,
+                                           fuse_relations=config.fuse_relations)
     elif model_encoder_type == "rgat":
         # we need to set the num_layers -1 because there is an output layer that is hard coded.
         gnn_encoder = RelationalGATEncoder(g,
@@ -1184,10 +1193,15 @@ def get_builtin_lp_eval_dataloader_class(config):
         test_dataloader_cls = GSgnnLinkPredictionTestDataLoader
     elif config.eval_negative_sampler == BUILTIN_LP_JOINT_NEG_SAMPLER:
         test_dataloader_cls = GSgnnLinkPredictionJointTestDataLoader
+    elif config.eval_negative_sampler == BUILTIN_LP_FULL_NEG_SAMPLER:
+        test_dataloader_cls = GSgnnLinkPredictionFullTestDataLoader
+    elif config.eval_negative_sampler == BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER:
+        test_dataloader_cls = GSgnnLinkPredictionFilteredFullTestDataLoader
     else:
         raise ValueError('Unknown test negative sampler.'
             'Supported test negative samplers include '
-            f'[{BUILTIN_LP_UNIFORM_NEG_SAMPLER}, {BUILTIN_LP_JOINT_NEG_SAMPLER}]')
+            f'[{BUILTIN_LP_UNIFORM_NEG_SAMPLER}, {BUILTIN_LP_JOINT_NEG_SAMPLER}, '
+            f'{BUILTIN_LP_FULL_NEG_SAMPLER}, {BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER}]')
     return test_dataloader_cls
 
 def get_builtin_lp_train_dataloader_class(config):
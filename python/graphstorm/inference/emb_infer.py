@@ -80,17 +80,19 @@ class GSgnnEmbGenInferer(GSInferrer):
         # For valid model classes, please see the parent class description.
         self._model.eval()
 
-        if use_mini_batch_infer:
-            embs = do_mini_batch_inference(self._model, data, batch_size=infer_batch_size,
-                                           fanout=eval_fanout, edge_mask=None,
-                                           task_tracker=self.task_tracker,
-                                           infer_ntypes=infer_ntypes)
-        else:
-            embs = do_full_graph_inference(self._model, data, fanout=eval_fanout,
-                                           edge_mask=None,
-                                           task_tracker=self.task_tracker)
-            if infer_ntypes:
-                embs = {ntype: embs[ntype] for ntype in infer_ntypes}
+        with self.autocast():
+            if use_mini_batch_infer:
+                embs = do_mini_batch_inference(self._model, data, batch_size=infer_batch_size,
+                                               fanout=eval_fanout, edge_mask=None,
+                                               task_tracker=self.task_tracker,
+                                               infer_ntypes=infer_ntypes)
+            else:
+                embs = do_full_graph_inference(self._model, data, fanout=eval_fanout,
+                                               edge_mask=None,
+                                               task_tracker=self.task_tracker,
+                                               pipeline_depth=self.infer_pipeline_depth)
+                if infer_ntypes:
+                    embs = {ntype: embs[ntype] for ntype in infer_ntypes}
 
         if get_rank() == 0:
             logging.info("save embeddings to %s", save_embed_path)
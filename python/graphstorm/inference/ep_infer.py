@@ -90,17 +90,19 @@ class GSgnnEdgePredictionInferrer(GSInferrer):
         sys_tracker.check('start inferencing')
         self._model.eval()
 
-        if use_mini_batch_infer:
-            res = edge_mini_batch_gnn_predict(self._model,
-                                              loader,
-                                              return_proba,
+        with self.autocast():
+            if use_mini_batch_infer:
+                res = edge_mini_batch_gnn_predict(self._model,
+                                                  loader,
+                                                  return_proba,
+                                                  return_label=do_eval)
+            else:
+                embs = do_full_graph_inference(self._model, loader.data, fanout=loader.fanout,
+                                               task_tracker=self.task_tracker,
+                                               pipeline_depth=self.infer_pipeline_depth)
+                sys_tracker.check('compute embeddings')
+                res = edge_mini_batch_predict(self._model, embs, loader, return_proba,
                                               return_label=do_eval)
-        else:
-            embs = do_full_graph_inference(self._model, loader.data, fanout=loader.fanout,
-                                           task_tracker=self.task_tracker)
-            sys_tracker.check('compute embeddings')
-            res = edge_mini_batch_predict(self._model, embs, loader, return_proba,
-                                          return_label=do_eval)
         preds = res[0]
         labels = res[1] if do_eval else None
         sys_tracker.check('compute prediction')
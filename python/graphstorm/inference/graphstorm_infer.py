@@ -15,6 +15,8 @@
 
     Inference framework.
 """
+from ..config import BUILTIN_PRECISION_FP32, BUILTIN_PRECISIONS
+from ..model.utils import precision_autocast
 from ..tracker import GSSageMakerTaskTracker
 
 
@@ -36,6 +38,8 @@ class GSInferrer():
         self._device = -1
         self._evaluator = None
         self._task_tracker = None
+        self._precision = BUILTIN_PRECISION_FP32
+        self._infer_pipeline_depth = 0
 
     def setup_device(self, device):
         """ Set up the device for the inferrer.
@@ -50,6 +54,45 @@ class GSInferrer():
         self._device = device
         self._model = self._model.to(self.device)
 
+    def setup_precision(self, precision):
+        """ Set up the numerical precision of inference.
+
+        With ``fp16`` or ``bf16``, the model runs under ``torch.autocast`` and
+        the output embeddings and predictions are stored in fp32.
+
+        Parameters
+        ----------
+        precision : str
+            One of ``fp32``, ``fp16`` and ``bf16``.
+        """
+        assert precision in BUILTIN_PRECISIONS, \
+            f"precision must be one of {BUILTIN_PRECISIONS}, but get {precision}."
+        self._precision = precision
+
+    def autocast(self):
+        """ The autocast context of the precision of this inferrer.
+
+        Returns
+        -------
+        A context manager under which the model runs in the precision given by
+        ``setup_precision()``.
+        """
+        return precision_autocast(self.device, self._precision)
+
+    def setup_infer_pipeline_depth(self, pipeline_depth):
+        """ Set up the pipelining of full-graph inference.
+
+        Parameters
+        ----------
+        pipeline_depth : int
+            The number of mini-batches sampled and fetched ahead of the computation
+            on a background thread in each GNN layer of full-graph inference.
+            0 disables pipelining.
+        """
+        assert isinstance(pipeline_depth, int) and pipeline_depth >= 0, \
+            f"pipeline_depth must be a non-negative integer, but get {pipeline_depth}."
+        self._infer_pipeline_depth = pipeline_depth
+
     def setup_task_tracker(self, task_tracker):
         """ Set the task tracker.
 
@@ -126,3 +169,16 @@ class GSInferrer():
         """ The device associated with the inferrer.
         """
         return self._device
+
+    @property
+    def precision(self):
+        """ The numerical precision of inference.
+        """
+        return self._precision
+
+    @property
+    def infer_pipeline_depth(self):
+        """ The number of mini-batches prepared ahead of the computation
+            in full-graph inference.
+        """
+        return self._infer_pipeline_depth
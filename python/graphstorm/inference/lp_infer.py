@@ -81,15 +81,17 @@ class GSgnnLinkPredictionInferrer(GSInferrer):
         """
         sys_tracker.check('start inferencing')
         self._model.eval()
-        if use_mini_batch_infer:
-            embs = do_mini_batch_inference(self._model, data, batch_size=infer_batch_size,
-                                           fanout=loader.fanout,
-                                           edge_mask=edge_mask_for_gnn_embeddings,
-                                           task_tracker=self.task_tracker)
-        else:
-            embs = do_full_graph_inference(self._model, data, fanout=loader.fanout,
-                                           edge_mask=edge_mask_for_gnn_embeddings,
-                                           task_tracker=self.task_tracker)
+        with self.autocast():
+            if use_mini_batch_infer:
+                embs = do_mini_batch_inference(self._model, data, batch_size=infer_batch_size,
+                                               fanout=loader.fanout,
+                                               edge_mask=edge_mask_for_gnn_embeddings,
+                                               task_tracker=self.task_tracker)
+            else:
+                embs = do_full_graph_inference(self._model, data, fanout=loader.fanout,
+                                               edge_mask=edge_mask_for_gnn_embeddings,
+                                               task_tracker=self.task_tracker,
+                                               pipeline_depth=self.infer_pipeline_depth)
         sys_tracker.check('compute embeddings')
         device = self.device
         g = data.g
@@ -104,8 +106,9 @@ class GSgnnLinkPredictionInferrer(GSInferrer):
 
         if self.evaluator is not None:
             test_start = time.time()
-            test_rankings, test_lengths = lp_mini_batch_predict(
-                self._model, embs, loader, device, return_batch_lengths=True)
+            with self.autocast():
+                test_rankings, test_lengths = lp_mini_batch_predict(
+                    self._model, embs, loader, device, return_batch_lengths=True)
             assert isinstance(self.evaluator, GSgnnLPRankingEvalInterface)
             val_score, test_score = self.evaluator.evaluate(
                 None,
@@ -150,18 +150,20 @@ class GSgnnMultiTaskLearningInferrer(GSInferrer):
             # Note(xiangsx): In DistDGl, as we are using the
             # same DistTensor to save the node embeddings
             # so the node embeddings are updated inplace.
-            if use_mini_batch_infer:
-                embs = do_mini_batch_inference(
-                    model, data, batch_size=infer_batch_size,
-                    fanout=fanout,
-                    edge_mask=edge_mask,
-                    task_tracker=self.task_tracker)
-            else:
-                embs = do_full_graph_inference(
-                    model, data,
-                    fanout=fanout,
-                    edge_mask=edge_mask,
-                    task_tracker=self.task_tracker)
+            with self.autocast():
+                if use_mini_batch_infer:
+                    embs = do_mini_batch_inference(
+                        model, data, batch_size=infer_batch_size,
+                        fanout=fanout,
+                        edge_mask=edge_mask,
+                        task_tracker=self.task_tracker)
+                else:
+                    embs = do_full_graph_inference(
+                        model, data,
+                        fanout=fanout,
+                        edge_mask=edge_mask,
+                        task_tracker=self.task_tracker,
+                        pipeline_depth=self.infer_pipeline_depth)
             return embs
 
         embs = gen_embs()
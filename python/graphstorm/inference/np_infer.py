@@ -88,27 +88,29 @@ class GSgnnNodePredictionInferrer(GSInferrer):
         # get the list of ntypes for inference.
         infer_ntypes = list(loader.target_nidx.keys())
 
-        if use_mini_batch_infer:
-            res = node_mini_batch_gnn_predict(self._model, loader, return_proba,
-                                              return_label=do_eval)
-            preds = res[0]
-            embs = res[1]
-            labels = res[2] if do_eval else None
-        else:
-            embs = do_full_graph_inference(self._model, loader.data, fanout=loader.fanout,
-                                           task_tracker=self.task_tracker)
-            res = node_mini_batch_predict(self._model, embs, loader, return_proba,
-                                          return_label=do_eval)
-            preds = res[0]
-            labels = res[1] if do_eval else None
-
-            if save_embed_path is not None:
-                # Only embeddings of the target nodes will be saved.
-                embs = {ntype: embs[ntype][loader.target_nidx[ntype]] \
-                        for ntype in infer_ntypes}
+        with self.autocast():
+            if use_mini_batch_infer:
+                res = node_mini_batch_gnn_predict(self._model, loader, return_proba,
+                                                  return_label=do_eval)
+                preds = res[0]
+                embs = res[1]
+                labels = res[2] if do_eval else None
             else:
-                # release embs
-                del embs
+                embs = do_full_graph_inference(self._model, loader.data, fanout=loader.fanout,
+                                               task_tracker=self.task_tracker,
+                                               pipeline_depth=self.infer_pipeline_depth)
+                res = node_mini_batch_predict(self._model, embs, loader, return_proba,
+                                              return_label=do_eval)
+                preds = res[0]
+                labels = res[1] if do_eval else None
+
+                if save_embed_path is not None:
+                    # Only embeddings of the target nodes will be saved.
+                    embs = {ntype: embs[ntype][loader.target_nidx[ntype]] \
+                            for ntype in infer_ntypes}
+                else:
+                    # release embs
+                    del embs
         sys_tracker.check('finish compute embeddings')
 
         # do evaluation first
@@ -19,6 +19,7 @@ from .embed import GSNodeEncoderInputLayer, GSEdgeEncoderInputLayer
 from .lm_embed import GSLMNodeEncoderInputLayer, GSPureLMNodeInputLayer
 
 from .utils import sparse_emb_initializer
+from .utils import precision_autocast
 
 from .gnn import GSgnnModel, GSgnnModelBase, GSOptimizer
 from .gnn import do_full_graph_inference
@@ -61,6 +61,50 @@ def init_emb(shape, dtype):
     nn.init.uniform_(arr, -1.0, 1.0)
     return arr
 
+def create_categorical_embed(num_categories, embed_size):
+    """ Create the embedding table of a categorical feature.
+
+    The categorical feature stores the indices of the categories of each row,
+    e.g., the ``index`` output of the ``to_categorical`` feature transformation.
+    The embeddings of the categories in a row are summed. The last row of the
+    table is the padding embedding of empty slots and unknown values.
+
+    Parameters
+    ----------
+    num_categories : int
+        The number of categories.
+    embed_size : int
+        The embedding size.
+
+    Returns
+    -------
+    nn.EmbeddingBag : the embedding table.
+    """
+    embed = nn.EmbeddingBag(num_categories + 1, embed_size, mode="sum",
+                            padding_idx=num_categories)
+    nn.init.xavier_uniform_(embed.weight, gain=nn.init.calculate_gain("relu"))
+    return embed
+
+def lookup_categorical_embed(embed, feats):
+    """ Look up the embeddings of the category indices in a categorical feature.
+
+    Parameters
+    ----------
+    embed : nn.EmbeddingBag
+        The embedding table created by ``create_categorical_embed``.
+    feats : Tensor
+        The category indices in the shape of (N, max_dim). Empty slots and
+        unknown values are -1.
+
+    Returns
+    -------
+    Tensor : the sum of the embeddings of the categories in each row.
+    """
+    padding_idx = embed.padding_idx
+    idx = feats.long()
+    idx = th.where((idx >= 0) & (idx < padding_idx), idx, padding_idx)
+    return embed(idx)
+
 
 class GSNodeInputLayer(GSLayer):  # pylint: disable=abstract-method
     """ The base input layer for nodes in a heterogeneous graph.
@@ -267,6 +311,11 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
     use_wholegraph_sparse_emb : bool
         Whether or not to use WholeGraph to host embeddings for sparse updates. Default:
         False.
+    num_categories : dict of int
+        The number of categories of the node types whose input feature stores category
+        indices, in the format of {ntype: num_categories}. The input layer looks up and sums
+        the embeddings of the categories in each row instead of projecting the feature.
+        Default: None.
 
     Examples:
     ----------
@@ -297,13 +346,15 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
                  num_ffn_layers_in_input=0,
                  ffn_activation=F.relu,
                  cache_embed=False,
-                 use_wholegraph_sparse_emb=False):
+                 use_wholegraph_sparse_emb=False,
+                 num_categories=None):
         super(GSNodeEncoderInputLayer, self).__init__(g)
         self.embed_size = embed_size
         self.dropout = nn.Dropout(dropout)
         self.use_node_embeddings = use_node_embeddings
         self._use_wholegraph_sparse_emb = use_wholegraph_sparse_emb
         self.feat_size = feat_size
+        self.num_categories = num_categories if num_categories is not None else {}
         if force_no_embeddings is None:
             force_no_embeddings = []
 
@@ -337,17 +388,27 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
         # create weight embeddings for each node for each relation
         self.proj_matrix = nn.ParameterDict()
         self.input_projs = nn.ParameterDict()
+        self.input_embeds = nn.ModuleDict()
         embed_name = "embed"
         for ntype in g.ntypes:
             feat_dim = 0
             if feat_size[ntype] > 0:
                 feat_dim += feat_size[ntype]
+            assert ntype not in self.num_categories or feat_dim > 0, \
+                f"Node {ntype} has categories but does not have features."
             if feat_dim > 0:
-                if get_rank() == 0:
-                    logging.debug("Node %s has %d features.", ntype, feat_dim)
-                input_projs = nn.Parameter(th.Tensor(feat_dim, self.embed_size))
-                nn.init.xavier_uniform_(input_projs, gain=nn.init.calculate_gain("relu"))
-                self.input_projs[ntype] = input_projs
+                if ntype in self.num_categories:
+                    if get_rank() == 0:
+                        logging.debug("Node %s has a categorical feature with %d categories.",
+                                      ntype, self.num_categories[ntype])
+                    self.input_embeds[ntype] = create_categorical_embed(
+                        self.num_categories[ntype], self.embed_size)
+                else:
+                    if get_rank() == 0:
+                        logging.debug("Node %s has %d features.", ntype, feat_dim)
+                    input_projs = nn.Parameter(th.Tensor(feat_dim, self.embed_size))
+                    nn.init.xavier_uniform_(input_projs, gain=nn.init.calculate_gain("relu"))
+                    self.input_projs[ntype] = input_projs
                 if self.use_node_embeddings:
                     if self._use_wholegraph_sparse_emb:
                         if get_rank() == 0:
@@ -439,10 +500,13 @@ class GSNodeEncoderInputLayer(GSNodeInputLayer):
                 input_nodes[ntype] = th.from_numpy(input_nodes[ntype])
             emb = None
             if ntype in input_feats:
-                assert ntype in self.input_projs, \
-                    f"We need a projection for node type {ntype}"
-                # If the input data is not float, we need to convert it t float first.
-                emb = input_feats[ntype].float() @ self.input_projs[ntype]
+                if ntype in self.input_embeds:
+                    emb = lookup_categorical_embed(self.input_embeds[ntype], input_feats[ntype])
+                else:
+                    assert ntype in self.input_projs, \
+                        f"We need a projection for node type {ntype}"
+                    # If the input data is not float, we need to convert it t float first.
+                    emb = input_feats[ntype].float() @ self.input_projs[ntype]
                 if self.use_node_embeddings:
                     assert ntype in self.sparse_embeds, \
                         f"We need sparse embedding for node type {ntype}"
@@ -564,6 +628,11 @@ class GSEdgeEncoderInputLayer(GSEdgeInputLayer):
         in the input layer. Default: 0.
     ffn_activation : callable
         The activation function for the feedforward neural networks. Default: relu.
+    num_categories : dict of int
+        The number of categories of the edge types whose input feature stores category
+        indices, in the format of {can_etype: num_categories}. The input layer looks up and
+        sums the embeddings of the categories in each row instead of projecting the feature.
+        Default: None.
 
     Examples:
     ----------
@@ -595,7 +664,8 @@ class GSEdgeEncoderInputLayer(GSEdgeInputLayer):
                  activation=F.relu,
                  dropout=0.0,
                  num_ffn_layers_in_input=0,
-                 ffn_activation=F.relu):
+                 ffn_activation=F.relu,
+                 num_categories=None):
         super(GSEdgeEncoderInputLayer, self).__init__(g)
         assert not is_wholegraph(), 'Current GraphStorm does not support edge feature when ' + \
             'using WholeGraph. Please do not convert graph feature(s) to WholeGraph format.'
@@ -604,9 +674,11 @@ class GSEdgeEncoderInputLayer(GSEdgeInputLayer):
         self.embed_size = embed_size
         self.dropout = nn.Dropout(dropout)
         self.feat_size = feat_size
+        self.num_categories = num_categories if num_categories is not None else {}
         self.activation = activation
 
         self.input_projs = nn.ParameterDict()
+        self.input_embeds = nn.ModuleDict()
 
         # ngnn
         self.num_ffn_layers_in_input = num_ffn_layers_in_input
@@ -614,7 +686,14 @@ class GSEdgeEncoderInputLayer(GSEdgeInputLayer):
 
         # set projection weights on edge features
         for canonical_etype in g.canonical_etypes:
-            if self.feat_size[canonical_etype] > 1:
+            if canonical_etype in self.num_categories:
+                assert self.feat_size[canonical_etype] > 0, \
+                    f"Edge {canonical_etype} has categories but does not have features."
+                self.input_embeds[str(canonical_etype)] = create_categorical_embed(
+                    self.num_categories[canonical_etype], self.embed_size)
+                self.ngnn_mlp[str(canonical_etype)] = NGNNMLP(embed_size, embed_size,
+                                num_ffn_layers_in_input, ffn_activation, dropout)
+            elif self.feat_size[canonical_etype] > 1:
                 feat_dim = self.feat_size[canonical_etype]
                 input_projs = nn.Parameter(th.Tensor(feat_dim, self.embed_size))
                 nn.init.xavier_uniform_(input_projs.T, gain=nn.init.calculate_gain('linear'))
@@ -646,10 +725,14 @@ class GSEdgeEncoderInputLayer(GSEdgeInputLayer):
                 f'The input features should be in a dict, but got {edge_input_feats}.'
             embs = {}
             for canonical_etype, feats in edge_input_feats.items():
-                assert str(canonical_etype) in self.input_projs, \
-                    f"The {self.__class__.__name__} need a projection weight for edge " + \
-                    f"features of edge type {canonical_etype}."
-                emb = feats.float() @ self.input_projs[str(canonical_etype)]
+                if str(canonical_etype) in self.input_embeds:
+                    emb = lookup_categorical_embed(self.input_embeds[str(canonical_etype)],
+                                                   feats)
+                else:
+                    assert str(canonical_etype) in self.input_projs, \
+                        f"The {self.__class__.__name__} need a projection weight for edge " + \
+                        f"features of edge type {canonical_etype}."
+                    emb = feats.float() @ self.input_projs[str(canonical_etype)]
 
                 if self.activation is not None:
                     emb = self.activation(emb)
@@ -778,7 +861,7 @@ def compute_node_input_embeddings(g, batch_size, embed_layer,
 
                 feat = prepare_batch_input(g, {ntype: input_nodes}, dev=dev, feat_field=feat_field)
                 emb = embed_layer(feat, {ntype: input_nodes})
-                input_emb[input_nodes] = emb[ntype].to('cpu')
+                input_emb[input_nodes] = emb[ntype].to(th.float32).to('cpu')
                 if iter_l % 200 == 0 and g.rank() == 0:
                     logging.debug("compute input embeddings on %s: %d of %d, takes %.3f s",
                                   ntype, iter_l, len(node_list), time.time() - iter_start)
@@ -106,17 +106,32 @@ class GSOptimizer():
             if not is_wholegraph_optimizer(optimizer):
                 optimizer.zero_grad()
 
-    def step(self):
+    def step(self, grad_scaler=None):
         """ Moving the optimizer
+
+        Parameters
+        ----------
+        grad_scaler: torch.amp.GradScaler
+            The gradient scaler used in fp16 training. If it is given, the
+            gradients of the dense and language model parameters are unscaled
+            before the update and the update is skipped if they contain
+            infs or NaNs. Default: None.
         """
+        if grad_scaler is not None:
+            assert len(self.sparse_opts) == 0, \
+                "Gradient scaling does not support sparse optimizers."
         all_opts = self.dense_opts + self.lm_opts + self.sparse_opts
         for optimizer in all_opts:
             if is_wholegraph_optimizer(optimizer):
                 #TODO(@chang-l): request wholegraph to update
                 # their optimizer to align with pytorch conventions
                 optimizer.step(optimizer.lr)
+            elif grad_scaler is not None:
+                grad_scaler.step(optimizer)
             else:
                 optimizer.step()
+        if grad_scaler is not None:
+            grad_scaler.update()
 
     def load_opt_state(self, path, device=None):
         """ Load the optimizer states
@@ -1142,7 +1157,7 @@ def do_mini_batch_inference(model, data, batch_size=1024,
     return embeddings
 
 def do_full_graph_inference(model, data, batch_size=1024, fanout=None, edge_mask=None,
-                            task_tracker=None):
+                            task_tracker=None, pipeline_depth=0):
     """ Do fullgraph inference
 
     It may use some of the edges indicated by `edge_mask` to compute GNN embeddings.
@@ -1161,6 +1176,9 @@ def do_full_graph_inference(model, data, batch_size=1024, fanout=None, edge_mask
         The edge mask that indicates what edges are used to compute GNN embeddings.
     task_tracker: GSTaskTrackerAbc
         Task tracker
+    pipeline_depth : int
+        The number of mini-batches sampled and fetched ahead of the computation
+        on a background thread in each GNN layer. 0 disables pipelining. Default: 0.
 
     Returns
     -------
@@ -1211,7 +1229,8 @@ def do_full_graph_inference(model, data, batch_size=1024, fanout=None, edge_mask
             return res
         embeddings = model.gnn_encoder.dist_inference(data.g, get_input_embeds,
                                                     batch_size, fanout, edge_mask=edge_mask,
-                                                    task_tracker=task_tracker)
+                                                    task_tracker=task_tracker,
+                                                    pipeline_depth=pipeline_depth)
     else:
         assert not model.gnn_encoder.is_using_edge_feat(), "Full-graph inference does not " + \
             "support using edge features. Please call the \"do_mini_batch_inference()\" " + \
@@ -1231,7 +1250,8 @@ def do_full_graph_inference(model, data, batch_size=1024, fanout=None, edge_mask
 
         embeddings = model.gnn_encoder.dist_inference(data.g, get_input_embeds,
                                                     batch_size, fanout, edge_mask=edge_mask,
-                                                    task_tracker=task_tracker)
+                                                    task_tracker=task_tracker,
+                                                    pipeline_depth=pipeline_depth)
     # Called when model.eval()
     model.inplace_normalize_node_embs(embeddings)
     model.train()
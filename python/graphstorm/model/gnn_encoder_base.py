@@ -16,8 +16,11 @@
     Relational GNN
 """
 
+from contextlib import ExitStack
 from functools import partial
 import logging
+import queue
+import threading
 
 import abc
 import dgl
@@ -30,6 +33,10 @@ from .gs_layer import GSLayer
 from ..utils import get_rank, barrier, is_distributed, create_dist_tensor, is_wholegraph
 from ..distributed import flush_data
 
+# The number of output rows of a node type buffered before they are written
+# to the output distributed tensor in layer-wise inference.
+INFER_WRITE_BATCH_SIZE = 65536
+
 class GSgnnGNNEncoderInterface:
     """ The interface for builtin GraphStorm gnn encoder layer.
 
@@ -140,7 +147,7 @@ class GraphConvEncoder(GSLayer):     # pylint: disable=abstract-method
         return self._layers
 
     def dist_inference(self, g, get_input_embeds, batch_size, fanout,
-                       edge_mask=None, task_tracker=None):
+                       edge_mask=None, task_tracker=None, pipeline_depth=0):
         """Distributed inference of final representation over all node types.
         Parameters
         ----------
@@ -158,12 +165,16 @@ class GraphConvEncoder(GSLayer):     # pylint: disable=abstract-method
             The edge mask indicates which edges are used to compute GNN embeddings.
         task_tracker : GSTaskTrackerAbc
             The task tracker.
+        pipeline_depth : int
+            The number of mini-batches prepared ahead of the computation in each layer.
+            0 disables pipelining. Default: 0.
         Returns
         -------
         dict of Tensor : the final GNN embeddings of all nodes.
         """
         return dist_inference(g, self, get_input_embeds, batch_size, fanout,
-                            edge_mask=edge_mask, task_tracker=task_tracker)
+                            edge_mask=edge_mask, task_tracker=task_tracker,
+                            pipeline_depth=pipeline_depth)
 
 def prepare_for_wholegraph(g, input_nodes, input_edges=None):
     """ Add missing ntypes in input_nodes for wholegraph compatibility
@@ -296,7 +307,8 @@ def dist_minibatch_inference(g, gnn_encoder, get_input_embeds, batch_size, fanou
                 output = gnn_encoder(blocks, n_h)
 
             for ntype, out_nodes in output_nodes.items():
-                out_embs[ntype][out_nodes] = output[ntype].cpu()
+                # Outputs computed under autocast are stored in fp32.
+                out_embs[ntype][out_nodes] = output[ntype].to(th.float32).cpu()
         # The nodes are split in such a way that all processes only need to compute
         # the embeddings of the nodes in the local partition. Therefore, a barrier
         # is enough to ensure that all data have been written to memory for distributed
@@ -306,10 +318,148 @@ def dist_minibatch_inference(g, gnn_encoder, get_input_embeds, batch_size, fanou
         barrier()
     return out_embs
 
+def _get_thread_context():
+    """ Capture the grad mode and the autocast mode of the calling thread.
+
+    Both modes are thread local in Pytorch. The returned function creates a context
+    that restores them in another thread.
+    """
+    grad_enabled = th.is_grad_enabled()
+    autocast_args = None
+    if hasattr(th, "get_autocast_dtype"):
+        for device_type in ["cuda", "cpu"]:
+            if th.is_autocast_enabled(device_type):
+                autocast_args = (device_type, th.get_autocast_dtype(device_type))
+                break
+    # The device-generic autocast APIs are not available before Pytorch 2.4.
+    elif th.is_autocast_enabled():
+        autocast_args = ("cuda", th.get_autocast_gpu_dtype())
+    elif th.is_autocast_cpu_enabled():
+        autocast_args = ("cpu", th.get_autocast_cpu_dtype())
+
+    def _context():
+        stack = ExitStack()
+        stack.enter_context(th.set_grad_enabled(grad_enabled))
+        if autocast_args is not None:
+            stack.enter_context(th.autocast(device_type=autocast_args[0],
+                                            dtype=autocast_args[1]))
+        return stack
+    return _context
+
+class _InferenceOutputWriter:
+    """ Write the outputs of layer-wise inference to distributed tensors.
+
+    The outputs are buffered per node type and written with one assignment
+    per ``write_batch_size`` rows, so that the rows stored on remote machines
+    are sent in a few large requests instead of one request per mini-batch.
+
+    Parameters
+    ----------
+    g : DistGraph
+        The full distributed graph.
+    layer_id : str
+        The layer ID.
+    target_ntypes : list of str
+        The node types where we compute GNN embeddings.
+    write_batch_size : int
+        The number of buffered rows of a node type that triggers a write.
+        Default: None, use ``INFER_WRITE_BATCH_SIZE``.
+    """
+    def __init__(self, g, layer_id, target_ntypes, write_batch_size=None):
+        self._g = g
+        self._layer_id = layer_id
+        self._target_ntypes = target_ntypes
+        self._write_batch_size = INFER_WRITE_BATCH_SIZE \
+            if write_batch_size is None else write_batch_size
+        self._dtype = None
+        self._ids = {}
+        self._vals = {}
+        self._num_rows = {}
+        self.y = {}
+
+    def _create_output_tensors(self, h):
+        # Infer the hidden dim size.
+        # Here we assume all node embeddings have the same dim size.
+        h_dim = 0
+        dtype = None
+        for k in h:
+            assert len(h[k].shape) == 2, \
+                    "The embedding tensors should have only two dimensions."
+            h_dim = h[k].shape[1]
+            # Outputs computed under autocast are stored in fp32.
+            dtype = th.float32 if h[k].dtype in [th.float16, th.bfloat16] else h[k].dtype
+        assert h_dim > 0, "Cannot inference the hidden dim size."
+        self._dtype = dtype
+
+        # Create distributed tensors to store the embeddings.
+        for k in self._target_ntypes:
+            self.y[k] = create_dist_tensor((self._g.number_of_nodes(k), h_dim),
+                                           dtype=dtype, name=f'h-{self._layer_id}',
+                                           part_policy=self._g.get_node_partition_policy(k),
+                                           # TODO(zhengda) this makes the tensor persistent.
+                                           persistent=True)
+
+    def add(self, output_nodes, h):
+        """ Add the outputs of a mini-batch.
+
+        Parameters
+        ----------
+        output_nodes : dict of Tensor
+            The output node IDs of the mini-batch.
+        h : dict of Tensor
+            The outputs of the mini-batch.
+        """
+        # For the first mini-batch, we need to create output tensors.
+        if self._dtype is None:
+            self._create_output_tensors(h)
+
+        for k in h.keys():
+            # some ntypes might be in the tensor h but are not in the output nodes
+            # that have empty tensors
+            if k in output_nodes:
+                assert k in self.y, "All mini-batch outputs should have the same tensor names."
+                self._ids.setdefault(k, []).append(output_nodes[k])
+                self._vals.setdefault(k, []).append(h[k].to(self._dtype))
+                self._num_rows[k] = self._num_rows.get(k, 0) + len(output_nodes[k])
+                if self._num_rows[k] >= self._write_batch_size:
+                    self._write(k)
+
+    def _write(self, ntype):
+        if self._num_rows.get(ntype, 0) > 0:
+            self.y[ntype][th.cat(self._ids[ntype])] = th.cat(self._vals[ntype])
+        self._ids[ntype] = []
+        self._vals[ntype] = []
+        self._num_rows[ntype] = 0
+
+    def flush(self):
+        """ Write all buffered outputs.
+        """
+        for ntype in list(self._ids.keys()):
+            self._write(ntype)
+
 def dist_inference_one_layer(layer_id, g, dataloader, target_ntypes, layer, get_input_embeds,
-                             device, task_tracker):
+                             device, task_tracker, pipeline_depth=0):
     """ Run distributed inference for one GNN layer.
 
+    When ``pipeline_depth`` is larger than 0, the inference is pipelined: a background
+    thread samples the mini-batches, fetches their input embeddings and writes the
+    outputs to the distributed tensors, while the calling thread computes the GNN layer.
+    Up to ``pipeline_depth`` mini-batches are prepared ahead of the computation.
+
+    The RPC client of DistGraph is not thread-safe, so RPC calls must never be issued
+    by two threads at the same time. While the pipeline runs, the background thread is
+    the only thread that issues RPC calls: sampling, pulling the input features and
+    writing the outputs all run on it, and the calling thread only runs the GNN layer
+    on the prepared mini-batches, which makes no RPC call. WholeGraph gathers in
+    ``get_input_embeds`` are collective operations that every process must call the
+    same number of times in the same order. The background thread prepares the
+    mini-batches one by one in iteration order and prepares empty mini-batches for
+    the last iterations, like the sequential inference, so the collectives stay in
+    lock-step across processes no matter how far ahead each process runs.
+
+    .. versionchanged:: 0.4.1
+        Add the ``pipeline_depth`` argument to pipeline the inference.
+
     Parameters
     ----------
     layer_id : str
@@ -328,6 +478,9 @@ def dist_inference_one_layer(layer_id, g, dataloader, target_ntypes, layer, get_
         The device to run mini-batch computation.
     task_tracker : GSTaskTrackerAbc
         The task tracker.
+    pipeline_depth : int
+        The number of mini-batches prepared ahead of the computation. 0 means
+        running the inference sequentially in the calling thread. Default: 0.
 
     Returns
     -------
@@ -343,11 +496,11 @@ def dist_inference_one_layer(layer_id, g, dataloader, target_ntypes, layer, get_
         max_num_batch = tensor[0]
 
     dataloader_iter = iter(dataloader)
-    y = {}
+    writer = _InferenceOutputWriter(g, layer_id, target_ntypes)
 
-    # WholeGraph does not support imbalanced batch numbers across processes/trainers
-    # TODO (IN): Fix dataloader to have same number of minibatches.
-    for iter_l in range(max_num_batch):
+    def _prepare(iter_l):
+        """ Sample a mini-batch and get its input embeddings.
+        """
         tmp_keys = []
         if iter_l < len_dataloader:
             input_nodes, output_nodes, blocks = next(dataloader_iter)
@@ -371,53 +524,120 @@ def dist_inference_one_layer(layer_id, g, dataloader, target_ntypes, layer, get_
             # computations in every iteration.
             input_nodes = {ntype: th.empty((0,), dtype=g.idtype) for ntype in g.ntypes}
             blocks = None
-        if iter_l % 100000 == 0 and get_rank() == 0:
-            logging.info("[Rank 0] dist_inference: finishes %d iterations.", iter_l)
-
-        if task_tracker is not None:
-            task_tracker.keep_alive(report_step=iter_l)
 
         h = get_input_embeds(input_nodes)
         if blocks is None:
-            continue
+            return None
         # Remove additional keys (ntypes) added for WholeGraph compatibility
         for ntype in tmp_keys:
             del input_nodes[ntype]
-        block = blocks[0].to(device)
-        h = layer(block, h)
+        return h, output_nodes, blocks[0].to(device)
 
-        # For the first iteration, we need to create output tensors.
-        if iter_l == 0:
-            # Infer the hidden dim size.
-            # Here we assume all node embeddings have the same dim size.
-            h_dim = 0
-            dtype = None
-            for k in h:
-                assert len(h[k].shape) == 2, \
-                        "The embedding tensors should have only two dimensions."
-                h_dim = h[k].shape[1]
-                dtype = h[k].dtype
-            assert h_dim > 0, "Cannot inference the hidden dim size."
-
-            # Create distributed tensors to store the embeddings.
-            for k in target_ntypes:
-                y[k] = create_dist_tensor((g.number_of_nodes(k), h_dim),
-                                          dtype=dtype, name=f'h-{layer_id}',
-                                          part_policy=g.get_node_partition_policy(k),
-                                          # TODO(zhengda) this makes the tensor persistent.
-                                          persistent=True)
+    def _compute(iter_l, batch):
+        """ Compute the GNN layer on a mini-batch.
+        """
+        if iter_l % 100000 == 0 and get_rank() == 0:
+            logging.info("[Rank 0] dist_inference: finishes %d iterations.", iter_l)
 
-        for k in h.keys():
-            # some ntypes might be in the tensor h but are not in the output nodes
-            # that have empty tensors
-            if k in output_nodes:
-                assert k in y, "All mini-batch outputs should have the same tensor names."
-                y[k][output_nodes[k]] = h[k].cpu()
+        if task_tracker is not None:
+            task_tracker.keep_alive(report_step=iter_l)
+
+        if batch is None:
+            return None
+        h, output_nodes, block = batch
+        h = layer(block, h)
+        return output_nodes, {k: v.cpu() for k, v in h.items()}
+
+    if pipeline_depth == 0:
+        for iter_l in range(max_num_batch):
+            outputs = _compute(iter_l, _prepare(iter_l))
+            if outputs is not None:
+                writer.add(*outputs)
+        writer.flush()
+    else:
+        _pipelined_inference(max_num_batch, _prepare, _compute, writer, pipeline_depth)
     flush_data()
-    return y
+    return writer.y
+
+def _pipelined_inference(max_num_batch, prepare_fn, compute_fn, writer, pipeline_depth):
+    """ Run the layer-wise inference loop with a background thread.
+
+    The background thread runs ``prepare_fn`` for every iteration in order and writes
+    the outputs with ``writer``, while the calling thread runs ``compute_fn``.
+    """
+    batch_queue = queue.Queue(maxsize=pipeline_depth)
+    output_queue = queue.Queue()
+    stop_event = threading.Event()
+    errors = []
+    thread_context = _get_thread_context()
+
+    def _write_outputs():
+        while True:
+            try:
+                item = output_queue.get_nowait()
+            except queue.Empty:
+                return
+            writer.add(*item)
+
+    def _put(item):
+        # Write the outputs while waiting for the compute loop to
+        # take the prepared mini-batch.
+        while not stop_event.is_set():
+            _write_outputs()
+            try:
+                batch_queue.put(item, timeout=0.01)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _io_loop():
+        try:
+            with thread_context():
+                for iter_l in range(max_num_batch):
+                    if not _put((iter_l, prepare_fn(iter_l))):
+                        return
+                if not _put(None):
+                    return
+                # Write the remaining outputs until the compute loop finishes.
+                while not stop_event.is_set():
+                    try:
+                        item = output_queue.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if item is None:
+                        break
+                    writer.add(*item)
+                writer.flush()
+        except Exception as e: # pylint: disable=broad-exception-caught
+            errors.append(e)
+            stop_event.set()
+
+    thread = threading.Thread(target=_io_loop, daemon=True)
+    thread.start()
+    try:
+        while True:
+            try:
+                item = batch_queue.get(timeout=0.1)
+            except queue.Empty:
+                if len(errors) > 0:
+                    raise errors[0]
+                continue
+            if item is None:
+                break
+            outputs = compute_fn(*item)
+            if outputs is not None:
+                output_queue.put(outputs)
+        output_queue.put(None)
+        thread.join()
+        if len(errors) > 0:
+            raise errors[0]
+    finally:
+        stop_event.set()
+        thread.join()
 
 def dist_inference(g, gnn_encoder, get_input_embeds, batch_size, fanout,
-                   edge_mask=None, task_tracker=None):
+                   edge_mask=None, task_tracker=None, pipeline_depth=0):
     """Distributed inference of final representation over all node types
        using layer-by-layer inference.
 
@@ -437,6 +657,9 @@ def dist_inference(g, gnn_encoder, get_input_embeds, batch_size, fanout,
         The edge mask indicates which edges are used to compute GNN embeddings.
     task_tracker : GSTaskTrackerAbc
         The task tracker.
+    pipeline_depth : int
+        The number of mini-batches prepared ahead of the computation in each layer.
+        0 disables pipelining. Default: 0.
 
     Returns
     -------
@@ -467,7 +690,8 @@ def dist_inference(g, gnn_encoder, get_input_embeds, batch_size, fanout,
             next_layer_input = dist_inference_one_layer(str(i), g, dataloader,
                                                         list(infer_nodes.keys()),
                                                         layer, get_input_embeds, device,
-                                                        task_tracker)
+                                                        task_tracker,
+                                                        pipeline_depth=pipeline_depth)
     return next_layer_input
 
 
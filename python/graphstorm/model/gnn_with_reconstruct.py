@@ -24,7 +24,8 @@ from ..utils import barrier
 from .gnn_encoder_base import GraphConvEncoder, dist_inference_one_layer
 
 def construct_node_feat(g, rel_names, input_gnn, get_input_embeds, batch_size,
-                        edge_mask=None, device="cpu", task_tracker=None):
+                        edge_mask=None, device="cpu", task_tracker=None,
+                        pipeline_depth=0):
     """ Construct node features with the input layer in the full-graph inference.
 
     Parameters
@@ -45,6 +46,9 @@ def construct_node_feat(g, rel_names, input_gnn, get_input_embeds, batch_size,
         The device where to perform the computation.
     task_tracker : GSTaskTrackerAbc
         The task tracker.
+    pipeline_depth : int
+        The number of mini-batches prepared ahead of the computation. 0 disables
+        pipelining. Default: 0.
 
     Returns
     -------
@@ -70,7 +74,8 @@ def construct_node_feat(g, rel_names, input_gnn, get_input_embeds, batch_size,
                                                         shuffle=False,
                                                         drop_last=False)
         return dist_inference_one_layer('input', g, dataloader, target_ntypes, input_gnn,
-                                        get_input_embeds, device, task_tracker)
+                                        get_input_embeds, device, task_tracker,
+                                        pipeline_depth=pipeline_depth)
 
 def get_input_embeds_combined(input_nodes, feats, get_input_embeds, device='cpu'):
     """ This gets the node embeddings from feats or get_input_embeds.
@@ -177,7 +182,7 @@ class GNNEncoderWithReconstructedEmbed(GraphConvEncoder):
         return out_h
 
     def dist_inference(self, g, get_input_embeds, batch_size, fanout,
-                       edge_mask=None, task_tracker=None):
+                       edge_mask=None, task_tracker=None, pipeline_depth=0):
         """Distributed inference of final representation over all node types.
 
         Parameters
@@ -196,6 +201,9 @@ class GNNEncoderWithReconstructedEmbed(GraphConvEncoder):
             The edge mask indicates which edges are used to compute GNN embeddings.
         task_tracker : GSTaskTrackerAbc
             The task tracker.
+        pipeline_depth : int
+            The number of mini-batches prepared ahead of the computation in each layer.
+            0 disables pipelining. Default: 0.
 
         Returns
         -------
@@ -205,7 +213,8 @@ class GNNEncoderWithReconstructedEmbed(GraphConvEncoder):
         constructed_feats = construct_node_feat(g, self._input_rel_names,
                                                 self._input_gnn, get_input_embeds,
                                                 batch_size, edge_mask=edge_mask,
-                                                device=device, task_tracker=task_tracker)
+                                                device=device, task_tracker=task_tracker,
+                                                pipeline_depth=pipeline_depth)
         barrier()
         get_input_embeds = partial(get_input_embeds_combined,
                                    feats=constructed_feats,
@@ -213,4 +222,5 @@ class GNNEncoderWithReconstructedEmbed(GraphConvEncoder):
                                    device=device)
         return self._gnn_encoder.dist_inference(g, get_input_embeds,
                                                 batch_size, fanout, edge_mask=edge_mask,
-                                                task_tracker=task_tracker)
+                                                task_tracker=task_tracker,
+                                                pipeline_depth=pipeline_depth)
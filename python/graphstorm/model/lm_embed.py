@@ -31,6 +31,7 @@ from .embed import GSNodeInputLayer
 from .embed import GSNodeEncoderInputLayer
 from .lm_model import init_lm_model
 from .lm_model import get_lm_node_feats
+from .lm_model import VALID_LEN, ATT_MASK_IDX
 from .utils import (
     load_pytorch_embedding,
     save_pytorch_embedding,
@@ -41,6 +42,9 @@ from ..utils import get_rank, get_world_size, create_dist_tensor
 from ..wholegraph import WholeGraphDistTensor
 from ..distributed import flush_data
 
+# Number of LM inference batches between two checkpoints of the computed embeddings.
+LM_CACHE_CHECKPOINT_INTERVAL = 1000
+
 class LMModels(nn.Module):
     """ LM model collection
 
@@ -235,6 +239,49 @@ class LMModels(nn.Module):
         all_hashes = [self.get_lm_model_hash(ntype) for ntype in self.ntypes]
         return ':'.join(all_hashes)
 
+def _get_token_lens(lm_node_feat, nodes, chunk_size=65536):
+    """ Get the number of valid tokens of the text features of the given nodes.
+
+    Parameters
+    ----------
+    lm_node_feat: dict of Tensor
+        The LM node features of a node type.
+    nodes: Tensor
+        The node IDs.
+    chunk_size: int
+        The number of nodes whose features are read at a time.
+
+    Returns
+    -------
+    Tensor or None: the number of valid tokens of each node, or None if
+    the LM node features do not have the attention mask or the valid length.
+    """
+    if ATT_MASK_IDX in lm_node_feat:
+        feat = lm_node_feat[ATT_MASK_IDX]
+    elif VALID_LEN in lm_node_feat:
+        feat = lm_node_feat[VALID_LEN]
+    else:
+        return None
+    token_lens = []
+    for chunk in th.split(nodes, chunk_size):
+        mask = feat[chunk]
+        # The attention mask may store the valid length directly.
+        token_lens.append(mask.long() if len(mask.shape) == 1 \
+            else th.sum(mask != 0, dim=1))
+    return th.cat(token_lens) if len(token_lens) > 0 \
+        else th.zeros((0,), dtype=th.int64)
+
+def _get_lm_batch_feats(lm_node_feat, input_nodes, max_len=None):
+    """ Read the LM node features of a batch and trim their padding to ``max_len``.
+    """
+    input_lm_feats = {}
+    for fname, feat in lm_node_feat.items():
+        feat = feat[input_nodes]
+        if max_len is not None and len(feat.shape) == 2:
+            feat = feat[:, :max_len]
+        input_lm_feats[fname] = feat
+    return input_lm_feats
+
 class LMCache:
     """ Cache for the LM embeddings.
 
@@ -280,9 +327,7 @@ class LMCache:
         embed_ndata_names = self.embed_ndata_name
         self._lm_emb_cache = {}
         for ntype in self._lm_models.ntypes:
-            embed_path = os.path.join(os.path.join(
-                    os.path.join(self._embed_path, "lm_cache"), ntype),
-                    self._get_model_name(ntype))
+            embed_path = self._get_embed_path(ntype)
             if os.path.exists(embed_path):
                 if get_rank() == 0:
                     logging.info("load LM embedding from %s for node type %s",
@@ -309,13 +354,82 @@ class LMCache:
             self._lm_emb_cache = {}
             self._lm_hash = ''
 
+    def _get_embed_path(self, ntype):
+        """ Get the path of the cached LM embeddings of a node type.
+        """
+        return os.path.join(os.path.join(
+                os.path.join(self._embed_path, "lm_cache"), ntype),
+                self._get_model_name(ntype))
+
+    def _get_checkpoint_path(self, ntype):
+        """ Get the path of the partially computed LM embeddings of a node type.
+        """
+        return self._get_embed_path(ntype) + "-partial"
+
+    def _get_checkpoint_prefix(self):
+        return f"rank{get_rank()}-of-{get_world_size()}-"
+
+    def _load_checkpoint(self, ntype, emb):
+        """ Load the LM embeddings computed by a previous run that stopped mid-way.
+
+        Parameters
+        ----------
+        ntype: str
+            The node type.
+        emb: DistTensor or WholeGraphDistTensor
+            The embedding tensor to write the loaded embeddings to.
+
+        Returns
+        -------
+        Tensor: The IDs of the nodes whose embeddings are loaded.
+        """
+        ckpt_path = self._get_checkpoint_path(ntype)
+        done_nodes = [th.zeros((0,), dtype=th.int64)]
+        if not os.path.exists(ckpt_path):
+            return done_nodes[0]
+        prefix = self._get_checkpoint_prefix()
+        device = 'cuda' if self.use_wg else 'cpu'
+        for fname in sorted(os.listdir(ckpt_path)):
+            if not fname.startswith(prefix):
+                continue
+            ckpt = th.load(os.path.join(ckpt_path, fname))
+            emb[ckpt["nodes"]] = ckpt["embs"].to(device)
+            done_nodes.append(ckpt["nodes"])
+        done_nodes = th.cat(done_nodes)
+        if len(done_nodes) > 0:
+            logging.info("Rank %d: resume LM embedding computation of node %s, "
+                         "%d nodes are loaded from %s",
+                         get_rank(), ntype, len(done_nodes), ckpt_path)
+        return done_nodes
+
+    def _save_checkpoint(self, ntype, ckpt_idx, nodes, embs):
+        """ Save the LM embeddings of a range of nodes computed so far.
+        """
+        ckpt_path = self._get_checkpoint_path(ntype)
+        os.makedirs(ckpt_path, exist_ok=True)
+        fname = os.path.join(ckpt_path,
+                             f"{self._get_checkpoint_prefix()}{ckpt_idx:012d}.pt")
+        # Write to a temporary file first so that a failure during saving
+        # does not leave a corrupted checkpoint behind.
+        th.save({"nodes": th.cat(nodes), "embs": th.cat(embs)}, fname + ".tmp")
+        os.replace(fname + ".tmp", fname)
+
+    def _remove_checkpoint(self, ntype):
+        """ Remove the checkpoint files of the local process.
+        """
+        ckpt_path = self._get_checkpoint_path(ntype)
+        if not os.path.exists(ckpt_path):
+            return
+        prefix = self._get_checkpoint_prefix()
+        for fname in os.listdir(ckpt_path):
+            if fname.startswith(prefix):
+                os.remove(os.path.join(ckpt_path, fname))
+
     def _save_embeddings(self):
         """ Save LM embeddings to files.
         """
         for ntype in self._lm_models.ntypes:
-            embed_path = os.path.join(os.path.join(
-                    os.path.join(self._embed_path, "lm_cache"), ntype),
-                    self._get_model_name(ntype))
+            embed_path = self._get_embed_path(ntype)
             if self.use_wg:
                 save_wholegraph_embedding(embed_path,
                                         self._lm_emb_cache[ntype],
@@ -359,15 +473,26 @@ class LMCache:
         """
         return {ntype: "bert_emb" for ntype in self.ntypes}
 
-    def update_cache(self, lm_infer_batch_size, use_fp16=True):
+    def update_cache(self, lm_infer_batch_size, use_fp16=True,
+                     checkpoint_interval=LM_CACHE_CHECKPOINT_INTERVAL):
         """ Update the LM embedding cache.
 
+        The nodes are sorted by the number of valid tokens of their text before
+        being split into batches, so that nodes with similar text lengths are computed
+        together and the padding of each batch is trimmed to its longest text.
+        When ``embed_path`` is provided, the embeddings computed so far are checkpointed
+        every ``checkpoint_interval`` batches under the ``lm_cache`` directory, and
+        a restarted job resumes from the nodes that have not been computed.
+
         Parameters
         ----------
         lm_infer_batch_size: int
             Language model inference batch size
         use_fp16 : bool
             Use float16 to store LM embeddings.
+        checkpoint_interval: int
+            The number of batches between two checkpoints of the computed embeddings.
+            Checkpointing is disabled if it is not larger than 0 or ``embed_path`` is None.
 
         Returns
         -------
@@ -422,20 +547,44 @@ class LMCache:
             logging.debug("Rank %d: node %s, local infer set: %d, batch size: %d",
                           get_rank(), ntype, len(infer_nodes), lm_infer_batch_size)
 
+            use_ckpt = self._embed_path is not None and checkpoint_interval > 0
+            ckpt_idx = 0
+            if use_ckpt:
+                done_nodes = self._load_checkpoint(ntype, emb)
+                if len(done_nodes) > 0:
+                    infer_nodes = infer_nodes[~th.isin(infer_nodes, done_nodes)]
+                ckpt_idx = len(done_nodes)
+
+            # Sort nodes by their text lengths so that each batch has little padding.
+            token_lens = _get_token_lens(lm_node_feat, infer_nodes)
+            len_list = None
+            if token_lens is not None:
+                token_lens, order = th.sort(token_lens, descending=True, stable=True)
+                infer_nodes = infer_nodes[order]
+                len_list = th.split(token_lens, lm_infer_batch_size)
             node_list = th.split(infer_nodes, lm_infer_batch_size)
             input_ntypes = [ntype]
+            device = 'cuda' if self.use_wg else 'cpu'
+            ckpt_nodes, ckpt_embs = [], []
             with th.no_grad():
                 for i, input_nodes in enumerate(node_list):
+                    max_len = max(int(len_list[i][0]), 1) if len_list is not None else None
                     input_lm_feats = {}
-                    input_lm_feats[ntype] = {
-                            fname: feat[input_nodes] for fname, feat in lm_node_feat.items()
-                    }
+                    input_lm_feats[ntype] = _get_lm_batch_feats(lm_node_feat, input_nodes,
+                                                                max_len)
                     text_embs = lm_model(input_ntypes, input_lm_feats)
-                    device = 'cuda' if self.use_wg else 'cpu'
                     if use_fp16:
-                        emb[input_nodes] = text_embs[ntype].half().to(device)
+                        text_emb = text_embs[ntype].half().to(device)
                     else:
-                        emb[input_nodes] = text_embs[ntype].to(device)
+                        text_emb = text_embs[ntype].to(device)
+                    emb[input_nodes] = text_emb
+                    if use_ckpt:
+                        ckpt_nodes.append(input_nodes)
+                        ckpt_embs.append(text_emb.cpu())
+                        if len(ckpt_nodes) == checkpoint_interval or i == len(node_list) - 1:
+                            self._save_checkpoint(ntype, ckpt_idx, ckpt_nodes, ckpt_embs)
+                            ckpt_idx += sum(len(nodes) for nodes in ckpt_nodes)
+                            ckpt_nodes, ckpt_embs = [], []
                     if i % 1000 == 0 and get_rank() == 0:
                         logging.debug("Compute LM embeddings on %d batches out of %d",
                                       i, len(node_list))
@@ -452,6 +601,9 @@ class LMCache:
 
         if self._embed_path is not None:
             self._save_embeddings()
+            # The complete embeddings are saved, the partial results are not needed.
+            for ntype in self._lm_models.ntypes:
+                self._remove_checkpoint(ntype)
         return True
 
     def _clear_cache(self):
@@ -19,13 +19,24 @@ import abc
 from collections import defaultdict
 from typing import Dict, List, Tuple, Union
 
+import dgl
 import torch as th
 
-from ..dataloading.dataloading import GSgnnEdgeDataLoader
+from ..dataloading.dataloading import (GSgnnEdgeDataLoader,
+                                       BUILTIN_LP_JOINT_NEG_SAMPLER,
+                                       BUILTIN_LP_FULL_NEG_SAMPLER)
 from .gnn import GSgnnModel, GSgnnModelBase
-from ..model.edge_decoder import LinkPredictionTestScoreInterface
+from ..model.edge_decoder import (LinkPredictionTestScoreInterface,
+                                  LinkPredictDotDecoder,
+                                  LinkPredictDistMultDecoder)
 from .utils import normalize_node_embs
-from ..eval.utils import calc_ranking
+from ..eval.utils import calc_ranking, count_higher_scores
+from ..utils import get_backend, is_distributed
+
+# Number of candidate destination nodes scored at a time in full-candidate ranking.
+LP_FULL_CANDIDATE_CHUNK_SIZE = 65536
+# Number of positive edges scored against one candidate chunk at a time.
+LP_FULL_CANDIDATE_QUERY_BATCH_SIZE = 1024
 
 class GSgnnLinkPredictionModelInterface:
     """ The interface for GraphStorm link prediction model.
@@ -226,7 +237,14 @@ def run_lp_mini_batch_predict(
         batch_lengths: Dict[Tuple, List[th.Tensor]] = defaultdict(list)
         assert isinstance(decoder, LinkPredictionTestScoreInterface), \
             f"The decoder must implement LinkPredictionTestScoreInterface, got {decoder=}"
+        full_cand_edges: Dict[Tuple, List[Tuple[th.Tensor, th.Tensor]]] = defaultdict(list)
         for pos_neg_tuple, neg_sample_type in loader:
+            if neg_sample_type == BUILTIN_LP_FULL_NEG_SAMPLER:
+                # Rank against all the candidates once all the positive edges
+                # are collected, so each candidate chunk is read only once.
+                for canonical_etype, (pos_src, _, pos_dst, _) in pos_neg_tuple.items():
+                    full_cand_edges[canonical_etype].append((pos_src, pos_dst))
+                continue
             score = \
                 decoder.calc_test_scores(
                     emb, pos_neg_tuple, neg_sample_type, device)
@@ -248,6 +266,15 @@ def run_lp_mini_batch_predict(
 
                 batch_lengths[canonical_etype].append(lengths_tensor)
 
+        filter_g = loader.data.g if getattr(loader, "filter_true_edges", False) else None
+        for canonical_etype, edges in full_cand_edges.items():
+            pos_src = th.cat([src for src, _ in edges])
+            pos_dst = th.cat([dst for _, dst in edges])
+            score_ranking, lengths_tensor = calc_full_candidate_ranking(
+                decoder, emb, canonical_etype, pos_src, pos_dst, device, g=filter_g)
+            ranking[canonical_etype].append(score_ranking)
+            batch_lengths[canonical_etype].append(lengths_tensor)
+
         rankings: Dict[Tuple, th.Tensor] = {}
         batch_length_tensors: Dict[Tuple, th.Tensor] = {}
         for canonical_etype, rank in ranking.items():
@@ -258,3 +285,171 @@ def run_lp_mini_batch_predict(
     if return_batch_lengths:
         return rankings, batch_length_tensors
     return rankings
+
+def _get_true_edges(g, canonical_etype, src):
+    """ Get all the edges of ``canonical_etype`` in ``g`` starting from ``src``.
+    """
+    utype = canonical_etype[0]
+    src = th.unique(src)
+    if isinstance(g, dgl.distributed.DistGraph):
+        subg = dgl.distributed.sample_neighbors(g, {utype: src}, -1, edge_dir='out')
+        return subg.edges(etype=canonical_etype)
+    return g.out_edges(src, etype=canonical_etype)
+
+def _get_excluded_candidates(pos_src, pos_dst, num_cands, g=None, canonical_etype=None):
+    """ Get the (positive edge, candidate) pairs that are not counted in
+        full-candidate ranking.
+
+        The destination node of each positive edge is always excluded, because
+        the positive score is compared against it separately. When ``g`` is given,
+        the destination nodes of all the edges of ``canonical_etype`` in ``g``
+        sharing the source node of the positive edge are excluded as well.
+
+        Returns
+        -------
+        tuple of th.Tensor
+            The positive edge indices and the candidate node IDs of the excluded
+            pairs, sorted by candidate node ID, and the number of candidates of
+            each positive edge.
+    """
+    num_queries = len(pos_src)
+    query_idx = th.arange(num_queries)
+    ex_query = [query_idx]
+    ex_cand = [pos_dst]
+    if g is not None:
+        true_src, true_dst = _get_true_edges(g, canonical_etype, pos_src)
+        true_src, order = th.sort(true_src)
+        true_dst = true_dst[order]
+        # Join the positive edges with the true edges sharing the same source node.
+        start = th.searchsorted(true_src, pos_src)
+        end = th.searchsorted(true_src, pos_src, right=True)
+        cnt = end - start
+        offset = th.cumsum(cnt, dim=0) - cnt
+        idx = th.arange(int(cnt.sum())) - th.repeat_interleave(offset - start, cnt)
+        ex_query.append(th.repeat_interleave(query_idx, cnt))
+        ex_cand.append(true_dst[idx])
+    # Sort by candidate ID and remove duplicated pairs.
+    keys = th.unique(th.cat(ex_cand).long() * num_queries + th.cat(ex_query))
+    ex_cand = keys // num_queries
+    ex_query = keys % num_queries
+    # The positive destination node itself is a candidate.
+    cand_sizes = num_cands - th.bincount(ex_query, minlength=num_queries) + 1
+    return ex_query, ex_cand, cand_sizes
+
+def calc_full_candidate_ranking(decoder, emb, canonical_etype, pos_src, pos_dst, device,
+                                g=None, chunk_size=None, query_batch_size=None):
+    """ Rank each positive edge against all the nodes of the destination node type.
+
+        The candidates are scored chunk by chunk and only the number of candidates
+        scoring higher than the positive edge is kept, so the full score rows are
+        never materialized or sorted. For dot-product and DistMult decoders a
+        chunk is scored with a single matrix multiplication. Other decoders are
+        scored through their joint negative sampling path.
+
+        Parameters
+        ----------
+        decoder : LinkPredictionTestScoreInterface
+            The GraphStorm link prediction decoder.
+        emb : dict of Tensor
+            The GNN embeddings.
+        canonical_etype : tuple of str
+            The edge type of the positive edges.
+        pos_src : th.Tensor
+            The source node IDs of the positive edges.
+        pos_dst : th.Tensor
+            The destination node IDs of the positive edges.
+        device: th.device or int
+            Device used to compute scores.
+        g : DGLGraph or DistGraph
+            When given, the other true edges in ``g`` are filtered out of the
+            candidates of each positive edge. Default: None.
+        chunk_size : int
+            Number of candidates scored at a time.
+            Default: ``LP_FULL_CANDIDATE_CHUNK_SIZE``.
+        query_batch_size : int
+            Number of positive edges scored at a time.
+            Default: ``LP_FULL_CANDIDATE_QUERY_BATCH_SIZE``.
+
+        Returns
+        -------
+        tuple of th.Tensor
+            The rankings of the positive edges and their candidate list sizes.
+    """
+    chunk_size = LP_FULL_CANDIDATE_CHUNK_SIZE if chunk_size is None else chunk_size
+    query_batch_size = LP_FULL_CANDIDATE_QUERY_BATCH_SIZE \
+        if query_batch_size is None else query_batch_size
+    utype, _, vtype = canonical_etype
+    num_queries = len(pos_src)
+    num_cands = emb[vtype].shape[0]
+    ex_query, ex_cand, cand_sizes = _get_excluded_candidates(
+        pos_src, pos_dst, num_cands, g, canonical_etype)
+
+    use_matmul = isinstance(decoder, (LinkPredictDotDecoder, LinkPredictDistMultDecoder))
+    if use_matmul:
+        rel_emb = None
+        if isinstance(decoder, LinkPredictDistMultDecoder):
+            rid = decoder.etype2rid[canonical_etype]
+            rel_emb = decoder.get_relembs()[0][rid].to(device)
+        queries, pos_scores = [], []
+        for start in range(0, num_queries, query_batch_size):
+            end = min(start + query_batch_size, num_queries)
+            query = emb[utype][pos_src[start:end]].to(device)
+            if rel_emb is not None:
+                query = query * rel_emb
+            queries.append(query)
+            pos_scores.append(th.sum(query * emb[vtype][pos_dst[start:end]].to(device), dim=-1))
+        queries = th.cat(queries)
+        pos_scores = th.cat(pos_scores)
+
+    counts = th.zeros(num_queries, dtype=th.long, device=device)
+    ex_start = 0
+    for cand_start in range(0, num_cands, chunk_size):
+        cand_end = min(cand_start + chunk_size, num_cands)
+        cand_emb = emb[vtype][th.arange(cand_start, cand_end)].to(device)
+        ex_end = int(th.searchsorted(ex_cand, th.tensor([cand_end]))[0])
+        chunk_ex_query = ex_query[ex_start:ex_end]
+        chunk_ex_cand = ex_cand[ex_start:ex_end] - cand_start
+        ex_start = ex_end
+        for start in range(0, num_queries, query_batch_size):
+            end = min(start + query_batch_size, num_queries)
+            if use_matmul:
+                pos_score = pos_scores[start:end]
+                scores = th.matmul(queries[start:end], cand_emb.t())
+            else:
+                pos_score, scores = _calc_joint_scores(
+                    decoder, emb, canonical_etype, pos_src[start:end],
+                    pos_dst[start:end], cand_emb, device)
+            in_batch = (chunk_ex_query >= start) & (chunk_ex_query < end)
+            scores[(chunk_ex_query[in_batch] - start).to(scores.device),
+                   chunk_ex_cand[in_batch].to(scores.device)] = -th.inf
+            counts[start:end] += count_higher_scores(pos_score, scores).to(counts.device)
+
+    rankings = counts + 1
+    cand_sizes = cand_sizes.to(rankings.device)
+    if is_distributed() and get_backend() == "gloo":
+        rankings = rankings.cpu()
+        cand_sizes = cand_sizes.cpu()
+    return rankings, cand_sizes
+
+def _calc_joint_scores(decoder, emb, canonical_etype, pos_src, pos_dst, cand_emb, device):
+    """ Score positive edges against a chunk of candidates with the joint negative
+        sampling path of a decoder.
+    """
+    utype, _, vtype = canonical_etype
+    num_pos = len(pos_src)
+    src_emb = emb[utype][pos_src].to(device)
+    dst_emb = emb[vtype][pos_dst].to(device)
+    if utype == vtype:
+        local_emb = {utype: th.cat([src_emb, dst_emb, cand_emb])}
+        dst_offset = num_pos
+    else:
+        local_emb = {utype: src_emb, vtype: th.cat([dst_emb, cand_emb])}
+        dst_offset = 0
+    pos_neg_tuple = {canonical_etype: (
+        th.arange(num_pos),
+        None,
+        th.arange(num_pos) + dst_offset,
+        th.arange(cand_emb.shape[0]) + dst_offset + num_pos)}
+    score = decoder.calc_test_scores(
+        local_emb, pos_neg_tuple, BUILTIN_LP_JOINT_NEG_SAMPLER, device)
+    return score[canonical_etype]
@@ -54,9 +54,19 @@ class GLEMOptimizer(GSOptimizer):
             # can be performed correctly.
             self._clear_traces()
 
-    def step(self, optimize_sparse_params=True):
+    def step(self, grad_scaler=None, optimize_sparse_params=True):
         """ Moving the optimizer
+
+        Parameters
+        ----------
+        grad_scaler: torch.amp.GradScaler
+            The gradient scaler used in fp16 training. GLEM does not support
+            gradient scaling, so it must be None. Default: None.
+        optimize_sparse_params: bool
+            Whether to update the sparse embedding parameters. Default: True.
         """
+        assert grad_scaler is None, \
+            "GLEM does not support gradient scaling."
         all_opts = self.dense_opts + self.lm_opts
         if optimize_sparse_params:
             all_opts += self.sparse_opts
@@ -22,7 +22,7 @@ import torch as th
 
 from .gnn import GSgnnModel, GSgnnModelBase
 from .gnn_encoder_base import prepare_for_wholegraph
-from .utils import append_to_dict
+from .utils import append_to_dict, to_full_precision
 from ..utils import is_distributed, get_rank, is_wholegraph
 
 class GSgnnNodeModelInterface:
@@ -436,9 +436,9 @@ def run_node_mini_batch_predict(decoder, emb, loader, device,
                 else:
                     pred = decoder.predict(emb[ntype][seed_nodes].to(device))
                 if ntype in preds:
-                    preds[ntype].append(pred.cpu())
+                    preds[ntype].append(to_full_precision(pred).cpu())
                 else:
-                    preds[ntype] = [pred.cpu()]
+                    preds[ntype] = [to_full_precision(pred).cpu()]
                 if return_label:
                     label_field = loader.label_field
                     lbl = data.get_node_feats(seeds, label_field)
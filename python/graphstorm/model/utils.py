@@ -20,6 +20,7 @@ import math
 import json
 import shutil
 import logging
+from contextlib import nullcontext
 
 import torch as th
 from torch import nn
@@ -29,6 +30,9 @@ from torch.nn.parallel import DistributedDataParallel
 import dgl
 
 from ..config import GRAPHSTORM_LP_EMB_L2_NORMALIZATION
+from ..config import (BUILTIN_PRECISION_FP32,
+                      BUILTIN_PRECISION_FP16,
+                      BUILTIN_PRECISIONS)
 from ..gconstruct.file_io import stream_dist_tensors_to_hdf5
 from ..utils import (
     get_rank,
@@ -63,6 +67,28 @@ def pad_file_index(file_index, width=5):
     assert width > 1, "Width should be larger than 1"
     return str(file_index).zfill(width)
 
+def precision_autocast(device, precision=BUILTIN_PRECISION_FP32):
+    """ Get the autocast context of the given precision.
+
+        Parameters
+        ----------
+        device: torch.device or str
+            The device where the computation runs.
+        precision: str
+            One of ``fp32``, ``fp16`` and ``bf16``.
+
+        Returns
+        -------
+        A context manager that runs the computation under ``torch.autocast`` with
+        the given precision, or a no-op context manager for ``fp32``.
+    """
+    assert precision in BUILTIN_PRECISIONS, \
+        f"precision must be one of {BUILTIN_PRECISIONS}, but get {precision}."
+    if precision == BUILTIN_PRECISION_FP32:
+        return nullcontext()
+    dtype = th.float16 if precision == BUILTIN_PRECISION_FP16 else th.bfloat16
+    return th.autocast(device_type=th.device(device).type, dtype=dtype)
+
 def sparse_emb_initializer(emb):
     """ Initialize sparse embedding
 
@@ -2009,9 +2035,26 @@ def append_to_dict(from_dict, to_dict):
     """
     for k, v in from_dict.items():
         if k in to_dict:
-            to_dict[k].append(v.cpu())
+            to_dict[k].append(to_full_precision(v).cpu())
         else:
-            to_dict[k] = [v.cpu()]
+            to_dict[k] = [to_full_precision(v).cpu()]
+
+def to_full_precision(tensor):
+    """ Cast a tensor computed in fp16 or bf16, e.g., under autocast, to fp32.
+
+        Parameters
+        ----------
+        tensor: th.Tensor
+            The input tensor.
+
+        Returns
+        -------
+        th.Tensor: The fp32 tensor if the input is in fp16 or bf16. Otherwise,
+        the input tensor.
+    """
+    if tensor.dtype in [th.float16, th.bfloat16]:
+        return tensor.to(th.float32)
+    return tensor
 
 def normalize_node_embs(embs, norm_method):
     """ Do node embedding normalization
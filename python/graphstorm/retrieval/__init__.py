@@ -0,0 +1,27 @@
+"""
+    Copyright 2023 Contributors
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Package initialization to load retrieval functions and classes
+"""
+from .ann_index import (GSAnnIndex,
+                        build_ann_indexes,
+                        load_node_embeddings,
+                        load_relation_embeddings)
+from .ann_index import (BUILTIN_ANN_INDEX_FLAT,
+                        BUILTIN_ANN_INDEX_HNSW,
+                        BUILTIN_ANN_INDEX_IVFPQ,
+                        BUILTIN_ANN_INDEX_TYPES,
+                        SUPPORTED_ANN_DECODERS,
+                        ANN_INDEX_DIR)
@@ -0,0 +1,523 @@
+"""
+    Copyright 2023 Contributors
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Approximate nearest neighbor (ANN) indexes on saved node embeddings
+    for link prediction retrieval.
+"""
+import ast
+import importlib
+import json
+import logging
+import math
+import os
+
+import numpy as np
+import torch as th
+
+from ..config.config import (BUILTIN_LP_DOT_DECODER,
+                             BUILTIN_LP_DISTMULT_DECODER,
+                             BUILTIN_LP_ROTATE_DECODER,
+                             BUILTIN_LP_TRANSE_L1_DECODER,
+                             BUILTIN_LP_TRANSE_L2_DECODER)
+from ..gconstruct.file_io import read_data_parquet
+from ..gconstruct.remap_result import GS_REMAP_NID_COL, GS_REMAP_EMBED_COL
+
+BUILTIN_ANN_INDEX_FLAT = "flat"
+BUILTIN_ANN_INDEX_HNSW = "hnsw"
+BUILTIN_ANN_INDEX_IVFPQ = "ivfpq"
+BUILTIN_ANN_INDEX_TYPES = [BUILTIN_ANN_INDEX_FLAT,
+                           BUILTIN_ANN_INDEX_HNSW,
+                           BUILTIN_ANN_INDEX_IVFPQ]
+
+SUPPORTED_ANN_DECODERS = [BUILTIN_LP_DOT_DECODER,
+                          BUILTIN_LP_DISTMULT_DECODER,
+                          BUILTIN_LP_ROTATE_DECODER,
+                          BUILTIN_LP_TRANSE_L1_DECODER,
+                          BUILTIN_LP_TRANSE_L2_DECODER]
+
+ANN_INDEX_DIR = "ann_index"
+ANN_INDEX_META_FILE = "index_meta.json"
+ANN_INDEX_FAISS_FILE = "index.faiss"
+ANN_INDEX_NID_FILE = "node_ids.npy"
+ANN_INDEX_EMB_FILE = "emb.npy"
+
+# Maximum number of score entries computed at a time by the exact scorers.
+ANN_SCORE_BLOCK_SIZE = 1 << 24
+
+def _import_faiss():
+    """ Import faiss, which is only needed by the HNSW and IVF-PQ indexes.
+    """
+    try:
+        return importlib.import_module("faiss")
+    except ImportError as err:
+        msg = ("HNSW and IVF-PQ indexes require faiss to run. "
+               "Please install the faiss-cpu Python package "
+               f"or use the {BUILTIN_ANN_INDEX_FLAT} index.")
+        raise ImportError(msg) from err
+
+def load_node_embeddings(embed_path, ntype):
+    """ Load the saved embeddings of a node type.
+
+    Both the embeddings saved by GraphStorm inference, i.e.,
+    ``embed-*.pt`` with optional ``embed_nids-*.pt``, and the embeddings remapped
+    into parquet files by ``graphstorm.gconstruct.remap_result``, i.e.,
+    ``embed-*.parquet``, are supported.
+
+    Parameters
+    ----------
+    embed_path: str
+        The path where the node embeddings are saved.
+    ntype: str
+        The node type.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The node IDs and the embeddings in float32.
+    """
+    emb_dir = os.path.join(embed_path, ntype)
+    fnames = os.listdir(emb_dir)
+    pt_files = sorted(fname for fname in fnames \
+                      if fname.startswith("embed-") and fname.endswith(".pt"))
+    nid_files = sorted(fname for fname in fnames \
+                       if fname.startswith("embed_nids-") and fname.endswith(".pt"))
+    parquet_files = sorted(fname for fname in fnames \
+                           if fname.startswith("embed-") and fname.endswith(".parquet"))
+
+    if len(pt_files) > 0:
+        embs = [th.load(os.path.join(emb_dir, fname)).float().numpy() for fname in pt_files]
+        embs = np.concatenate(embs)
+        if len(nid_files) > 0:
+            assert len(nid_files) == len(pt_files), \
+                "Number of nid files must match number of embedding files. " \
+                f"But get {len(nid_files)} and {len(pt_files)}."
+            nids = np.concatenate([th.load(os.path.join(emb_dir, fname)).numpy() \
+                                   for fname in nid_files])
+        else:
+            # Embeddings saved without node IDs are stored in node ID order.
+            nids = np.arange(len(embs))
+    elif len(parquet_files) > 0:
+        nids, embs = [], []
+        for fname in parquet_files:
+            data = read_data_parquet(os.path.join(emb_dir, fname),
+                                     [GS_REMAP_NID_COL, GS_REMAP_EMBED_COL])
+            if data is None:
+                continue
+            nids.append(data[GS_REMAP_NID_COL])
+            embs.append(data[GS_REMAP_EMBED_COL].astype(np.float32))
+        nids = np.concatenate(nids)
+        embs = np.concatenate(embs)
+        if nids.dtype.hasobject:
+            nids = nids.astype(str)
+    else:
+        raise RuntimeError(f"No node embeddings of {ntype} are found under {emb_dir}.")
+    return nids, np.ascontiguousarray(embs, dtype=np.float32)
+
+def load_relation_embeddings(embed_path):
+    """ Load the relation embeddings saved by ``save_relation_embeddings``.
+
+    Parameters
+    ----------
+    embed_path: str
+        The path where the embeddings are saved.
+
+    Returns
+    -------
+    dict of numpy.ndarray
+        The relation embeddings in the format of {(src_ntype, etype, dst_ntype): emb}.
+    """
+    rel_embs = th.load(os.path.join(embed_path, "rel_emb.pt")).float().numpy()
+    with open(os.path.join(embed_path, "relation2id_map.json"), "r", encoding="utf-8") as f:
+        et2id_map = json.load(f)
+    return {ast.literal_eval(etype): rel_embs[rid] for etype, rid in et2id_map.items()}
+
+class GSAnnIndex:
+    """ ANN index on the embeddings of one node type for link prediction retrieval.
+
+    The index retrieves the destination nodes with the highest link prediction
+    scores for a batch of source node embeddings. The queries are transformed
+    according to the decoder, so that the index search matches the score function:
+
+    * ``dot_product`` and ``distmult`` search by inner product with the source
+      embedding (multiplied by the relation embedding for DistMult).
+    * ``transe_l1`` and ``transe_l2`` search by L1 or L2 distance to the source
+      embedding translated by the relation embedding.
+    * ``rotate`` searches by L2 distance to the rotated source embedding and
+      re-ranks the candidates with the exact RotatE score.
+
+    The candidates returned by an approximate index can be re-ranked with the
+    exact decoder score by fetching ``rerank_factor`` times more candidates.
+
+    Parameters
+    ----------
+    node_ids: numpy.ndarray
+        The IDs of the indexed nodes.
+    embs: numpy.ndarray
+        The embeddings of the indexed nodes.
+    index_type: str
+        The index type, one of ``flat``, ``hnsw`` and ``ivfpq``.
+    decoder_type: str
+        The link prediction decoder the embeddings are trained with.
+    gamma: float
+        The gamma of the TransE and RotatE decoders. Default: 12.
+    index: faiss.Index
+        The faiss index. It is None for the ``flat`` index. Default: None.
+    params: dict
+        Index construction and search parameters. Default: None.
+    """
+    def __init__(self, node_ids, embs, index_type, decoder_type,
+                 gamma=12., index=None, params=None):
+        assert index_type in BUILTIN_ANN_INDEX_TYPES, \
+            f"Unknown index type {index_type}, supported: {BUILTIN_ANN_INDEX_TYPES}"
+        assert decoder_type in SUPPORTED_ANN_DECODERS, \
+            f"Unknown decoder type {decoder_type}, supported: {SUPPORTED_ANN_DECODERS}"
+        assert len(node_ids) == len(embs), \
+            f"Got {len(node_ids)} node IDs but {len(embs)} embeddings."
+        self._node_ids = node_ids
+        self._embs = embs
+        self._index_type = index_type
+        self._decoder_type = decoder_type
+        self._gamma = gamma
+        self._index = index
+        self._params = {} if params is None else params
+
+    @classmethod
+    def build(cls, node_ids, embs, index_type=BUILTIN_ANN_INDEX_HNSW,
+              decoder_type=BUILTIN_LP_DOT_DECODER, gamma=12., **params):
+        """ Build an index on node embeddings.
+
+        Parameters
+        ----------
+        node_ids: numpy.ndarray
+            The IDs of the indexed nodes.
+        embs: numpy.ndarray
+            The embeddings of the indexed nodes.
+        index_type: str
+            The index type, one of ``flat``, ``hnsw`` and ``ivfpq``. Default: ``hnsw``.
+        decoder_type: str
+            The link prediction decoder. Default: ``dot_product``.
+        gamma: float
+            The gamma of the TransE and RotatE decoders. Default: 12.
+        params:
+            ``hnsw_m`` and ``ef_construction`` for HNSW, ``nlist``, ``pq_m`` and
+            ``nbits`` for IVF-PQ.
+
+        Returns
+        -------
+        GSAnnIndex: The index.
+        """
+        embs = np.ascontiguousarray(embs, dtype=np.float32)
+        index = None
+        if index_type != BUILTIN_ANN_INDEX_FLAT:
+            faiss = _import_faiss()
+            metric = cls._get_faiss_metric(faiss, decoder_type, index_type)
+            num_nodes, dim = embs.shape
+            if index_type == BUILTIN_ANN_INDEX_HNSW:
+                params.setdefault("hnsw_m", 32)
+                params.setdefault("ef_construction", 200)
+                index = faiss.IndexHNSWFlat(dim, params["hnsw_m"], metric)
+                index.hnsw.efConstruction = params["ef_construction"]
+            else:
+                # Keep at least 39 training points per centroid as faiss suggests.
+                params.setdefault("nlist", max(1, min(int(4 * math.sqrt(num_nodes)),
+                                                      num_nodes // 39)))
+                params.setdefault("pq_m", next(m for m in (64, 32, 16, 8, 4, 2, 1) \
+                                               if dim % m == 0 and dim // m >= 2 or m == 1))
+                params.setdefault("nbits", max(1, min(8, int(math.log2(max(num_nodes, 2))))))
+                quantizer = faiss.IndexFlatIP(dim) \
+                    if metric == faiss.METRIC_INNER_PRODUCT else faiss.IndexFlatL2(dim)
+                index = faiss.IndexIVFPQ(quantizer, dim, params["nlist"],
+                                         params["pq_m"], params["nbits"], metric)
+                train_size = min(num_nodes, max(params["nlist"] * 256, 65536))
+                train_idx = np.random.permutation(num_nodes)[:train_size]
+                index.train(embs[train_idx])
+            index.add(embs)
+        logging.debug("Built %s index on %d embeddings for %s decoder.",
+                      index_type, len(embs), decoder_type)
+        return cls(node_ids, embs, index_type, decoder_type, gamma, index, params)
+
+    @staticmethod
+    def _get_faiss_metric(faiss, decoder_type, index_type):
+        """ Get the faiss metric matching the decoder score function.
+        """
+        if decoder_type in [BUILTIN_LP_DOT_DECODER, BUILTIN_LP_DISTMULT_DECODER]:
+            return faiss.METRIC_INNER_PRODUCT
+        if decoder_type == BUILTIN_LP_TRANSE_L1_DECODER \
+            and index_type == BUILTIN_ANN_INDEX_HNSW:
+            return faiss.METRIC_L1
+        # IVF-PQ only supports L2 and inner product. The L1 TransE and RotatE
+        # candidates are re-ranked with the exact score.
+        return faiss.METRIC_L2
+
+    def save(self, path):
+        """ Save the index into a directory.
+
+        Parameters
+        ----------
+        path: str
+            The directory to save the index.
+        """
+        os.makedirs(path, exist_ok=True)
+        meta = {
+            "index_type": self._index_type,
+            "decoder_type": self._decoder_type,
+            "gamma": self._gamma,
+            "num_nodes": len(self._node_ids),
+            "emb_dim": self._embs.shape[1],
+            "params": self._params,
+        }
+        with open(os.path.join(path, ANN_INDEX_META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=4)
+        np.save(os.path.join(path, ANN_INDEX_NID_FILE), self._node_ids)
+        # The embeddings are used by the flat search and the exact re-ranking.
+        np.save(os.path.join(path, ANN_INDEX_EMB_FILE), self._embs)
+        if self._index is not None:
+            _import_faiss().write_index(self._index, os.path.join(path, ANN_INDEX_FAISS_FILE))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """ Load an index saved by ``save``.
+
+        Parameters
+        ----------
+        path: str
+            The directory of the index.
+        mmap: bool
+            Whether to memory-map the embeddings instead of reading them into memory.
+            Default: True.
+
+        Returns
+        -------
+        GSAnnIndex: The index.
+        """
+        with open(os.path.join(path, ANN_INDEX_META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        node_ids = np.load(os.path.join(path, ANN_INDEX_NID_FILE))
+        embs = np.load(os.path.join(path, ANN_INDEX_EMB_FILE),
+                       mmap_mode="r" if mmap else None)
+        index = None
+        if meta["index_type"] != BUILTIN_ANN_INDEX_FLAT:
+            index = _import_faiss().read_index(os.path.join(path, ANN_INDEX_FAISS_FILE))
+        return cls(node_ids, embs, meta["index_type"], meta["decoder_type"],
+                   meta["gamma"], index, meta["params"])
+
+    @property
+    def node_ids(self):
+        """ The IDs of the indexed nodes.
+        """
+        return self._node_ids
+
+    @property
+    def index_type(self):
+        """ The index type.
+        """
+        return self._index_type
+
+    @property
+    def decoder_type(self):
+        """ The link prediction decoder the index serves.
+        """
+        return self._decoder_type
+
+    def transform_query(self, src_embs, rel_emb=None):
+        """ Transform source node embeddings into query vectors.
+
+        Parameters
+        ----------
+        src_embs: numpy.ndarray
+            The source node embeddings in the shape of (N, D).
+        rel_emb: numpy.ndarray
+            The relation embedding of the edge type. It is required by all the
+            decoders except ``dot_product``. Default: None.
+
+        Returns
+        -------
+        numpy.ndarray: The query vectors in the shape of (N, D).
+        """
+        src_embs = np.asarray(src_embs, dtype=np.float32)
+        if self._decoder_type == BUILTIN_LP_DOT_DECODER:
+            return src_embs
+        assert rel_emb is not None, \
+            f"The {self._decoder_type} decoder requires the relation embedding."
+        rel_emb = np.asarray(rel_emb, dtype=np.float32)
+        if self._decoder_type == BUILTIN_LP_DISTMULT_DECODER:
+            return src_embs * rel_emb
+        if self._decoder_type in [BUILTIN_LP_TRANSE_L1_DECODER, BUILTIN_LP_TRANSE_L2_DECODER]:
+            return src_embs + rel_emb
+        # RotatE, see graphstorm.eval.utils.calc_rotate_pos_score
+        rel_emb_init = self._gamma / rel_emb.shape[-1]
+        phase_rel = rel_emb / (rel_emb_init / math.pi)
+        real_rel, imag_rel = np.cos(phase_rel), np.sin(phase_rel)
+        real_head, imag_head = np.split(src_embs, 2, axis=-1)
+        return np.concatenate([real_head * real_rel - imag_head * imag_rel,
+                               real_head * imag_rel + imag_head * real_rel], axis=-1)
+
+    def _score(self, queries, cand_embs):
+        """ Compute the exact decoder scores between transformed queries and
+            candidates in broadcastable shapes of (..., D).
+        """
+        if self._decoder_type in [BUILTIN_LP_DOT_DECODER, BUILTIN_LP_DISTMULT_DECODER]:
+            return np.sum(queries * cand_embs, axis=-1)
+        diff = queries - cand_embs
+        if self._decoder_type == BUILTIN_LP_TRANSE_L1_DECODER:
+            return self._gamma - np.sum(np.abs(diff), axis=-1)
+        if self._decoder_type == BUILTIN_LP_TRANSE_L2_DECODER:
+            return self._gamma - np.sqrt(np.sum(diff * diff, axis=-1))
+        real_diff, imag_diff = np.split(diff, 2, axis=-1)
+        return self._gamma - np.sum(np.sqrt(real_diff ** 2 + imag_diff ** 2), axis=-1)
+
+    def _flat_search(self, queries, k):
+        """ Exact top-k search that scans the candidates block by block and keeps
+            a running top-k instead of full score rows.
+        """
+        num_queries, dim = queries.shape
+        num_nodes = len(self._embs)
+        best_scores = np.full((num_queries, 0), -np.inf, dtype=np.float32)
+        best_idx = np.zeros((num_queries, 0), dtype=np.int64)
+        inner_product = self._decoder_type in [BUILTIN_LP_DOT_DECODER,
+                                               BUILTIN_LP_DISTMULT_DECODER]
+        block = max(1, ANN_SCORE_BLOCK_SIZE // (num_queries * (1 if inner_product else dim)))
+        for start in range(0, num_nodes, block):
+            end = min(start + block, num_nodes)
+            cand_embs = np.asarray(self._embs[start:end])
+            if inner_product:
+                scores = queries @ cand_embs.T
+            else:
+                scores = self._score(queries[:, None, :], cand_embs[None, :, :])
+            scores = np.concatenate([best_scores, scores.astype(np.float32)], axis=1)
+            idx = np.concatenate(
+                [best_idx, np.broadcast_to(np.arange(start, end), (num_queries, end - start))],
+                axis=1)
+            if scores.shape[1] > k:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, top, axis=1)
+                idx = np.take_along_axis(idx, top, axis=1)
+            best_scores, best_idx = scores, idx
+        return best_scores, best_idx
+
+    def _index_search(self, queries, k, nprobe=None, ef_search=None):
+        """ Search the faiss index.
+        """
+        if self._index_type == BUILTIN_ANN_INDEX_HNSW:
+            self._index.hnsw.efSearch = ef_search if ef_search is not None \
+                else max(2 * k, 64)
+        else:
+            self._index.nprobe = nprobe if nprobe is not None \
+                else max(1, self._params["nlist"] // 16)
+        _, idx = self._index.search(np.ascontiguousarray(queries), k)
+        return idx
+
+    def query(self, src_embs, k, rel_emb=None, rerank_factor=None,
+              batch_size=4096, nprobe=None, ef_search=None):
+        """ Retrieve the top-k destination nodes for a batch of source node embeddings.
+
+        Parameters
+        ----------
+        src_embs: numpy.ndarray
+            The source node embeddings in the shape of (N, D).
+        k: int
+            The number of destination nodes to retrieve for each source node.
+        rel_emb: numpy.ndarray
+            The relation embedding of the edge type. Default: None.
+        rerank_factor: int
+            Retrieve ``k * rerank_factor`` candidates from an approximate index
+            and re-rank them with the exact decoder score. Default: 4 for IVF-PQ
+            indexes and the RotatE decoder, 1 otherwise.
+        batch_size: int
+            Number of queries searched at a time. Default: 4096.
+        nprobe: int
+            Number of IVF lists probed by an IVF-PQ index.
+            Default: 1/16 of the lists.
+        ef_search: int
+            The search depth of an HNSW index. Default: max(2k, 64).
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The scores and the node IDs of the retrieved nodes in the shape of (N, k),
+            sorted by descending score. Missing results of an approximate index have
+            the score of -inf.
+        """
+        queries = self.transform_query(src_embs, rel_emb)
+        k = min(k, len(self._node_ids))
+        if rerank_factor is None:
+            rerank_factor = 4 if self._index_type == BUILTIN_ANN_INDEX_IVFPQ \
+                or self._decoder_type == BUILTIN_LP_ROTATE_DECODER else 1
+        num_cands = min(k * rerank_factor, len(self._node_ids))
+
+        all_scores, all_idx = [], []
+        for start in range(0, len(queries), batch_size):
+            batch = queries[start:start + batch_size]
+            if self._index is None:
+                scores, idx = self._flat_search(batch, k)
+            else:
+                idx = self._index_search(batch, num_cands, nprobe, ef_search)
+                # Re-score the candidates with the exact decoder score.
+                cand_embs = np.asarray(self._embs[np.maximum(idx, 0).reshape(-1)])
+                cand_embs = cand_embs.reshape(idx.shape[0], idx.shape[1], -1)
+                scores = self._score(batch[:, None, :], cand_embs).astype(np.float32)
+                scores[idx < 0] = -np.inf
+            order = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+            all_scores.append(np.take_along_axis(scores, order, axis=1))
+            all_idx.append(np.take_along_axis(idx, order, axis=1))
+        scores = np.concatenate(all_scores)
+        idx = np.concatenate(all_idx)
+        return scores, self._node_ids[np.maximum(idx, 0)]
+
+def build_ann_indexes(embed_path, ntypes=None, index_type=BUILTIN_ANN_INDEX_HNSW,
+                      decoder_type=BUILTIN_LP_DOT_DECODER, gamma=12., output_path=None,
+                      **params):
+    """ Build and save an ANN index for each node type with saved embeddings.
+
+    The index of node type ``ntype`` is saved in ``<output_path>/<ntype>/ann_index``,
+    i.e., next to the embeddings when ``output_path`` is not given.
+
+    Parameters
+    ----------
+    embed_path: str
+        The path where the node embeddings are saved.
+    ntypes: list of str
+        The node types to index. Default: all the node types under ``embed_path``.
+    index_type: str
+        The index type. Default: ``hnsw``.
+    decoder_type: str
+        The link prediction decoder. Default: ``dot_product``.
+    gamma: float
+        The gamma of the TransE and RotatE decoders. Default: 12.
+    output_path: str
+        The path to save the indexes. Default: ``embed_path``.
+    params:
+        Index construction parameters passed to ``GSAnnIndex.build``.
+
+    Returns
+    -------
+    dict of str: The paths of the saved indexes in the format of {ntype: path}.
+    """
+    output_path = embed_path if output_path is None else output_path
+    if ntypes is None:
+        ntypes = [ntype for ntype in sorted(os.listdir(embed_path)) \
+                  if os.path.isdir(os.path.join(embed_path, ntype)) and \
+                  any(fname.startswith("embed-") \
+                      for fname in os.listdir(os.path.join(embed_path, ntype)))]
+    index_paths = {}
+    for ntype in ntypes:
+        nids, embs = load_node_embeddings(embed_path, ntype)
+        index = GSAnnIndex.build(nids, embs, index_type, decoder_type, gamma, **params)
+        index_path = os.path.join(output_path, ntype, ANN_INDEX_DIR)
+        index.save(index_path)
+        logging.info("Saved %s index of %d %s nodes to %s.",
+                     index_type, len(nids), ntype, index_path)
+        index_paths[ntype] = index_path
+    return index_paths
@@ -0,0 +1,86 @@
+"""
+    Copyright 2023 Contributors
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Entry point for building ANN indexes on saved node embeddings.
+
+    Run as:
+    python3 -m graphstorm.run.gs_build_ann_index <args>
+"""
+import argparse
+import logging
+
+from graphstorm.retrieval import (build_ann_indexes,
+                                  BUILTIN_ANN_INDEX_HNSW,
+                                  BUILTIN_ANN_INDEX_TYPES,
+                                  SUPPORTED_ANN_DECODERS)
+
+def main(args):
+    """ Main function
+    """
+    params = {}
+    for name in ["hnsw_m", "ef_construction", "nlist", "pq_m", "nbits"]:
+        if getattr(args, name) is not None:
+            params[name] = getattr(args, name)
+    build_ann_indexes(args.embed_path,
+                      ntypes=args.ntypes,
+                      index_type=args.index_type,
+                      decoder_type=args.decoder_type,
+                      gamma=args.gamma,
+                      output_path=args.output_path,
+                      **params)
+
+def generate_parser():
+    """ Generate an argument parser
+    """
+    parser = argparse.ArgumentParser("Build ANN indexes on node embeddings")
+    group = parser.add_argument_group(title="ann index")
+    group.add_argument("--embed-path", type=str, required=True,
+                       help="The directory storing the node embeddings, either saved "
+                            "by GraphStorm inference or remapped by remap_result.")
+    group.add_argument("--ntypes", type=str, nargs="+", default=None,
+                       help="The node types to index. By default, all the node types "
+                            "under --embed-path are indexed.")
+    group.add_argument("--index-type", type=str, default=BUILTIN_ANN_INDEX_HNSW,
+                       choices=BUILTIN_ANN_INDEX_TYPES,
+                       help="The index type.")
+    group.add_argument("--decoder-type", type=str, default=SUPPORTED_ANN_DECODERS[0],
+                       choices=SUPPORTED_ANN_DECODERS,
+                       help="The link prediction decoder used to train the embeddings.")
+    group.add_argument("--gamma", type=float, default=12.,
+                       help="The gamma of the TransE and RotatE decoders.")
+    group.add_argument("--output-path", type=str, default=None,
+                       help="The directory to save the indexes. "
+                            "By default, the indexes are saved next to the embeddings.")
+    group.add_argument("--hnsw-m", type=int, default=None,
+                       help="The number of neighbors of each node in an HNSW index.")
+    group.add_argument("--ef-construction", type=int, default=None,
+                       help="The construction search depth of an HNSW index.")
+    group.add_argument("--nlist", type=int, default=None,
+                       help="The number of IVF lists of an IVF-PQ index.")
+    group.add_argument("--pq-m", type=int, default=None,
+                       help="The number of PQ sub-quantizers of an IVF-PQ index.")
+    group.add_argument("--nbits", type=int, default=None,
+                       help="The number of bits per PQ code of an IVF-PQ index.")
+    group.add_argument("--logging-level", type=str, default="info",
+                       help="The logging level. The possible values: debug, info, warning, \
+                                   error. The default value is info.")
+    return parser
+
+if __name__ == "__main__":
+    ann_parser = generate_parser()
+    ann_args = ann_parser.parse_args()
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s",
+                        level=getattr(logging, ann_args.logging_level.upper(), None))
+    main(ann_args)
@@ -99,6 +99,8 @@ def main(config_args):
     # start to infer
     emb_generator = GSgnnEmbGenInferer(model)
     emb_generator.setup_device(device=get_device())
+    emb_generator.setup_precision(config.precision)
+    emb_generator.setup_infer_pipeline_depth(config.infer_pipeline_depth)
 
     if config.multi_tasks:
         # infer_ntypes = None means all node types.
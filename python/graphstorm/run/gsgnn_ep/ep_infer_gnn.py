@@ -60,6 +60,8 @@ def main(config_args):
     # TODO(zhengda) we should use a different way to get rank.
     infer = GSgnnEdgePredictionInferrer(model)
     infer.setup_device(device=get_device())
+    infer.setup_precision(config.precision)
+    infer.setup_infer_pipeline_depth(config.infer_pipeline_depth)
     if not config.no_validation:
         target_idxs = infer_data.get_edge_test_set(config.target_etype)
         evaluator = get_evaluator(config)
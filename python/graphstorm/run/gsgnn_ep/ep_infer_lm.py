@@ -56,6 +56,8 @@ def main(config_args):
                         model_layer_to_load=config.restore_model_layers)
     infer = GSgnnEdgePredictionInferrer(model)
     infer.setup_device(device=get_device())
+    infer.setup_precision(config.precision)
+    infer.setup_infer_pipeline_depth(config.infer_pipeline_depth)
     if not config.no_validation:
         target_idxs = infer_data.get_edge_test_set(config.target_etype)
         evaluator = get_evaluator(config)
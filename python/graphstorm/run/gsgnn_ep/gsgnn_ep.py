@@ -70,12 +70,16 @@ def main(config_args):
                            node_feat_field=config.node_feat_name,
                            edge_feat_field=config.edge_feat_name,
                            lm_feat_ntypes=get_lm_ntypes(config.node_lm_configs))
+    train_data.init_node_feat_cache(config.node_feat_cache_size,
+                                    config.node_feat_cache_policy)
     model = gs.create_builtin_edge_gnn_model(train_data.g, config, train_task=True)
     trainer = GSgnnEdgePredictionTrainer(model, topk_model_to_save=config.topk_model_to_save)
     if config.restore_model_path is not None:
         trainer.restore_model(model_path=config.restore_model_path,
                               model_layer_to_load=config.restore_model_layers)
     trainer.setup_device(device=get_device())
+    trainer.setup_precision(config.precision)
+    trainer.setup_infer_pipeline_depth(config.infer_pipeline_depth)
     if not config.no_validation:
         # TODO(zhengda) we need to refactor the evaluator.
         evaluator = get_evaluator(config)
@@ -151,7 +155,8 @@ def main(config_args):
                 save_perf_results_path=config.save_perf_results_path,
                 freeze_input_layer_epochs=config.freeze_lm_encoder_epochs,
                 max_grad_norm=config.max_grad_norm,
-                grad_norm_type=config.grad_norm_type)
+                grad_norm_type=config.grad_norm_type,
+                prefetch_depth=config.prefetch_depth)
 
     if config.save_embed_path is not None:
         assert config.edge_feat_name is None, 'GraphStorm edge prediction training command ' + \
@@ -169,7 +174,8 @@ def main(config_args):
         # For example pre-compute all BERT embeddings
         model.prepare_input_encoder(train_data)
         embeddings = do_full_graph_inference(model, train_data, fanout=config.eval_fanout,
-                                             task_tracker=tracker)
+                                             task_tracker=tracker,
+                                             pipeline_depth=config.infer_pipeline_depth)
         # only save node embeddings of nodes with node types from target_etype
         target_ntypes = set()
         for etype in config.target_etype:
@@ -47,6 +47,8 @@ def main(config_args):
         trainer.restore_model(model_path=config.restore_model_path,
                               model_layer_to_load=config.restore_model_layers)
     trainer.setup_device(device=get_device())
+    trainer.setup_precision(config.precision)
+    trainer.setup_infer_pipeline_depth(config.infer_pipeline_depth)
     if not config.no_validation:
         # TODO(zhengda) we need to refactor the evaluator.
         # Currently, we only support mrr
@@ -130,7 +132,8 @@ def main(config_args):
                 save_model_frequency=config.save_model_frequency,
                 save_perf_results_path=config.save_perf_results_path,
                 max_grad_norm=config.max_grad_norm,
-                grad_norm_type=config.grad_norm_type)
+                grad_norm_type=config.grad_norm_type,
+                prefetch_depth=config.prefetch_depth)
 
     if config.save_embed_path is not None:
         assert config.edge_feat_name is None, 'GraphStorm node prediction training command ' + \
@@ -149,7 +152,8 @@ def main(config_args):
         model.prepare_input_encoder(train_data)
         # TODO(zhengda) we may not want to only use training edges to generate GNN embeddings.
         embeddings = do_full_graph_inference(model, train_data, fanout=config.eval_fanout,
-                                             edge_mask="train_mask", task_tracker=tracker)
+                                             edge_mask="train_mask", task_tracker=tracker,
+                                             pipeline_depth=config.infer_pipeline_depth)
         save_full_node_embeddings(
             train_data.g,
             config.save_embed_path,
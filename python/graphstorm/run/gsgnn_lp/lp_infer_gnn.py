@@ -25,9 +25,13 @@ from graphstorm.eval import GSgnnLPEvaluator
 from graphstorm.dataloading import GSgnnData
 from graphstorm.dataloading import (GSgnnLinkPredictionTestDataLoader,
                                     GSgnnLinkPredictionJointTestDataLoader,
-                                    GSgnnLinkPredictionPredefinedTestDataLoader)
+                                    GSgnnLinkPredictionPredefinedTestDataLoader,
+                                    GSgnnLinkPredictionFullTestDataLoader,
+                                    GSgnnLinkPredictionFilteredFullTestDataLoader)
 from graphstorm.dataloading import BUILTIN_LP_UNIFORM_NEG_SAMPLER
 from graphstorm.dataloading import BUILTIN_LP_JOINT_NEG_SAMPLER
+from graphstorm.dataloading import (BUILTIN_LP_FULL_NEG_SAMPLER,
+                                    BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER)
 from graphstorm.utils import (
     get_device,
     get_lm_ntypes,
@@ -56,6 +60,8 @@ def main(config_args):
                         model_layer_to_load=config.restore_model_layers)
     infer = GSgnnLinkPredictionInferrer(model)
     infer.setup_device(device=get_device())
+    infer.setup_precision(config.precision)
+    infer.setup_infer_pipeline_depth(config.infer_pipeline_depth)
     assert all((x.startswith(SUPPORTED_HIT_AT_METRICS)
                 or x in SUPPORTED_LINK_PREDICTION_METRICS)
                 for x in config.eval_metric), (
@@ -86,10 +92,15 @@ def main(config_args):
             test_dataloader_cls = GSgnnLinkPredictionTestDataLoader
         elif config.eval_negative_sampler == BUILTIN_LP_JOINT_NEG_SAMPLER:
             test_dataloader_cls = GSgnnLinkPredictionJointTestDataLoader
+        elif config.eval_negative_sampler == BUILTIN_LP_FULL_NEG_SAMPLER:
+            test_dataloader_cls = GSgnnLinkPredictionFullTestDataLoader
+        elif config.eval_negative_sampler == BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER:
+            test_dataloader_cls = GSgnnLinkPredictionFilteredFullTestDataLoader
         else:
             raise ValueError('Unknown test negative sampler.'
                 'Supported test negative samplers include '
-                f'[{BUILTIN_LP_UNIFORM_NEG_SAMPLER}, {BUILTIN_LP_JOINT_NEG_SAMPLER}]')
+                f'[{BUILTIN_LP_UNIFORM_NEG_SAMPLER}, {BUILTIN_LP_JOINT_NEG_SAMPLER}, '
+                f'{BUILTIN_LP_FULL_NEG_SAMPLER}, {BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER}]')
 
         dataloader = test_dataloader_cls(infer_data, infer_idxs,
             batch_size=config.eval_batch_size,
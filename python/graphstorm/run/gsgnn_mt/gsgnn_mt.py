@@ -367,6 +367,8 @@ def main(config_args):
                            node_feat_field=config.node_feat_name,
                            edge_feat_field=config.edge_feat_name,
                            lm_feat_ntypes=get_lm_ntypes(config.node_lm_configs))
+    train_data.init_node_feat_cache(config.node_feat_cache_size,
+                                    config.node_feat_cache_policy)
     model = GSgnnMultiTaskSharedEncoderModel(config.alpha_l2norm)
     gs.gsf.set_encoder(model, train_data.g, config, train_task=True)
 
@@ -432,6 +434,8 @@ def main(config_args):
         trainer.restore_model(model_path=config.restore_model_path,
                               model_layer_to_load=config.restore_model_layers)
     trainer.setup_device(device=get_device())
+    trainer.setup_precision(config.precision)
+    trainer.setup_infer_pipeline_depth(config.infer_pipeline_depth)
 
     # Preparing input layer for training or inference.
     # The input layer can pre-compute node features in the preparing step if needed.
@@ -460,7 +464,8 @@ def main(config_args):
                 save_perf_results_path=config.save_perf_results_path,
                 freeze_input_layer_epochs=config.freeze_lm_encoder_epochs,
                 max_grad_norm=config.max_grad_norm,
-                grad_norm_type=config.grad_norm_type)
+                grad_norm_type=config.grad_norm_type,
+                prefetch_depth=config.prefetch_depth)
 
     if config.save_embed_path is not None:
         # Save node embeddings
@@ -490,7 +495,8 @@ def main(config_args):
         model.prepare_input_encoder(train_data)
 
         embeddings = do_full_graph_inference(model, train_data, fanout=config.eval_fanout,
-                                             task_tracker=tracker)
+                                             task_tracker=tracker,
+                                             pipeline_depth=config.infer_pipeline_depth)
 
         # Save the original embs first
         save_full_node_embeddings(
@@ -33,9 +33,13 @@ from graphstorm.dataloading import (GSgnnNodeDataLoader,
                                     GSgnnMultiTaskDataLoader)
 from graphstorm.dataloading import (GSgnnLinkPredictionTestDataLoader,
                                     GSgnnLinkPredictionJointTestDataLoader,
-                                    GSgnnLinkPredictionPredefinedTestDataLoader)
+                                    GSgnnLinkPredictionPredefinedTestDataLoader,
+                                    GSgnnLinkPredictionFullTestDataLoader,
+                                    GSgnnLinkPredictionFilteredFullTestDataLoader)
 from graphstorm.dataloading import BUILTIN_LP_UNIFORM_NEG_SAMPLER
 from graphstorm.dataloading import BUILTIN_LP_JOINT_NEG_SAMPLER
+from graphstorm.dataloading import (BUILTIN_LP_FULL_NEG_SAMPLER,
+                                    BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER)
 
 from graphstorm.model.multitask_gnn import GSgnnMultiTaskSharedEncoderModel
 from graphstorm.inference import GSgnnMultiTaskLearningInferrer
@@ -131,10 +135,15 @@ def create_task_infer_dataloader(task, config, infer_data):
                 test_dataloader_cls = GSgnnLinkPredictionTestDataLoader
             elif config.eval_negative_sampler == BUILTIN_LP_JOINT_NEG_SAMPLER:
                 test_dataloader_cls = GSgnnLinkPredictionJointTestDataLoader
+            elif config.eval_negative_sampler == BUILTIN_LP_FULL_NEG_SAMPLER:
+                test_dataloader_cls = GSgnnLinkPredictionFullTestDataLoader
+            elif config.eval_negative_sampler == BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER:
+                test_dataloader_cls = GSgnnLinkPredictionFilteredFullTestDataLoader
             else:
                 raise ValueError('Unknown test negative sampler.'
                     'Supported test negative samplers include '
-                    f'[{BUILTIN_LP_UNIFORM_NEG_SAMPLER}, {BUILTIN_LP_JOINT_NEG_SAMPLER}]')
+                    f'[{BUILTIN_LP_UNIFORM_NEG_SAMPLER}, {BUILTIN_LP_JOINT_NEG_SAMPLER}, '
+                    f'{BUILTIN_LP_FULL_NEG_SAMPLER}, {BUILTIN_LP_FULL_FILTERED_NEG_SAMPLER}]')
 
             return test_dataloader_cls(infer_data, infer_idxs,
                 batch_size=task_config.eval_batch_size,
@@ -296,6 +305,8 @@ def main(config_args):
                                             task_evaluators)
         infer.setup_evaluator(evaluator)
     infer.setup_device(device=get_device())
+    infer.setup_precision(config.precision)
+    infer.setup_infer_pipeline_depth(config.infer_pipeline_depth)
     infer.infer(infer_data,
                 predict_test_dataloader,
                 lp_test_dataloader,
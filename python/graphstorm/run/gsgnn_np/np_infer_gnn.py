@@ -60,6 +60,8 @@ def main(config_args):
                         model_layer_to_load=config.restore_model_layers)
     infer = GSgnnNodePredictionInferrer(model)
     infer.setup_device(device=get_device())
+    infer.setup_precision(config.precision)
+    infer.setup_infer_pipeline_depth(config.infer_pipeline_depth)
     if not config.no_validation:
         infer_idxs = infer_data.get_node_test_set(config.target_ntype)
         evaluator = get_evaluator(config)
@@ -25,6 +25,7 @@ from torch.nn.parallel import DistributedDataParallel
 from ..model.edge_gnn import edge_mini_batch_gnn_predict, edge_mini_batch_predict
 from ..model.edge_gnn import GSgnnEdgeModelInterface
 from ..model import do_full_graph_inference, GSgnnModelBase, GSgnnModel
+from ..dataloading import GSgnnPrefetchLoader, move_to_device
 from .gsgnn_trainer import GSgnnTrainer
 
 from ..utils import sys_tracker, rt_profiler, print_mem, get_rank
@@ -85,7 +86,8 @@ class GSgnnEdgePredictionTrainer(GSgnnTrainer):
             save_perf_results_path=None,
             freeze_input_layer_epochs=0,
             max_grad_norm=None,
-            grad_norm_type=2.0):
+            grad_norm_type=2.0,
+            prefetch_depth=0):
         """ Fit function for edge prediction.
 
         This function performs the training for the given edge prediction model.
@@ -137,6 +139,11 @@ class GSgnnEdgePredictionTrainer(GSgnnTrainer):
             in `torch.nn.utils.clip_grad_norm_ <https://pytorch.org/docs/2.1/generated/
             torch.nn.utils.clip_grad_norm_.html#torch.nn.utils.clip_grad_norm_>`__.
             Default: 2.0.
+        prefetch_depth: int
+            The number of mini-batches sampled, fetched and copied to the device on a
+            background thread while the current mini-batch is computed. Prefetching is
+            disabled when the training steps make RPC calls, e.g., to pull sparse embeddings.
+            Default: 0, meaning mini-batches are prepared synchronously.
         """
         # Check the correctness of configurations.
         if self.evaluator is not None:
@@ -171,6 +178,58 @@ class GSgnnEdgePredictionTrainer(GSgnnTrainer):
         total_steps = 0
         early_stop = False # used when early stop is True
         sys_tracker.check('start training')
+        # When prefetch_depth > 0, the prefetch thread samples mini-batches and fetches
+        # their features into host memory, and then copies them to the device. Sampling
+        # and fetching features make RPC calls, which are not thread-safe, so this thread
+        # pauses the prefetch thread when it evaluates the model.
+        prefetch_depth = self.get_prefetch_depth(prefetch_depth, freeze_input_layer_epochs)
+        fetch_device = device if prefetch_depth == 0 else th.device("cpu")
+        def fetch_mini_batch(mini_batch):
+            rt_profiler.record('train_sample')
+            input_nodes, batch_graph, blocks = mini_batch
+            if not isinstance(input_nodes, dict):
+                assert len(batch_graph.ntypes) == 1
+                input_nodes = {batch_graph.ntypes[0]: input_nodes}
+            nfeat_fields = train_loader.node_feat_fields
+            node_input_feats = data.get_node_feats(input_nodes, nfeat_fields, fetch_device)
+            # Since v0.4, add edge features as one input
+            efeat_fields = train_loader.edge_feat_fields
+            edge_input_feats = data.get_blocks_edge_feats(blocks, efeat_fields, fetch_device)
+
+            if train_loader.decoder_edge_feat_fields is not None:
+                input_edges = {etype: batch_graph.edges[etype].data[dgl.EID] \
+                        for etype in batch_graph.canonical_etypes}
+                edge_decoder_feats = \
+                    data.get_edge_feats(input_edges,
+                                        train_loader.decoder_edge_feat_fields,
+                                        fetch_device)
+                edge_decoder_feats = {etype: feat.to(th.float32) \
+                    for etype, feat in edge_decoder_feats.items()}
+            else:
+                edge_decoder_feats = None
+
+            # retrieving seed edge id from the graph to find labels
+            # TODO(zhengda) expand code for multiple edge types
+            assert len(batch_graph.etypes) == 1, \
+                "Edge classification/regression tasks only support " \
+                "conducting prediction on one edge type."
+            target_etype = batch_graph.canonical_etypes[0]
+            # TODO(zhengda) the data loader should return labels directly.
+            seeds = batch_graph.edges[target_etype[1]].data[dgl.EID]
+
+            label_field = train_loader.label_field
+            lbl = data.get_edge_feats({target_etype: seeds}, label_field, fetch_device)
+            rt_profiler.record('train_node_feats')
+            return input_nodes, batch_graph, blocks, node_input_feats, edge_input_feats, \
+                edge_decoder_feats, lbl
+
+        def mini_batch_to_device(mini_batch):
+            # The input node IDs stay on the host.
+            return mini_batch[:1] + move_to_device(mini_batch[1:], device)
+
+        prefetch_loader = GSgnnPrefetchLoader(train_loader, fetch_mini_batch,
+                                              mini_batch_to_device,
+                                              prefetch_depth=prefetch_depth)
         for epoch in range(num_epochs):
             model.train()
             epoch_start = time.time()
@@ -179,55 +238,20 @@ class GSgnnEdgePredictionTrainer(GSgnnTrainer):
             # TODO(xiangsx) Support unfreezing gnn encoder and decoder
             rt_profiler.start_record()
             batch_tic = time.time()
-            for i, (input_nodes, batch_graph, blocks) in enumerate(train_loader):
-                rt_profiler.record('train_sample')
-                total_steps += 1
-
-                if not isinstance(input_nodes, dict):
-                    assert len(batch_graph.ntypes) == 1
-                    input_nodes = {batch_graph.ntypes[0]: input_nodes}
-                nfeat_fields = train_loader.node_feat_fields
-                node_input_feats = data.get_node_feats(input_nodes, nfeat_fields, device)
-                # Since v0.4, add edge features as one input
-                efeat_fields = train_loader.edge_feat_fields
-                edge_input_feats = data.get_blocks_edge_feats(blocks, efeat_fields, device)
-
-                if train_loader.decoder_edge_feat_fields is not None:
-                    input_edges = {etype: batch_graph.edges[etype].data[dgl.EID] \
-                            for etype in batch_graph.canonical_etypes}
-                    edge_decoder_feats = \
-                        data.get_edge_feats(input_edges,
-                                            train_loader.decoder_edge_feat_fields,
-                                            device)
-                    edge_decoder_feats = {etype: feat.to(th.float32) \
-                        for etype, feat in edge_decoder_feats.items()}
-                else:
-                    edge_decoder_feats = None
-                rt_profiler.record('train_node_feats')
-
-                # retrieving seed edge id from the graph to find labels
-                # TODO(zhengda) expand code for multiple edge types
-                assert len(batch_graph.etypes) == 1, \
-                    "Edge classification/regression tasks only support " \
-                    "conducting prediction on one edge type."
-                target_etype = batch_graph.canonical_etypes[0]
-                # TODO(zhengda) the data loader should return labels directly.
-                seeds = batch_graph.edges[target_etype[1]].data[dgl.EID]
-
-                label_field = train_loader.label_field
-                lbl = data.get_edge_feats({target_etype: seeds}, label_field, device)
-                blocks = [block.to(device) for block in blocks]
-                batch_graph = batch_graph.to(device)
+            for i, (input_nodes, batch_graph, blocks, node_input_feats, edge_input_feats,
+                    edge_decoder_feats, lbl) in enumerate(prefetch_loader):
                 rt_profiler.record('train_graph2GPU')
+                total_steps += 1
 
-                loss = model(blocks, batch_graph, node_input_feats, edge_input_feats,
-                             edge_decoder_feats, lbl, input_nodes)
+                with self.autocast():
+                    loss = model(blocks, batch_graph, node_input_feats, edge_input_feats,
+                                 edge_decoder_feats, lbl, input_nodes)
                 rt_profiler.record('train_forward')
 
                 self.optimizer.zero_grad()
-                loss.backward()
+                self.backward(loss)
                 rt_profiler.record('train_backward')
-                self.optimizer.step()
+                self.step()
                 rt_profiler.record('train_step')
 
                 if max_grad_norm is not None:
@@ -243,9 +267,10 @@ class GSgnnEdgePredictionTrainer(GSgnnTrainer):
 
                 val_score = None
                 if self.can_do_validation(val_loader) and self.evaluator.do_eval(total_steps):
-                    val_score = self.eval(model.module if is_distributed() else model,
-                                          val_loader, test_loader,
-                                          use_mini_batch_infer, total_steps, return_proba=False)
+                    with prefetch_loader.pause():
+                        val_score = self.eval(model.module if is_distributed() else model,
+                                              val_loader, test_loader,
+                                              use_mini_batch_infer, total_steps, return_proba=False)
 
                     if self.evaluator.do_early_stop(val_score):
                         early_stop = True
@@ -260,9 +285,10 @@ class GSgnnEdgePredictionTrainer(GSgnnTrainer):
                         # not in the same eval_frequncy iteration
                         if self.can_do_validation(val_loader):
                             # for model saving, force to do evaluation if can
-                            val_score = self.eval(model.module if is_distributed() else model,
-                                                val_loader, test_loader, use_mini_batch_infer,
-                                                total_steps, return_proba=False)
+                            with prefetch_loader.pause():
+                                val_score = self.eval(model.module if is_distributed() else model,
+                                                    val_loader, test_loader, use_mini_batch_infer,
+                                                    total_steps, return_proba=False)
                     # We will save the best model when
                     # 1. If not do evaluation, we will keep the latest K models.
                     # 2. If do evaluaiton, we need to follow the guidance of validation score.
@@ -365,34 +391,36 @@ class GSgnnEdgePredictionTrainer(GSgnnTrainer):
 
 
         model.eval()
-        if use_mini_batch_infer:
-            val_pred, val_label = edge_mini_batch_gnn_predict(model, val_loader, return_proba,
+        with self.autocast():
+            if use_mini_batch_infer:
+                val_pred, val_label = edge_mini_batch_gnn_predict(model, val_loader, return_proba,
+                                                                  return_label=True)
+                sys_tracker.check("after_val_score")
+                if test_loader is not None:
+                    test_pred, test_label = \
+                        edge_mini_batch_gnn_predict(model, test_loader, return_proba,
+                                                    return_label=True)
+                else: # there is no test set
+                    test_pred = None
+                    test_label = None
+                sys_tracker.check("after_test_score")
+            else:
+                emb = do_full_graph_inference(model, val_loader.data, fanout=val_loader.fanout,
+                                              task_tracker=self.task_tracker,
+                                              pipeline_depth=self.infer_pipeline_depth)
+
+                val_pred, val_label = edge_mini_batch_predict(model, emb, val_loader, return_proba,
                                                               return_label=True)
-            sys_tracker.check("after_val_score")
-            if test_loader is not None:
-                test_pred, test_label = \
-                    edge_mini_batch_gnn_predict(model, test_loader, return_proba,
+                sys_tracker.check("after_val_score")
+                if test_loader is not None:
+                    test_pred, test_label = \
+                        edge_mini_batch_predict(model, emb, test_loader, return_proba,
                                                 return_label=True)
-            else: # there is no test set
-                test_pred = None
-                test_label = None
-            sys_tracker.check("after_test_score")
-        else:
-            emb = do_full_graph_inference(model, val_loader.data, fanout=val_loader.fanout,
-                                          task_tracker=self.task_tracker)
-
-            val_pred, val_label = edge_mini_batch_predict(model, emb, val_loader, return_proba,
-                                                          return_label=True)
-            sys_tracker.check("after_val_score")
-            if test_loader is not None:
-                test_pred, test_label = \
-                    edge_mini_batch_predict(model, emb, test_loader, return_proba,
-                                            return_label=True)
-            else:
-                # there is no test set
-                test_pred = None
-                test_label = None
-            sys_tracker.check("after_test_score")
+                else:
+                    # there is no test set
+                    test_pred = None
+                    test_label = None
+                sys_tracker.check("after_test_score")
 
         # TODO: we only support edge prediction on one edge type for evaluation now
         assert len(val_label) == 1, "We only support prediction on one edge type for now."
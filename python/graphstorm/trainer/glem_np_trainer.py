@@ -25,6 +25,7 @@ from ..model.node_gnn import GSgnnNodeModelInterface
 from ..model.node_glem import GLEM
 from .np_trainer import GSgnnNodePredictionTrainer
 
+from ..config import BUILTIN_PRECISION_FP32
 from ..utils import sys_tracker, rt_profiler, print_mem
 from ..utils import barrier, get_rank, is_distributed
 from ..dataloading import GSgnnNodeSemiSupDataLoader
@@ -84,7 +85,8 @@ class GLEMNodePredictionTrainer(GSgnnNodePredictionTrainer):
             save_perf_results_path=None,
             freeze_input_layer_epochs=0,
             max_grad_norm=None,
-            grad_norm_type=2.0):
+            grad_norm_type=2.0,
+            prefetch_depth=0):
         """ The fit function for node prediction.
 
         The fit method alternates between training a GNN model and
@@ -123,7 +125,17 @@ class GLEMNodePredictionTrainer(GSgnnNodePredictionTrainer):
         grad_norm_type: float
             Norm type for the gradient clip
             Default: 2.0
+        prefetch_depth: int
+            Not supported by GLEM, which alternates between training the GNN
+            model and the language model in each epoch.
+            Default: 0.
         """
+        if prefetch_depth > 0:
+            logging.warning("GLEM does not support prefetching mini-batches. "
+                            "prefetch_depth is ignored.")
+        if self.precision != BUILTIN_PRECISION_FP32:
+            logging.warning("GLEM does not support mixed-precision training. "
+                            "The model is trained in fp32.")
         # Check the correctness of configurations.
         if self.evaluator is not None:
             assert val_loader is not None, \
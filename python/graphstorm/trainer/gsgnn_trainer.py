@@ -19,15 +19,21 @@ import os
 import logging
 from typing import Optional
 
+import torch as th
+
 from ..eval.evaluator import GSgnnBaseEvaluator
 from ..model import GSOptimizer
 from ..model import GSgnnModel, GSgnnModelBase
 from ..model.utils import TopKList
 from ..model.utils import remove_saved_models as remove_gsgnn_models
 from ..model.utils import save_model_results_json
+from ..model.utils import precision_autocast
 from ..config import GRAPHSTORM_MODEL_ALL_LAYERS
+from ..config import (BUILTIN_PRECISION_FP32,
+                      BUILTIN_PRECISION_FP16,
+                      BUILTIN_PRECISIONS)
 from ..tracker import GSSageMakerTaskTracker
-from ..utils import barrier, get_rank, is_distributed
+from ..utils import barrier, get_rank, is_distributed, is_wholegraph
 
 class GSgnnTrainer():
     """ Generic GSgnn trainer.
@@ -66,6 +72,9 @@ class GSgnnTrainer():
                                                         # perf epoch+iteration for
                                                         # saving/removing models.
         self._task_tracker = None
+        self._precision = BUILTIN_PRECISION_FP32
+        self._grad_scaler = None
+        self._infer_pipeline_depth = 0
 
     def setup_device(self, device):
         """ Set up the device of this trainer.
@@ -81,6 +90,77 @@ class GSgnnTrainer():
         self._model = self._model.to(self.device)
         self._optimizer.move_to_device(self._model.device)
 
+    def setup_precision(self, precision):
+        """ Set up the numerical precision of model training and inference.
+
+        With ``fp16`` or ``bf16``, the forward computation and the loss run under
+        ``torch.autocast``. Model parameters, sparse embeddings and optimizer states
+        stay in fp32. ``fp16`` training on GPUs uses dynamic loss scaling, which is
+        disabled when the model has sparse embeddings because the sparse optimizers
+        cannot unscale their gradients.
+
+        This should be called after ``setup_device()``.
+
+        Parameters
+        ----------
+        precision : str
+            One of ``fp32``, ``fp16`` and ``bf16``.
+        """
+        assert precision in BUILTIN_PRECISIONS, \
+            f"precision must be one of {BUILTIN_PRECISIONS}, but get {precision}."
+        self._precision = precision
+        self._grad_scaler = None
+        if precision == BUILTIN_PRECISION_FP16 and th.device(self.device).type == "cuda":
+            if len(self.optimizer.sparse_opts) > 0:
+                if get_rank() == 0:
+                    logging.warning("Loss scaling is disabled in fp16 training because "
+                                    "the model has sparse embeddings. Consider bf16 "
+                                    "to avoid gradient underflow.")
+            else:
+                self._grad_scaler = th.amp.GradScaler("cuda")
+
+    def autocast(self):
+        """ The autocast context of the precision of this trainer.
+
+        Returns
+        -------
+        A context manager under which the forward computation runs in the
+        precision given by ``setup_precision()``.
+        """
+        return precision_autocast(self.device, self._precision)
+
+    def backward(self, loss):
+        """ Compute the gradients of the loss, scaling the loss in fp16 training.
+
+        Parameters
+        ----------
+        loss : torch.Tensor
+            The training loss.
+        """
+        if self._grad_scaler is not None:
+            self._grad_scaler.scale(loss).backward()
+        else:
+            loss.backward()
+
+    def step(self):
+        """ Update the model parameters with the gradients computed by ``backward()``.
+        """
+        self.optimizer.step(grad_scaler=self._grad_scaler)
+
+    def setup_infer_pipeline_depth(self, pipeline_depth):
+        """ Set up the pipelining of full-graph inference.
+
+        Parameters
+        ----------
+        pipeline_depth : int
+            The number of mini-batches sampled and fetched ahead of the computation
+            on a background thread in each GNN layer of full-graph inference.
+            0 disables pipelining.
+        """
+        assert isinstance(pipeline_depth, int) and pipeline_depth >= 0, \
+            f"pipeline_depth must be a non-negative integer, but get {pipeline_depth}."
+        self._infer_pipeline_depth = pipeline_depth
+
     def setup_task_tracker(self, task_tracker):
         """ Set the task tracker.
 
@@ -345,6 +425,42 @@ class GSgnnTrainer():
         else:
             return True
 
+    def get_prefetch_depth(self, prefetch_depth, freeze_input_layer_epochs=0):
+        """ Get the prefetch depth that the training loop can use.
+
+        When mini-batches are prefetched, the prefetch thread is the only thread
+        that makes RPC calls while a mini-batch is computed. Prefetching is
+        disabled if a training step of the model makes RPC calls or WholeGraph
+        collective calls itself, i.e., when the model has sparse embeddings,
+        when the input encoder reads the cached LM embeddings of frozen input
+        layers, when the model is not a ``GSgnnModel``, or when WholeGraph is used.
+
+        Parameters
+        ----------
+        prefetch_depth: int
+            The requested number of prefetched mini-batches.
+        freeze_input_layer_epochs: int
+            The number of epochs in which the input layer is frozen.
+
+        Returns
+        -------
+        int: The number of prefetched mini-batches.
+        """
+        if prefetch_depth == 0:
+            return 0
+        if not isinstance(self._model, GSgnnModel):
+            reason = "the model is not a GSgnnModel"
+        elif self._model.has_sparse_params():
+            reason = "the model has sparse embeddings"
+        elif freeze_input_layer_epochs > 0:
+            reason = "the input layer is frozen"
+        elif is_wholegraph():
+            reason = "WholeGraph is used"
+        else:
+            return prefetch_depth
+        logging.warning("Prefetching mini-batches is disabled because %s.", reason)
+        return 0
+
     @property
     def evaluator(self) -> Optional[GSgnnBaseEvaluator]:
         """ The evaluator associated with the trainer.
@@ -368,3 +484,16 @@ class GSgnnTrainer():
         """ The device associated with the trainer.
         """
         return self._device
+
+    @property
+    def precision(self):
+        """ The numerical precision of model training and inference.
+        """
+        return self._precision
+
+    @property
+    def infer_pipeline_depth(self):
+        """ The number of mini-batches prepared ahead of the computation
+            in full-graph inference.
+        """
+        return self._infer_pipeline_depth
@@ -30,6 +30,7 @@ from ..model import (do_full_graph_inference,
                      do_mini_batch_inference,
                      GSgnnModelBase,
                      GSgnnModel)
+from ..dataloading import GSgnnPrefetchLoader, move_to_device
 from .gsgnn_trainer import GSgnnTrainer
 
 from ..utils import sys_tracker, rt_profiler, print_mem, get_rank
@@ -91,7 +92,8 @@ class GSgnnLinkPredictionTrainer(GSgnnTrainer):
             edge_mask_for_gnn_embeddings='train_mask',
             freeze_input_layer_epochs=0,
             max_grad_norm=None,
-            grad_norm_type=2.0):
+            grad_norm_type=2.0,
+            prefetch_depth=0):
         """ Fit function for link prediction.
 
         This function performs the training for the given link prediction model.
@@ -146,6 +148,11 @@ class GSgnnLinkPredictionTrainer(GSgnnTrainer):
             in `torch.nn.utils.clip_grad_norm_ <https://pytorch.org/docs/2.1/generated/
             torch.nn.utils.clip_grad_norm_.html#torch.nn.utils.clip_grad_norm_>`__.
             Default: 2.0.
+        prefetch_depth: int
+            The number of mini-batches sampled, fetched and copied to the device on a
+            background thread while the current mini-batch is computed. Prefetching is
+            disabled when the training steps make RPC calls, e.g., to pull sparse embeddings.
+            Default: 0, meaning mini-batches are prepared synchronously.
         """
         if not use_mini_batch_infer:
             assert isinstance(self._model, GSgnnModel), \
@@ -183,6 +190,43 @@ class GSgnnLinkPredictionTrainer(GSgnnTrainer):
         total_steps = 0
         early_stop = False # used when early stop is True
         sys_tracker.check('start training')
+        # When prefetch_depth > 0, the prefetch thread samples mini-batches and fetches
+        # their features into host memory, and then copies them to the device. Sampling
+        # and fetching features make RPC calls, which are not thread-safe, so this thread
+        # pauses the prefetch thread when it evaluates the model.
+        prefetch_depth = self.get_prefetch_depth(prefetch_depth, freeze_input_layer_epochs)
+        fetch_device = device if prefetch_depth == 0 else th.device("cpu")
+        def fetch_mini_batch(mini_batch):
+            rt_profiler.record('train_sample')
+            input_nodes, pos_graph, neg_graph, blocks = mini_batch
+            if not isinstance(input_nodes, dict):
+                assert len(pos_graph.ntypes) == 1
+                input_nodes = {pos_graph.ntypes[0]: input_nodes}
+            nfeat_fields = train_loader.node_feat_fields
+            node_input_feats = data.get_node_feats(input_nodes, nfeat_fields, fetch_device)
+            # Since v0.4, add edge features as one input
+            efeat_fields = train_loader.edge_feat_fields
+            edge_input_feats = data.get_blocks_edge_feats(blocks, efeat_fields, fetch_device)
+
+            if train_loader.pos_graph_edge_feat_fields is not None:
+                input_edges = {etype: pos_graph.edges[etype].data[dgl.EID] \
+                    for etype in pos_graph.canonical_etypes}
+                pos_graph_feats = data.get_edge_feats(input_edges,
+                                                      train_loader.pos_graph_edge_feat_fields,
+                                                      fetch_device)
+            else:
+                pos_graph_feats = None
+            rt_profiler.record('train_node_feats')
+            return input_nodes, pos_graph, neg_graph, blocks, node_input_feats, \
+                edge_input_feats, pos_graph_feats
+
+        def mini_batch_to_device(mini_batch):
+            # The input node IDs stay on the host.
+            return mini_batch[:1] + move_to_device(mini_batch[1:], device)
+
+        prefetch_loader = GSgnnPrefetchLoader(train_loader, fetch_mini_batch,
+                                              mini_batch_to_device,
+                                              prefetch_depth=prefetch_depth)
         for epoch in range(num_epochs):
             model.train()
             epoch_start = time.time()
@@ -193,45 +237,23 @@ class GSgnnLinkPredictionTrainer(GSgnnTrainer):
 
             rt_profiler.start_record()
             batch_tic = time.time()
-            for i, (input_nodes, pos_graph, neg_graph, blocks) in enumerate(train_loader):
-                rt_profiler.record('train_sample')
-                total_steps += 1
-
-                if not isinstance(input_nodes, dict):
-                    assert len(pos_graph.ntypes) == 1
-                    input_nodes = {pos_graph.ntypes[0]: input_nodes}
-                nfeat_fields = train_loader.node_feat_fields
-                node_input_feats = data.get_node_feats(input_nodes, nfeat_fields, device)
-                # Since v0.4, add edge features as one input
-                efeat_fields = train_loader.edge_feat_fields
-                edge_input_feats = data.get_blocks_edge_feats(blocks, efeat_fields, device)
-
-                if train_loader.pos_graph_edge_feat_fields is not None:
-                    input_edges = {etype: pos_graph.edges[etype].data[dgl.EID] \
-                        for etype in pos_graph.canonical_etypes}
-                    pos_graph_feats = data.get_edge_feats(input_edges,
-                                                          train_loader.pos_graph_edge_feat_fields,
-                                                          device)
-                else:
-                    pos_graph_feats = None
-                rt_profiler.record('train_node_feats')
-
-                pos_graph = pos_graph.to(device)
-                neg_graph = neg_graph.to(device)
-                blocks = [blk.to(device) for blk in blocks]
+            for i, (input_nodes, pos_graph, neg_graph, blocks, node_input_feats,
+                    edge_input_feats, pos_graph_feats) in enumerate(prefetch_loader):
                 rt_profiler.record('train_graph2GPU')
+                total_steps += 1
 
-                loss = model(blocks, pos_graph, neg_graph,
-                             node_feats=node_input_feats,
-                             edge_feats=edge_input_feats,
-                             pos_edge_feats=pos_graph_feats,
-                             input_nodes=input_nodes)
+                with self.autocast():
+                    loss = model(blocks, pos_graph, neg_graph,
+                                 node_feats=node_input_feats,
+                                 edge_feats=edge_input_feats,
+                                 pos_edge_feats=pos_graph_feats,
+                                 input_nodes=input_nodes)
                 rt_profiler.record('train_forward')
 
                 self.optimizer.zero_grad()
-                loss.backward()
+                self.backward(loss)
                 rt_profiler.record('train_backward')
-                self.optimizer.step()
+                self.step()
                 rt_profiler.record('train_step')
 
                 if max_grad_norm is not None:
@@ -244,9 +266,10 @@ class GSgnnLinkPredictionTrainer(GSgnnTrainer):
 
                 val_score = None
                 if self.can_do_validation(val_loader) and self.evaluator.do_eval(total_steps):
-                    val_score = self.eval(model.module if is_distributed() else model,
-                                          data, val_loader, test_loader, total_steps,
-                                          edge_mask_for_gnn_embeddings, use_mini_batch_infer)
+                    with prefetch_loader.pause():
+                        val_score = self.eval(model.module if is_distributed() else model,
+                                              data, val_loader, test_loader, total_steps,
+                                              edge_mask_for_gnn_embeddings, use_mini_batch_infer)
                     if self.evaluator.do_early_stop(val_score):
                         early_stop = True
 
@@ -260,9 +283,11 @@ class GSgnnLinkPredictionTrainer(GSgnnTrainer):
                         # not in the same eval_frequncy iteration
                         if self.can_do_validation(val_loader):
                             # for model saving, force to do evaluation if can
-                            val_score = self.eval(model.module if is_distributed() else model,
-                                                data, val_loader, test_loader, total_steps,
-                                                edge_mask_for_gnn_embeddings, use_mini_batch_infer)
+                            with prefetch_loader.pause():
+                                val_score = self.eval(model.module if is_distributed() else model,
+                                                      data, val_loader, test_loader, total_steps,
+                                                      edge_mask_for_gnn_embeddings,
+                                                      use_mini_batch_infer)
                     # We will save the best model when
                     # 1. If not do evaluation, we will keep the latest K models.
                     # 2. If do evaluaiton, we need to follow the guidance of validation score.
@@ -356,27 +381,29 @@ class GSgnnLinkPredictionTrainer(GSgnnTrainer):
         sys_tracker.check('before prediction')
         model.eval()
 
-        if use_mini_batch_infer:
-            emb = do_mini_batch_inference(model, data, fanout=val_loader.fanout,
-                                          edge_mask=edge_mask_for_gnn_embeddings,
-                                          task_tracker=self.task_tracker)
-        else:
-            emb = do_full_graph_inference(model, data, fanout=val_loader.fanout,
-                                          edge_mask=edge_mask_for_gnn_embeddings,
-                                          task_tracker=self.task_tracker)
-        sys_tracker.check('compute embeddings')
-        if val_loader is not None:
-            val_rankings, val_lengths = lp_mini_batch_predict(
-                model, emb, val_loader, self.device, return_batch_lengths=True)
-        else:
-            val_rankings, val_lengths = None, None
-        sys_tracker.check('after_val_score')
-        if test_loader is not None:
-            test_rankings, test_lengths = lp_mini_batch_predict(
-                model, emb, test_loader, self.device, return_batch_lengths=True)
-        else:
-            test_rankings, test_lengths = None, None
-        sys_tracker.check('after_test_score')
+        with self.autocast():
+            if use_mini_batch_infer:
+                emb = do_mini_batch_inference(model, data, fanout=val_loader.fanout,
+                                              edge_mask=edge_mask_for_gnn_embeddings,
+                                              task_tracker=self.task_tracker)
+            else:
+                emb = do_full_graph_inference(model, data, fanout=val_loader.fanout,
+                                              edge_mask=edge_mask_for_gnn_embeddings,
+                                              task_tracker=self.task_tracker,
+                                              pipeline_depth=self.infer_pipeline_depth)
+            sys_tracker.check('compute embeddings')
+            if val_loader is not None:
+                val_rankings, val_lengths = lp_mini_batch_predict(
+                    model, emb, val_loader, self.device, return_batch_lengths=True)
+            else:
+                val_rankings, val_lengths = None, None
+            sys_tracker.check('after_val_score')
+            if test_loader is not None:
+                test_rankings, test_lengths = lp_mini_batch_predict(
+                    model, emb, test_loader, self.device, return_batch_lengths=True)
+            else:
+                test_rankings, test_lengths = None, None
+            sys_tracker.check('after_test_score')
         assert self.evaluator is not None, \
             "Evaluator needs to be setup, use trainer.setup_evaluator(evaluator)"
         assert isinstance(self.evaluator, GSgnnLPRankingEvalInterface), \
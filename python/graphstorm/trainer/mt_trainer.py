@@ -38,6 +38,7 @@ from ..model import (do_full_graph_inference,
                      multi_task_mini_batch_predict,
                      gen_emb_for_nfeat_reconstruct)
 from ..model.lp_gnn import run_lp_mini_batch_predict
+from ..dataloading import GSgnnPrefetchLoader, move_to_device
 from .gsgnn_trainer import GSgnnTrainer
 
 from ..utils import sys_tracker, rt_profiler, print_mem, get_rank
@@ -347,7 +348,8 @@ class GSgnnMultiTaskLearningTrainer(GSgnnTrainer):
             save_perf_results_path=None,
             freeze_input_layer_epochs=0,
             max_grad_norm=None,
-            grad_norm_type=2.0):
+            grad_norm_type=2.0,
+            prefetch_depth=0):
         """ The fit function for multi-task learning.
 
         Performs the training for `self.model`. Iterates over all the tasks
@@ -387,6 +389,11 @@ class GSgnnMultiTaskLearningTrainer(GSgnnTrainer):
         grad_norm_type: float
             Norm type for the gradient clip
             Default: 2.0
+        prefetch_depth: int
+            The number of mini-batches sampled, fetched and copied to the device on a
+            background thread while the current mini-batch is computed. Prefetching is
+            disabled when the training steps make RPC calls, e.g., to pull sparse embeddings.
+            Default: 0, meaning mini-batches are prepared synchronously.
         """
         # Check the correctness of configurations.
         if self.evaluator is not None:
@@ -419,6 +426,29 @@ class GSgnnMultiTaskLearningTrainer(GSgnnTrainer):
         # training loop
         total_steps = 0
         sys_tracker.check('start training')
+        # When prefetch_depth > 0, the prefetch thread samples mini-batches and fetches
+        # their features into host memory, and then copies them to the device. Sampling
+        # and fetching features make RPC calls, which are not thread-safe, so this thread
+        # pauses the prefetch thread when it evaluates the model.
+        prefetch_depth = self.get_prefetch_depth(prefetch_depth, freeze_input_layer_epochs)
+        fetch_device = device if prefetch_depth == 0 else th.device("cpu")
+        def fetch_mini_batches(task_mini_batches):
+            rt_profiler.record('train_sample')
+            mini_batches = [(task_info, self._prepare_mini_batch(data, task_info,
+                                                                 mini_batch, fetch_device)) \
+                for (task_info, mini_batch) in task_mini_batches]
+            rt_profiler.record('train_node_feats')
+            return mini_batches
+
+        def mini_batches_to_device(mini_batches):
+            # The prepared mini-batches of all tasks end with the input node IDs,
+            # which stay on the host.
+            return [(task_info, move_to_device(mini_batch[:-1], device) + mini_batch[-1:]) \
+                for (task_info, mini_batch) in mini_batches]
+
+        prefetch_loader = GSgnnPrefetchLoader(train_loader, fetch_mini_batches,
+                                              mini_batches_to_device,
+                                              prefetch_depth=prefetch_depth)
         for epoch in range(num_epochs):
             model.train()
             epoch_start = time.time()
@@ -428,22 +458,18 @@ class GSgnnMultiTaskLearningTrainer(GSgnnTrainer):
 
             rt_profiler.start_record()
             batch_tic = time.time()
-            for i, task_mini_batches in enumerate(train_loader):
-                rt_profiler.record('train_sample')
+            for i, mini_batches in enumerate(prefetch_loader):
+                rt_profiler.record('train_graph2GPU')
                 total_steps += 1
 
-                mini_batches = []
-                for (task_info, mini_batch) in task_mini_batches:
-                    mini_batches.append((task_info, \
-                        self._prepare_mini_batch(data, task_info, mini_batch, device)))
-
-                loss, task_losses = model(mini_batches)
+                with self.autocast():
+                    loss, task_losses = model(mini_batches)
 
                 rt_profiler.record('train_forward')
                 self.optimizer.zero_grad()
-                loss.backward()
+                self.backward(loss)
                 rt_profiler.record('train_backward')
-                self.optimizer.step()
+                self.step()
                 rt_profiler.record('train_step')
 
                 if max_grad_norm is not None:
@@ -462,8 +488,9 @@ class GSgnnMultiTaskLearningTrainer(GSgnnTrainer):
 
                 val_score = None
                 if self.can_do_validation(val_loader) and self.evaluator.do_eval(total_steps):
-                    val_score = self.eval(model.module if is_distributed() else model,
-                                          data, val_loader, test_loader, total_steps)
+                    with prefetch_loader.pause():
+                        val_score = self.eval(model.module if is_distributed() else model,
+                                              data, val_loader, test_loader, total_steps)
                     # TODO(xiangsx): Add early stop support
 
                 # Every n iterations, save the model and keep
@@ -476,8 +503,9 @@ class GSgnnMultiTaskLearningTrainer(GSgnnTrainer):
                         # not in the same eval_frequncy iteration
                         if self.can_do_validation(val_loader):
                             # for model saving, force to do evaluation if can
-                            val_score = self.eval(model.module if is_distributed() else model,
-                                                data, val_loader, test_loader, total_steps)
+                            with prefetch_loader.pause():
+                                val_score = self.eval(model.module if is_distributed() else model,
+                                                    data, val_loader, test_loader, total_steps)
                     # We will save the best model when
                     # 1. There is no evaluation, we will keep the
                     #    latest K models.
@@ -643,16 +671,18 @@ class GSgnnMultiTaskLearningTrainer(GSgnnTrainer):
         def gen_embs(edge_mask=None):
             """ Compute node embeddings
             """
-            if use_mini_batch_infer:
-                emb = do_mini_batch_inference(model, data,
-                                              fanout=fanout,
-                                              edge_mask=edge_mask,
-                                              task_tracker=self.task_tracker)
-            else:
-                emb = do_full_graph_inference(model, data,
-                                              fanout=fanout,
-                                              edge_mask=edge_mask,
-                                              task_tracker=self.task_tracker)
+            with self.autocast():
+                if use_mini_batch_infer:
+                    emb = do_mini_batch_inference(model, data,
+                                                  fanout=fanout,
+                                                  edge_mask=edge_mask,
+                                                  task_tracker=self.task_tracker)
+                else:
+                    emb = do_full_graph_inference(model, data,
+                                                  fanout=fanout,
+                                                  edge_mask=edge_mask,
+                                                  task_tracker=self.task_tracker,
+                                                  pipeline_depth=self.infer_pipeline_depth)
             return emb
 
         embs = None
@@ -24,6 +24,7 @@ from torch.nn.parallel import DistributedDataParallel
 from ..model.node_gnn import node_mini_batch_gnn_predict, node_mini_batch_predict
 from ..model.node_gnn import GSgnnNodeModelInterface
 from ..model import do_full_graph_inference, GSgnnModelBase, GSgnnModel
+from ..dataloading import GSgnnPrefetchLoader, move_to_device
 from .gsgnn_trainer import GSgnnTrainer
 
 from ..utils import sys_tracker, rt_profiler, print_mem, get_rank
@@ -84,7 +85,8 @@ class GSgnnNodePredictionTrainer(GSgnnTrainer):
             save_perf_results_path=None,
             freeze_input_layer_epochs=0,
             max_grad_norm=None,
-            grad_norm_type=2.0):
+            grad_norm_type=2.0,
+            prefetch_depth=0):
         """ Fit function for node prediction training.
 
         This function performs the training for the given node prediction model.
@@ -135,6 +137,11 @@ class GSgnnNodePredictionTrainer(GSgnnTrainer):
             in `torch.nn.utils.clip_grad_norm_ <https://pytorch.org/docs/2.1/generated/
             torch.nn.utils.clip_grad_norm_.html#torch.nn.utils.clip_grad_norm_>`__.
             Default: 2.0.
+        prefetch_depth: int
+            The number of mini-batches sampled, fetched and copied to the device on a
+            background thread while the current mini-batch is computed. Prefetching is
+            disabled when the training steps make RPC calls, e.g., to pull sparse embeddings.
+            Default: 0, meaning mini-batches are prepared synchronously.
         """
         # Check the correctness of configurations.
         if self.evaluator is not None:
@@ -170,6 +177,39 @@ class GSgnnNodePredictionTrainer(GSgnnTrainer):
         early_stop = False # used when early stop is True
         sys_tracker.check('start training')
         g = data.g
+        # When prefetch_depth > 0, the prefetch thread samples mini-batches and fetches
+        # their features into host memory, and then copies them to the device. Sampling
+        # and fetching features make RPC calls, which are not thread-safe, so this thread
+        # pauses the prefetch thread when it evaluates the model.
+        prefetch_depth = self.get_prefetch_depth(prefetch_depth, freeze_input_layer_epochs)
+        fetch_device = device if prefetch_depth == 0 else th.device("cpu")
+        def fetch_mini_batch(mini_batch):
+            rt_profiler.record('train_sample')
+            input_nodes, seeds, blocks = mini_batch
+            if not isinstance(input_nodes, dict):
+                # This happens on a homogeneous graph.
+                assert len(g.ntypes) == 1, \
+                    "The graph should be a homogeneous graph, " \
+                    f"but it has multiple node types {g.ntypes}"
+                input_nodes = {g.ntypes[0]: input_nodes}
+            nfeat_fields = train_loader.node_feat_fields
+            node_input_feats = data.get_node_feats(input_nodes, nfeat_fields, fetch_device)
+            # Since v0.4, add edge features as one input
+            efeat_fields = train_loader.edge_feat_fields
+            edge_input_feats = data.get_blocks_edge_feats(blocks, efeat_fields, fetch_device)
+
+            label_field = train_loader.label_field
+            lbl = data.get_node_feats(seeds, label_field, fetch_device)
+            rt_profiler.record('train_node_feats')
+            return input_nodes, blocks, node_input_feats, edge_input_feats, lbl
+
+        def mini_batch_to_device(mini_batch):
+            # The input node IDs stay on the host.
+            return mini_batch[:1] + move_to_device(mini_batch[1:], device)
+
+        prefetch_loader = GSgnnPrefetchLoader(train_loader, fetch_mini_batch,
+                                              mini_batch_to_device,
+                                              prefetch_depth=prefetch_depth)
         for epoch in range(num_epochs):
             model.train()
             epoch_start = time.time()
@@ -180,36 +220,19 @@ class GSgnnNodePredictionTrainer(GSgnnTrainer):
             # TODO(zhengda) the dataloader should return node features and labels directly.
             rt_profiler.start_record()
             batch_tic = time.time()
-            for i, (input_nodes, seeds, blocks) in enumerate(train_loader):
-                rt_profiler.record('train_sample')
-                total_steps += 1
-
-                if not isinstance(input_nodes, dict):
-                    # This happens on a homogeneous graph.
-                    assert len(g.ntypes) == 1, \
-                        "The graph should be a homogeneous graph, " \
-                        f"but it has multiple node types {g.ntypes}"
-                    input_nodes = {g.ntypes[0]: input_nodes}
-                nfeat_fields = train_loader.node_feat_fields
-                node_input_feats = data.get_node_feats(input_nodes, nfeat_fields, device)
-                # Since v0.4, add edge features as one input
-                efeat_fields = train_loader.edge_feat_fields
-                edge_input_feats = data.get_blocks_edge_feats(blocks, efeat_fields, device)
-
-                label_field = train_loader.label_field
-                lbl = data.get_node_feats(seeds, label_field, device)
-                rt_profiler.record('train_node_feats')
-
-                blocks = [block.to(device) for block in blocks]
+            for i, (input_nodes, blocks, node_input_feats, edge_input_feats, lbl) \
+                    in enumerate(prefetch_loader):
                 rt_profiler.record('train_graph2GPU')
+                total_steps += 1
 
-                loss = model(blocks, node_input_feats, edge_input_feats, lbl, input_nodes)
+                with self.autocast():
+                    loss = model(blocks, node_input_feats, edge_input_feats, lbl, input_nodes)
                 rt_profiler.record('train_forward')
 
                 self.optimizer.zero_grad()
-                loss.backward()
+                self.backward(loss)
                 rt_profiler.record('train_backward')
-                self.optimizer.step()
+                self.step()
                 rt_profiler.record('train_step')
 
                 if max_grad_norm is not None:
@@ -223,9 +246,10 @@ class GSgnnNodePredictionTrainer(GSgnnTrainer):
 
                 val_score = None
                 if self.can_do_validation(val_loader) and self.evaluator.do_eval(total_steps):
-                    val_score = self.eval(model.module if is_distributed() else model,
-                                          val_loader, test_loader,
-                                          use_mini_batch_infer, total_steps, return_proba=False)
+                    with prefetch_loader.pause():
+                        val_score = self.eval(model.module if is_distributed() else model,
+                                              val_loader, test_loader,
+                                              use_mini_batch_infer, total_steps, return_proba=False)
 
                     if self.evaluator.do_early_stop(val_score):
                         early_stop = True
@@ -240,9 +264,10 @@ class GSgnnNodePredictionTrainer(GSgnnTrainer):
                         # not in the same eval_frequncy iteration
                         if self.can_do_validation(val_loader):
                             # for model saving, force to do evaluation if can
-                            val_score = self.eval(model.module if is_distributed() else model,
-                                                val_loader, test_loader, use_mini_batch_infer,
-                                                total_steps, return_proba=False)
+                            with prefetch_loader.pause():
+                                val_score = self.eval(model.module if is_distributed() else model,
+                                                    val_loader, test_loader, use_mini_batch_infer,
+                                                    total_steps, return_proba=False)
                     # We will save the best model when
                     # 1. If not do evaluation, we will keep the latest K models.
                     # 2. If do evaluaiton, we need to follow the guidance of validation score.
@@ -341,34 +366,37 @@ class GSgnnNodePredictionTrainer(GSgnnTrainer):
             logging.warning("%s requires return_proba==True. \
                 Set return_proba to True.", need_proba)
 
-        if use_mini_batch_infer:
-            val_pred, _, val_label = node_mini_batch_gnn_predict(model, val_loader, return_proba,
-                                                                 return_label=True)
-            sys_tracker.check('after_val_score')
-            if test_loader is not None:
-                test_pred, _, test_label = \
-                    node_mini_batch_gnn_predict(model, test_loader, return_proba,
+        with self.autocast():
+            if use_mini_batch_infer:
+                val_pred, _, val_label = \
+                    node_mini_batch_gnn_predict(model, val_loader, return_proba,
                                                 return_label=True)
-            else: # there is no test set
-                test_pred = None
-                test_label = None
-            sys_tracker.check('after_test_score')
-        else:
-            emb = do_full_graph_inference(model, val_loader.data, fanout=val_loader.fanout,
-                                          task_tracker=self.task_tracker)
-            sys_tracker.check('after_full_infer')
-            val_pred, val_label = node_mini_batch_predict(model, emb, val_loader, return_proba,
-                                                          return_label=True)
-            sys_tracker.check('after_val_score')
-            if test_loader is not None:
-                test_pred, test_label = \
-                    node_mini_batch_predict(model, emb, test_loader, return_proba,
-                                            return_label=True)
+                sys_tracker.check('after_val_score')
+                if test_loader is not None:
+                    test_pred, _, test_label = \
+                        node_mini_batch_gnn_predict(model, test_loader, return_proba,
+                                                    return_label=True)
+                else: # there is no test set
+                    test_pred = None
+                    test_label = None
+                sys_tracker.check('after_test_score')
             else:
-                # there is no test set
-                test_pred = None
-                test_label = None
-            sys_tracker.check('after_test_score')
+                emb = do_full_graph_inference(model, val_loader.data, fanout=val_loader.fanout,
+                                              task_tracker=self.task_tracker,
+                                              pipeline_depth=self.infer_pipeline_depth)
+                sys_tracker.check('after_full_infer')
+                val_pred, val_label = node_mini_batch_predict(model, emb, val_loader, return_proba,
+                                                              return_label=True)
+                sys_tracker.check('after_val_score')
+                if test_loader is not None:
+                    test_pred, test_label = \
+                        node_mini_batch_predict(model, emb, test_loader, return_proba,
+                                                return_label=True)
+                else:
+                    # there is no test set
+                    test_pred = None
+                    test_label = None
+                sys_tracker.check('after_test_score')
         sys_tracker.check('predict')
 
         # TODO(wlcong) we only support node prediction on one node type for evaluation now
@@ -408,6 +408,7 @@ class RuntimeProfiler:
     def __init__(self, profile_path=None):
         self._checkpoints = []
         self._runtime = {}
+        self._counters = {}
         self._profile_path = profile_path
         self._rank = -1
 
@@ -472,12 +473,34 @@ class RuntimeProfiler:
         # at the same time.
         th.distributed.barrier()
 
+    def count(self, name, num_hits, num_total):
+        """ Record the hits of a counter, e.g., the hits of a cache.
+
+        Unlike ``record``, it does not synchronize the trainers, so it can be
+        called in background threads.
+
+        Parameters
+        ----------
+        name : str
+            The name of the counter.
+        num_hits : int
+            The number of hits.
+        num_total : int
+            The number of accesses.
+        """
+        if self._profile_path is None:
+            return
+        hits, total = self._counters.get(name, (0, 0))
+        self._counters[name] = (hits + num_hits, total + num_total)
+
     def print_stats(self):
         """ Print the statistics
         """
         if self._rank == 0 and self._profile_path is not None:
             for name, runtimes in self._runtime.items():
                 logging.info("%s %.3f seconds", name, sum(runtimes) / len(runtimes))
+            for name, (hits, total) in self._counters.items():
+                logging.info("%s rate %.3f (%d/%d)", name, hits / max(total, 1), hits, total)
 
     def save_profile(self):
         """ Save the profiling result to a file.
@@ -490,6 +513,13 @@ class RuntimeProfiler:
             data_frame = pd.DataFrame(runtime)
             data_frame.to_csv(profile_path, float_format='%.3f', index=False)
             logging.info("Save profiling in %s.", profile_path)
+            if len(self._counters) > 0:
+                counter_path = os.path.join(self._profile_path, f"{self._rank}_counters.csv")
+                data_frame = pd.DataFrame(
+                    [(name, hits, total, hits / max(total, 1)) \
+                     for name, (hits, total) in self._counters.items()],
+                    columns=["name", "hits", "total", "rate"])
+                data_frame.to_csv(counter_path, float_format='%.3f', index=False)
 
 sys_tracker = SysTracker()
 rt_profiler = RuntimeProfiler()
@@ -24,6 +24,7 @@ import dgl
 import torch as th
 import pandas as pd
 import copy
+import pickle
 
 from functools import partial
 from numpy.testing import assert_equal, assert_almost_equal
@@ -32,16 +33,18 @@ from graphstorm.gconstruct.construct_graph import (parse_edge_data,
                                                    prepare_edge_data,
                                                    verify_confs,
                                                    is_homogeneous,
-                                                   _collect_parsed_edge_data)
+                                                   _collect_parsed_edge_data,
+                                                   _EdgeDataStager)
 from graphstorm.gconstruct.file_io import write_data_parquet, read_data_parquet
 from graphstorm.gconstruct.file_io import write_data_json, read_data_json
 from graphstorm.gconstruct.file_io import write_data_csv, read_data_csv
 from graphstorm.gconstruct.file_io import write_data_hdf5, read_data_hdf5, HDF5Array
 from graphstorm.gconstruct.file_io import write_index_json
 from graphstorm.gconstruct.transform import parse_feat_ops, process_features, preprocess_features
-from graphstorm.gconstruct.transform import parse_label_ops, process_labels
+from graphstorm.gconstruct.transform import parse_label_ops, process_labels, LABEL_STATS_FIELD
 from graphstorm.gconstruct.transform import Noop, do_multiprocess_transform, LinkPredictionProcessor
-from graphstorm.gconstruct.id_map import IdMap, IdReverseMap, map_node_ids
+from graphstorm.gconstruct.id_map import (IdMap, ArrayIdMap, IdReverseMap, NoopMap,
+                                         map_node_ids, share_id_maps, save_reverse_id_map)
 from graphstorm.gconstruct.transform import (BucketTransform, RankGaussTransform,
                                              Text2BERT, NumericalMinMaxTransform)
 from graphstorm.gconstruct.utils import (ExtMemArrayMerger,
@@ -1439,6 +1442,102 @@ def test_id_map():
                                                          decimal.Decimal(15),
                                                          decimal.Decimal(20)]))
 
+def test_array_id_map():
+    # This tests all cases in ArrayIdMap.
+    str_ids = np.array([str(i) for i in range(10)])
+    id_map = ArrayIdMap(str_ids)
+    assert len(id_map) == len(str_ids)
+    assert id_map.map_key_dtype == str
+
+    check_id_map_exist(id_map, str_ids)
+    check_id_map_not_exist(id_map, str_ids, np.array(["11", "15", "20"]))
+    with pytest.raises(AssertionError):
+        id_map.map_id(np.random.randint(10, size=5))
+
+    int_ids = np.arange(10)
+    id_map = ArrayIdMap(int_ids)
+    check_id_map_exist(id_map, int_ids)
+    check_id_map_not_exist(id_map, int_ids, np.array([11, 15, 20]))
+    with pytest.raises(AssertionError):
+        id_map.map_id(np.array([str(i) for i in range(5)]))
+
+    # Test id map as other types such as decimal.Decimal (e.g., UUID)
+    decial_ids = np.array([decimal.Decimal(i) for i in range(10)])
+    id_map = ArrayIdMap(decial_ids)
+    check_id_map_exist(id_map, decial_ids)
+    check_id_map_not_exist(id_map, decial_ids, np.array([decimal.Decimal(11),
+                                                         decimal.Decimal(15),
+                                                         decimal.Decimal(20)]))
+
+    # ArrayIdMap should give the same mapping as IdMap.
+    ids = np.random.permutation(100)
+    str_ids = np.array([f"id-{i}" for i in ids])
+    id_map = ArrayIdMap(str_ids)
+    dict_id_map = IdMap(str_ids)
+    test_ids = np.concatenate([str_ids[np.random.randint(100, size=50)],
+                               np.array(["id-100", "id-200"])])
+    np.random.shuffle(test_ids)
+    new_ids1, idx1 = id_map.map_id(test_ids)
+    new_ids2, idx2 = dict_id_map.map_id(test_ids)
+    assert_equal(new_ids1, new_ids2)
+    assert_equal(idx1, idx2)
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        id_map.save(os.path.join(tmpdirname, "id_map"))
+        df_table = pq.read_table(os.path.join(tmpdirname, "id_map")).to_pandas()
+        new_id_map = dict(zip(df_table['orig'], df_table['new']))
+        assert len(new_id_map) == len(id_map)
+        assert_equal(np.array([new_id_map[i] for i in str_ids]), np.arange(100))
+
+        # The saved ID map can be loaded by IdReverseMap.
+        id_reverse_map = IdReverseMap(os.path.join(tmpdirname, "id_map"))
+        assert_equal(id_reverse_map.map_range(0, 100), str_ids)
+
+    # Test duplicated IDs. The last occurrence wins as in IdMap.
+    id_map = ArrayIdMap(np.array([3, 1, 3, 2]))
+    assert len(id_map) == 3
+    new_ids, idx = id_map.map_id(np.array([1, 2, 3]))
+    assert_equal(new_ids, np.array([1, 3, 2]))
+    assert_equal(idx, np.arange(3))
+
+    # An empty ID map returns empty results as IdMap.
+    for empty_ids in [np.array([], dtype=np.int64), np.array([], dtype=str)]:
+        id_map = ArrayIdMap(empty_ids)
+        assert len(id_map) == 0
+        for test_ids in [np.array([1, 2]), np.array(["1", "2"])]:
+            new_ids, idx = id_map.map_id(test_ids)
+            assert len(new_ids) == 0
+            assert len(idx) == 0
+
+def test_share_id_maps():
+    str_ids = np.array([f"id-{i}" for i in np.random.permutation(1000)])
+    id_maps = {"n0": ArrayIdMap(str_ids),
+               "n1": ArrayIdMap(np.random.permutation(1000)),
+               "n2": NoopMap(10)}
+    test_ids = str_ids[np.random.randint(1000, size=100)]
+    expected_ids, expected_idx = id_maps["n0"].map_id(test_ids)
+    orig_size = len(pickle.dumps(id_maps["n0"]))
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        share_id_maps(id_maps, tmpdirname)
+        assert id_maps["n0"].is_shared
+        assert id_maps["n1"].is_shared
+        assert os.path.exists(os.path.join(tmpdirname, "n0", "keys.npy"))
+        assert os.path.exists(os.path.join(tmpdirname, "n1", "vals.npy"))
+
+        # Only the path of the shared ID map is pickled.
+        data = pickle.dumps(id_maps["n0"])
+        assert len(data) < orig_size
+        new_id_map = pickle.loads(data)
+        assert new_id_map.is_shared
+        assert len(new_id_map) == len(id_maps["n0"])
+        new_ids, idx = new_id_map.map_id(test_ids)
+        assert_equal(new_ids, expected_ids)
+        assert_equal(idx, expected_idx)
+
+        new_ids, idx = id_maps["n1"].map_id(np.arange(10))
+        assert_equal(np.arange(10)[idx], np.arange(10))
+        assert len(new_ids) == 10
+
 def test_id_reverse_map():
     with tempfile.TemporaryDirectory() as tmpdirname:
         str_ids = np.array([str(i) for i in range(10)])
@@ -1456,6 +1555,53 @@ def test_id_reverse_map():
         new_ids = np.array([id_map._ids[str(key)] for key in test_reverse])
         assert_equal(np.arange(1, 9), new_ids)
 
+@pytest.mark.parametrize("ids", [np.array([f"id-{i}" for i in np.random.permutation(100)]),
+                                 np.random.permutation(100) * 3])
+def test_id_reverse_map_mmap(ids):
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        map_prefix = os.path.join(tmpdirname, "id_map")
+        ArrayIdMap(ids).save(map_prefix)
+        id_reverse_map = IdReverseMap(map_prefix)
+        assert not id_reverse_map.is_mmap
+
+        save_reverse_id_map(map_prefix)
+        assert os.path.exists(os.path.join(map_prefix, "_reverse_ids.npy"))
+        # The parquet files can still be read as a dataset.
+        assert pq.read_table(map_prefix).num_rows == 100
+
+        mmap_reverse_map = IdReverseMap(map_prefix)
+        assert mmap_reverse_map.is_mmap
+        assert len(mmap_reverse_map) == len(id_reverse_map)
+        test_ids = np.random.permutation(100)[:30]
+        assert_equal(mmap_reverse_map.map_id(test_ids), id_reverse_map.map_id(test_ids))
+        assert_equal(mmap_reverse_map.map_range(10, 60), id_reverse_map.map_range(10, 60))
+
+        # Only the file path is pickled.
+        new_reverse_map = pickle.loads(pickle.dumps(mmap_reverse_map))
+        assert new_reverse_map._ids is None
+        assert_equal(new_reverse_map.map_id(test_ids), id_reverse_map.map_id(test_ids))
+
+def test_id_reverse_map_stale_mmap():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        map_prefix = os.path.join(tmpdirname, "id_map")
+        ArrayIdMap(np.arange(100) * 2).save(map_prefix)
+        save_reverse_id_map(map_prefix)
+        assert IdReverseMap(map_prefix).is_mmap
+
+        # Saving a new mapping into the same directory without a reverse ID map
+        # must not leave the old one behind.
+        new_ids = np.random.permutation(100) * 3
+        ArrayIdMap(new_ids).save(map_prefix)
+        assert not os.path.exists(os.path.join(map_prefix, "_reverse_ids.npy"))
+        id_reverse_map = IdReverseMap(map_prefix)
+        assert not id_reverse_map.is_mmap
+        assert_equal(id_reverse_map.map_range(0, 100), new_ids)
+
+        save_reverse_id_map(map_prefix)
+        mmap_reverse_map = IdReverseMap(map_prefix)
+        assert mmap_reverse_map.is_mmap
+        assert_equal(mmap_reverse_map.map_range(0, 100), new_ids)
+
 def check_map_node_ids_exist(str_src_ids, str_dst_ids, id_map):
     # Test the case that both source node IDs and destination node IDs exist.
     src_ids = np.array([str(random.randint(0, len(str_src_ids) - 1)) for _ in range(15)])
@@ -1533,12 +1679,13 @@ def check_map_node_ids_dst_not_exist(str_src_ids, str_dst_ids, id_map):
     assert len(new_src_ids) == 0
     assert len(new_dst_ids) == 0
 
-def test_map_node_ids():
+@pytest.mark.parametrize("id_map_cls", [IdMap, ArrayIdMap])
+def test_map_node_ids(id_map_cls):
     # This tests all cases in map_node_ids.
     str_src_ids = np.array([str(i) for i in range(10)])
     str_dst_ids = np.array([str(i) for i in range(15)])
-    id_map = {"src": IdMap(str_src_ids),
-              "dst": IdMap(str_dst_ids)}
+    id_map = {"src": id_map_cls(str_src_ids),
+              "dst": id_map_cls(str_dst_ids)}
     check_map_node_ids_exist(str_src_ids, str_dst_ids, id_map)
     check_map_node_ids_src_not_exist(str_src_ids, str_dst_ids, id_map)
     check_map_node_ids_dst_not_exist(str_src_ids, str_dst_ids, id_map)
@@ -1595,6 +1742,78 @@ def test_merge_arrays():
         assert isinstance(em_arr, (np.ndarray, ExtMemArrayWrapper))
         np.testing.assert_array_equal(data1, em_arr)
 
+def test_edge_data_stager():
+    src_ids = [np.random.randint(100, size=10),
+               np.array([], dtype=np.int64),
+               np.random.randint(100, size=20),
+               np.random.randint(100, size=5)]
+    dst_ids = [np.random.randint(100, size=len(ids)) for ids in src_ids]
+    # An edge feature can be named as src_ids.
+    feats = [{"src_ids": np.random.uniform(size=len(ids)),
+              "feat": np.random.uniform(size=(len(ids), 4)),
+              LABEL_STATS_FIELD + "label": i} for i, ids in enumerate(src_ids)]
+
+    def check_stager(workspace, in_mem):
+        def count_staged_files():
+            return sum(len(files) for _, _, files \
+                       in os.walk(os.path.join(workspace, "staged")))
+
+        arr_merger = ExtMemArrayMerger(workspace, 2)
+        stager = _EdgeDataStager(arr_merger, "src-rel-dst", 0)
+        # The files are processed out of order and one of the files is empty.
+        for i in [2, 0, 4, 1, 3]:
+            data = (src_ids[i], dst_ids[i], feats[i]) if i < len(src_ids) else None
+            ret = stager(i, data)
+            if data is None:
+                assert ret is None
+                continue
+            # Only the label statistics are left in the parsed data.
+            assert ret[0] is None and ret[1] is None
+            assert ret[2] == {LABEL_STATS_FIELD + "label": i}
+            if workspace is not None and len(src_ids[i]) > 0:
+                # The staged chunks are stored in the workspace.
+                assert count_staged_files() > 0
+        assert stager.has_ids
+        assert stager.feat_names == ["src_ids", "feat"]
+        for feat_name in stager.feat_names:
+            merged_feat = stager.merge_feat(feat_name)
+            if isinstance(merged_feat, ExtMemArrayWrapper):
+                merged_feat = merged_feat.to_numpy()
+            assert_almost_equal(merged_feat,
+                                np.concatenate([feat[feat_name] for feat in feats]))
+        merged_src_ids, merged_dst_ids = stager.merge_ids()
+        assert isinstance(merged_src_ids, np.memmap) != in_mem
+        assert isinstance(merged_dst_ids, np.memmap) != in_mem
+        assert_equal(merged_src_ids, np.concatenate(src_ids))
+        assert_equal(merged_dst_ids, np.concatenate(dst_ids))
+        if workspace is not None:
+            # The staged chunks are removed after they are merged.
+            assert count_staged_files() == 0
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # The node IDs and edge data are staged in the workspace.
+        check_stager(tmpdirname, in_mem=False)
+        # Without the external-memory workspace, they are merged in memory.
+        check_stager(None, in_mem=True)
+
+        # All input files don't have valid edges.
+        stager = _EdgeDataStager(ExtMemArrayMerger(tmpdirname, 2), "src-rel-dst", 0)
+        stager(1, (src_ids[1], dst_ids[1], {}))
+        stager(0, None)
+        assert stager.has_ids
+        merged_src_ids, merged_dst_ids = stager.merge_ids()
+        assert len(merged_src_ids) == 0
+        assert len(merged_dst_ids) == 0
+
+        # The input files don't have node IDs.
+        stager = _EdgeDataStager(ExtMemArrayMerger(tmpdirname, 2), "src-rel-dst", 0)
+        stager(0, (None, None, {"feat": feats[0]["feat"]}))
+        assert not stager.has_ids
+        assert stager.feat_names == ["feat"]
+        assert_almost_equal(stager.merge_feat("feat").to_numpy(), feats[0]["feat"])
+        # Remove the merged arrays before the workspace is removed.
+        del stager
+
 @pytest.mark.parametrize("num_parts", [1, 2])
 def test_partition_graph(num_parts):
     # This is to verify the correctness of partition_graph.
@@ -1727,12 +1946,14 @@ def test_partition_graph(num_parts):
             pass
 
     # Partition the graph with our own partition_graph.
+    # A tiny memory budget shuffles the features of one partition at a time.
     dgl.random.seed(0)
     node_data1 = []
     edge_data1 = []
     with tempfile.TemporaryDirectory() as tmpdirname:
         partition_graph(g, node_data, edge_data, 'test', num_parts, tmpdirname,
-                        part_method="random", save_mapping=True)
+                        part_method="random", save_mapping=True,
+                        num_workers=2, mem_budget=1)
         for i in range(num_parts):
             part_dir = os.path.join(tmpdirname, "part" + str(i))
             node_data1.append(dgl.data.utils.load_tensors(os.path.join(part_dir,
@@ -14,8 +14,11 @@
     limitations under the License.
 """
 import os
+import sys
+import subprocess
 import tempfile
 import json
+from functools import partial
 
 import dgl
 import numpy as np
@@ -31,7 +34,8 @@ from numpy.testing import assert_almost_equal, assert_raises
 from graphstorm.gconstruct.utils import _estimate_sizeof, _to_numpy_array, _to_shared_memory
 from graphstorm.gconstruct.utils import HDF5Array, ExtNumpyWrapper
 from graphstorm.gconstruct.utils import convert_to_ext_mem_numpy, _to_ext_memory
-from graphstorm.gconstruct.utils import multiprocessing_data_read
+from graphstorm.gconstruct.utils import multiprocessing_data_read, DataReadWorkerPool
+from graphstorm.gconstruct.utils import _gather_rows, _shuffle_partition_feats
 from graphstorm.gconstruct.utils import (save_maps,
                                          load_maps,
                                          get_hard_edge_negs_feats,
@@ -233,6 +237,101 @@ def test_multiprocessing_read():
         return
     assert False
 
+def dummy_parse(in_file, scale):
+    return {"pid": os.getpid(),
+            "data": np.full((10, 2), int(in_file) * scale, dtype=np.int64)}
+
+def test_worker_pool_read():
+    in_files = [str(i) for i in range(10)]
+    with DataReadWorkerPool(3) as pool:
+        assert pool.num_processes == 3
+        pids = set()
+        for scale in [1, 2]:
+            return_dict = multiprocessing_data_read(in_files, 2,
+                                                    partial(dummy_parse, scale=scale),
+                                                    worker_pool=pool)
+            assert len(return_dict) == len(in_files)
+            for i in range(len(in_files)):
+                assert np.all(return_dict[i]["data"] == i * scale)
+                pids.add(return_dict[i]["pid"])
+        # The same worker processes are used by all calls.
+        assert len(pids) <= 2
+        assert os.getpid() not in pids
+
+        # The files are processed in the main process.
+        return_dict = multiprocessing_data_read(in_files, 1,
+                                                partial(dummy_parse, scale=1),
+                                                worker_pool=pool)
+        assert all(val["pid"] == os.getpid() for val in return_dict.values())
+
+    with DataReadWorkerPool(2) as pool:
+        with pytest.raises(RuntimeError):
+            multiprocessing_data_read(in_files, 2, dummy_read, worker_pool=pool)
+
+class _CountPickle:
+    """ An object that counts how many times it is pickled.
+    """
+    num_pickles = 0
+
+    def __init__(self, val):
+        self.val = val
+
+    def __reduce__(self):
+        _CountPickle.num_pickles += 1
+        return (_CountPickle, (self.val,))
+
+def shared_parse(in_file, objs):
+    return {"data": np.full((10, 2), int(in_file) * objs["a"].val, dtype=np.int64)}
+
+def test_worker_pool_share():
+    in_files = [str(i) for i in range(10)]
+    objs = {"a": _CountPickle(3)}
+    with DataReadWorkerPool(2) as pool:
+        pool.share(objs)
+        for _ in range(3):
+            return_dict = multiprocessing_data_read(in_files, 2,
+                                                    partial(shared_parse, objs=objs),
+                                                    worker_pool=pool)
+            for i in range(len(in_files)):
+                assert np.all(return_dict[i]["data"] == i * 3)
+    # The shared object is sent to each worker once instead of with every call.
+    assert _CountPickle.num_pickles == 2
+
+def test_worker_pool_error_exit():
+    # An error in the main process kills the workers that wait for tasks.
+    with pytest.raises(ValueError):
+        with DataReadWorkerPool(2) as pool:
+            processes = list(pool._processes)
+            assert all(proc.daemon for proc in processes)
+            raise ValueError("test error")
+    assert not any(proc.is_alive() for proc in processes)
+
+    # Graph construction exits with the error when a worker fails
+    # to read an input file, instead of hanging.
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        in_files = [os.path.join(tmpdirname, f"bad_file{i}.parquet") for i in range(2)]
+        for in_file in in_files:
+            with open(in_file, "w", encoding="utf8") as f:
+                f.write("not a parquet file")
+        conf = {
+            "version": "gconstruct-v0.1",
+            "nodes": [{"node_type": "n", "format": {"name": "parquet"},
+                       "files": in_files, "node_id_col": "id"}],
+            "edges": [],
+        }
+        conf_file = os.path.join(tmpdirname, "conf.json")
+        with open(conf_file, "w", encoding="utf8") as f:
+            json.dump(conf, f)
+        ret = subprocess.run([sys.executable, "-m", "graphstorm.gconstruct.construct_graph",
+                              "--conf-file", conf_file,
+                              "--output-dir", os.path.join(tmpdirname, "output"),
+                              "--graph-name", "test", "--num-processes", "2",
+                              "--use-worker-pool"],
+                             env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+                             capture_output=True, timeout=300, check=False)
+        assert ret.returncode != 0
+        assert b"One of the worker processes fails" in ret.stderr
+
 def test_read_empty_parquet():
     with tempfile.TemporaryDirectory() as tmpdirname:
         data_file = os.path.join(tmpdirname, "test.parquet")
@@ -525,6 +624,76 @@ def test_validate_numerical_feats():
                       [1,2,np.nan]])
     assert validate_numerical_feats(array) is False
 
+@pytest.mark.parametrize("num_rows", [0, 1, 7, 20, 100])
+def test_gather_rows(num_rows, monkeypatch):
+    # Use small chunks so that the rows are read across chunk boundaries.
+    monkeypatch.setattr("graphstorm.gconstruct.utils.FEAT_SHUFFLE_CHUNK_ROWS", 7)
+    data = np.random.rand(50, 4).astype(np.float32)
+    # The row indices are unsorted and contain duplicates.
+    orig_ids = np.random.randint(0, 50, size=num_rows)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        ext_data = convert_to_ext_mem_numpy(os.path.join(tmpdirname, "data.npy"), data)
+        for arr in [data, ext_data]:
+            rows = _gather_rows(arr, orig_ids)
+            assert isinstance(rows, th.Tensor)
+            assert rows.shape == (num_rows, 4)
+            np.testing.assert_equal(rows.numpy(), data[orig_ids])
+
+    # 1D arrays
+    data = np.arange(50) * 2
+    orig_ids = np.random.permutation(50)[:num_rows]
+    np.testing.assert_equal(_gather_rows(data, orig_ids).numpy(), data[orig_ids])
+
+@pytest.mark.parametrize("mem_budget", [0, 10 ** 9])
+@pytest.mark.parametrize("num_workers", [1, 4])
+def test_shuffle_partition_feats(mem_budget, num_workers, monkeypatch):
+    monkeypatch.setattr("graphstorm.gconstruct.utils.FEAT_SHUFFLE_CHUNK_ROWS", 3)
+    num_partitions = 3
+    feats = {
+        "n0": {"feat": np.random.rand(30, 4), "label": np.arange(30)},
+        "n1": {"feat": np.random.rand(20, 2)},
+    }
+    orig_id_keys = {"n0": "n0/orig_ids", "n1": "n1/orig_ids"}
+    n0_ids = np.array_split(np.random.permutation(30), num_partitions)
+    n1_ids = np.array_split(np.random.permutation(20), num_partitions)
+
+    events = []
+    gather_rows = graphstorm.gconstruct.utils._gather_rows
+    save_tensors = dgl.data.utils.save_tensors
+    def record_gather(data, orig_ids):
+        events.append("gather")
+        return gather_rows(data, orig_ids)
+    def record_save(path, data):
+        events.append("save")
+        save_tensors(path, data)
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        for i in range(num_partitions):
+            part_dir = os.path.join(tmpdirname, f"part{i}")
+            os.makedirs(part_dir)
+            dgl.data.utils.save_tensors(os.path.join(part_dir, "node_feat.dgl"),
+                                        {"n0/orig_ids": th.tensor(n0_ids[i]),
+                                         "n1/orig_ids": th.tensor(n1_ids[i])})
+
+        monkeypatch.setattr("graphstorm.gconstruct.utils._gather_rows", record_gather)
+        monkeypatch.setattr("dgl.data.utils.save_tensors", record_save)
+        _shuffle_partition_feats(tmpdirname, num_partitions, "node_feat.dgl", feats,
+                                 orig_id_keys, num_workers, mem_budget)
+
+        for i in range(num_partitions):
+            data = dgl.data.utils.load_tensors(
+                os.path.join(tmpdirname, f"part{i}", "node_feat.dgl"))
+            assert set(data.keys()) == {"n0/feat", "n0/label", "n1/feat"}
+            np.testing.assert_equal(data["n0/feat"].numpy(), feats["n0"]["feat"][n0_ids[i]])
+            np.testing.assert_equal(data["n0/label"].numpy(), feats["n0"]["label"][n0_ids[i]])
+            np.testing.assert_equal(data["n1/feat"].numpy(), feats["n1"]["feat"][n1_ids[i]])
+
+    assert events.count("gather") == 3 * num_partitions
+    assert events.count("save") == num_partitions
+    if mem_budget == 0:
+        # Only one partition is gathered at a time.
+        assert events == ["gather", "gather", "gather", "save"] * num_partitions
+
 if __name__ == '__main__':
     test_validate_numerical_feats()
     test_validate_features()
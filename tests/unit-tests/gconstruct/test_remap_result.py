@@ -397,6 +397,26 @@ def test_write_data_csv_file():
 
         check_write_content(output_fname, ["new_emb", "new_nid", "pred"])
 
+def test_write_data_in_blocks():
+    data = {"emb": np.random.rand(25, 8).astype(np.float32),
+            "nid": np.arange(25)}
+    blocks = [{key: val[start:start+10] for key, val in data.items()} \
+              for start in range(0, 25, 10)]
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        file_prefix = os.path.join(tmpdirname, "test")
+        write_data_parquet_file(iter(blocks), file_prefix)
+        parq_data = read_data_parquet(f"{file_prefix}.parquet", ["emb", "nid"])
+        assert_equal(data["emb"], parq_data["emb"])
+        assert_equal(data["nid"], parq_data["nid"])
+
+        write_data_csv_file(iter(blocks), file_prefix)
+        csv_data = pd.read_csv(f"{file_prefix}.csv", delimiter=",")
+        assert len(csv_data) == 25
+        csv_emb_data = np.array([d.split(";") for d in csv_data["emb"]], dtype=np.float32)
+        assert_equal(data["emb"], csv_emb_data)
+        assert_equal(data["nid"], csv_data["nid"].values)
+
 def test_parse_config():
     with tempfile.TemporaryDirectory() as tmpdirname:
         part_path = os.path.join(tmpdirname, "tmp.json")
@@ -13,21 +13,29 @@
     See the License for the specific language governing permissions and
     limitations under the License.
 """
+import os
 import pytest
 import inspect
+import tempfile
+from types import SimpleNamespace
 
 import numpy as np
+import torch as th
 from numpy.testing import assert_equal, assert_almost_equal, assert_raises
-from scipy.special import erfinv
+from scipy.special import erf, erfinv
 
 from graphstorm.gconstruct.transform import (_get_output_dtype,
                                              NumericalMinMaxTransform,
                                              NumericalStandardTransform,
                                              Noop,
                                              RankGaussTransform,
+                                             ApproxRankGaussTransform,
                                              CategoricalTransform,
                                              BucketTransform,
-                                             HardEdgeDstNegativeTransform)
+                                             HardEdgeDstNegativeTransform,
+                                             Text2BERT,
+                                             EmbeddingCache,
+                                             parse_feat_ops)
 from graphstorm.gconstruct.transform import (_check_label_stats_type,
                                              collect_label_stats,
                                              CustomLabelProcessor,
@@ -554,6 +562,109 @@ def test_categorize_transform():
         feat[int(str_i)] = 0
         assert np.all(feat == 0)
 
+def test_categorize_transform_index_output():
+    # Test a single categorical value.
+    transform_conf = {
+        "name": "to_categorical",
+        "output_format": "index"
+    }
+    transform = CategoricalTransform("test1", "test", transform_conf=transform_conf,
+                                     output_format="index")
+    str_ids = np.array([str(i) for i in np.random.randint(0, 10, 1000)] + [None], dtype=object)
+    res = transform.pre_process(str_ids)
+    transform.update_info([res["test"]])
+    feat = np.array([str(i) for i in np.random.randint(0, 10, 100)] + [None, "10"],
+                    dtype=object)
+    cat_feat = transform(feat)["test"]
+    assert cat_feat.shape == (len(feat), 1)
+    for idx, str_i in zip(cat_feat[:100, 0], feat[:100]):
+        assert idx == transform_conf["mapping"][str_i]
+    # None and unknown values are -1.
+    assert cat_feat[100, 0] == -1
+    assert cat_feat[101, 0] == -1
+
+    # The index output is consistent with the one-hot output.
+    one_hot_transform = CategoricalTransform("test1", "test",
+                                             transform_conf={"name": "to_categorical"})
+    one_hot_transform.update_info([res["test"]])
+    one_hot_feat = one_hot_transform(feat[:100])["test"]
+    assert_equal(np.argmax(one_hot_feat, axis=1), cat_feat[:100, 0])
+
+    # Test multiple categorical values.
+    transform_conf = {
+        "name": "to_categorical",
+        "output_format": "index"
+    }
+    transform = CategoricalTransform("test1", "test", separator=',',
+                                     transform_conf=transform_conf,
+                                     output_format="index")
+    str_ids = [f"{i},{i+1}" for i in np.random.randint(0, 9, 1000)] + ["0,1,2"]
+    info = [transform.pre_process(np.array(str_ids[:500]))["test"],
+            transform.pre_process(np.array(str_ids[500:]))["test"]]
+    transform.update_info(info)
+    assert transform_conf["max_dim"] == 3
+    assert len(transform_conf["mapping"]) == 10
+    feat = np.array(["1,2", "3", "4,5,6", "7,100"])
+    cat_feat = transform(feat)["test"]
+    mapping = transform_conf["mapping"]
+    assert_equal(cat_feat, np.array([[mapping["1"], mapping["2"], -1],
+                                     [mapping["3"], -1, -1],
+                                     [mapping["4"], mapping["5"], mapping["6"]],
+                                     [mapping["7"], -1, -1]]))
+
+    # Reuse the mapping and max_dim in the configuration.
+    transform = CategoricalTransform("test1", "test", separator=',',
+                                     transform_conf=transform_conf,
+                                     output_format="index")
+    assert len(transform.pre_process(np.array(str_ids))) == 0
+    transform.update_info([])
+    assert_equal(transform(feat)["test"], cat_feat)
+
+    # Parse the transformation from the feature configuration.
+    (ops, _, _, _) = parse_feat_ops([{"feature_col": "test1",
+                                      "transform": transform_conf}])
+    assert isinstance(ops[0], CategoricalTransform)
+    assert ops[0]._output_format == "index"
+
+def test_categorize_transform_unknown_values():
+    # Test a single categorical value.
+    transform_conf = {
+        "name": "to_categorical"
+    }
+    transform = CategoricalTransform("test1", "test", transform_conf=transform_conf)
+    str_ids = np.array([str(i) for i in np.random.randint(0, 10, 1000)] + [None], dtype=object)
+    res = transform.pre_process(str_ids)
+    transform.update_info([res["test"]])
+    feat = np.array([str(i) for i in np.random.randint(0, 10, 100)] + [None, "10"],
+                    dtype=object)
+    cat_feat = transform(feat)["test"]
+    assert cat_feat.shape == (len(feat), 10)
+    for one_hot, str_i in zip(cat_feat[:100], feat[:100]):
+        assert np.sum(one_hot) == 1
+        assert one_hot[transform_conf["mapping"][str_i]] == 1
+    # None and unknown values are all zeros.
+    assert np.all(cat_feat[100:] == 0)
+
+    # Test multiple categorical values.
+    transform_conf = {
+        "name": "to_categorical"
+    }
+    transform = CategoricalTransform("test1", "test", separator=',',
+                                     transform_conf=transform_conf)
+    str_ids = [f"{i},{i+1}" for i in np.random.randint(0, 9, 1000)] + ["0,1,2"]
+    info = [transform.pre_process(np.array(str_ids[:500]))["test"],
+            transform.pre_process(np.array(str_ids[500:]))["test"]]
+    transform.update_info(info)
+    assert len(transform_conf["mapping"]) == 10
+    feat = np.array(["1,2", "3", "4,5,6", "7,100"])
+    cat_feat = transform(feat)["test"]
+    mapping = transform_conf["mapping"]
+    expected = np.zeros((len(feat), 10), dtype=np.int8)
+    for i, vals in enumerate([["1", "2"], ["3"], ["4", "5", "6"], ["7"]]):
+        for val in vals:
+            expected[i, mapping[val]] = 1
+    assert_equal(cat_feat, expected)
+
 @pytest.mark.parametrize("out_dtype", [None, np.float16, np.float64])
 def test_noop_transform(out_dtype):
     transform = Noop("test", "test", out_dtype=out_dtype)
@@ -583,6 +694,180 @@ def test_noop_truncate():
     assert trunc_feats["test"].shape[1] == 16
 
 
+class DummyTokenizer:
+    """ Tokenize a string into the code points of its characters.
+    """
+    def __init__(self, max_seq_length):
+        self.max_seq_length = max_seq_length
+        self.num_calls = 0
+
+    def __call__(self, strs):
+        self.num_calls += 1
+        tokens = np.zeros((len(strs), self.max_seq_length), dtype=np.int64)
+        att_masks = np.zeros((len(strs), self.max_seq_length), dtype=np.int8)
+        for i, s in enumerate(strs):
+            codes = [ord(c) for c in s[:self.max_seq_length]]
+            tokens[i, :len(codes)] = codes
+            att_masks[i, :len(codes)] = 1
+        return {"input_ids": tokens, "attention_mask": att_masks,
+                "token_type_ids": np.zeros_like(att_masks)}
+
+class DummyLM(th.nn.Module):
+    """ Compute the masked mean and max of the token ids.
+    """
+    def __init__(self):
+        super().__init__()
+        self.num_texts = 0
+        self.config = SimpleNamespace(hidden_size=2)
+
+    def forward(self, tokens, attention_mask, token_type_ids):
+        self.num_texts += len(tokens)
+        masked = tokens.float() * attention_mask
+        lens = attention_mask.sum(dim=1, keepdim=True).clamp(min=1)
+        return SimpleNamespace(pooler_output=th.cat(
+            [masked.sum(dim=1, keepdim=True) / lens,
+             masked.max(dim=1, keepdim=True).values], dim=1))
+
+def _expected_embs(strs, max_seq_length):
+    embs = np.zeros((len(strs), 2), dtype=np.float32)
+    for i, s in enumerate(strs):
+        codes = [ord(c) for c in s[:max_seq_length]]
+        if len(codes) > 0:
+            embs[i] = [np.mean(codes), np.max(codes)]
+    return embs
+
+@pytest.mark.parametrize("infer_batch_size", [None, 3])
+def test_text2bert_dedup_and_cache(infer_batch_size):
+    strs = np.array(["graph", "a", "storm", "graph", "", "a much longer string",
+                     "storm", "a", "gnn"])
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        transform = Text2BERT("test", "test", DummyTokenizer(8), "dummy",
+                              infer_batch_size=infer_batch_size, cache_dir=tmpdirname)
+        transform.lm_model = DummyLM()
+        embs = transform(strs)["test"]
+        assert embs.dtype == np.float32
+        assert_almost_equal(embs, _expected_embs(strs, 8))
+        # Duplicated strings are only embedded once.
+        assert transform.lm_model.num_texts == len(np.unique(strs))
+
+        # A new transformation reuses the cached embeddings.
+        transform = Text2BERT("test", "test", DummyTokenizer(8), "dummy",
+                              infer_batch_size=infer_batch_size, cache_dir=tmpdirname)
+        transform.lm_model = DummyLM()
+        new_strs = np.array(["storm", "gnn", "new", "graph"])
+        embs = transform(new_strs)["test"]
+        assert_almost_equal(embs, _expected_embs(new_strs, 8))
+        assert transform.lm_model.num_texts == 1
+        embs = transform(strs)["test"]
+        assert_almost_equal(embs, _expected_embs(strs, 8))
+        assert transform.lm_model.num_texts == 1
+        assert transform.tokenizer.num_calls == 1
+
+        # The cache is keyed by the model name and the maximal sequence length.
+        transform = Text2BERT("test", "test", DummyTokenizer(4), "dummy",
+                              infer_batch_size=infer_batch_size, cache_dir=tmpdirname)
+        transform.lm_model = DummyLM()
+        embs = transform(strs)["test"]
+        assert_almost_equal(embs, _expected_embs(strs, 4))
+        assert transform.lm_model.num_texts == len(np.unique(strs))
+
+def test_text2bert_missing_values():
+    transform = Text2BERT("test", "test", DummyTokenizer(8), "dummy")
+    transform.lm_model = DummyLM()
+    # None and NaN are embedded as zeros.
+    strs = np.array(["graph", None, "storm", np.nan, "graph"], dtype=object)
+    embs = transform(strs)["test"]
+    expected = _expected_embs(["graph", "", "storm", "", "graph"], 8)
+    assert_almost_equal(embs, expected)
+    assert transform.lm_model.num_texts == 2
+
+    # The input only has missing values.
+    embs = transform(np.array([None, None], dtype=object))["test"]
+    assert embs.shape == (2, 2)
+    assert np.all(embs == 0)
+
+    # The input is empty.
+    embs = transform(np.array([], dtype=str))["test"]
+    assert embs.shape == (0, 2)
+    assert transform.lm_model.num_texts == 2
+
+def test_embedding_cache():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cache = EmbeddingCache(tmpdirname, "dummy", 16)
+        keys = cache.hash_texts(["a", "b", "c"])
+        assert keys.shape == (3,)
+        assert len(np.unique(keys)) == 3
+        found, embs = cache.get(keys)
+        assert not found.any()
+        assert embs is None
+
+        cache.put(keys[:2], np.array([[1, 2], [3, 4]], dtype=np.float32))
+        found, embs = cache.get(keys[::-1])
+        assert_equal(found, [False, True, True])
+        assert_equal(embs, [[3, 4], [1, 2]])
+
+        # Another cache object sees the shards written by others.
+        cache2 = EmbeddingCache(tmpdirname, "dummy", 16)
+        cache2.put(keys[2:], np.array([[5, 6]], dtype=np.float32))
+        found, embs = cache2.get(keys)
+        assert found.all()
+        assert_equal(embs, [[1, 2], [3, 4], [5, 6]])
+        # There are no temporary files left.
+        assert all(not name.endswith(".tmp") \
+            for _, _, names in os.walk(tmpdirname) for name in names)
+
+        # Different models don't share embeddings.
+        cache3 = EmbeddingCache(tmpdirname, "dummy2", 16)
+        found, _ = cache3.get(cache3.hash_texts(["a", "b", "c"]))
+        assert not found.any()
+
+@pytest.mark.parametrize("out_dtype", [None, np.float16])
+def test_approx_rank_gauss_transform(out_dtype):
+    eps = 1e-6
+    feats = [np.random.randn(1000, 2).astype(np.float32) for _ in range(4)]
+    # Small sketches are exact when the files are smaller than num_quantiles.
+    transform = ApproxRankGaussTransform("test", "test", out_dtype=out_dtype,
+                                         epsilon=eps, num_quantiles=2000)
+    info = [transform.pre_process(feat)["test"] for feat in feats]
+    transform.update_info(info)
+    trans_feats = [transform(feat)["test"] for feat in feats]
+    if out_dtype is not None:
+        assert trans_feats[0].dtype == np.float16
+    else:
+        assert trans_feats[0].dtype == np.float32
+
+    exact_transform = RankGaussTransform("test", "test", epsilon=eps)
+    exact_feat = exact_transform.after_merge_transform(np.concatenate(feats))
+    assert_almost_equal(np.concatenate(trans_feats).astype(np.float32), exact_feat,
+                        decimal=2 if out_dtype is not None else 4)
+
+    # Approximate with small sketches.
+    transform = ApproxRankGaussTransform("test", "test", epsilon=eps, num_quantiles=64)
+    info = [transform.pre_process(feat)["test"] for feat in feats]
+    transform.update_info(info)
+    trans_feat = np.concatenate([transform(feat)["test"] for feat in feats])
+    # Compare the CDF values. The approximation error is bounded by the sketch size.
+    approx_cdf = (erf(trans_feat) + 1) / 2
+    exact_cdf = (erf(exact_feat) + 1) / 2
+    assert np.max(np.abs(approx_cdf - exact_cdf)) < 0.05
+    # The transformation keeps the order of values.
+    for col in range(2):
+        order = np.argsort(np.concatenate(feats)[:, col])
+        assert np.all(np.diff(trans_feat[order, col]) >= 0)
+
+    # Values out of the range of the sketch.
+    res = transform(np.array([[-100., 100.], [100., -100.]], dtype=np.float32))["test"]
+    assert_almost_equal(res, erfinv(np.array([[-1 + eps, 1 - eps], [1 - eps, -1 + eps]])),
+                        decimal=4)
+
+    # Parse the transformation from the feature configuration.
+    (ops, two_phase_ops, after_merge_ops, _) = parse_feat_ops([{
+        "feature_col": "test",
+        "transform": {"name": "rank_gauss", "approx": True, "num_quantiles": 128}}])
+    assert isinstance(ops[0], ApproxRankGaussTransform)
+    assert len(two_phase_ops) == 1
+    assert len(after_merge_ops) == 0
+
 @pytest.mark.parametrize("input_dtype", [np.cfloat, np.float32])
 @pytest.mark.parametrize("out_dtype", [None, np.float16])
 def test_rank_gauss_transform(input_dtype, out_dtype):
@@ -1356,6 +1641,11 @@ if __name__ == '__main__':
     test_bucket_transform(None)
     test_bucket_transform(np.float16)
 
+    test_approx_rank_gauss_transform(None)
+    test_approx_rank_gauss_transform(np.float16)
+    test_text2bert_dedup_and_cache(None)
+    test_text2bert_dedup_and_cache(3)
+    test_embedding_cache()
     test_rank_gauss_transform(np.cfloat, None)
     test_rank_gauss_transform(np.cfloat, np.float16)
     test_rank_gauss_transform(np.float32, None)
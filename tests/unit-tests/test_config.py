@@ -285,6 +285,10 @@ def create_train_config(tmp_path, file_name):
         "use_self_loop": False,
         "use_early_stop": True,
         "save_model_path": os.path.join(tmp_path, "save"),
+        "prefetch_depth": 2,
+        "node_feat_cache_size": 128,
+        "node_feat_cache_policy": "lfu",
+        "precision": "bf16",
     }
 
     with open(os.path.join(tmp_path, file_name+".yaml"), "w") as f:
@@ -338,6 +342,10 @@ def create_train_config(tmp_path, file_name):
         "early_stop_rounds": 0,
         "wd_l2norm": "NA",
         "alpha_l2norm": "NA",
+        "prefetch_depth": -1,
+        "node_feat_cache_size": -1,
+        "node_feat_cache_policy": "fifo",
+        "precision": "fp8",
     }
 
     with open(os.path.join(tmp_path, file_name+"_fail.yaml"), "w") as f:
@@ -376,6 +384,10 @@ def test_train_info():
         assert config.use_node_embeddings == False
         assert config.use_self_loop == True
         assert config.use_early_stop == False
+        assert config.prefetch_depth == 0
+        assert config.node_feat_cache_size == 0
+        assert config.node_feat_cache_policy == "lru"
+        assert config.precision == "fp32"
 
         args = Namespace(yaml_config_file=os.path.join(Path(tmpdirname), 'train_test.yaml'), local_rank=0)
         config = GSConfig(args)
@@ -395,6 +407,10 @@ def test_train_info():
         assert config.use_early_stop == True
         assert config.early_stop_burnin_rounds == 0
         assert config.early_stop_rounds == 3
+        assert config.prefetch_depth == 2
+        assert config.node_feat_cache_size == 128
+        assert config.node_feat_cache_policy == "lfu"
+        assert config.precision == "bf16"
 
         args = Namespace(yaml_config_file=os.path.join(Path(tmpdirname), 'train_test1.yaml'), local_rank=0)
         config = GSConfig(args)
@@ -435,6 +451,10 @@ def test_train_info():
         check_failure(config, "early_stop_rounds")
         check_failure(config, "wd_l2norm")
         check_failure(config, "alpha_l2norm")
+        check_failure(config, "prefetch_depth")
+        check_failure(config, "node_feat_cache_size")
+        check_failure(config, "node_feat_cache_policy")
+        check_failure(config, "precision")
 
         args = Namespace(yaml_config_file=os.path.join(Path(tmpdirname), 'train_test_fail1.yaml'), local_rank=0)
         config = GSConfig(args)
@@ -454,12 +474,14 @@ def create_rgcn_config(tmp_path, file_name):
 
     yaml_object["gsf"]["rgcn"] = {
         "num_bases": 2,
+        "fuse_relations": True,
     }
     with open(os.path.join(tmp_path, file_name+".yaml"), "w") as f:
         yaml.dump(yaml_object, f)
 
     yaml_object["gsf"]["rgcn"] = {
         "num_bases": 0.1,
+        "fuse_relations": "yes",
     }
     with open(os.path.join(tmp_path, file_name+"_fail.yaml"), "w") as f:
         yaml.dump(yaml_object, f)
@@ -476,14 +498,17 @@ def test_rgcn_info():
         args = Namespace(yaml_config_file=os.path.join(Path(tmpdirname), 'rgcn_test_default.yaml'), local_rank=0)
         config = GSConfig(args)
         assert config.num_bases == -1
+        assert config.fuse_relations == False
 
         args = Namespace(yaml_config_file=os.path.join(Path(tmpdirname), 'rgcn_test.yaml'), local_rank=0)
         config = GSConfig(args)
         assert config.num_bases == 2
+        assert config.fuse_relations == True
 
         args = Namespace(yaml_config_file=os.path.join(Path(tmpdirname), 'rgcn_test_fail.yaml'), local_rank=0)
         config = GSConfig(args)
         check_failure(config, "num_bases")
+        check_failure(config, "fuse_relations")
 
         args = Namespace(yaml_config_file=os.path.join(Path(tmpdirname), 'rgcn_test_fail2.yaml'), local_rank=0)
         config = GSConfig(args)
@@ -1321,12 +1346,15 @@ def create_gnn_config(tmp_path, file_name):
     yaml_object["gsf"]["gnn"] = {
         "node_feat_name": ["ntype0:feat_name"],
         "edge_feat_name": ["ntype0, rel0, ntype1:feat_name"],
+        "node_feat_num_categories": ["ntype0:100"],
+        "edge_feat_num_categories": ["ntype0, rel0, ntype1:10"],
         "edge_feat_mp_op": "mul",
         "fanout": "n1/a/n2:10@n1/b/n2:10,n1/a/n2:10@n1/b/n2:10@n1/c/n2:20",
         "eval_fanout": "-1,10",
         "num_layers": 2,
         "hidden_size": 128,
         "use_mini_batch_infer": True,
+        "infer_pipeline_depth": 2,
         "num_ffn_layers_in_gnn": 1,
         "num_ffn_layers_in_input": 1
     }
@@ -1341,6 +1369,8 @@ def create_gnn_config(tmp_path, file_name):
         "node_feat_name": ["ntype0:feat_name,feat_name2", "ntype1:fname"],
         "edge_feat_name": ["ntype0, rel0, ntype1:feat_name, feat_name2",
                            "ntype1, rel1, ntype2:fname"],
+        "node_feat_num_categories": ["ntype0:100"], # ntype0 has two features
+        "edge_feat_num_categories": ["ntype1, rel1, ntype2:10"],
         "edge_feat_mp_op": "add",
     }
     with open(os.path.join(tmp_path, file_name+"3.yaml"), "w") as f:
@@ -1398,7 +1428,10 @@ def create_gnn_config(tmp_path, file_name):
         "eval_fanout": "error",
         "hidden_size": 0,
         "num_layers": 0,
-        "use_mini_batch_infer": "error"
+        "use_mini_batch_infer": "error",
+        "infer_pipeline_depth": -1,
+        "node_feat_num_categories": ["ntype0:error"],
+        "edge_feat_num_categories": ["ntype0, rel0:10"] # error of can_etype format
     }
     with open(os.path.join(tmp_path, file_name+"_error1.yaml"), "w") as f:
         yaml.dump(yaml_object, f)
@@ -1449,6 +1482,9 @@ def test_gnn_info():
         assert config.num_layers == 3
         assert config.hidden_size == 128
         assert config.use_mini_batch_infer == False
+        assert config.infer_pipeline_depth == 0
+        assert config.node_feat_num_categories is None
+        assert config.edge_feat_num_categories is None
 
         args = Namespace(yaml_config_file=os.path.join(Path(tmpdirname), 'gnn_test2.yaml'),
                          local_rank=0)
@@ -1457,6 +1493,8 @@ def test_gnn_info():
         assert 'ntype0' in config.node_feat_name
         assert config.node_feat_name['ntype0'] == ["feat_name"]
         assert config.edge_feat_name[("ntype0", "rel0", "ntype1")] == ["feat_name"]
+        assert config.node_feat_num_categories == {"ntype0": 100}
+        assert config.edge_feat_num_categories == {("ntype0", "rel0", "ntype1"): 10}
         assert config.edge_feat_mp_op == "mul"
         assert config.fanout[0][("n1","a","n2")] == 10
         assert config.fanout[0][("n1","b","n2")] == 10
@@ -1467,6 +1505,7 @@ def test_gnn_info():
         assert config.num_layers == 2
         assert config.hidden_size == 128
         assert config.use_mini_batch_infer == True
+        assert config.infer_pipeline_depth == 2
         assert config.num_ffn_layers_in_input == 1
         assert config.num_ffn_layers_in_gnn == 1
 
@@ -1482,6 +1521,8 @@ def test_gnn_info():
         assert ("ntype1", "rel1", "ntype2") in config.edge_feat_name
         assert config.edge_feat_name[("ntype0", "rel0", "ntype1")] == ["feat_name", "feat_name2"]
         assert config.edge_feat_name[("ntype1", "rel1", "ntype2")] == ["fname"]
+        check_failure(config, "node_feat_num_categories")
+        assert config.edge_feat_num_categories == {("ntype1", "rel1", "ntype2"): 10}
         assert config.edge_feat_mp_op == "add"
         assert config.use_mini_batch_infer == True
 
@@ -1545,6 +1586,9 @@ def test_gnn_info():
         check_failure(config, "hidden_size")
         check_failure(config, "num_layers")
         check_failure(config, "use_mini_batch_infer")
+        check_failure(config, "infer_pipeline_depth")
+        check_failure(config, "node_feat_num_categories")
+        check_failure(config, "edge_feat_num_categories")
 
         args = Namespace(yaml_config_file=os.path.join(Path(tmpdirname), 'gnn_test_error2.yaml'),
                          local_rank=0)
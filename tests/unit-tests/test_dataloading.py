@@ -18,6 +18,8 @@
 import os
 import tempfile
 import shutil
+import threading
+import time
 import numpy as np
 import multiprocessing as mp
 import torch.distributed as dist
@@ -64,6 +66,8 @@ from graphstorm.dataloading import (GSgnnLinkPredictionTestDataLoader,
 from graphstorm.dataloading import DistillDataloaderGenerator, DistillDataManager
 from graphstorm.dataloading import DistributedFileSampler
 from graphstorm.dataloading import GSgnnMultiTaskDataLoader
+from graphstorm.dataloading import GSgnnPrefetchLoader, move_to_device
+from graphstorm.dataloading import FeatRowCache
 from graphstorm.dataloading import (BUILTIN_LP_UNIFORM_NEG_SAMPLER,
                                     BUILTIN_LP_JOINT_NEG_SAMPLER,
                                     BUILTIN_LP_FIXED_NEG_SAMPLER)
@@ -1999,6 +2003,43 @@ def test_hard_edge_dst_negative_sample_generate_complex_case():
             assert hard_neg_dst.issubset(hard_neg_set)
     check_more_hard_negs(hard_sampler, etype2, hard2)
 
+def test_hard_edge_dst_negative_sample_ragged():
+    # test GSHardEdgeDstNegativeSampler._generate when every edge has
+    # a different number of valid hard negatives, including none.
+    num_nodes = 1000
+    num_negs = 10
+    _, etype1, _, hard1, _, _, src, _, g = _create_hard_neg_graph(num_nodes, num_negs)
+    hard1[:] = th.randperm(num_nodes)[:num_negs]
+    num_valid = th.arange(num_nodes) % (num_negs + 1)
+    hard1[th.arange(num_negs).unsqueeze(0) >= num_valid.unsqueeze(1)] = -1
+    g.edges[etype1].data["hard_negative"] = hard1
+
+    num_edges = 100
+    eids = th.arange(num_edges)
+    for num_hard_negs in [4, num_negs]:
+        sampler = GlobalUniform(num_negs)
+        hard_sampler = GSHardEdgeDstNegativeSampler(num_negs, "hard_negative",
+                                                    sampler, num_hard_negs=num_hard_negs)
+        neg_src, neg_dst = hard_sampler._generate(g, eids, etype1)
+        assert_equal(th.repeat_interleave(src[:num_edges], num_negs, 0).numpy(),
+                     neg_src.numpy())
+        neg_dst = neg_dst.reshape(num_edges, num_negs)
+        assert th.sum(neg_dst == -1) == 0
+        for i in range(num_edges):
+            num_hard = min(int(num_valid[i]), num_hard_negs)
+            hard_neg_set = set(hard1[i][:num_valid[i]].tolist())
+            # the first num_hard negatives are distinct valid hard negatives
+            assert len(set(neg_dst[i][:num_hard].tolist())) == num_hard
+            assert set(neg_dst[i][:num_hard].tolist()).issubset(hard_neg_set)
+
+    # every valid hard negative should be sampled when only one is required
+    hard_sampler = GSHardEdgeDstNegativeSampler(num_negs, "hard_negative",
+                                                GlobalUniform(num_negs), num_hard_negs=1)
+    eids = th.full((2000,), 5, dtype=th.int64)
+    _, neg_dst = hard_sampler._generate(g, eids, etype1)
+    sampled = set(neg_dst.reshape(-1, num_negs)[:, 0].tolist())
+    assert sampled == set(hard1[5][:5].tolist())
+
 def test_hard_edge_dst_negative_sample_generate():
     # test GSHardEdgeDstNegativeSampler._generate with fast track when all pos edges have enough hard negatives defined
     num_nodes = 100
@@ -2632,6 +2673,184 @@ def run_dist_small_val_test(part_config, worker_rank, world_size):
     if worker_rank == 0:
         th.distributed.destroy_process_group()
 
+@pytest.mark.parametrize("prefetch_depth", [0, 1, 3])
+def test_GSgnnPrefetchLoader(prefetch_depth):
+    class DummyLoader:
+        def __init__(self, num_batches, fail_at=None):
+            self.num_batches = num_batches
+            self.fail_at = fail_at
+            self.num_sampled = 0
+            self.sample_threads = set()
+
+        def __len__(self):
+            return self.num_batches
+
+        def __iter__(self):
+            for i in range(self.num_batches):
+                self.sample_threads.add(threading.get_ident())
+                if i == self.fail_at:
+                    raise RuntimeError("sampling fails")
+                self.num_sampled += 1
+                yield th.full((4,), i)
+
+    fetch_threads = set()
+    to_device_threads = set()
+    def fetch(batch):
+        fetch_threads.add(threading.get_ident())
+        return batch, batch * 2
+
+    def to_device(batch):
+        to_device_threads.add(threading.get_ident())
+        if th.all(batch[0] == -1):
+            raise RuntimeError("copy fails")
+        return move_to_device(batch, th.device("cpu"))
+
+    loader = DummyLoader(10)
+    prefetch_loader = GSgnnPrefetchLoader(loader, fetch, to_device,
+                                          prefetch_depth=prefetch_depth)
+    assert len(prefetch_loader) == 10
+    assert prefetch_loader.prefetch_depth == prefetch_depth
+    # Iterate over the loader for multiple epochs.
+    for _ in range(2):
+        batches = list(prefetch_loader)
+        assert len(batches) == 10
+        for i, (batch, fetched) in enumerate(batches):
+            assert th.all(batch == i)
+            assert th.all(fetched == i * 2)
+    # Sampling, fetching and the device copies are all done in the calling thread
+    # without prefetching and never in the calling thread with prefetching.
+    if prefetch_depth == 0:
+        assert loader.sample_threads == {threading.get_ident()}
+        assert fetch_threads == {threading.get_ident()}
+        assert to_device_threads == {threading.get_ident()}
+    else:
+        assert threading.get_ident() not in loader.sample_threads
+        assert threading.get_ident() not in fetch_threads
+        assert threading.get_ident() not in to_device_threads
+
+    # The background thread does not sample or fetch mini-batches when it is paused.
+    loader = DummyLoader(100)
+    prefetch_loader = GSgnnPrefetchLoader(loader, fetch, to_device,
+                                          prefetch_depth=prefetch_depth)
+    for i, (batch, _) in enumerate(prefetch_loader):
+        assert th.all(batch == i)
+        with prefetch_loader.pause():
+            num_sampled = loader.num_sampled
+            time.sleep(0.05)
+            assert loader.num_sampled == num_sampled
+        if i == 2:
+            break
+
+    # Stop iterating early. The background thread stops prefetching.
+    loader = DummyLoader(100)
+    num_threads = threading.active_count()
+    for i, (batch, _) in enumerate(GSgnnPrefetchLoader(loader, fetch, to_device,
+                                                       prefetch_depth=prefetch_depth)):
+        assert th.all(batch == i)
+        if i == 4:
+            break
+    # The background thread may hold one more mini-batch than the queue.
+    assert loader.num_sampled <= 5 + prefetch_depth + min(prefetch_depth, 1)
+    assert threading.active_count() == num_threads
+
+    # The errors in sampling are raised in the main thread.
+    loader = DummyLoader(10, fail_at=5)
+    with pytest.raises(RuntimeError, match="sampling fails"):
+        for i, (batch, _) in enumerate(GSgnnPrefetchLoader(loader, fetch, to_device,
+                                                           prefetch_depth=prefetch_depth)):
+            assert th.all(batch == i)
+    assert loader.num_sampled == 5
+
+    # The errors in the background thread are raised in the main thread.
+    loader = DummyLoader(10)
+    with pytest.raises(RuntimeError, match="copy fails"):
+        for batch, _ in GSgnnPrefetchLoader(loader, lambda batch: (batch * 0 - 1, batch),
+                                            to_device, prefetch_depth=prefetch_depth):
+            pass
+
+def test_move_to_device():
+    g = dgl.graph((th.tensor([0, 1]), th.tensor([1, 2])))
+    data = ({"n": th.arange(3)}, [g, None], th.ones(2), "name")
+    moved = move_to_device(data, th.device("cpu"))
+    assert isinstance(moved, tuple)
+    assert th.all(moved[0]["n"] == th.arange(3))
+    assert isinstance(moved[1], list)
+    assert moved[1][0].num_edges() == 2
+    assert moved[1][1] is None
+    assert th.all(moved[2] == 1)
+    assert moved[3] == "name"
+
+@pytest.mark.parametrize("policy", ["lru", "lfu", "degree"])
+def test_feat_row_cache(policy):
+    feats = th.arange(100 * 4, dtype=th.float32).reshape(100, 4)
+    cache = FeatRowCache(10, (4,), th.float32, policy=policy)
+    assert cache.capacity == 10
+    assert cache.num_cached == 0
+
+    def access(nids):
+        hit, rows = cache.lookup(nids)
+        assert_equal(rows.numpy(), feats[nids[hit]].numpy())
+        cache.admit(nids[~hit], feats[nids[~hit]])
+        return hit
+
+    hit = access(th.tensor([1, 3, 5, 7]))
+    assert not hit.any()
+    if policy == "degree":
+        # The degree policy only caches the rows filled in advance.
+        assert cache.num_cached == 0
+        cache.fill(th.tensor([3, 5]), feats[th.tensor([3, 5])])
+        hit = access(th.tensor([1, 3, 5, 7]))
+        assert_equal(hit.numpy(), [False, True, True, False])
+        for _ in range(5):
+            access(th.arange(20, 40))
+        assert cache.num_cached == 2
+        assert_equal(access(th.tensor([3, 5])).numpy(), [True, True])
+        return
+
+    assert cache.num_cached == 4
+    hit = access(th.tensor([5, 1, 9]))
+    assert_equal(hit.numpy(), [True, True, False])
+    assert cache.num_cached == 5
+
+    # Access hot rows repeatedly and a stream of cold rows once.
+    hot = th.tensor([1, 5])
+    for i in range(10):
+        access(hot)
+        access(th.arange(20 + i * 8, 28 + i * 8))
+    assert cache.num_cached == 10
+    # The hot rows stay in the cache.
+    assert_equal(access(hot).numpy(), [True, True])
+
+    if policy == "lru":
+        # The most recent cold rows are in the cache.
+        hit = access(th.arange(92, 100))
+        assert hit.all()
+    else:
+        # Rarely accessed rows do not evict frequently accessed rows.
+        hit = access(th.arange(92, 100))
+        for _ in range(5):
+            access(th.tensor([11, 12]))
+        assert_equal(access(th.tensor([11, 12])).numpy(), [True, True])
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_feat_row_cache_index(policy):
+    # The sorted index is updated incrementally on every admit.
+    th.manual_seed(0)
+    feats = th.randn(1000, 2)
+    cache = FeatRowCache(64, (2,), th.float32, policy=policy)
+    for _ in range(50):
+        nids = th.unique(th.randint(0, 1000, (32,)))
+        hit, rows = cache.lookup(nids)
+        assert_equal(rows.numpy(), feats[nids[hit]].numpy())
+        cache.admit(nids[~hit], feats[nids[~hit]])
+        # pylint: disable=protected-access
+        keys = cache._keys[:cache.num_cached]
+        sorted_keys, sorted_slots = th.sort(keys)
+        assert_equal(cache._sorted_keys.numpy(), sorted_keys.numpy())
+        assert_equal(cache._keys[cache._sorted_slots].numpy(), sorted_keys.numpy())
+        assert_equal(th.sort(cache._sorted_slots).values.numpy(),
+                     th.sort(sorted_slots).values.numpy())
+
 def test_GSgnnTranData_small_val_test():
     with tempfile.TemporaryDirectory() as tmpdirname:
         _, part_config = generate_dummy_dist_graph(tmpdirname)
@@ -2651,6 +2870,11 @@ def test_GSgnnTranData_small_val_test():
 
 if __name__ == '__main__':
     test_GSgnnTranData_small_val_test()
+    test_GSgnnPrefetchLoader(0)
+    test_GSgnnPrefetchLoader(2)
+    test_feat_row_cache("lru")
+    test_feat_row_cache("lfu")
+    test_feat_row_cache("degree")
     test_GSgnnLinkPredictionTestDataLoader(1, 1)
     test_GSgnnLinkPredictionTestDataLoader(10, 20)
     test_GSgnnMultiTaskDataLoader()
@@ -41,6 +41,7 @@ from graphstorm.eval.utils import (calc_distmult_pos_score,
                                    calc_transe_pos_score)
 from graphstorm.eval.utils import calc_dot_pos_score
 from graphstorm.eval.utils import calc_ranking
+from graphstorm.model.lp_gnn import calc_full_candidate_ranking
 
 from numpy.testing import assert_equal
 
@@ -758,6 +759,70 @@ def test_LinkPredictDotDecoder(h_dim, num_pos, num_neg, device):
     check_calc_test_scores_dot_uniform_neg(decoder, etype, h_dim, num_pos, num_neg, device)
     check_calc_test_scores_dot_joint_neg(decoder, etype, h_dim, num_pos, num_neg, device)
 
+def test_calc_ranking():
+    pos_score = th.tensor([0.5, 2., -1., 3.])
+    neg_score = th.tensor([[0.1, 0.7, 0.5],
+                           [0.1, 0.2, 0.3],
+                           [-2., 0., 1.],
+                           [4., 5., 6.]])
+    ranking = calc_ranking(pos_score, neg_score)
+    # Ties are resolved in favor of the positive score.
+    assert_equal(ranking.numpy(), [2, 1, 3, 4])
+
+def _full_candidate_ranking_brute_force(decoder, emb, etype, pos_src, pos_dst, g, device):
+    num_cands = emb[etype[2]].shape[0]
+    rankings, sizes = [], []
+    for src, dst in zip(pos_src, pos_dst):
+        cand = th.arange(num_cands)
+        if g is not None:
+            _, true_dst = g.out_edges(src.view(1), etype=etype)
+            keep = ~th.isin(cand, true_dst) | (cand == dst)
+            cand = cand[keep]
+        score = decoder.calc_test_scores(
+            emb, {etype: (src.view(1), None, dst.view(1), cand.view(1, -1))},
+            BUILTIN_LP_UNIFORM_NEG_SAMPLER, device)
+        pos_score, neg_score = score[etype]
+        neg_score = neg_score[0][cand != dst]
+        rankings.append(int(th.sum(neg_score > pos_score[0])) + 1)
+        sizes.append(len(cand))
+    return rankings, sizes
+
+@pytest.mark.parametrize("decoder_type", ["dot", "distmult", "transe"])
+@pytest.mark.parametrize("filter_true_edges", [True, False])
+def test_full_candidate_ranking(decoder_type, filter_true_edges):
+    th.manual_seed(0)
+    h_dim = 16
+    etypes = [('a', 'r1', 'b'), ('a', 'r2', 'a')]
+    num_nodes = {'a': 150, 'b': 200}
+    g = dgl.heterograph({
+        etype: (th.randint(num_nodes[etype[0]], (2000,)),
+                th.randint(num_nodes[etype[2]], (2000,)))
+        for etype in etypes}, num_nodes_dict=num_nodes)
+    emb = {ntype: th.rand((num, h_dim)) for ntype, num in num_nodes.items()}
+    if decoder_type == "dot":
+        decoder = LinkPredictDotDecoder(h_dim)
+        etypes = etypes[:1]
+    elif decoder_type == "distmult":
+        decoder = LinkPredictDistMultDecoder(etypes, h_dim)
+    else:
+        decoder = LinkPredictTransEDecoder(etypes, h_dim, gamma=12.)
+
+    with th.no_grad():
+        for etype in etypes:
+            pos_src, pos_dst = g.find_edges(th.randint(2000, (50,)), etype=etype)
+            filter_g = g if filter_true_edges else None
+            # Small chunks so that the candidates and the positive edges
+            # span several chunks and query batches.
+            ranking, sizes = calc_full_candidate_ranking(
+                decoder, emb, etype, pos_src, pos_dst, "cpu", g=filter_g,
+                chunk_size=37, query_batch_size=16)
+            exp_ranking, exp_sizes = _full_candidate_ranking_brute_force(
+                decoder, emb, etype, pos_src, pos_dst, filter_g, "cpu")
+            assert_equal(ranking.numpy(), exp_ranking)
+            assert_equal(sizes.numpy(), exp_sizes)
+            if not filter_true_edges:
+                assert_equal(sizes.numpy(), num_nodes[etype[2]])
+
 def check_forward(decoder, etype, h_dim, num_pos, num_neg, comput_score, device):
     n0_embs = th.rand((1000, h_dim), device=device)
     n1_embs = th.rand((1000, h_dim), device=device)
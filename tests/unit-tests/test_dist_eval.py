@@ -33,6 +33,7 @@ import numpy as np
 from graphstorm.eval import GSgnnClassificationEvaluator
 from graphstorm.eval import GSgnnRegressionEvaluator
 from graphstorm.eval import GSgnnMrrLPEvaluator
+from graphstorm.eval.dist_metrics import EXACT_EVAL_MAX_SIZE, compute_sharded_scores
 from graphstorm.utils import setup_device
 
 from graphstorm.config import BUILTIN_LP_DOT_DECODER
@@ -179,16 +180,19 @@ def run_dist_nc_eval_worker(eval_config, worker_rank, metric, val_pred, test_pre
     th.cuda.set_device(worker_rank)
     device = setup_device(worker_rank)
     config = eval_config
+    exact_eval_max_size = getattr(config, "exact_eval_max_size", EXACT_EVAL_MAX_SIZE)
 
-    if config.eval_metric_list[0] in ["rmse", "mse"]:
+    if config.eval_metric_list[0] in ["rmse", "mse", "mae"]:
         evaluator = GSgnnRegressionEvaluator(config.eval_frequency,
                                              config.eval_metric_list,
-                                             config.use_early_stop)
+                                             config.use_early_stop,
+                                             exact_eval_max_size=exact_eval_max_size)
     else:
         evaluator = GSgnnClassificationEvaluator(config.eval_frequency,
                                                  config.eval_metric_list,
                                                  config.multilabel,
-                                                 config.use_early_stop)
+                                                 config.use_early_stop,
+                                                 exact_eval_max_size=exact_eval_max_size)
 
     val_score0, test_score0 = evaluator.evaluate(
         val_pred.to(device),
@@ -273,7 +277,7 @@ def run_local_nc_eval_worker(eval_config, metric, val_pred, test_pred,
                                       rank=0)
     config = eval_config
 
-    if config.eval_metric_list[0] in ["rmse", "mse"]:
+    if config.eval_metric_list[0] in ["rmse", "mse", "mae"]:
         evaluator = GSgnnRegressionEvaluator(config.eval_frequency,
                                              config.eval_metric_list,
                                              config.use_early_stop)
@@ -478,6 +482,130 @@ def test_nc_dist_regression_eval(metric, seed, backend):
             np.array(metrics_local[key]),
             decimal=8)
 
+@pytest.mark.parametrize("metric", [["accuracy", "f1_score"], ["roc_auc"], ["precision_recall"]])
+@pytest.mark.parametrize("seed", [41, 42])
+def test_nc_dist_sharded_eval(metric, seed):
+    """ Classification metrics computed from sharded statistics should match
+        the metrics computed on all predictions.
+    """
+    th.manual_seed(seed)
+
+    num_samples = 200
+    labels = th.randint(2, (num_samples,))
+    logits = th.rand((num_samples, 2)) / 2
+    logits[th.arange(num_samples), labels] += 0.5
+    if metric[0] in ["accuracy", "f1_score"]:
+        val_pred = logits.argmax(dim=1)
+    else:
+        val_pred = th.softmax(logits, dim=1)
+    test_pred = val_pred
+
+    val_labels0 = labels.clone()
+    val_labels0[140:] = th.randint(2, (num_samples - 140,))
+    val_labels1 = labels.clone()
+    val_labels1[190:] = 1 - val_labels1[190:]
+    val_labels2 = labels.clone()
+    val_labels2[100:] = 1 - val_labels2[100:]
+    test_labels = labels.clone()
+    test_labels[150:] = th.randint(2, (num_samples - 150,))
+
+    config = Dummy({
+        "eval_metric_list": metric,
+        "no_validation": False,
+        "multilabel": False,
+        "eval_frequency": 100,
+        "use_early_stop": False,
+        "exact_eval_max_size": 0,
+    })
+
+    metrics_local = run_local_nc_eval(config, metric, val_pred, test_pred,
+        val_labels0, val_labels1, val_labels2, test_labels)
+    metrics_dist = run_dist_nc_eval(config, metric, val_pred, test_pred,
+        val_labels0, val_labels1, val_labels2, test_labels, "gloo")
+
+    # ROC-AUC and PR-AUC are approximated with score histograms.
+    decimal = 8 if metric[0] in ["accuracy", "f1_score"] else 3
+    for key in metrics_local.keys():
+        assert_almost_equal(
+            np.array(metrics_dist[key]),
+            np.array(metrics_local[key]),
+            decimal=decimal)
+
+@pytest.mark.parametrize("metric", [["rmse"], ["mse"], ["mae"]])
+@pytest.mark.parametrize("seed", [41, 42])
+def test_nc_dist_sharded_regression_eval(metric, seed):
+    """ Regression metrics computed from sharded statistics should match
+        the metrics computed on all predictions.
+    """
+    th.manual_seed(seed)
+
+    val_pred = th.rand((200,1)) * 100
+    test_pred = th.rand((200,1)) * 100
+    val_labels0 = th.rand((200,1)) * 100
+    val_labels1 = val_labels0.clone()
+    val_labels2 = val_labels0.clone()
+    val_labels0[:180] = val_pred[:180]
+    val_labels1[:190] = val_pred[:190]
+    val_labels2[:160] = val_pred[:160]
+    test_labels = th.rand((200,1)) * 100
+    test_labels[:80] = test_pred[:80]
+
+    config = Dummy({
+        "eval_metric_list": metric,
+        "no_validation": False,
+        "eval_frequency": 100,
+        "use_early_stop": False,
+        "exact_eval_max_size": 0,
+    })
+
+    metrics_local = run_local_nc_eval(config, metric, val_pred, test_pred,
+        val_labels0, val_labels1, val_labels2, test_labels)
+    metrics_dist = run_dist_nc_eval(config, metric, val_pred, test_pred,
+        val_labels0, val_labels1, val_labels2, test_labels, "gloo")
+
+    for key in metrics_local.keys():
+        assert_almost_equal(
+            np.array(metrics_dist[key]),
+            np.array(metrics_local[key]),
+            decimal=4)
+
+def run_dist_sharded_scores_worker(worker_rank, pred, labels, conn):
+    dist_init_method = 'tcp://{master_ip}:{master_port}'.format(
+        master_ip='127.0.0.1', master_port='12345')
+    th.distributed.init_process_group(backend="gloo",
+                                      init_method=dist_init_method,
+                                      world_size=2,
+                                      rank=worker_rank)
+    scores = compute_sharded_scores(["accuracy"], pred, labels, exact_eval_max_size=0)
+    conn.send(scores)
+    th.distributed.destroy_process_group()
+
+def run_dist_sharded_scores(preds, labels):
+    ctx = mp.get_context('spawn')
+    conns = [mp.Pipe() for _ in range(2)]
+    procs = [ctx.Process(target=run_dist_sharded_scores_worker,
+                         args=(i, preds[i], labels[i], conns[i][1])) for i in range(2)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=120)
+        assert proc.exitcode == 0
+    return [conn.recv() for conn, _ in conns]
+
+def test_dist_sharded_scores_missing_pred():
+    """ All trainers agree on whether the scores are computed from sharded statistics.
+    """
+    pred = th.randint(2, (20,))
+    labels = th.randint(2, (20,))
+    scores = run_dist_sharded_scores([pred, pred], [labels, labels])
+    assert scores[0] == scores[1]
+    assert_almost_equal(scores[0]["accuracy"], (pred == labels).float().mean().item())
+
+    # When one trainer does not have predictions, no trainer computes the
+    # scores from sharded statistics instead of waiting for each other.
+    scores = run_dist_sharded_scores([pred, None], [labels, None])
+    assert scores == [None, None]
+
 if __name__ == '__main__':
     test_lp_dist_eval(seed=41)
     test_lp_dist_eval(seed=42)
@@ -493,3 +621,8 @@ if __name__ == '__main__':
     ##test_nc_dist_eval(["f1_score"], seed=41, backend="nccl")
     test_nc_dist_eval_multilabel(seed=41, backend="gloo")
     ##test_nc_dist_eval_multilabel(seed=41, backend="nccl")
+
+    test_nc_dist_sharded_eval(["accuracy", "f1_score"], seed=41)
+    test_nc_dist_sharded_eval(["roc_auc"], seed=41)
+    test_nc_dist_sharded_regression_eval(["rmse"], seed=41)
+    test_dist_sharded_scores_missing_pred()
@@ -21,7 +21,7 @@ import torch as th
 from torch import nn
 import torch.nn.functional as F
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_raises
+from numpy.testing import assert_almost_equal, assert_raises, assert_equal
 import tempfile
 
 
@@ -36,7 +36,8 @@ from graphstorm.model import (GSNodeEncoderInputLayer,
 from graphstorm.model.embed import compute_node_input_embeddings
 from graphstorm.dataloading.dataset import prepare_batch_input
 from graphstorm.model.lm_model import TOKEN_IDX, ATT_MASK_IDX, VALID_LEN
-from graphstorm.model.lm_embed import LMModels, LMCache
+from graphstorm.model.lm_embed import (LMModels, LMCache,
+                                       _get_token_lens, _get_lm_batch_feats)
 from graphstorm.model.utils import (LazyDistTensor,
                                     load_pytorch_embedding,
                                     save_pytorch_embedding)
@@ -319,6 +320,59 @@ def test_input_layer4(dev):
     th.distributed.destroy_process_group()
     dgl.distributed.kvstore.close_kvstore()
 
+# In this case, the input features of one node type and one edge type store
+# category indices, which are looked up in embedding tables.
+def test_categorical_input_layer():
+    # initialize the torch distributed environment
+    th.distributed.init_process_group(backend='gloo',
+                                      init_method='tcp://127.0.0.1:23456',
+                                      rank=0,
+                                      world_size=1)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # get the test dummy distributed graph
+        g, _ = generate_dummy_dist_graph(tmpdirname)
+
+    def check_embed(embed_table, feats, emb):
+        true_val = th.zeros(len(feats), embed_table.weight.shape[1])
+        for i, row in enumerate(feats):
+            for idx in row:
+                # Empty slots and unknown values are -1.
+                if idx >= 0:
+                    true_val[i] += embed_table.weight[idx]
+        assert_almost_equal(emb.detach().numpy(), true_val.detach().numpy(), decimal=5)
+
+    cat_feats = th.tensor([[0, 3, -1], [4, -1, -1], [-1, -1, -1], [1, 1, 2]])
+    feat_size = get_node_feat_size(g, 'feat')
+    feat_size['n0'] = 3
+    layer = GSNodeEncoderInputLayer(g, feat_size, 2, num_categories={'n0': 5})
+    assert set(layer.input_embeds.keys()) == {'n0'}
+    assert set(layer.input_projs.keys()) == set(g.ntypes) - {'n0'}
+    input_nodes = {ntype: np.arange(4) for ntype in g.ntypes}
+    node_feat = {ntype: g.nodes[ntype].data['feat'][input_nodes[ntype]] \
+        for ntype in g.ntypes}
+    node_feat['n0'] = cat_feats
+    embed = layer(node_feat, input_nodes)
+    assert set(embed.keys()) == set(g.ntypes)
+    check_embed(layer.input_embeds['n0'], cat_feats, embed['n0'])
+    # The embeddings of the categories are trained.
+    embed['n0'].sum().backward()
+    assert_equal(layer.input_embeds['n0'].weight.grad[:5, 0].numpy(),
+                 np.array([1, 2, 1, 1, 1], dtype=np.float32))
+
+    etype = ('n0', 'r0', 'n1')
+    edge_feat_size = get_edge_feat_size(g, {etype: ['feat']})
+    edge_feat_size[etype] = 3
+    edge_input_layer = GSEdgeEncoderInputLayer(g, edge_feat_size, 2, activation=None,
+                                               num_categories={etype: 5})
+    assert set(edge_input_layer.input_embeds.keys()) == {str(etype)}
+    assert len(edge_input_layer.input_projs) == 0
+    embed = edge_input_layer([{etype: cat_feats}, {etype: cat_feats[:0]}])
+    check_embed(edge_input_layer.input_embeds[str(etype)], cat_feats, embed[0][etype])
+    assert embed[1][etype].shape == (0, 2)
+
+    th.distributed.destroy_process_group()
+    dgl.distributed.kvstore.close_kvstore()
+
 @pytest.mark.parametrize("dev", ['cpu','cuda:0'])
 def test_compute_embed(dev):
     # initialize the torch distributed environment
@@ -395,6 +449,66 @@ def test_lm_cache():
     th.distributed.destroy_process_group()
     dgl.distributed.kvstore.close_kvstore()
 
+def test_lm_cache_bucketing():
+    th.distributed.init_process_group(backend='gloo',
+                                      init_method='tcp://127.0.0.1:23456',
+                                      rank=0,
+                                      world_size=1)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        lm_config, _, _, _, g, _ = create_lm_graph(tmpdirname)
+        lm_models = LMModels(g, lm_config, 0, 10)
+        lm_model = lm_models.get_lm_model("n0")
+        lm_model.eval()
+        lm_node_feat = lm_models.get_lm_node_feat("n0")
+        nodes = th.arange(10)
+        token_lens = _get_token_lens(lm_node_feat, nodes)
+        assert_equal(token_lens.numpy(), g.nodes["n0"].data[VALID_LEN][nodes].long().numpy())
+
+        # Trimming the padding does not change the LM embeddings.
+        max_len = int(token_lens.max())
+        feats = _get_lm_batch_feats(lm_node_feat, nodes, max_len)
+        assert feats[TOKEN_IDX].shape[1] == max_len
+        with th.no_grad():
+            emb = lm_model(["n0"], {"n0": _get_lm_batch_feats(lm_node_feat, nodes)})
+            emb_trim = lm_model(["n0"], {"n0": feats})
+        assert_almost_equal(emb["n0"].numpy(), emb_trim["n0"].numpy(), decimal=4)
+
+    th.distributed.destroy_process_group()
+    dgl.distributed.kvstore.close_kvstore()
+
+def test_lm_cache_checkpoint():
+    th.distributed.init_process_group(backend='gloo',
+                                      init_method='tcp://127.0.0.1:23456',
+                                      rank=0,
+                                      world_size=1)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        lm_config, _, _, _, g, _ = create_lm_graph(tmpdirname)
+        lm_models = LMModels(g, lm_config, 0, 10)
+        lm_cache = LMCache(g, lm_models, tmpdirname)
+        # The job fails after computing the embeddings but before saving them.
+        with patch.object(LMCache, "_save_embeddings", side_effect=RuntimeError("fail")):
+            with pytest.raises(RuntimeError):
+                lm_cache.update_cache(10, checkpoint_interval=2)
+        ckpt_path = lm_cache._get_checkpoint_path("n0")
+        assert len(os.listdir(ckpt_path)) > 0
+        emb1 = lm_cache["n0"]
+
+        # The restarted job loads all embeddings from the checkpoint
+        # without running the LM model.
+        lm_cache2 = LMCache(g, lm_models, tmpdirname)
+        with patch.object(lm_models.get_lm_model("n0"), "forward",
+                          side_effect=AssertionError("LM should not run")):
+            ret = lm_cache2.update_cache(10, checkpoint_interval=2)
+        assert ret == True
+        emb2 = lm_cache2["n0"]
+        assert np.all(emb1[0:len(emb1)].numpy() == emb2[0:len(emb2)].numpy())
+        # The partial results are removed once the embeddings are saved.
+        assert len(os.listdir(ckpt_path)) == 0
+        assert os.path.exists(lm_cache2._get_embed_path("n0"))
+
+    th.distributed.destroy_process_group()
+    dgl.distributed.kvstore.close_kvstore()
+
 def run_dist_cache(part_config, tmpdirname):
     gs.initialize(ip_config=None, backend="gloo")
     g, lm_config = load_lm_graph(part_config)
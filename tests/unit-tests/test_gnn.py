@@ -548,6 +548,57 @@ def test_rgcn_node_prediction(norm):
     th.distributed.destroy_process_group()
     dgl.distributed.kvstore.close_kvstore()
 
+def test_dist_inference_pipeline():
+    """ Test that the pipelined layer-wise inference computes the same embeddings
+        as the sequential inference.
+    """
+    # initialize the torch distributed environment
+    th.distributed.init_process_group(backend='gloo',
+                                      init_method='tcp://127.0.0.1:23456',
+                                      rank=0,
+                                      world_size=1)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # get the test dummy distributed graph
+        _, part_config = generate_dummy_dist_graph(tmpdirname)
+        np_data = GSgnnData(part_config=part_config,
+                            node_feat_field='feat')
+    g = np_data.g
+    model = create_rgcn_node_model(g)
+    model.eval()
+    def get_input_embeds(input_nodes):
+        feats = prepare_batch_input(g, input_nodes, feat_field=np_data.node_feat_field)
+        return model.node_input_encoder(feats, input_nodes)
+
+    embs = model.gnn_encoder.dist_inference(g, get_input_embeds, 10, [-1, -1],
+                                            pipeline_depth=0)
+    # Write the outputs in small batches to cover the buffered writes.
+    with patch("graphstorm.model.gnn_encoder_base.INFER_WRITE_BATCH_SIZE", 16):
+        for pipeline_depth in [1, 4]:
+            embs2 = model.gnn_encoder.dist_inference(g, get_input_embeds, 10, [-1, -1],
+                                                     pipeline_depth=pipeline_depth)
+            assert len(embs) == len(embs2)
+            for ntype in embs:
+                assert_almost_equal(embs[ntype][0:len(embs[ntype])].numpy(),
+                                    embs2[ntype][0:len(embs2[ntype])].numpy())
+
+    # Errors when preparing mini-batches are raised in the calling thread.
+    def get_input_embeds_fail(input_nodes):
+        raise RuntimeError("fail to get input embeddings")
+    with assert_raises(RuntimeError):
+        model.gnn_encoder.dist_inference(g, get_input_embeds_fail, 10, [-1, -1],
+                                         pipeline_depth=2)
+
+    # Full-graph inference computes identical embeddings with and without pipelining.
+    embs = do_full_graph_inference(model, np_data, batch_size=10, fanout=[-1, -1])
+    embs2 = do_full_graph_inference(model, np_data, batch_size=10, fanout=[-1, -1],
+                                    pipeline_depth=2)
+    assert len(embs) == len(embs2)
+    for ntype in embs:
+        assert_equal(embs[ntype][0:len(embs[ntype])].numpy(),
+                     embs2[ntype][0:len(embs2[ntype])].numpy())
+    th.distributed.destroy_process_group()
+    dgl.distributed.kvstore.close_kvstore()
+
 def test_rgcn_node_prediction_multi_target_ntypes():
     """ Test edge prediction logic correctness with a node prediction model
         composed of InputLayerEncoder + RGCNLayer + Decoder
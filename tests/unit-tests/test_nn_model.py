@@ -192,6 +192,71 @@ def test_rgcn_with_no_indegree_dstnodes(input_dim, output_dim):
     assert outputs['n2'].shape[1] == output_dim
 
 
+@pytest.mark.parametrize("input_dim", [32])
+@pytest.mark.parametrize("output_dim", [16, 64])
+@pytest.mark.parametrize("num_bases", [2, 3])
+def test_rgcn_fuse_relations(input_dim, output_dim, num_bases):
+    """ Test that the fused message passing of RelGraphConvLayer matches
+        the per-relation message passing.
+    """
+    heter_graph = generate_dummy_hetero_graph(size='tiny', gen_mask=False,
+                                              add_reverse=True)
+    seeds = {'n0': th.arange(10), 'n1': th.arange(20)}
+    subg = dgl.sampling.sample_neighbors(heter_graph, seeds, 5)
+    block = dgl.to_block(subg, seeds)
+    etypes = heter_graph.canonical_etypes
+    inputs = {ntype: th.rand(block.num_src_nodes(ntype), input_dim)
+              for ntype in block.srctypes}
+
+    for weight in [True, False]:
+        layer = RelGraphConvLayer(
+            input_dim, output_dim if weight else input_dim, etypes,
+            num_bases, weight=weight, activation=th.nn.ReLU(), self_loop=True)
+        layer.eval()
+        out = layer(block, inputs)
+        layer.fuse_relations = True
+        out_fused = layer(block, inputs)
+        assert set(out.keys()) == set(out_fused.keys())
+        for ntype in out:
+            assert_almost_equal(out[ntype].detach().numpy(),
+                                out_fused[ntype].detach().numpy(), decimal=5)
+
+    # relations without any input or any edge.
+    block, inputs, _, etypes = create_dummy_zero_input_test_graph(input_dim)
+    layer = RelGraphConvLayer(
+        input_dim, output_dim, etypes,
+        num_bases, activation=th.nn.ReLU(), self_loop=True)
+    layer.eval()
+    out = layer(block, inputs)
+    layer.fuse_relations = True
+    out_fused = layer(block, inputs)
+    assert set(out.keys()) == set(out_fused.keys())
+    for ntype in out:
+        assert_almost_equal(out[ntype].detach().numpy(),
+                            out_fused[ntype].detach().numpy(), decimal=5)
+
+    # mix fused relations with relations that use edge features.
+    heter_graph = generate_dummy_hetero_graph(size='tiny', gen_mask=False,
+                                              add_reverse=False, is_random=False)
+    seeds = {'n1': [0, 1, 2]}
+    subg = dgl.sampling.sample_neighbors(heter_graph, seeds, 100)
+    block = dgl.to_block(subg, seeds)
+    etypes = [("n0", "r0", "n1"), ("n0", "r1", "n1")]
+    inputs = {ntype: th.rand(block.num_src_nodes(ntype), input_dim)
+              for ntype in block.srctypes}
+    edge_feats = {("n0", "r0", "n1"): th.rand(block.num_edges(("n0", "r0", "n1")), input_dim)}
+    layer = RelGraphConvLayer(
+        input_dim, output_dim, etypes, num_bases,
+        edge_feat_name={("n0", "r0", "n1"): ['feat']},
+        activation=th.nn.ReLU(), self_loop=True)
+    layer.eval()
+    out = layer(block, inputs, edge_feats)
+    layer.fuse_relations = True
+    out_fused = layer(block, inputs, edge_feats)
+    assert_almost_equal(out['n1'].detach().numpy(),
+                        out_fused['n1'].detach().numpy(), decimal=5)
+
+
 @pytest.mark.parametrize("input_dim", [32])
 @pytest.mark.parametrize("output_dim", [32,64])
 def test_rgat_with_no_indegree_dstnodes(input_dim, output_dim):
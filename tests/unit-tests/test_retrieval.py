@@ -0,0 +1,132 @@
+"""
+    Copyright 2023 Contributors
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+"""
+import os
+import tempfile
+
+import pytest
+import numpy as np
+import torch as th
+from numpy.testing import assert_equal, assert_almost_equal
+
+from graphstorm.retrieval import (GSAnnIndex,
+                                  build_ann_indexes,
+                                  load_node_embeddings,
+                                  ANN_INDEX_DIR)
+from graphstorm.retrieval import ann_index
+from graphstorm.gconstruct.file_io import write_data_parquet
+from graphstorm.eval.utils import (calc_distmult_pos_score,
+                                   calc_dot_pos_score,
+                                   calc_rotate_pos_score,
+                                   calc_transe_pos_score)
+
+def _exact_scores(decoder_type, src_embs, embs, rel_emb, gamma):
+    h = th.tensor(src_embs).unsqueeze(1)
+    t = th.tensor(embs).unsqueeze(0)
+    if decoder_type == "dot_product":
+        return calc_dot_pos_score(h, t).numpy()
+    r = th.tensor(rel_emb)
+    if decoder_type == "distmult":
+        return calc_distmult_pos_score(h, t, r).numpy()
+    if decoder_type == "rotate":
+        return calc_rotate_pos_score(h, t, r, gamma / r.shape[-1], gamma).numpy()
+    norm = "l1" if decoder_type == "transe_l1" else "l2"
+    return calc_transe_pos_score(h, t, r, gamma, norm=norm).numpy()
+
+@pytest.mark.parametrize("decoder_type",
+                         ["dot_product", "distmult", "transe_l1", "transe_l2", "rotate"])
+def test_flat_index_query(decoder_type, monkeypatch):
+    th.manual_seed(0)
+    num_nodes, dim, k = 500, 16, 5
+    embs = th.rand(num_nodes, dim).numpy()
+    nids = np.arange(num_nodes) * 10
+    src_embs = th.rand(37, dim).numpy()
+    rel_dim = dim // 2 if decoder_type == "rotate" else dim
+    rel_emb = th.rand(rel_dim).numpy()
+    # Scan the candidates in several blocks.
+    monkeypatch.setattr(ann_index, "ANN_SCORE_BLOCK_SIZE", 3000)
+
+    index = GSAnnIndex.build(nids, embs, "flat", decoder_type, gamma=12.)
+    scores, ids = index.query(src_embs, k, rel_emb=rel_emb, batch_size=16)
+    exp_scores = _exact_scores(decoder_type, src_embs, embs, rel_emb, 12.)
+    exp_idx = np.argsort(-exp_scores, axis=1)[:, :k]
+    assert_equal(ids, nids[exp_idx])
+    assert_almost_equal(scores, np.take_along_axis(exp_scores, exp_idx, axis=1), decimal=4)
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        index.save(tmpdirname)
+        index = GSAnnIndex.load(tmpdirname)
+        assert index.decoder_type == decoder_type
+        scores2, ids2 = index.query(src_embs, k, rel_emb=rel_emb)
+        assert_equal(ids2, ids)
+        assert_almost_equal(scores2, scores)
+
+def test_load_node_embeddings():
+    th.manual_seed(0)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # Embeddings saved by GraphStorm inference.
+        os.makedirs(os.path.join(tmpdirname, "n0"))
+        os.makedirs(os.path.join(tmpdirname, "n1"))
+        embs = th.rand(20, 4)
+        nids = th.randperm(20)
+        for i in range(2):
+            th.save(embs[i*10:(i+1)*10],
+                    os.path.join(tmpdirname, "n0", f"embed-0000{i}.pt"))
+            th.save(nids[i*10:(i+1)*10],
+                    os.path.join(tmpdirname, "n0", f"embed_nids-0000{i}.pt"))
+        load_nids, load_embs = load_node_embeddings(tmpdirname, "n0")
+        assert_equal(load_nids, nids.numpy())
+        assert_almost_equal(load_embs, embs.numpy())
+
+        # Embeddings remapped into parquet files.
+        str_nids = np.array([f"n{i}" for i in range(20)])
+        for i in range(2):
+            write_data_parquet({"nid": str_nids[i*10:(i+1)*10],
+                                "emb": embs[i*10:(i+1)*10].numpy()},
+                               os.path.join(tmpdirname, "n1", f"embed-00000_0000{i}.parquet"))
+        load_nids, load_embs = load_node_embeddings(tmpdirname, "n1")
+        assert_equal(load_nids, str_nids)
+        assert_almost_equal(load_embs, embs.numpy())
+
+        index_paths = build_ann_indexes(tmpdirname, index_type="flat")
+        assert sorted(index_paths.keys()) == ["n0", "n1"]
+        index = GSAnnIndex.load(os.path.join(tmpdirname, "n1", ANN_INDEX_DIR))
+        _, ids = index.query(embs[:3].numpy(), 1)
+        assert ids.shape == (3, 1)
+
+@pytest.mark.parametrize("index_type", ["hnsw", "ivfpq"])
+def test_faiss_index_query(index_type):
+    pytest.importorskip("faiss")
+    th.manual_seed(0)
+    num_nodes, dim, k = 2000, 16, 10
+    embs = th.rand(num_nodes, dim).numpy()
+    nids = np.arange(num_nodes)
+    src_embs = th.rand(20, dim).numpy()
+    rel_emb = th.rand(dim).numpy()
+
+    index = GSAnnIndex.build(nids, embs, index_type, "distmult")
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        index.save(tmpdirname)
+        index = GSAnnIndex.load(tmpdirname)
+    scores, ids = index.query(src_embs, k, rel_emb=rel_emb, nprobe=16)
+    assert ids.shape == (20, k)
+    # Scores are exact decoder scores sorted in descending order.
+    exp_scores = _exact_scores("distmult", src_embs, embs, rel_emb, 12.)
+    assert_almost_equal(scores, np.take_along_axis(exp_scores, ids, axis=1), decimal=4)
+    assert np.all(np.diff(scores, axis=1) <= 0)
+    # Recall of the true top-k.
+    exp_idx = np.argsort(-exp_scores, axis=1)[:, :k]
+    recall = np.mean([len(np.intersect1d(ids[i], exp_idx[i])) / k for i in range(20)])
+    assert recall > 0.5
@@ -55,6 +55,8 @@ from graphstorm.dataloading import (GSgnnNodeDataLoader,
                                     GSgnnLinkPredictionDataLoader,
                                     GSgnnLinkPredictionTestDataLoader)
 from graphstorm.model import GSgnnMultiTaskModelInterface, GSgnnModel, HGTLayerwithEdgeFeat
+from graphstorm.model import GSOptimizer
+from graphstorm.model.utils import to_full_precision
 from numpy.testing import assert_equal, assert_raises
 
 from util import (DummyGSgnnEncoderModel,
@@ -216,6 +218,53 @@ class DummyGSgnnMultiTaskSharedEncoderModel(GSgnnModel, GSgnnMultiTaskModelInter
     def predict(self, task_id, mini_batch, return_proba=False):
         pass
 
+class DummyLinearModel(th.nn.Module):
+    def __init__(self):
+        super(DummyLinearModel, self).__init__()
+        self.linear = th.nn.Linear(4, 2)
+
+    def forward(self, x):
+        return self.linear(x)
+
+    def create_optimizer(self):
+        return GSOptimizer(dense_opts=[th.optim.SGD(self.parameters(), lr=0.1)])
+
+    @property
+    def device(self):
+        return self.linear.weight.device
+
+def test_trainer_setup_precision():
+    model = DummyLinearModel()
+    trainer = GSgnnTrainer(model)
+    trainer.setup_device("cpu")
+    assert trainer.precision == "fp32"
+    with assert_raises(AssertionError):
+        trainer.setup_precision("fp8")
+
+    feats = th.rand(8, 4)
+    with trainer.autocast():
+        out = model(feats)
+    assert out.dtype == th.float32
+
+    trainer.setup_precision("bf16")
+    assert trainer.precision == "bf16"
+    weight = model.linear.weight.detach().clone()
+    with trainer.autocast():
+        out = model(feats)
+        loss = out.sum()
+    assert out.dtype == th.bfloat16
+    trainer.optimizer.zero_grad()
+    trainer.backward(loss)
+    trainer.step()
+    # Parameters and gradients stay in fp32.
+    assert model.linear.weight.dtype == th.float32
+    assert model.linear.weight.grad.dtype == th.float32
+    assert not th.equal(weight, model.linear.weight.detach())
+
+    # Outputs computed under autocast are stored in fp32.
+    assert to_full_precision(out).dtype == th.float32
+    assert to_full_precision(th.arange(4)).dtype == th.int64
+
 def test_mtask_prepare_reconstruct_edge_feat():
     with tempfile.TemporaryDirectory() as tmpdirname:
         # get the test dummy distributed graph
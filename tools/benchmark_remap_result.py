@@ -0,0 +1,113 @@
+"""
+    Copyright 2023 Contributors
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+    Throughput benchmark of remapping node embeddings with
+    graphstorm.gconstruct.remap_result against the row-by-row writers
+    it used before.
+
+    Usage:
+    python3 benchmark_remap_result.py --num-rows 1000000 --dim 256
+"""
+import argparse
+import os
+import tempfile
+import time
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import torch as th
+
+from graphstorm.gconstruct import remap_result
+from graphstorm.gconstruct.id_map import IdMap, IdReverseMap
+from graphstorm.gconstruct.remap_result import (worker_remap_node_data,
+                                                write_data_csv_file,
+                                                write_data_parquet_file,
+                                                GS_REMAP_NID_COL)
+
+def legacy_write_parquet(data, file_prefix):
+    """ The row-by-row parquet writer, one Python object per embedding row.
+    """
+    arrs = [val if len(val.shape) == 1 else [val[i] for i in range(len(val))] \
+            for val in data.values()]
+    table = pa.Table.from_arrays(arrs, names=list(data.keys()))
+    pq.write_table(table, f"{file_prefix}.parquet")
+
+def legacy_write_csv(data, file_prefix, delimiter=","):
+    """ The row-by-row CSV writer formatting each value in Python.
+    """
+    csv_data = {}
+    for key, vals in data.items():
+        if len(vals.shape) == 1:
+            csv_data[key] = vals.tolist()
+        else:
+            csv_data[key] = [";".join([str(v) for v in val]) for val in vals.tolist()]
+    pd.DataFrame(csv_data).to_csv(f"{file_prefix}.csv", index=False, sep=delimiter)
+
+def legacy_remap_node_data(data_file_path, nid_path, ntype, data_col_key,
+                           output_fname_prefix, output_func):
+    """ Remap a whole embedding shard loaded into memory at once.
+    """
+    node_data = th.load(data_file_path).numpy()
+    nids = th.load(nid_path).numpy()
+    data = {data_col_key: node_data,
+            GS_REMAP_NID_COL: remap_result.id_maps[ntype].map_id(nids)}
+    output_func(data, f"{output_fname_prefix}_00000")
+
+def run(name, func):
+    """ Time one remapping run.
+    """
+    start = time.time()
+    func()
+    return name, time.time() - start
+
+def main(args):
+    """ Main function
+    """
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        ids = np.array([f"n_{i}" for i in np.random.permutation(args.num_rows)])
+        IdMap(ids).save(os.path.join(tmpdirname, "n0"))
+        remap_result.id_maps["n0"] = IdReverseMap(os.path.join(tmpdirname, "n0"))
+
+        data_path = os.path.join(tmpdirname, "embed-00000.pt")
+        nid_path = os.path.join(tmpdirname, "embed_nids-00000.pt")
+        th.save(th.rand(args.num_rows, args.dim), data_path)
+        th.save(th.randperm(args.num_rows), nid_path)
+        out_prefix = os.path.join(tmpdirname, "out")
+
+        results = [
+            run("legacy parquet", partial(legacy_remap_node_data, data_path, nid_path, "n0",
+                                          "emb", out_prefix, legacy_write_parquet)),
+            run("columnar parquet", partial(worker_remap_node_data, data_path, nid_path, "n0",
+                                            "emb", out_prefix, args.num_rows,
+                                            write_data_parquet_file)),
+            run("legacy csv", partial(legacy_remap_node_data, data_path, nid_path, "n0",
+                                      "emb", out_prefix, legacy_write_csv)),
+            run("vectorized csv", partial(worker_remap_node_data, data_path, nid_path, "n0",
+                                          "emb", out_prefix, args.num_rows,
+                                          write_data_csv_file)),
+        ]
+    for name, duration in results:
+        print(f"{name:>18}: {duration:8.2f}s, {args.num_rows / duration:12.0f} rows/s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("Benchmark remapping node embeddings")
+    parser.add_argument("--num-rows", type=int, default=1000000,
+                        help="The number of embeddings in the shard.")
+    parser.add_argument("--dim", type=int, default=256,
+                        help="The embedding dimension.")
+    main(parser.parse_args())